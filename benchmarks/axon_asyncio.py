@@ -0,0 +1,88 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+""" Benchmarks a burst of concurrent forward requests against a threaded axon and an asyncio axon with the same
+    handler threads and priority workers. The synapse waits on a slow backend, as a miner calling a remote model
+    does, so the requests in flight are bounded by the threads each server parks on waiting requests.
+
+    python -m benchmarks.axon_asyncio --requests 64 --workers 64 --handlers 10 --latency 0.2
+"""
+import time
+import asyncio
+import argparse
+import threading
+
+import bittensor
+from bittensor.utils.test_utils import get_random_unused_port
+from benchmarks.utils import timeit
+
+class SlowBackendSynapse( bittensor.TextPromptingSynapse ):
+    def __init__( self, axon: 'bittensor.axon', latency: float ):
+        super().__init__( axon = axon )
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def forward( self, messages ):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max( self.max_in_flight, self.in_flight )
+        time.sleep( self.latency )
+        with self.lock:
+            self.in_flight -= 1
+        return messages[0]['content']
+
+    def backward( self, messages, response, rewards ): pass
+    def priority( self, call: bittensor.SynapseCall ) -> float: return 0.0
+    def blacklist( self, call: bittensor.SynapseCall ) -> bool: return False
+
+def run( args, wallet, sender, asyncio_axon: bool ):
+    config = bittensor.axon.config()
+    config.axon.priority.max_workers = args.workers
+    axon = bittensor.axon( wallet = wallet, metagraph = None, config = config, port = get_random_unused_port(), external_ip = '127.0.0.1', max_workers = args.handlers, use_asyncio = asyncio_axon )
+    synapse = SlowBackendSynapse( axon = axon, latency = args.latency )
+    axon.start()
+    # One dendrite per request, as a validator querying many uids: nonces are only ordered per dendrite.
+    dendrites = [ bittensor.text_prompting( axon = axon.info(), keypair = sender.hotkey, ip = '127.0.0.1' ) for _ in range( args.requests ) ]
+    def burst():
+        calls = dendrites[0].loop.run_until_complete( asyncio.gather( *[
+            dendrite.async_forward( roles = [ 'user' ], messages = [ str( i ) ], timeout = 60 ) for i, dendrite in enumerate( dendrites )
+        ] ) )
+        assert all( call.is_success for call in calls ), [ call.return_message for call in calls if not call.is_success ][:1]
+    burst() # warm up the channel.
+    elapsed = timeit( burst, repeat = 3 )
+    axon.stop()
+    return elapsed, synapse.max_in_flight
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--requests', type = int, default = 64, help = 'Concurrent requests in the burst.' )
+    parser.add_argument( '--workers', type = int, default = 64, help = 'Axon priority threadpool workers.' )
+    parser.add_argument( '--handlers', type = int, default = 10, help = 'grpc handler threads, --axon.max_workers.' )
+    parser.add_argument( '--latency', type = float, default = 0.2, help = 'Backend latency of each forward in seconds.' )
+    args = parser.parse_args()
+
+    wallet, sender = bittensor.wallet.mock(), bittensor.wallet.mock()
+    threaded, threaded_in_flight = run( args, wallet, sender, asyncio_axon = False )
+    aio, aio_in_flight = run( args, wallet, sender, asyncio_axon = True )
+    print( f'{args.requests} requests, {args.handlers} handlers, {args.workers} workers, {args.latency}s backend' )
+    print( f'  threaded: {args.requests / threaded:7.1f} req/s   max in flight: {threaded_in_flight}' )
+    print( f'  asyncio:  {args.requests / aio:7.1f} req/s   max in flight: {aio_in_flight}   speedup: {threaded / aio:5.1f}x' )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+""" Signature verifications per second of the axon AuthInterceptor, with the previous check that parsed a new
+    Keypair per request against the cached public key path, inline and in a process pool.
+    Run with python -m benchmarks.axon_auth
+"""
+import os
+import time
+import uuid
+
+from substrateinterface import Keypair
+
+from bittensor._axon import AuthInterceptor
+from benchmarks.utils import timeit
+
+
+def keypair_per_request( interceptor, nonces, nonce, sender_hotkey, signature, receptor_uuid ):
+    r""" The check_signature body before the key cache and nonce store. """
+    keypair = Keypair( ss58_address = sender_hotkey )
+    message = f"{nonce}.{sender_hotkey}.{interceptor.receiver_hotkey}.{receptor_uuid}"
+    endpoint_key = f"{sender_hotkey}:{receptor_uuid}"
+    if endpoint_key in nonces and nonce <= nonces[ endpoint_key ]:
+        raise Exception( "Nonce is too small" )
+    if not keypair.verify( message, signature ):
+        raise Exception( "Signature mismatch" )
+    nonces[ endpoint_key ] = nonce
+
+def signed_requests( receiver_hotkey: str, n_senders: int, n: int ):
+    r""" Returns n ( nonce, sender_hotkey, signature, receptor_uuid ) requests from n_senders hotkeys. """
+    senders = [ Keypair.create_from_mnemonic( Keypair.generate_mnemonic() ) for _ in range( n_senders ) ]
+    receptor_uuids = [ str( uuid.uuid1() ) for _ in range( n_senders ) ]
+    requests = []
+    for i in range( n ):
+        sender, receptor_uuid = senders[ i % n_senders ], receptor_uuids[ i % n_senders ]
+        nonce = time.monotonic_ns()
+        message = f"{nonce}.{sender.ss58_address}.{receiver_hotkey}.{receptor_uuid}"
+        requests.append( ( nonce, sender.ss58_address, '0x' + sender.sign( message ).hex(), receptor_uuid ) )
+    return requests
+
+def main( n: int = 2000, n_senders: int = 64 ):
+    receiver_hotkey = Keypair.create_from_mnemonic( Keypair.generate_mnemonic() ).ss58_address
+    requests = signed_requests( receiver_hotkey, n_senders, n )
+    print( f"{n} requests from {n_senders} senders, {os.cpu_count()} cpus" )
+
+    def run( check ):
+        return lambda: [ check( *request ) for request in requests ]
+
+    interceptor = AuthInterceptor( receiver_hotkey = receiver_hotkey )
+    seconds = timeit( lambda: run( lambda *request: keypair_per_request( interceptor, {}, *request ) )(), repeat = 1 )
+    print( f"keypair per request: {n / seconds:10.0f} verifications/s" )
+
+    cached = AuthInterceptor( receiver_hotkey = receiver_hotkey )
+    seconds = timeit( lambda: run( cached.check_signature )(), repeat = 1 )
+    print( f"cached public key:   {n / seconds:10.0f} verifications/s" )
+
+    processes = max( 1, ( os.cpu_count() or 1 ) - 1 )
+    pooled = AuthInterceptor( receiver_hotkey = receiver_hotkey, verification_processes = processes )
+    pooled.check_signature( *signed_requests( receiver_hotkey, 1, 1 )[0] ) # Spawn the workers outside the timing.
+    seconds = timeit( lambda: run( pooled.check_signature )(), repeat = 1 )
+    pooled.close()
+    # Requests are checked one after the other here, the pool pays off when grpc threads check concurrently
+    # on a machine with spare cores.
+    print( f"{processes} process pool:      {n / seconds:10.0f} verifications/s" )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+""" Benchmarks waiting for epochs on a simulated chain which produces a block every --blocktime seconds. The
+    miner loop used to poll get_current_block every 0.1s, one round trip each, while the block clock gets one
+    header per block from its subscription. Reports the round trips and how late each epoch was noticed.
+
+    python -m benchmarks.block_clock --blocktime 0.2 --epochs 3 --blocks-per-epoch 5
+"""
+import time
+import argparse
+import threading
+from unittest.mock import MagicMock
+
+import bittensor
+
+class SimulatedChain:
+    r""" Produces blocks on a timer, serves reads of the current block and new heads subscriptions. """
+    def __init__( self, blocktime: float, rtt: float ):
+        self.blocktime = blocktime
+        self.rtt = rtt
+        self.start = time.monotonic()
+        self.reads = 0
+        self.headers = 0
+        self.closed = threading.Event()
+
+    def block( self ) -> int:
+        return int( ( time.monotonic() - self.start ) // self.blocktime )
+
+    def block_started( self, block: int ) -> float:
+        return self.start + block * self.blocktime
+
+    def get_current_block( self ) -> int:
+        self.reads += 1
+        time.sleep( self.rtt )
+        return self.block()
+
+    def subscribe_block_headers( self, handler ):
+        block = self.block()
+        while not self.closed.is_set():
+            self.closed.wait( max( 0, self.block_started( block + 1 ) - time.monotonic() ) )
+            block += 1
+            self.headers += 1
+            if handler( { 'header': { 'number': block } }, 0, 'id' ) is not None: return
+
+    def close( self ):
+        self.closed.set()
+
+def polling_loop( chain: SimulatedChain, epochs: int, blocks_per_epoch: int ) -> float:
+    r""" The previous miner loop. Returns the mean delay between an epoch block and the loop noticing it. """
+    delays = []
+    last_update = chain.get_current_block()
+    for _ in range( epochs ):
+        current_block = chain.get_current_block()
+        while ( current_block - last_update ) < blocks_per_epoch:
+            time.sleep( 0.1 )
+            current_block = chain.get_current_block()
+        delays.append( time.monotonic() - chain.block_started( last_update + blocks_per_epoch ) )
+        last_update = chain.get_current_block()
+    return sum( delays ) / len( delays )
+
+def clock_loop( chain: SimulatedChain, epochs: int, blocks_per_epoch: int ) -> float:
+    subtensor = MagicMock( chain_endpoint = 'simulated' )
+    subtensor.get_current_block.side_effect = chain.get_current_block
+    clock = bittensor.BlockClock( subtensor, substrate_factory = lambda: chain, blocktime = chain.blocktime )
+    try:
+        delays = []
+        last_update = clock.current_block
+        for _ in range( epochs ):
+            target = last_update + blocks_per_epoch
+            last_update = clock.wait_for_block( target )
+            delays.append( time.monotonic() - chain.block_started( target ) )
+        return sum( delays ) / len( delays )
+    finally:
+        clock.stop()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--blocktime', type = float, default = 0.2, help = 'Simulated seconds per block.' )
+    parser.add_argument( '--rtt', type = float, default = 0.01, help = 'Simulated round trip time in seconds.' )
+    parser.add_argument( '--epochs', type = int, default = 3 )
+    parser.add_argument( '--blocks-per-epoch', type = int, default = 5 )
+    args = parser.parse_args()
+
+    print( '{} epochs of {} blocks, blocktime {:.0f}ms, rtt {:.0f}ms'.format( args.epochs, args.blocks_per_epoch, 1000 * args.blocktime, 1000 * args.rtt ) )
+    for name, loop in ( ( 'polling get_current_block', polling_loop ), ( 'block clock', clock_loop ) ):
+        chain = SimulatedChain( args.blocktime, args.rtt )
+        delay = loop( chain, args.epochs, args.blocks_per_epoch )
+        print( '  {:<26}: {:>4} block reads, {:>3} headers, epoch noticed after {:.0f}ms'.format( name, chain.reads, chain.headers, 1000 * delay ) )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+""" Benchmarks SCALE decoding of the custom rpc chain data types.
+
+    python -m benchmarks.chain_data_decode --n 4096
+"""
+import argparse
+from scalecodec.base import RuntimeConfigurationObject, ScaleBytes
+from scalecodec.type_registry import load_type_registry_preset
+
+from bittensor._subtensor.chain_data import ChainDataType, NeuronColumns, NeuronInfoLite, custom_rpc_type_registry, from_scale_encoding
+from benchmarks.utils import timeit, synthetic_neurons_lite_vec_u8
+
+
+def uncached_from_scale_encoding( vec_u8, type_name: ChainDataType, is_vec: bool = False ):
+    r""" The decode path before the runtime cache: a fresh registry per call. """
+    rpc_runtime_config = RuntimeConfigurationObject()
+    rpc_runtime_config.update_type_registry( load_type_registry_preset( "legacy" ) )
+    rpc_runtime_config.update_type_registry( custom_rpc_type_registry )
+    type_string = f'Vec<{type_name.name}>' if is_vec else type_name.name
+    return rpc_runtime_config.create_scale_object( type_string, data = ScaleBytes( bytes( vec_u8 ) ) ).decode()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--n', type = int, default = 4096, help = 'Number of neurons in the synthetic Vec<NeuronInfoLite>.' )
+    parser.add_argument( '--single_calls', type = int, default = 200, help = 'Number of single neuron decodes.' )
+    args = parser.parse_args()
+
+    single = synthetic_neurons_lite_vec_u8( 1 )[1:]
+    blob = synthetic_neurons_lite_vec_u8( args.n )
+    assert uncached_from_scale_encoding( single, ChainDataType.NeuronInfoLite ) == from_scale_encoding( single, ChainDataType.NeuronInfoLite )
+
+    uncached = timeit( lambda: [ uncached_from_scale_encoding( single, ChainDataType.NeuronInfoLite ) for _ in range( args.single_calls ) ], repeat = 1 )
+    cached = timeit( lambda: [ from_scale_encoding( single, ChainDataType.NeuronInfoLite ) for _ in range( args.single_calls ) ], repeat = 1 )
+    print( f'single NeuronInfoLite decode  uncached: {1e3 * uncached / args.single_calls:8.3f} ms/call   cached: {1e3 * cached / args.single_calls:8.3f} ms/call   speedup: {uncached / cached:6.1f}x' )
+
+    scale_decode = timeit( lambda: from_scale_encoding( blob, ChainDataType.NeuronInfoLite, is_vec = True ), repeat = 1 )
+    list_decode = timeit( lambda: NeuronInfoLite.list_from_vec_u8( blob ), repeat = 1 )
+    columns_decode = timeit( lambda: NeuronColumns.from_vec_u8( blob ) )
+    print( f'Vec<NeuronInfoLite> n={args.n} ({len(blob)} bytes)  scale decode: {scale_decode:7.3f} s   list_from_vec_u8: {list_decode:7.3f} s   NeuronColumns: {columns_decode:7.3f} s' )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+""" Benchmarks decoding get_delegates() and neurons_lite() results into the slotted lazy chain records against
+    the previous path: a scalecodec decode followed by building every ss58 string, Balance and info object.
+    Both reads then touch uid/take and stake only, as most callers do. Memory is the traced allocation held by
+    the decoded records.
+
+    python -m benchmarks.chain_data_records --delegates 64 --nominators 200 --neurons 1024
+"""
+import gc
+import argparse
+import tracemalloc
+
+from bittensor._subtensor.chain_data import ChainDataType, DelegateInfo, NeuronInfoLite, from_scale_encoding
+from benchmarks.utils import timeit, encode_vec, synthetic_neurons_lite_vec_u8
+
+def synthetic_delegate( index: int, n_nominators: int ) -> dict:
+    return {
+        'delegate_ss58': '0x' + index.to_bytes( 32, 'little' ).hex(),
+        'take': 11796,
+        'nominators': [ ( '0x' + ( 10**6 * ( index + 1 ) + nominator ).to_bytes( 32, 'little' ).hex(), 10**9 + nominator ) for nominator in range( n_nominators ) ],
+        'owner_ss58': '0x' + ( index + 7 ).to_bytes( 32, 'little' ).hex(),
+        'registrations': [ 1, 3 ],
+        'validator_permits': [ 1 ],
+        'return_per_1000': 5 * 10**6,
+        'total_daily_return': 7 * 10**9,
+    }
+
+def eager( records, fields ):
+    r""" Materializes every field, as the dataclasses built them on decode. """
+    for record in records:
+        for name in fields:
+            getattr( record, name )
+    return records
+
+def eager_delegates( vec_u8 ):
+    return eager( [ DelegateInfo.fix_decoded_values( value ) for value in from_scale_encoding( vec_u8, ChainDataType.DelegateInfo, is_vec = True ) ], DelegateInfo._fields )
+
+def eager_neurons( vec_u8 ):
+    return eager( [ NeuronInfoLite.fix_decoded_values( value ) for value in from_scale_encoding( vec_u8, ChainDataType.NeuronInfoLite, is_vec = True ) ], NeuronInfoLite._fields )
+
+def lazy_delegates( vec_u8 ):
+    delegates = DelegateInfo.list_from_vec_u8( vec_u8 )
+    return delegates, [ ( delegate.take, delegate.total_stake ) for delegate in delegates ]
+
+def lazy_neurons( vec_u8 ):
+    neurons = NeuronInfoLite.list_from_vec_u8( vec_u8 )
+    return neurons, [ ( neuron.uid, neuron.stake ) for neuron in neurons ]
+
+def held_bytes( fn, vec_u8 ) -> int:
+    tracemalloc.start()
+    result = fn( vec_u8 )
+    # Drop the decoder's reference cycles, only the records should be counted.
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return held
+
+def report( name: str, n: int, eager_fn, lazy_fn, vec_u8 ):
+    eager_time = timeit( lambda: eager_fn( vec_u8 ), repeat = 1 )
+    lazy_time = timeit( lambda: lazy_fn( vec_u8 ) )
+    eager_bytes, lazy_bytes = held_bytes( eager_fn, vec_u8 ), held_bytes( lazy_fn, vec_u8 )
+    print( '{} ({} records, {} bytes)'.format( name, n, len( vec_u8 ) ) )
+    print( '  eager dataclass path : {:8.3f}s {:10.0f} bytes/record'.format( eager_time, eager_bytes / n ) )
+    print( '  lazy slotted records : {:8.3f}s {:10.0f} bytes/record'.format( lazy_time, lazy_bytes / n ) )
+    print( '  speedup {:.1f}x, memory {:.1f}x smaller'.format( eager_time / lazy_time, eager_bytes / lazy_bytes ) )
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--delegates', type = int, default = 64, help = 'Number of delegates.' )
+    parser.add_argument( '--nominators', type = int, default = 200, help = 'Nominators per delegate.' )
+    parser.add_argument( '--neurons', type = int, default = 1024, help = 'Number of neurons.' )
+    args = parser.parse_args()
+
+    delegates = encode_vec( ChainDataType.DelegateInfo, [ synthetic_delegate( index, args.nominators ) for index in range( args.delegates ) ] )
+    report( 'get_delegates, {} nominators each'.format( args.nominators ), args.delegates, eager_delegates, lazy_delegates, delegates )
+    report( 'neurons_lite', args.neurons, eager_neurons, lazy_neurons, synthetic_neurons_lite_vec_u8( args.neurons ) )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+""" Benchmarks the prompting validator event history. The validator used to keep a SimpleNamespace per forward,
+    holding its tensors, prompt and completions, in a queue.Queue; a per uid mean reward meant walking every event.
+    The EventStore keeps the ( uid, reward ) rows in preallocated ring buffer columns and writes the text to a gzip
+    log. Reports the memory held, the append time and a windowed per uid mean over the history.
+
+    python -m benchmarks.event_store --events 20000 --uids 50
+"""
+import os
+import sys
+import queue
+import random
+import argparse
+import tempfile
+import tracemalloc
+from types import SimpleNamespace
+import torch
+
+from benchmarks.utils import timeit
+
+sys.path.insert( 0, os.path.join( os.path.dirname( __file__ ), '..', 'neurons', 'text', 'prompting', 'validators', 'core' ) )
+from event_store import EventStore
+
+def synthetic_events( n_events: int, n_uids: int, n: int ):
+    rng = random.Random( 0 )
+    for step in range( n_events ):
+        uids = torch.tensor( rng.sample( range( n ), n_uids ) )
+        completions = [ 'completion {} of uid {}'.format( step, uid ) * 8 for uid in uids.tolist() ]
+        yield SimpleNamespace(
+            completion = completions[0], message = 'prompt {}'.format( step ) * 32, uids = uids, rewards = torch.tensor( [ rng.random() for _ in range( n_uids ) ] ),
+            all_uids = uids, all_completions = completions, block = torch.tensor( step // 10 ), is_question = False,
+        )
+
+def queue_history( events ) -> queue.Queue:
+    history = queue.Queue()
+    for event in events: history.put( event )
+    return history
+
+def queue_means( history: queue.Queue, n: int, last_events: int ) -> torch.FloatTensor:
+    sums, counts = torch.zeros( n ), torch.zeros( n )
+    for event in list( history.queue )[ -last_events: ]:
+        sums.index_add_( 0, event.uids, event.rewards )
+        counts.index_add_( 0, event.uids, torch.ones_like( event.rewards ) )
+    return sums / counts.clamp( min = 1 )
+
+def store_history( events, log_path: str ) -> EventStore:
+    store = EventStore( capacity = 1000000, log_path = log_path )
+    for event in events:
+        store.append( event.uids, event.rewards, event.block.item(), event.message, event.completion, event.all_uids, event.all_completions, event.is_question )
+    store.flush()
+    return store
+
+def traced( fn ):
+    r""" Returns fn() and the python memory it allocated, without the tensor storages. """
+    tracemalloc.start()
+    result = fn()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, held
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--events', type = int, default = 20000 )
+    parser.add_argument( '--uids', type = int, default = 50, help = 'Rewarded uids per event.' )
+    parser.add_argument( '--n', type = int, default = 1024, help = 'Uids on the subnet.' )
+    args = parser.parse_args()
+    events = list( synthetic_events( args.events, args.uids, args.n ) )
+    window = args.events // 2
+
+    with tempfile.TemporaryDirectory() as root:
+        log_path = os.path.join( root, 'completions.jsonl.gz' )
+        history, queue_bytes = traced( lambda: queue_history( synthetic_events( args.events, args.uids, args.n ) ) )
+        store = store_history( events, log_path )
+        append = timeit( lambda: store_history( events, os.path.join( root, 'again.jsonl.gz' ) ), repeat = 1 )
+        assert torch.allclose( queue_means( history, args.n, window ), store.mean_rewards( args.n, last_events = window ) )
+        assert torch.equal( EventStore.from_log( log_path ).mean_rewards( args.n ), store.mean_rewards( args.n ) )
+        queue_query = timeit( lambda: queue_means( history, args.n, window ) )
+        store_query = timeit( lambda: store.mean_rewards( args.n, last_events = window ) )
+        log_bytes = os.path.getsize( log_path )
+
+    print( '{} events of {} uids'.format( args.events, args.uids ) )
+    print( '  queue of SimpleNamespace : {:.1f} MB held, without the tensors'.format( queue_bytes / 1e6 ) )
+    print( '  event store              : {:.1f} MB held, {:.1f} MB gzip log, {:.0f}us per append'.format( store.nbytes / 1e6, log_bytes / 1e6, 1e6 * append / args.events ) )
+    print( '  mean rewards over the last {} events'.format( window ) )
+    print( '    queue walk             : {:.4f}s'.format( queue_query ) )
+    print( '    event store            : {:.4f}s'.format( store_query ) )
+    print( '    speedup                : {:.1f}x'.format( queue_query / store_query ) )
+
+if __name__ == '__main__':
+    main()
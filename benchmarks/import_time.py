@@ -0,0 +1,70 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+""" Benchmarks the import cost of the bittensor entry points, each in a fresh interpreter with python -X importtime.
+    The eager case resolves every lazy attribute and default section, which is what import bittensor used to cost.
+
+    python -m benchmarks.import_time --top 8
+"""
+import os
+import sys
+import argparse
+import subprocess
+from typing import Dict, Tuple
+
+ENTRY_POINTS = {
+    'import bittensor': 'import bittensor',
+    'btcli parser': 'import bittensor; bittensor.cli.__create_parser__()',
+    'wallet + defaults': 'import bittensor; bittensor.wallet( _mock = True ); bittensor.defaults.wallet.name',
+    'subtensor': 'import bittensor; bittensor.Subtensor',
+    'eager ( previous import bittensor )': 'import bittensor; [ getattr( bittensor, name ) for name in bittensor._LAZY_ATTRIBUTES ]; bittensor.defaults.load()',
+}
+
+def import_times( code: str ) -> Dict[str, Tuple[float, int]]:
+    r""" Returns the cumulative import seconds and nesting depth of each module imported by code in a fresh
+        interpreter. Depth 0 modules were imported by code itself, their times add up to the total.
+    """
+    root = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+    env = dict( os.environ, PYTHONPATH = root )
+    stderr = subprocess.run( [ sys.executable, '-X', 'importtime', '-c', code ], cwd = root, env = env, capture_output = True, text = True, check = True ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith( 'import time:' ) or 'cumulative' in line: continue
+        _, cumulative, name = line.split( '|' )
+        depth = ( len( name ) - len( name.lstrip() ) - 1 ) // 2
+        times[ name.strip() ] = ( int( cumulative ) / 1e6, depth )
+    return times
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--top', type = int, default = 5, help = 'Number of top level third party imports listed per entry point.' )
+    parser.add_argument( '--repeat', type = int, default = 3, help = 'Runs per entry point, the best one is reported.' )
+    args = parser.parse_args()
+
+    for label, code in ENTRY_POINTS.items():
+        runs = [ import_times( code ) for _ in range( args.repeat ) ]
+        top_levels = [ { name: seconds for name, ( seconds, depth ) in times.items() if depth == 0 } for times in runs ]
+        top_level = min( top_levels, key = lambda times: sum( times.values() ) )
+        # Third party modules imported while bittensor resolved the attribute, at any depth.
+        best = runs[ top_levels.index( top_level ) ]
+        children = { name: seconds for name, ( seconds, depth ) in best.items() if '.' not in name and not name.startswith( ( '_', 'bittensor' ) ) }
+        heaviest = sorted( children.items(), key = lambda item: -item[1] )[ :args.top ]
+        print( '{:38s}: {:6.3f}s total, import bittensor {:6.3f}s'.format( label, sum( top_level.values() ), top_level.get( 'bittensor', 0.0 ) ) )
+        print( '    ' + ', '.join( '{} {:.3f}s'.format( name, seconds ) for name, seconds in heaviest ) )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+""" Benchmarks the per request hotkey lookups of the miner priority and blacklist functions, replaying one second
+    of traffic at --rps requests per second against a metagraph of --n neurons.
+
+    python -m benchmarks.metagraph_lookup --n 4096 --rps 1000
+"""
+import random
+import argparse
+
+from benchmarks.utils import timeit, synthetic_neurons_lite_vec_u8
+from benchmarks.metagraph_sync import columnar_sync
+
+
+def list_lookups( metagraph, src_hotkey: str ):
+    r""" priority() then blacklist() before the key index: a hotkeys list rebuilt and scanned on every access. """
+    priority = metagraph.S[ metagraph.hotkeys.index( src_hotkey ) ].item() if src_hotkey in metagraph.hotkeys else 0.0
+    is_registered = src_hotkey in metagraph.hotkeys
+    stake = metagraph.S[ metagraph.hotkeys.index( src_hotkey ) ].item() if is_registered else 0.0
+    return priority, is_registered, stake
+
+def index_lookups( metagraph, src_hotkey: str ):
+    uid = metagraph.uid_for_hotkey( src_hotkey )
+    priority = metagraph.S[ uid ].item() if uid is not None else 0.0
+    stake = metagraph.S[ uid ].item() if uid is not None else 0.0
+    return priority, uid is not None, stake
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--n', type = int, default = 4096, help = 'Number of neurons in the synthetic subnet.' )
+    parser.add_argument( '--rps', type = int, default = 1000, help = 'Requests in the replayed second of traffic.' )
+    args = parser.parse_args()
+
+    metagraph = columnar_sync( synthetic_neurons_lite_vec_u8( args.n, distinct = args.n ) )
+    hotkeys = metagraph.hotkeys
+    # One request in ten comes from a hotkey which is not registered.
+    rng = random.Random( 0 )
+    requests = [ rng.choice( hotkeys ) if i % 10 else '5' + str( i ) for i in range( args.rps ) ]
+    assert [ list_lookups( metagraph, hotkey ) for hotkey in requests ] == [ index_lookups( metagraph, hotkey ) for hotkey in requests ]
+
+    before = timeit( lambda: [ list_lookups( metagraph, hotkey ) for hotkey in requests ], repeat = 1 )
+    after = timeit( lambda: [ index_lookups( metagraph, hotkey ) for hotkey in requests ] )
+    print( f'{args.rps} requests against n={args.n}  hotkeys list: {before:7.3f} s   key index: {after:7.4f} s   speedup: {before / after:6.1f}x' )
+    print( f'share of one core spent on lookups at {args.rps} rps  hotkeys list: {100 * before:6.1f}%   key index: {100 * after:6.2f}%' )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+""" Benchmarks metagraph snapshots against the previous pickled state_dict files.
+
+    python -m benchmarks.metagraph_snapshot --n 4096 --blocks 50
+"""
+import os
+import argparse
+import tempfile
+import torch
+import bittensor
+
+from benchmarks.utils import timeit, synthetic_neurons_lite_vec_u8
+from benchmarks.metagraph_sync import columnar_sync
+
+
+def pickle_save( metagraph, dir_path: str ):
+    r""" The save path before snapshots: torch.save of the state_dict and axons, then reloaded. """
+    state_dict = metagraph.state_dict()
+    state_dict['axons'] = list( metagraph.axons )
+    graph_file = os.path.join( dir_path, 'block-{}.pt'.format( metagraph.block.item() ) )
+    torch.save( state_dict, graph_file )
+    torch.load( graph_file )
+
+def directory_size( dir_path: str ) -> int:
+    return sum( os.path.getsize( os.path.join( dir_path, name ) ) for name in os.listdir( dir_path ) )
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--n', type = int, default = 4096, help = 'Number of neurons in the synthetic subnet.' )
+    parser.add_argument( '--blocks', type = int, default = 50, help = 'Number of saved blocks to iterate over.' )
+    args = parser.parse_args()
+
+    metagraph = columnar_sync( synthetic_neurons_lite_vec_u8( args.n ) )
+    with tempfile.TemporaryDirectory() as legacy_dir, tempfile.TemporaryDirectory() as snapshot_dir:
+        for block in range( args.blocks ):
+            metagraph.block.data = torch.tensor( block )
+            pickle_save( metagraph, legacy_dir )
+            metagraph.save_to_path( snapshot_dir )
+
+        print( f'n={args.n}  save  pickle: {timeit( lambda: pickle_save( metagraph, legacy_dir ) ):7.4f} s   snapshot: {timeit( lambda: metagraph.save_to_path( snapshot_dir ) ):7.4f} s' )
+        legacy_load = timeit( lambda: bittensor.metagraph( netuid = 1, network = 'mock', sync = False ).load_from_path( legacy_dir ) )
+        snapshot_load = timeit( lambda: bittensor.metagraph( netuid = 1, network = 'mock', sync = False ).load_from_path( snapshot_dir ) )
+        print( f'n={args.n}  load latest  pickle: {legacy_load:7.4f} s   snapshot: {snapshot_load:7.4f} s' )
+
+        legacy_files = [ os.path.join( legacy_dir, name ) for name in sorted( os.listdir( legacy_dir ) ) ]
+        legacy_scan = timeit( lambda: [ torch.load( path )['total_stake'].sum() for path in legacy_files ], repeat = 1 )
+        snapshot_scan = timeit( lambda: [ graph.total_stake.sum() for graph in metagraph.iter_blocks( dir_path = snapshot_dir ) ], repeat = 1 )
+        print( f'n={args.n}  total stake over {args.blocks} blocks  pickle: {legacy_scan:7.4f} s   snapshot: {snapshot_scan:7.4f} s' )
+        print( f'n={args.n}  disk  pickle: {directory_size( legacy_dir ) / 2**20:7.2f} MB   snapshot: {directory_size( snapshot_dir ) / 2**20:7.2f} MB' )
+
+if __name__ == '__main__':
+    main()
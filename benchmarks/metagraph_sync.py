@@ -0,0 +1,78 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+""" Benchmarks building the metagraph tensors from a neuronInfo_getNeuronsLite result, with the rpc round-trip mocked out.
+
+    python -m benchmarks.metagraph_sync --n 4096
+"""
+import argparse
+import torch
+import bittensor
+from unittest.mock import MagicMock, patch
+from bittensor._subtensor.chain_data import ChainDataType, from_scale_encoding
+
+from benchmarks.utils import timeit, synthetic_neurons_lite_vec_u8
+
+
+def object_sync( vec_u8 ):
+    r""" The sync path before the columnar decode: neuron objects, then one list comprehension per tensor. """
+    decoded = from_scale_encoding( vec_u8, ChainDataType.NeuronInfoLite, is_vec = True )
+    neurons = [ bittensor.NeuronInfoLite.fix_decoded_values( value ) for value in decoded ]
+    tensors = {
+        'uids': torch.tensor( [ neuron.uid for neuron in neurons ], dtype = torch.int64 ),
+        'trust': torch.tensor( [ neuron.trust for neuron in neurons ], dtype = torch.float32 ),
+        'consensus': torch.tensor( [ neuron.consensus for neuron in neurons ], dtype = torch.float32 ),
+        'incentive': torch.tensor( [ neuron.incentive for neuron in neurons ], dtype = torch.float32 ),
+        'dividends': torch.tensor( [ neuron.dividends for neuron in neurons ], dtype = torch.float32 ),
+        'ranks': torch.tensor( [ neuron.rank for neuron in neurons ], dtype = torch.float32 ),
+        'emission': torch.tensor( [ neuron.emission for neuron in neurons ], dtype = torch.float32 ),
+        'active': torch.tensor( [ neuron.active for neuron in neurons ], dtype = torch.int64 ),
+        'last_update': torch.tensor( [ neuron.last_update for neuron in neurons ], dtype = torch.int64 ),
+        'validator_permit': torch.tensor( [ neuron.validator_permit for neuron in neurons ], dtype = torch.bool ),
+        'validator_trust': torch.tensor( [ neuron.validator_trust for neuron in neurons ], dtype = torch.float32 ),
+        'total_stake': torch.tensor( [ neuron.total_stake.tao for neuron in neurons ], dtype = torch.float32 ),
+        'stake': torch.tensor( [ float( neuron.stake ) for neuron in neurons ], dtype = torch.float32 ),
+    }
+    axons = [ neuron.axon_info for neuron in neurons ]
+    return tensors, axons
+
+def columnar_sync( vec_u8 ) -> 'bittensor.metagraph':
+    subtensor = MagicMock( block = 1 )
+    subtensor.neuron_columns.side_effect = lambda **kwargs: bittensor.NeuronColumns.from_vec_u8( vec_u8 )
+    with patch( 'bittensor.subtensor', return_value = subtensor ):
+        return bittensor.metagraph( netuid = 1, network = 'mock', sync = False ).sync( lite = True )
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--n', type = int, default = 4096, help = 'Number of neurons in the synthetic subnet.' )
+    args = parser.parse_args()
+
+    vec_u8 = synthetic_neurons_lite_vec_u8( args.n )
+    tensors, axons = object_sync( vec_u8 )
+    metagraph = columnar_sync( vec_u8 )
+    for name, tensor in tensors.items():
+        assert torch.equal( tensor, getattr( metagraph, name ) ), name
+    assert list( metagraph.axons ) == axons
+
+    before = timeit( lambda: object_sync( vec_u8 ), repeat = 1 )
+    after = timeit( lambda: columnar_sync( vec_u8 ) )
+    hotkeys = timeit( lambda: columnar_sync( vec_u8 ).hotkeys, repeat = 1 )
+    print( f'metagraph sync n={args.n}  neuron objects: {before:7.3f} s   columns: {after:7.3f} s   speedup: {before / after:6.1f}x   columns + hotkeys: {hotkeys:7.3f} s' )
+
+if __name__ == '__main__':
+    main()
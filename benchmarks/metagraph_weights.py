@@ -0,0 +1,75 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+""" Benchmarks building the metagraph weights and bonds matrices in dense and sparse layouts.
+
+    python -m benchmarks.metagraph_weights --n 1024 4096
+"""
+import argparse
+import torch
+
+from bittensor.utils import weight_utils
+from benchmarks.utils import timeit
+
+
+def synthetic_entries( n: int, validators: int ):
+    r""" Sparse ( row, uid ) entries where the first validators rows set weights on every uid and the rest are empty. """
+    rows = torch.arange( validators ).repeat_interleave( n )
+    cols = torch.arange( n ).repeat( validators )
+    values = torch.randint( 1, 65536, ( validators * n, ) )
+    return torch.stack( [ rows, cols ] ), values
+
+def per_row_dense( n: int, index: torch.LongTensor, values: torch.LongTensor ):
+    r""" The sync path before the matrix converters: one converted row per neuron, then stacked. """
+    counts = torch.bincount( index[0], minlength = n ).tolist()
+    cols, vals = index[1].split( counts ), values.split( counts )
+    weights, bonds = [], []
+    for row in range( n ):
+        if counts[ row ] == 0:
+            weights.append( torch.zeros( n ) )
+            bonds.append( torch.zeros( n ) )
+        else:
+            weights.append( weight_utils.convert_weight_uids_and_vals_to_tensor( n, cols[ row ].tolist(), vals[ row ].tolist() ) )
+            bonds.append( weight_utils.convert_bond_uids_and_vals_to_tensor( n, cols[ row ].tolist(), vals[ row ].tolist() ) )
+    return torch.stack( weights ), torch.stack( bonds )
+
+def nbytes( x: torch.Tensor ) -> int:
+    if x.layout == torch.sparse_coo:
+        return nbytes( x.indices() ) + nbytes( x.values() )
+    elif x.layout == torch.sparse_csr:
+        return nbytes( x.crow_indices() ) + nbytes( x.col_indices() ) + nbytes( x.values() )
+    return x.numel() * x.element_size()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--n', type = int, nargs = '+', default = [ 1024, 4096 ], help = 'Subnet sizes to benchmark.' )
+    parser.add_argument( '--validators', type = int, default = 128, help = 'Number of rows with weights set.' )
+    args = parser.parse_args()
+
+    for n in args.n:
+        index, values = synthetic_entries( n, min( n, args.validators ) )
+        before = timeit( lambda: per_row_dense( n, index, values ), repeat = 1 )
+        print( f'n={n} nnz={values.numel()}  per row dense: {before:7.3f} s' )
+        for layout in ( torch.strided, torch.sparse_coo, torch.sparse_csr ):
+            build = lambda: ( weight_utils.convert_sparse_weights_to_tensor( n, index, values, layout = layout ), weight_utils.convert_sparse_bonds_to_tensor( n, index, values, layout = layout ) )
+            weights, bonds = build()
+            seconds = timeit( build )
+            print( f'n={n}  {str(layout):18s}  build: {seconds:7.3f} s   W: {nbytes( weights ) / 2**20:8.2f} MB   B: {nbytes( bonds ) / 2**20:8.2f} MB' )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+""" Benchmarks the prompting validator RewardModel.reward() on CPU with a tiny randomly initialised GPT-J and a
+    word level tokenizer built on the fly, so nothing is downloaded. Compares the previous one sample at a time path,
+    padded to 550 tokens and duplicated into a chosen and rejected row, against the length bucketed micro-batches.
+
+    python -m benchmarks.reward_model --samples 64
+"""
+import os
+import sys
+import random
+import argparse
+import tempfile
+import torch
+
+from transformers import GPTJConfig, PreTrainedTokenizerFast
+from tokenizers import Tokenizer, models, pre_tokenizers
+
+from benchmarks.utils import timeit
+
+sys.path.insert( 0, os.path.join( os.path.dirname( __file__ ), '..', 'neurons', 'text', 'prompting', 'validators', 'core' ) )
+from reward import RewardModel
+
+WORDS = [ 'word{}'.format( i ) for i in range( 500 ) ]
+
+def tiny_reward_model( path: str ) -> RewardModel:
+    GPTJConfig( vocab_size = len( WORDS ) + 2, n_positions = 1024, n_embd = 64, n_layer = 2, n_head = 4, rotary_dim = 8 ).save_pretrained( path )
+    vocab = { word: i for i, word in enumerate( [ '[UNK]', '<|endoftext|>' ] + WORDS ) }
+    tokenizer = Tokenizer( models.WordLevel( vocab = vocab, unk_token = '[UNK]' ) )
+    tokenizer.pre_tokenizer = pre_tokenizers.WhitespaceSplit()
+    PreTrainedTokenizerFast( tokenizer_object = tokenizer, eos_token = '<|endoftext|>', unk_token = '[UNK]' ).save_pretrained( path )
+    torch.manual_seed( 0 )
+    return RewardModel( model_path = path, device = 'cpu', tokenizer_path = path ).eval()
+
+def per_sample_reward( model: RewardModel, samples ) -> torch.FloatTensor:
+    r""" The reward_fn of RewardModel.reward() before batching, applied to each sample. """
+    scores = []
+    for sample in samples:
+        encodings_dict = model.tokenizer( [ "<|startoftext|>" + sample + "<|endoftext|>" ], truncation = False, max_length = 550, padding = "max_length", return_tensors = "pt" )
+        input_ids = encodings_dict["input_ids"].repeat( 2, 1 )
+        attn_masks = encodings_dict["attention_mask"].repeat( 2, 1 )
+        with torch.no_grad():
+            scores.append( model( input_ids = input_ids, attention_mask = attn_masks )["chosen_end_scores"].mean().item() )
+    return torch.tensor( scores, dtype = torch.float32 )
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--samples', type = int, default = 64, help = 'Number of completions to score.' )
+    parser.add_argument( '--batch_size', type = int, default = 16 )
+    args = parser.parse_args()
+
+    rng = random.Random( 0 )
+    # Completion lengths as seen from miners: mostly short, some long.
+    samples = [ ' ' + ' '.join( rng.choice( WORDS ) for _ in range( int( rng.expovariate( 1 / 60 ) ) + 1 ) ) for _ in range( args.samples ) ]
+    with tempfile.TemporaryDirectory() as path:
+        model = tiny_reward_model( path )
+        before = per_sample_reward( model, samples )
+        after = model.end_scores( samples, batch_size = args.batch_size )
+        assert torch.allclose( before, after, atol = 1e-4 ), ( before - after ).abs().max()
+
+        slow = timeit( lambda: per_sample_reward( model, samples ), repeat = 1 )
+        fast = timeit( lambda: model.end_scores( samples, batch_size = args.batch_size ) )
+        print( f'{args.samples} completions  per sample: {slow:7.3f} s   batched: {fast:7.3f} s   speedup: {slow / fast:6.1f}x   max abs diff: {( before - after ).abs().max().item():.2e}' )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+""" Benchmarks the per call overhead of the dendrite rpc logging, log_outbound then log_inbound, for a validator
+    querying every uid. The previous path, with debug off, still computed the shapes, formatted every field and
+    had loguru build a record which the sink filter then dropped.
+
+    python -m benchmarks.rpc_log --calls 20000
+"""
+import os
+import time
+import argparse
+import tempfile
+from types import SimpleNamespace
+
+import torch
+import bittensor
+from loguru import logger
+from benchmarks.utils import timeit
+
+class Call:
+    r""" The fields DendriteCall.log_outbound and log_inbound read. """
+    is_forward = True
+    name = 'text_prompting'
+    return_message = 'Success'
+    return_code = bittensor.proto.ReturnCode.Success
+    elapsed = 0.42
+    dest_hotkey = '5C4hrfjw9DjXZTzV3MwzrrAr9P1MJhSrvWGWqi1eSuyUpnhM'
+
+    def __init__( self, uid: int ):
+        self.dendrite = SimpleNamespace( uid = uid )
+        self.messages = [ 'system prompt', 'user question' ]
+        self.completion = 'answer'
+
+    def get_inputs_shape( self ) -> torch.Size:
+        return torch.Size( [ len( message ) for message in self.messages ] )
+
+    def get_outputs_shape( self ) -> torch.Size:
+        return torch.Size( [ len( self.completion ) ] )
+
+def log_calls( calls ):
+    for call in calls:
+        bittensor.DendriteCall.log_outbound( call )
+        bittensor.DendriteCall.log_inbound( call )
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--calls', type = int, default = 20000, help = 'Number of logged calls.' )
+    args = parser.parse_args()
+    calls = [ Call( uid % 1024 ) for uid in range( args.calls ) ]
+
+    # A sink which accepts nothing, as the stdout sink filters out debug records when debug is off.
+    bittensor.logging.set_debug( False )
+    logger.remove()
+    logger.add( lambda message: None, level = 0, filter = lambda record: False )
+
+    bittensor.logging.set_debug( True )
+    formatted = timeit( lambda: log_calls( calls ) )
+    bittensor.logging.set_debug( False )
+    short_circuit = timeit( lambda: log_calls( calls ) )
+
+    with tempfile.TemporaryDirectory() as directory:
+        sink = bittensor.logging.add_rpc_sink( os.path.join( directory, 'rpc.jsonl' ) )
+        queued = timeit( lambda: log_calls( calls ) )
+        start = time.perf_counter()
+        sink.flush()
+        drained = time.perf_counter() - start
+        bittensor.logging.remove_rpc_sink()
+
+    per_call = lambda seconds: 1e6 * seconds / args.calls
+    print( 'rpc logging of {} dendrite calls ( outbound + inbound )'.format( args.calls ) )
+    print( '  formatted then filtered out : {:7.2f} us/call'.format( per_call( formatted ) ) )
+    print( '  level short-circuit         : {:7.2f} us/call'.format( per_call( short_circuit ) ) )
+    print( '  structured sink, caller side: {:7.2f} us/call ( {} written, {} dropped, drained in {:.3f}s )'.format( per_call( queued ), sink.stats.written, sink.stats.dropped, drained ) )
+    print( '  speedup ( debug off )       : {:.1f}x'.format( formatted / short_circuit ) )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+""" Benchmarks the chain reads of a validator step against a simulated node with a fixed round trip time,
+    with and without the subtensor query cache: the block is read a few times per step and the weight
+    hyperparameters once per step, all within one block.
+
+    python -m benchmarks.subtensor_cache --steps 10 --rtt 0.05
+"""
+import argparse
+from types import SimpleNamespace
+
+import bittensor
+from benchmarks.utils import timeit
+from benchmarks.subtensor_snapshot import SimulatedNode
+
+def step( subtensor ):
+    for _ in range( 3 ):
+        subtensor.block
+    return (
+        subtensor.min_allowed_weights( netuid = 1 ),
+        subtensor.max_weight_limit( netuid = 1 ),
+        subtensor.subnetwork_n( netuid = 1 ),
+        subtensor.validator_epoch_length( netuid = 1 ),
+        subtensor.tempo( netuid = 1 ),
+    )
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--steps', type = int, default = 10, help = 'Validator steps per block.' )
+    parser.add_argument( '--rtt', type = float, default = 0.05, help = 'Simulated round trip time in seconds.' )
+    args = parser.parse_args()
+
+    node = SimulatedNode( SimpleNamespace( rtt = args.rtt, neurons = 1, subnets = 1 ) )
+    subtensor = bittensor.Subtensor( substrate = node, network = 'simulated', chain_endpoint = node.url )
+    uncached = timeit( lambda: [ step( subtensor ) for _ in range( args.steps ) ], repeat = 1 )
+    cache = subtensor.enable_cache()
+    cached = timeit( lambda: [ step( subtensor ) for _ in range( args.steps ) ], repeat = 1 )
+
+    print( '{} validator steps in one block, rtt {:.0f}ms'.format( args.steps, 1000 * args.rtt ) )
+    print( '  uncached : {:.3f}s'.format( uncached ) )
+    print( '  cached   : {:.3f}s ({} hits, {} misses)'.format( cached, cache.stats.hits, cache.stats.misses ) )
+    print( '  speedup  : {:.1f}x'.format( uncached / cached ) )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+""" Benchmarks a validator loop reading the chain through a simulated node with a fixed round trip time.
+    The legacy connection closes its websocket after every call and reconnects on the next one, the pooled
+    connection stays open. The async variant then overlaps the chain reads of each step with a simulated
+    dendrite query through AsyncSubtensor.
+
+    python -m benchmarks.subtensor_pool --steps 5 --rtt 0.05 --dendrite 0.2
+"""
+import time
+import asyncio
+import argparse
+from types import SimpleNamespace
+
+import bittensor
+from benchmarks.utils import timeit
+from benchmarks.subtensor_snapshot import SimulatedNode
+
+class PooledNode( SimulatedNode ):
+    r""" SimulatedNode whose websocket stays open when a `with` block exits, as PooledSubstrateInterface does. """
+    def __exit__( self, *args ): pass
+
+def reads( subtensor ):
+    return subtensor.block, subtensor.neurons_lite( netuid = 1 ), subtensor.tempo( netuid = 1 ), subtensor.subnetwork_n( netuid = 1 )
+
+def sync_loop( subtensor, args ):
+    for _ in range( args.steps ):
+        reads( subtensor )
+        time.sleep( args.dendrite )
+
+def async_loop( subtensor, args ):
+    async def run():
+        with subtensor.as_async() as async_subtensor:
+            for _ in range( args.steps ):
+                await asyncio.gather( async_subtensor.run( reads, subtensor ), asyncio.sleep( args.dendrite ) )
+    asyncio.run( run() )
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--steps', type = int, default = 5, help = 'Validator steps.' )
+    parser.add_argument( '--rtt', type = float, default = 0.05, help = 'Simulated round trip time in seconds.' )
+    parser.add_argument( '--dendrite', type = float, default = 0.2, help = 'Simulated dendrite query time per step in seconds.' )
+    args = parser.parse_args()
+
+    node_args = SimpleNamespace( rtt = args.rtt, neurons = 16, subnets = 1 )
+    legacy = bittensor.Subtensor( substrate = SimulatedNode( node_args ), network = 'simulated', chain_endpoint = 'ws://127.0.0.1:9944' )
+    pooled = bittensor.Subtensor( substrate = PooledNode( node_args ), network = 'simulated', chain_endpoint = 'ws://127.0.0.1:9944' )
+    per_call = timeit( lambda: sync_loop( legacy, args ), repeat = 1 )
+    persistent = timeit( lambda: sync_loop( pooled, args ), repeat = 1 )
+    overlapped = timeit( lambda: async_loop( pooled, args ), repeat = 1 )
+
+    print( '{} validator steps, rtt {:.0f}ms, dendrite {:.0f}ms'.format( args.steps, 1000 * args.rtt, 1000 * args.dendrite ) )
+    print( '  reconnect per call : {:.3f}s'.format( per_call ) )
+    print( '  pooled connection  : {:.3f}s'.format( persistent ) )
+    print( '  pooled + async     : {:.3f}s'.format( overlapped ) )
+    print( '  speedup            : {:.1f}x'.format( per_call / overlapped ) )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+""" Benchmarks the chain reads of btcli overview against a simulated node with a fixed round trip time: the
+    per call reads the command used to issue (one reconnect and request per subnet, tempo and balance) against
+    one pinned SubtensorSnapshot fanning the subnets out over pooled connections.
+
+    python -m benchmarks.subtensor_snapshot --subnets 32 --neurons 256 --coldkeys 8 --rtt 0.05
+"""
+import copy
+import time
+import argparse
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import bittensor
+from bittensor._subtensor.chain_data import ChainDataType, get_decoder_class
+from benchmarks.utils import timeit, synthetic_neurons_lite_vec_u8
+
+def synthetic_subnet_info( netuid: int ) -> dict:
+    info = { name: 0 for name in (
+        'rho', 'kappa', 'difficulty', 'immunity_period', 'validator_batch_size', 'validator_sequence_length',
+        'validator_epochs_per_reset', 'validator_epoch_length', 'max_allowed_validators', 'min_allowed_weights',
+        'max_weights_limit', 'scaling_law_power', 'synergy_scaling_law_power', 'subnetwork_n', 'max_allowed_uids',
+        'blocks_since_last_step', 'network_modality', 'emission_values', 'burn' ) }
+    info.update( netuid = netuid, tempo = 99, network_connect = [] )
+    return info
+
+class SimulatedNode:
+    r""" Stands in for a SubstrateInterface: every request waits one round trip, and a closed websocket
+        costs one more round trip to reconnect, as the `with self.substrate` blocks of Subtensor do.
+    """
+    def __init__( self, args ):
+        self.rtt = args.rtt
+        self.connected = False
+        self.url = 'ws://127.0.0.1:9944'
+        self.neurons = synthetic_neurons_lite_vec_u8( args.neurons )
+        subnets = [ synthetic_subnet_info( netuid ) for netuid in range( args.subnets ) ]
+        self.subnets = list( get_decoder_class( ChainDataType.SubnetInfo, is_vec = True, is_option = True )().encode( subnets ).data )
+        self.netuids = [ ( SimpleNamespace( value = netuid ), True ) for netuid in range( args.subnets ) ]
+
+    def fork( self ) -> 'SimulatedNode':
+        r""" Returns a new, not yet connected, websocket to the same node. """
+        connection = copy.copy( self )
+        connection.connected = False
+        return connection
+
+    def __enter__( self ): return self
+    def __exit__( self, *args ): self.close()
+    def close( self ): self.connected = False
+
+    def _round_trip( self ):
+        if not self.connected:
+            time.sleep( self.rtt )
+            self.connected = True
+        time.sleep( self.rtt )
+
+    def rpc_request( self, method, params ):
+        self._round_trip()
+        return { 'result': self.subnets if method == 'subnetInfo_getSubnetsInfo' else self.neurons }
+
+    def query( self, module, storage_function, params, block_hash = None, round_trip = True ):
+        if round_trip: self._round_trip()
+        if storage_function == 'Account': return SimpleNamespace( value = { 'data': { 'free': 10**9 } } )
+        return SimpleNamespace( value = 99 if storage_function == 'Tempo' else True )
+
+    def query_storage_at( self, queries, block_hash = None ):
+        r""" Stands in for bittensor._subtensor.storage.query_storage_at: one round trip for every query. """
+        self._round_trip()
+        return [ self.query( module, storage_function, params, block_hash, round_trip = False ) for module, storage_function, params in queries ]
+
+    def query_map( self, module, storage_function, params, block_hash = None ):
+        self._round_trip()
+        return _Records( self.netuids )
+
+    def get_block_number( self, block_hash ):
+        self._round_trip()
+        return 1000
+
+    def get_block_hash( self, block ):
+        self._round_trip()
+        return '0x{:064x}'.format( block )
+
+    def get_chain_head( self ):
+        self._round_trip()
+        return '0x{:064x}'.format( 1000 )
+
+class _Records( list ):
+    @property
+    def records( self ): return self
+
+def per_call( subtensor, coldkeys ):
+    block = subtensor.block
+    balances = [ subtensor.get_balance( coldkey ) for coldkey in coldkeys ]
+    netuids = subtensor.get_all_subnet_netuids()
+    neurons = { netuid: subtensor.neurons_lite( netuid = netuid ) for netuid in netuids }
+    tempos = { netuid: subtensor.tempo( netuid = netuid ) for netuid in netuids }
+    return block, balances, neurons, tempos
+
+def snapshot( subtensor, coldkeys, workers ):
+    with subtensor.snapshot( max_workers = workers ) as view:
+        balances = list( view.get_balances_for( coldkeys ).values() )
+        tempos = view.tempos()
+        neurons = view.neurons_lite_for( list( tempos.keys() ) )
+        return view.block, balances, neurons, tempos
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--subnets', type = int, default = 32, help = 'Subnets on the simulated chain.' )
+    parser.add_argument( '--neurons', type = int, default = 256, help = 'Neurons per subnet.' )
+    parser.add_argument( '--coldkeys', type = int, default = 8, help = 'Coldkey balances read, as btcli overview --all.' )
+    parser.add_argument( '--workers', type = int, default = 32, help = 'Snapshot max_workers.' )
+    parser.add_argument( '--rtt', type = float, default = 0.05, help = 'Simulated round trip time in seconds.' )
+    args = parser.parse_args()
+
+    node = SimulatedNode( args )
+    subtensor = bittensor.Subtensor( substrate = node, network = 'simulated', chain_endpoint = node.url )
+    coldkeys = [ str( i ) for i in range( args.coldkeys ) ]
+    with patch.object( bittensor.SubtensorSnapshot, '_open_connection', lambda view: node.fork() ), \
+            patch( 'bittensor._subtensor.snapshot.query_storage_at', lambda substrate, queries, block_hash: substrate.query_storage_at( queries, block_hash ) ):
+        legacy_result, pinned_result = per_call( subtensor, coldkeys ), snapshot( subtensor, coldkeys, args.workers )
+        assert legacy_result == pinned_result
+        legacy = timeit( lambda: per_call( subtensor, coldkeys ), repeat = 3 )
+        pinned = timeit( lambda: snapshot( subtensor, coldkeys, args.workers ), repeat = 3 )
+
+    print( 'subnets {} x {} neurons, {} coldkeys, rtt {:.0f}ms'.format( args.subnets, args.neurons, args.coldkeys, 1000 * args.rtt ) )
+    print( '  per call reads : {:.3f}s ({:.1f} rtt)'.format( legacy, legacy / args.rtt ) )
+    print( '  snapshot       : {:.3f}s ({:.1f} rtt)'.format( pinned, pinned / args.rtt ) )
+    print( '  speedup        : {:.1f}x'.format( legacy / pinned ) )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+""" Benchmarks a burst of concurrent forward requests answered one generate call per request, as a miner forward()
+    does, against the SynapseBatcher grouping them into forward_batch calls. Uses a tiny randomly initialised GPT-2
+    and a word level tokenizer built on the fly, on CPU.
+
+    python -m benchmarks.synapse_batching --requests 32 --workers 8
+"""
+import random
+import argparse
+import concurrent.futures
+import torch
+
+from transformers import GPT2Config, GPT2LMHeadModel, PreTrainedTokenizerFast
+from tokenizers import Tokenizer, models, pre_tokenizers
+
+from bittensor._synapse.batcher import SynapseBatcher
+from benchmarks.utils import timeit
+
+WORDS = [ 'word{}'.format( i ) for i in range( 500 ) ]
+
+class TinyMiner:
+    def __init__( self, max_new_tokens: int ):
+        vocab = { word: i for i, word in enumerate( [ '[UNK]', '<|endoftext|>' ] + WORDS ) }
+        tokenizer = Tokenizer( models.WordLevel( vocab = vocab, unk_token = '[UNK]' ) )
+        tokenizer.pre_tokenizer = pre_tokenizers.WhitespaceSplit()
+        self.tokenizer = PreTrainedTokenizerFast( tokenizer_object = tokenizer, eos_token = '<|endoftext|>', unk_token = '[UNK]', pad_token = '<|endoftext|>', padding_side = 'left' )
+        torch.manual_seed( 0 )
+        self.model = GPT2LMHeadModel( GPT2Config( vocab_size = len( vocab ), n_positions = 512, n_embd = 128, n_layer = 4, n_head = 4 ) ).eval()
+        self.max_new_tokens = max_new_tokens
+
+    def forward( self, prompt: str ) -> str:
+        return self.forward_batch( [ prompt ] )[0]
+
+    def forward_batch( self, prompts ):
+        inputs = self.tokenizer( prompts, return_tensors = 'pt', padding = True )
+        with torch.no_grad():
+            output = self.model.generate( **inputs, max_new_tokens = self.max_new_tokens, do_sample = False, pad_token_id = self.tokenizer.eos_token_id )
+        return self.tokenizer.batch_decode( output[ :, inputs['input_ids'].shape[1]: ], skip_special_tokens = True )
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--requests', type = int, default = 32, help = 'Concurrent requests in the burst.' )
+    parser.add_argument( '--workers', type = int, default = 8, help = 'Axon worker threads, the upper bound of a batch.' )
+    parser.add_argument( '--max_new_tokens', type = int, default = 32 )
+    args = parser.parse_args()
+
+    torch.set_num_threads( 1 )
+    miner = TinyMiner( args.max_new_tokens )
+    rng = random.Random( 0 )
+    prompts = [ ' '.join( rng.choice( WORDS ) for _ in range( rng.randint( 10, 40 ) ) ) for _ in range( args.requests ) ]
+    batcher = SynapseBatcher( miner.forward_batch, max_batch_size = args.workers, max_wait_ms = 5 )
+
+    def burst( forward ):
+        with concurrent.futures.ThreadPoolExecutor( max_workers = args.workers ) as executor:
+            return list( executor.map( forward, prompts ) )
+
+    unbatched = timeit( lambda: burst( miner.forward ), repeat = 1 )
+    batched = timeit( lambda: burst( batcher.submit ), repeat = 1 )
+    print( f'{args.requests} requests, {args.workers} workers  one per call: {args.requests / unbatched:7.1f} req/s   batched: {args.requests / batched:7.1f} req/s   speedup: {unbatched / batched:5.1f}x' )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+""" Shared helpers for the standalone micro-benchmarks in this directory. None of them need a chain
+    connection. Run them from the repository root, e.g. python -m benchmarks.chain_data_decode
+"""
+import time
+from typing import Callable, Dict, List
+
+from bittensor._subtensor.chain_data import ChainDataType, get_decoder_class
+
+
+def timeit( fn: Callable, repeat: int = 3 ) -> float:
+    r""" Returns the best wall time in seconds of repeat calls to fn. """
+    best = float('inf')
+    for _ in range( repeat ):
+        start = time.perf_counter()
+        fn()
+        best = min( best, time.perf_counter() - start )
+    return best
+
+def synthetic_neuron_lite( uid: int, n_stakers: int = 1 ) -> Dict:
+    r""" Returns a NeuronInfoLite value dict as the chain would encode it. """
+    hotkey = '0x' + ( 2 * uid ).to_bytes( 32, 'little' ).hex()
+    coldkey = '0x' + ( 2 * uid + 1 ).to_bytes( 32, 'little' ).hex()
+    return {
+        'hotkey': hotkey,
+        'coldkey': coldkey,
+        'uid': uid,
+        'netuid': 1,
+        'active': True,
+        'axon_info': { 'block': uid, 'version': 1, 'ip': 3232235777 + uid, 'port': 8091, 'ip_type': 4, 'protocol': 4, 'placeholder1': 0, 'placeholder2': 0 },
+        'prometheus_info': { 'block': uid, 'version': 1, 'ip': 0, 'port': 0, 'ip_type': 4 },
+        'stake': [ ( coldkey, 10**9 * ( uid + i ) ) for i in range( n_stakers ) ],
+        'rank': ( 7 * uid ) % 65536,
+        'emission': 1000 * uid,
+        'incentive': ( 11 * uid ) % 65536,
+        'consensus': ( 13 * uid ) % 65536,
+        'trust': ( 17 * uid ) % 65536,
+        'validator_trust': ( 19 * uid ) % 65536,
+        'dividends': ( 23 * uid ) % 65536,
+        'last_update': 1000 + uid,
+        'validator_permit': uid % 8 == 0,
+        'pruning_score': ( 29 * uid ) % 65536,
+    }
+
+def synthetic_neuron( uid: int, n: int, n_weights: int = 0 ) -> Dict:
+    r""" Returns a NeuronInfo value dict with n_weights weights and bonds spread over n uids. """
+    neuron = synthetic_neuron_lite( uid )
+    targets = sorted( { ( uid + 31 * i ) % n for i in range( n_weights ) } )
+    neuron['weights'] = [ ( target, ( uid + target ) % 65536 ) for target in targets ]
+    neuron['bonds'] = [ ( target, ( uid * target ) % 65536 ) for target in targets ]
+    return neuron
+
+def encode_vec( type_name: ChainDataType, values: List[Dict] ) -> List[int]:
+    r""" SCALE encodes values as a Vec<type_name>, returning the list of u8 the rpc returns. """
+    return list( get_decoder_class( type_name, is_vec = True )().encode( values ).data )
+
+def synthetic_neurons_lite_vec_u8( n: int, distinct: int = 64 ) -> List[int]:
+    r""" Returns an encoded Vec<NeuronInfoLite> of n neurons. Only the first distinct neurons are encoded,
+        the rest of the blob repeats their bytes, which decodes at the same cost and keeps setup fast.
+    """
+    distinct = min( n, distinct )
+    # Strip the one byte Compact length prefix of each single element vector.
+    encoded = [ encode_vec( ChainDataType.NeuronInfoLite, [ synthetic_neuron_lite( uid ) ] )[1:] for uid in range( distinct ) ]
+    vec_u8 = _compact_length( n )
+    for uid in range( n ):
+        vec_u8.extend( encoded[ uid % distinct ] )
+    return vec_u8
+
+def _compact_length( n: int ) -> List[int]:
+    r""" SCALE Compact<u32> encoding of a vector length. """
+    if n < 1 << 6:
+        return [ n << 2 ]
+    elif n < 1 << 14:
+        return list( ( ( n << 2 ) | 0b01 ).to_bytes( 2, 'little' ) )
+    else:
+        return list( ( ( n << 2 ) | 0b10 ).to_bytes( 4, 'little' ) )
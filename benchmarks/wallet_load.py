@@ -0,0 +1,70 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+""" Benchmarks listing the hotkeys of a coldkey with many hotkeys, as btcli overview, inspect, stake and unstake
+    do. The previous path built a bittensor.wallet per hotkey file, read it twice and derived every keypair from its
+    seed to print the address.
+
+    python -m benchmarks.wallet_load --hotkeys 256
+"""
+import os
+import argparse
+import tempfile
+
+import bittensor
+from benchmarks.utils import timeit
+from bittensor._keyfile.keyfile_impl import keypair_cache, serialized_keypair_to_keyfile_data
+
+def previous_hotkey_addresses( path: str, name: str ):
+    addresses = []
+    for hotkey in next( os.walk( os.path.join( path, name, 'hotkeys' ) ) )[2]:
+        wallet = bittensor.wallet( path = path, name = name, hotkey = hotkey )
+        if wallet.hotkey_file.exists_on_device() and not wallet.hotkey_file.is_encrypted():
+            addresses.append( wallet.hotkey.ss58_address )
+    return addresses
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--hotkeys', type = int, default = 256, help = 'Hotkeys of the coldkey.' )
+    parser.add_argument( '--workers', type = int, default = 8, help = 'Threads of load_all.' )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as path:
+        os.makedirs( os.path.join( path, 'default', 'hotkeys' ) )
+        for index in range( args.hotkeys ):
+            keypair = bittensor.Keypair.create_from_mnemonic( bittensor.Keypair.generate_mnemonic() )
+            with open( os.path.join( path, 'default', 'hotkeys', 'h{}'.format( index ) ), 'wb' ) as file:
+                file.write( serialized_keypair_to_keyfile_data( keypair ) )
+
+        def uncached():
+            keypair_cache.clear()
+            return previous_hotkey_addresses( path, 'default' )
+        previous = timeit( uncached )
+        cached = timeit( lambda: previous_hotkey_addresses( path, 'default' ) )
+        views = timeit( lambda: bittensor.wallet.load_all( path = path, max_workers = args.workers ) )
+
+        expected = sorted( uncached() )
+        assert sorted( view.hotkey_ss58 for view in bittensor.wallet.load_all( path = path ) ) == expected
+
+    print( 'addresses of {} hotkeys'.format( args.hotkeys ) )
+    print( '  wallet per hotkey, keypair derived : {:8.3f}s'.format( previous ) )
+    print( '  wallet per hotkey, keypair cache   : {:8.3f}s'.format( cached ) )
+    print( '  wallet.load_all ( {} threads )      : {:8.3f}s'.format( args.workers, views ) )
+    print( '  speedup                            : {:.1f}x'.format( previous / views ) )
+
+if __name__ == '__main__':
+    main()
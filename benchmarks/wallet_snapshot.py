@@ -0,0 +1,80 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+""" Benchmarks reading five stats of a wallet ( trust, rank, incentive, dividends, validator_permit ) against
+    a simulated node with a fixed round trip time. Each accessor used to check the registration, look the uid up
+    and decode the full neuron, three round trips per stat. They now share one block stamped wallet snapshot.
+
+    python -m benchmarks.wallet_snapshot --rtt 0.05
+"""
+import argparse
+from types import SimpleNamespace
+
+import bittensor
+from benchmarks.utils import timeit, synthetic_neuron
+from benchmarks.subtensor_snapshot import SimulatedNode
+from bittensor._subtensor.chain_data import ChainDataType, get_decoder_class
+
+STATS = ( 'trust', 'rank', 'incentive', 'dividends', 'validator_permit' )
+
+class NeuronNode( SimulatedNode ):
+    r""" Serves the uid and the neuron of a single registered hotkey. """
+    def __init__( self, args ):
+        super().__init__( args )
+        self.neuron = list( get_decoder_class( ChainDataType.NeuronInfo )().encode( synthetic_neuron( 0, 256, n_weights = 64 ) ).data )
+
+    def rpc_request( self, method, params ):
+        if method != 'neuronInfo_getNeuron': return super().rpc_request( method, params )
+        self._round_trip()
+        return { 'result': self.neuron }
+
+    def query( self, module, storage_function, params, block_hash = None, round_trip = True ):
+        if storage_function != 'Uids': return super().query( module, storage_function, params, block_hash, round_trip )
+        if round_trip: self._round_trip()
+        return SimpleNamespace( value = 0 )
+
+def previous_stats( wallet, subtensor ):
+    r""" The previous accessors: is_registered, then neuron_for_wallet, for every stat. """
+    stats = []
+    for name in STATS:
+        assert subtensor.is_hotkey_registered_on_subnet( wallet.hotkey.ss58_address, netuid = 1 )
+        stats.append( getattr( subtensor.neuron_for_wallet( wallet, netuid = 1 ), name ) )
+    return stats
+
+def snapshot_stats( wallet, subtensor ):
+    snapshot = wallet.snapshot( netuid = 1, subtensor = subtensor, refresh = True )
+    return [ getattr( wallet, name )( 1 ) for name in STATS ] if snapshot.is_registered else None
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--rtt', type = float, default = 0.05, help = 'Simulated round trip time in seconds.' )
+    args = parser.parse_args()
+
+    node = NeuronNode( SimpleNamespace( rtt = args.rtt, neurons = 1, subnets = 1 ) )
+    subtensor = bittensor.Subtensor( substrate = node, network = 'simulated', chain_endpoint = node.url )
+    wallet = bittensor.wallet( _mock = True )
+    assert previous_stats( wallet, subtensor ) == snapshot_stats( wallet, subtensor )
+    previous = timeit( lambda: previous_stats( wallet, subtensor ), repeat = 1 )
+    snapshot = timeit( lambda: snapshot_stats( wallet, subtensor ), repeat = 1 )
+
+    print( '{} wallet stats, rtt {:.0f}ms'.format( len( STATS ), 1000 * args.rtt ) )
+    print( '  one neuron read per stat : {:.3f}s'.format( previous ) )
+    print( '  wallet snapshot          : {:.3f}s'.format( snapshot ) )
+    print( '  speedup                  : {:.1f}x'.format( previous / snapshot ) )
+
+if __name__ == '__main__':
+    main()
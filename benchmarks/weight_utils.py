@@ -0,0 +1,126 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+""" Benchmarks the batched weight_utils conversions against the element by element implementations they replaced,
+    and checks that both give bit for bit the same results.
+
+    python -m benchmarks.weight_utils --n 256 1024 4096 --rows 64
+"""
+import argparse
+import torch
+
+from bittensor.utils import weight_utils
+from benchmarks.utils import timeit
+
+U16_MAX = weight_utils.U16_MAX
+
+# The implementations before vectorisation, kept here as the reference.
+def legacy_normalize_max_weight( x: torch.FloatTensor, limit: float = 0.1 ) -> torch.FloatTensor:
+    epsilon = 1e-7
+    weights = x.clone()
+    values, _ = torch.sort( weights )
+    if x.sum() == 0 or len( x ) * limit <= 1:
+        return torch.ones_like( x ) / x.size( 0 )
+    estimation = values / values.sum()
+    if estimation.max() <= limit:
+        return weights / weights.sum()
+    cumsum = torch.cumsum( estimation, 0 )
+    estimation_sum = torch.tensor( [ ( len( values ) - i - 1 ) * estimation[i] for i in range( len( values ) ) ] )
+    n_values = ( estimation / ( estimation_sum + cumsum + epsilon ) < limit ).sum()
+    cutoff_scale = ( limit * cumsum[ n_values - 1 ] - epsilon ) / ( 1 - ( limit * ( len( estimation ) - n_values ) ) )
+    cutoff = cutoff_scale * values.sum()
+    weights[ weights > cutoff ] = cutoff
+    return weights / weights.sum()
+
+def legacy_convert_weight_uids_and_vals_to_tensor( n, uids, weights ):
+    row_weights = torch.zeros( [ n ], dtype = torch.float32 )
+    for uid_j, wij in list( zip( uids, weights ) ):
+        row_weights[ uid_j ] = float( wij )
+    row_sum = row_weights.sum()
+    if row_sum > 0:
+        row_weights /= row_sum
+    return row_weights
+
+def legacy_convert_bond_uids_and_vals_to_tensor( n, uids, bonds ):
+    row_bonds = torch.zeros( [ n ], dtype = torch.int64 )
+    for uid_j, bij in list( zip( uids, bonds ) ):
+        row_bonds[ uid_j ] = int( bij )
+    return row_bonds
+
+def legacy_convert_weights_and_uids_for_emit( uids, weights ):
+    weights = weights.tolist()
+    uids = uids.tolist()
+    if sum( weights ) == 0:
+        return [], []
+    max_weight = float( max( weights ) )
+    weights = [ float( value ) / max_weight for value in weights ]
+    weight_vals, weight_uids = [], []
+    for weight_i, uid_i in list( zip( weights, uids ) ):
+        uint16_val = round( float( weight_i ) * int( U16_MAX ) )
+        if uint16_val != 0:
+            weight_vals.append( uint16_val )
+            weight_uids.append( uid_i )
+    return weight_uids, weight_vals
+
+def synthetic_weights( rows: int, n: int ) -> torch.FloatTensor:
+    r""" Random weights with a heavy tail so that normalize_max_weight clips, a zero row and sparse rows. """
+    weights = torch.rand( rows, n ) ** 8
+    weights[ weights < 0.01 ] = 0
+    weights[ 0 ] = 0
+    return weights
+
+def report( name: str, legacy: float, batched: float, exact: bool ):
+    print( f'  {name:38s} legacy: {legacy * 1e3:9.2f} ms   batched: {batched * 1e3:8.2f} ms   speedup: {legacy / batched:7.1f}x   bit exact: {exact}' )
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument( '--n', type = int, nargs = '+', default = [ 256, 1024, 4096 ], help = 'Subnet sizes to benchmark.' )
+    parser.add_argument( '--rows', type = int, default = 64, help = 'Neurons converted by the matrix forms.' )
+    parser.add_argument( '--limit_scale', type = float, default = 4, help = 'normalize_max_weight limit times n, low enough for the synthetic weights to be clipped.' )
+    args = parser.parse_args()
+
+    torch.manual_seed( 0 )
+    for n in args.n:
+        limit = args.limit_scale / n
+        print( f'n={n} rows={args.rows} limit={limit:.2e}' )
+        weights = synthetic_weights( args.rows, n )
+        uids = torch.arange( n )
+        row = weights[ 1 ]
+        chain_uids = uids[ row > 0 ].tolist()
+        chain_vals = torch.randint( 1, U16_MAX + 1, ( len( chain_uids ), ) ).tolist()
+
+        exact = torch.equal( legacy_convert_weight_uids_and_vals_to_tensor( n, chain_uids, chain_vals ), weight_utils.convert_weight_uids_and_vals_to_tensor( n, chain_uids, chain_vals ) )
+        report( 'convert_weight_uids_and_vals_to_tensor', timeit( lambda: legacy_convert_weight_uids_and_vals_to_tensor( n, chain_uids, chain_vals ) ), timeit( lambda: weight_utils.convert_weight_uids_and_vals_to_tensor( n, chain_uids, chain_vals ) ), exact )
+
+        exact = torch.equal( legacy_convert_bond_uids_and_vals_to_tensor( n, chain_uids, chain_vals ), weight_utils.convert_bond_uids_and_vals_to_tensor( n, chain_uids, chain_vals ) )
+        report( 'convert_bond_uids_and_vals_to_tensor', timeit( lambda: legacy_convert_bond_uids_and_vals_to_tensor( n, chain_uids, chain_vals ) ), timeit( lambda: weight_utils.convert_bond_uids_and_vals_to_tensor( n, chain_uids, chain_vals ) ), exact )
+
+        exact = all( legacy_convert_weights_and_uids_for_emit( uids, w ) == weight_utils.convert_weights_and_uids_for_emit( uids, w ) for w in weights )
+        report( 'convert_weights_and_uids_for_emit', timeit( lambda: legacy_convert_weights_and_uids_for_emit( uids, row ) ), timeit( lambda: weight_utils.convert_weights_and_uids_for_emit( uids, row ) ), exact )
+
+        exact = all( torch.equal( legacy_normalize_max_weight( w, limit ), weight_utils.normalize_max_weight( w, limit ) ) for w in weights )
+        report( 'normalize_max_weight', timeit( lambda: legacy_normalize_max_weight( row, limit ) ), timeit( lambda: weight_utils.normalize_max_weight( row, limit ) ), exact )
+
+        # Matrix forms against one legacy call per neuron.
+        exact = torch.equal( torch.stack( [ legacy_normalize_max_weight( w, limit ) for w in weights ] ), weight_utils.normalize_max_weight( weights, limit ) )
+        report( 'normalize_max_weight [ rows, n ]', timeit( lambda: [ legacy_normalize_max_weight( w, limit ) for w in weights ], repeat = 1 ), timeit( lambda: weight_utils.normalize_max_weight( weights, limit ) ), exact )
+
+        exact = [ list( pair ) for pair in zip( *weight_utils.convert_weight_matrix_for_emit( weights, uids ) ) ] == [ list( legacy_convert_weights_and_uids_for_emit( uids, w ) ) for w in weights ]
+        report( 'convert_weight_matrix_for_emit', timeit( lambda: [ legacy_convert_weights_and_uids_for_emit( uids, w ) for w in weights ], repeat = 1 ), timeit( lambda: weight_utils.convert_weight_matrix_for_emit( weights, uids ) ), exact )
+
+if __name__ == '__main__':
+    main()
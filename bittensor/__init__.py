@@ -15,13 +15,9 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-import torch
-from typing import Union, List, Dict
-from rich.console import Console
-from rich.traceback import install
-from prometheus_client import Info
-from langchain.llms.base import LLM
-from typing import Optional, List, Mapping, Any, Tuple
+import importlib
+import importlib.util
+from typing import Any, List
 
 import nest_asyncio
 nest_asyncio.apply()
@@ -32,19 +28,12 @@ version_split = __version__.split(".")
 __version_as_int__ = (100 * int(version_split[0])) + (10 * int(version_split[1])) + (1 * int(version_split[2]))
 __new_signature_version__ = 360
 
-# Turn off rich console locals trace.
-from rich.traceback import install
-install(show_locals=False)
-
-# Rich console.
-__console__ = Console()
+# Rich console, created on first use, see __getattr__.
 __use_console__ = True
 
-# Remove overdue locals in debug training.
-install(show_locals=False)
-
 def turn_console_off():
     from io import StringIO
+    from rich.console import Console
     __use_console__ = False
     __console__ = Console(file=StringIO(), stderr=False)
 
@@ -97,11 +86,8 @@ __network_explorer_map__ = {
     'finney': "https://explorer.finney.opentensor.ai/#/explorer"
 }
 
-# Avoid collisions with other processes
-from .utils.test_utils import get_random_unused_port
-mock_subtensor_port = get_random_unused_port()
-__mock_entrypoint__ = f"localhost:{mock_subtensor_port}"
-
+# The mock subtensor port, __mock_entrypoint__ and mock_subtensor_port are picked on first use to avoid collisions
+# with other processes, see __getattr__.
 __mock_chain_db__ = './tmp/mock_chain_db'
 
 # --- Type Registry ---
@@ -115,125 +101,6 @@ __type_registry__ = {
 __prometheus_version__ = "0.1.0"
 prometheus_version__split = __prometheus_version__.split(".")
 __prometheus_version__as_int__ = (100 * int(prometheus_version__split[0])) + (10 * int(prometheus_version__split[1])) + (1 * int(prometheus_version__split[2]))
-try:
-    bt_promo_info = Info("bittensor_info", "Information about the installed bittensor package.")
-    bt_promo_info.info (
-        {
-            '__version__': str(__version__),
-            '__version_as_int__': str(__version_as_int__),
-            '__vocab_size__': str(__vocab_size__),
-            '__network_dim__': str(__network_dim__),
-            '__blocktime__': str(__blocktime__),
-            '__prometheus_version__': str(__prometheus_version__),
-            '__prometheus_version__as_int__': str(__prometheus_version__as_int__),
-        }
-    )
-except ValueError:
-    # This can silently fail if we import bittensor twice in the same process.
-    # We simply pass over this error.
-    pass
-
-
-# ---- Config ----
-from bittensor._config import config as config
-
-# ---- LOGGING ----
-# Duplicate import for ease of use.
-from bittensor._logging import logging as logging
-from bittensor._logging import logging as logger
-
-# ---- Protos ----
-import bittensor._proto.bittensor_pb2 as proto
-import bittensor._proto.bittensor_pb2_grpc as grpc
-
-# ---- Utils ----
-from bittensor.utils import unbiased_topk as unbiased_topk
-from bittensor.utils.tokenizer_utils import topk_token_phrases
-from bittensor.utils.tokenizer_utils import compact_topk_token_phrases
-from bittensor.utils.tokenizer_utils import unravel_topk_token_phrases
-from bittensor.utils.tokenizer_utils import prep_tokenizer
-from bittensor._cli.commands import utils as cli_utils
-
-# ---- Factories -----
-from bittensor.utils.balance import Balance as Balance
-from bittensor._cli import cli as cli
-from bittensor._axon import axon as axon
-from bittensor._axon import axon_info as axon_info
-from bittensor._wallet import wallet as wallet
-from bittensor._keyfile import keyfile as keyfile
-from bittensor._metagraph import metagraph as metagraph
-from bittensor._prometheus import prometheus as prometheus
-from bittensor._subtensor import subtensor as subtensor
-from bittensor._tokenizer import tokenizer as tokenizer
-from bittensor._serializer import serializer as serializer
-from bittensor._dataset import dataset as dataset
-from bittensor._threadpool import prioritythreadpool as prioritythreadpool
-
-# ---- Classes -----
-from bittensor._cli.cli_impl import CLI as CLI
-from bittensor._config.config_impl import Config as Config
-from bittensor._subtensor.chain_data import DelegateInfo as DelegateInfo
-from bittensor._wallet.wallet_impl import Wallet as Wallet
-from bittensor._keyfile.keyfile_impl import Keyfile as Keyfile
-from bittensor._subtensor.chain_data import NeuronInfo as NeuronInfo
-from bittensor._subtensor.chain_data import NeuronInfoLite as NeuronInfoLite
-from bittensor._subtensor.chain_data import PrometheusInfo as PrometheusInfo
-from bittensor._subtensor.subtensor_impl import Subtensor as Subtensor
-from bittensor._serializer.serializer_impl import Serializer as Serializer
-from bittensor._subtensor.chain_data import SubnetInfo as SubnetInfo
-from bittensor._dataset.dataset_impl import Dataset as Dataset
-from bittensor._threadpool.priority_thread_pool_impl import PriorityThreadPoolExecutor as PriorityThreadPoolExecutor
-from bittensor._ipfs.ipfs_impl import Ipfs as Ipfs
-
-# ---- Errors and Exceptions -----
-from bittensor._keyfile.keyfile_impl import KeyFileError as KeyFileError
-
-from bittensor._proto.bittensor_pb2 import ForwardTextPromptingRequest
-from bittensor._proto.bittensor_pb2 import ForwardTextPromptingResponse
-from bittensor._proto.bittensor_pb2 import MultiForwardTextPromptingRequest
-from bittensor._proto.bittensor_pb2 import MultiForwardTextPromptingResponse
-from bittensor._proto.bittensor_pb2 import BackwardTextPromptingRequest
-from bittensor._proto.bittensor_pb2 import BackwardTextPromptingResponse
-
-# ---- Synapses -----
-from bittensor._synapse.synapse import Synapse
-from bittensor._synapse.synapse import SynapseCall
-from bittensor._synapse.text_prompting.synapse import TextPromptingSynapse
-
-# ---- Dendrites -----
-from bittensor._dendrite.dendrite import Dendrite
-from bittensor._dendrite.dendrite import DendriteCall
-from bittensor._dendrite.text_prompting.dendrite import TextPromptingDendrite as text_prompting
-from bittensor._dendrite.text_prompting.dendrite_pool import TextPromptingDendritePool as text_prompting_pool
-
-# ---- Base Miners -----
-from bittensor._synapse.text_prompting.miner import BasePromptingMiner
-
-# ---- Errors and Exceptions -----
-from bittensor._keyfile.keyfile_impl import KeyFileError as KeyFileError
-
-# ---- Errors and Exceptions -----
-from bittensor._keyfile.keyfile_impl import KeyFileError as KeyFileError
-
-# DEFAULTS
-defaults = Config()
-defaults.netuid = 1
-subtensor.add_defaults( defaults )
-axon.add_defaults( defaults )
-prioritythreadpool.add_defaults( defaults )
-prometheus.add_defaults( defaults )
-wallet.add_defaults( defaults )
-dataset.add_defaults( defaults )
-logging.add_defaults( defaults )
-
-from substrateinterface import Keypair as Keypair
-
-# Logging helpers.
-def trace():
-    logging.set_trace(True)
-
-def debug():
-    logging.set_debug(True)
 
 default_prompt = '''
 You are Chattensor.
@@ -243,143 +110,184 @@ Chattensor is designed to be able to assist with a wide range of tasks, from ans
 
 default_prompting_validator_key = '5F4tQyWrhfGVcNhoqeiNsR6KjD4wMZ2kfhLj4oHYuyHbZAc3'
 
-__context_prompting_llm = None
-def prompt(
-        content: Union[ str, List[str], List[Dict[ str ,str ]]],
-        wallet_name: str = "default",
-        hotkey: str = default_prompting_validator_key,
-        subtensor_: Optional['Subtensor'] = None,
-        axon_: Optional['axon_info'] = None,
-        return_all: bool = False,
-    ) -> str:
-    global __context_prompting_llm
-    if __context_prompting_llm == None:
-        __context_prompting_llm = prompting(
-            wallet_name = wallet_name,
-            hotkey = hotkey,
-            subtensor_ = subtensor_,
-            axon_ = axon_,
-        )
-    return __context_prompting_llm( content = content, return_all = return_all )
-
-class prompting ( torch.nn.Module ):
-    _axon: 'axon_info'
-    _dendrite: 'Dendrite'
-    _subtensor: 'Subtensor'
-    _hotkey: str
-    _keypair: 'Keypair'
-
-    def __init__(
-        self,
-        wallet_name: str = "default",
-        hotkey: str = default_prompting_validator_key,
-        subtensor_: Optional['Subtensor'] = None,
-        axon_: Optional['axon_info'] = None,
-        use_coldkey: bool = False
-    ):
-        super(prompting, self).__init__()
-        self._hotkey = hotkey
-        self._subtensor = subtensor() if subtensor_ is None else subtensor_
-        if use_coldkey:
-            self._keypair = wallet( name = wallet_name ).create_if_non_existent().coldkey
-        else:
-            self._keypair = wallet( name = wallet_name ).create_if_non_existent().hotkey
-
-        if axon_ is not None:
-            self._axon = axon_
-        else:
-            self._metagraph = metagraph( 1 )
-            self._axon = self._metagraph.axons[ self._metagraph.hotkeys.index( self._hotkey ) ]
-        self._dendrite = text_prompting(
-            keypair = self._keypair,
-            axon = self._axon
-        )
-
-    @staticmethod
-    def format_content( content: Union[ str, List[str], List[Dict[ str ,str ]]] ) -> Tuple[ List[str], List[str ]]:
-        if isinstance( content, str ):
-            return ['system', 'user'], [ default_prompt, content ]
-        elif isinstance( content, list ):
-            if isinstance( content[0], str ):
-                return ['user' for _ in content ], content
-            elif isinstance( content[0], dict ):
-                return [ dictitem[ list(dictitem.keys())[0] ] for dictitem in content ], [ dictitem[ list(dictitem.keys())[1] ] for dictitem in content ]
-            else:
-                raise ValueError('content has invalid type {}'.format( type( content )))
-        else:
-            raise ValueError('content has invalid type {}'.format( type( content )))
-
-    def forward(
-            self,
-            content: Union[ str, List[str], List[Dict[ str ,str ]]],
-            timeout: float = 24,
-            return_call: bool = False,
-            return_all: bool = False,
-        ) -> Union[str, List[str]]:
-        roles, messages = self.format_content( content )
-        if not return_all:
-            return self._dendrite.forward(
-                roles = roles,
-                messages = messages,
-                timeout = timeout
-            ).completion
-        else:
-            return self._dendrite.multi_forward(
-                roles = roles,
-                messages = messages,
-                timeout = timeout
-            ).multi_completions
-
-
-    async def async_forward(
-            self,
-            content: Union[ str, List[str], List[Dict[ str ,str ]]],
-            timeout: float = 24,
-            return_all: bool = False,
-        ) -> Union[str, List[str]]:
-        roles, messages = self.format_content( content )
-        if not return_all:
-            return await self._dendrite.async_forward(
-                    roles = roles,
-                    messages = messages,
-                    timeout = timeout
-                ).completion
-        else:
-            return self._dendrite.async_multi_forward(
-                roles = roles,
-                messages = messages,
-                timeout = timeout
-            ).multi_completions
-
-class BittensorLLM(LLM):
-    """Wrapper around Bittensor Prompting Subnetwork.
-This Python file implements the BittensorLLM class, a wrapper around the Bittensor Prompting Subnetwork for easy integration into language models. The class provides a query method to receive responses from the subnetwork for a given user message and an implementation of the _call method to return the best response. The class can be initialized with various parameters such as the wallet name and chain endpoint.
-
-    Example:
-        .. code-block:: python
-
-            from bittensor import BittensorLLM
-            btllm = BittensorLLM(wallet_name="default")
-    """
-
-    wallet_name: str = 'default'
-    hotkey: str = default_prompting_validator_key
-    llm: prompting = None
-    def __init__(self, subtensor_: Optional['Subtensor'] = None, axon_: Optional['axon_info'] = None, **data):
-        super().__init__(**data)
-        self.llm = prompting(wallet_name=self.wallet_name, hotkey=self.hotkey, subtensor_=subtensor_, axon_=axon_ )
-
-    @property
-    def _identifying_params(self) -> Mapping[str, Any]:
-        """Get the identifying parameters."""
-        return {"wallet_name": self.wallet_name, "hotkey_name": self.hotkey}
+# Public attributes, imported from their module on first access ( PEP 562 ) so that `import bittensor` stays cheap
+# and e.g. a btcli wallet command never loads torch, grpc or langchain. name -> ( module, attribute ), where an
+# attribute of None is the module itself.
+_LAZY_ATTRIBUTES = {
+    # ---- Config ----
+    'config': ( 'bittensor._config', 'config' ),
+
+    # ---- LOGGING ----
+    # Duplicate import for ease of use.
+    'logging': ( 'bittensor._logging', 'logging' ),
+    'logger': ( 'bittensor._logging', 'logging' ),
+
+    # ---- Protos ----
+    'proto': ( 'bittensor._proto.bittensor_pb2', None ),
+    'grpc': ( 'bittensor._proto.bittensor_pb2_grpc', None ),
+
+    # ---- Utils ----
+    'utils': ( 'bittensor.utils', None ),
+    'unbiased_topk': ( 'bittensor.utils', 'unbiased_topk' ),
+    'topk_token_phrases': ( 'bittensor.utils.tokenizer_utils', 'topk_token_phrases' ),
+    'compact_topk_token_phrases': ( 'bittensor.utils.tokenizer_utils', 'compact_topk_token_phrases' ),
+    'unravel_topk_token_phrases': ( 'bittensor.utils.tokenizer_utils', 'unravel_topk_token_phrases' ),
+    'prep_tokenizer': ( 'bittensor.utils.tokenizer_utils', 'prep_tokenizer' ),
+    'cli_utils': ( 'bittensor._cli.commands.utils', None ),
+
+    # ---- Factories -----
+    'Balance': ( 'bittensor.utils.balance', 'Balance' ),
+    'cli': ( 'bittensor._cli', 'cli' ),
+    'axon': ( 'bittensor._axon', 'axon' ),
+    'axon_info': ( 'bittensor._axon', 'axon_info' ),
+    'wallet': ( 'bittensor._wallet', 'wallet' ),
+    'keyfile': ( 'bittensor._keyfile', 'keyfile' ),
+    'metagraph': ( 'bittensor._metagraph', 'metagraph' ),
+    'prometheus': ( 'bittensor._prometheus', 'prometheus' ),
+    'subtensor': ( 'bittensor._subtensor', 'subtensor' ),
+    'tokenizer': ( 'bittensor._tokenizer', 'tokenizer' ),
+    'serializer': ( 'bittensor._serializer', 'serializer' ),
+    'dataset': ( 'bittensor._dataset', 'dataset' ),
+    'prioritythreadpool': ( 'bittensor._threadpool', 'prioritythreadpool' ),
+
+    # ---- Classes -----
+    'CLI': ( 'bittensor._cli.cli_impl', 'CLI' ),
+    'Config': ( 'bittensor._config.config_impl', 'Config' ),
+    'DelegateInfo': ( 'bittensor._subtensor.chain_data', 'DelegateInfo' ),
+    'MetagraphDiff': ( 'bittensor._metagraph', 'MetagraphDiff' ),
+    'Wallet': ( 'bittensor._wallet.wallet_impl', 'Wallet' ),
+    'WalletView': ( 'bittensor._wallet.wallet_view', 'WalletView' ),
+    'WalletSnapshot': ( 'bittensor._wallet.wallet_snapshot', 'WalletSnapshot' ),
+    'Keyfile': ( 'bittensor._keyfile.keyfile_impl', 'Keyfile' ),
+    'NeuronInfo': ( 'bittensor._subtensor.chain_data', 'NeuronInfo' ),
+    'NeuronInfoLite': ( 'bittensor._subtensor.chain_data', 'NeuronInfoLite' ),
+    'NeuronColumns': ( 'bittensor._subtensor.chain_data', 'NeuronColumns' ),
+    'PrometheusInfo': ( 'bittensor._subtensor.chain_data', 'PrometheusInfo' ),
+    'Subtensor': ( 'bittensor._subtensor.subtensor_impl', 'Subtensor' ),
+    'SubtensorSnapshot': ( 'bittensor._subtensor.snapshot', 'SubtensorSnapshot' ),
+    'AsyncSubtensor': ( 'bittensor._subtensor.async_subtensor', 'AsyncSubtensor' ),
+    'BlockClock': ( 'bittensor._subtensor.block_clock', 'BlockClock' ),
+    'QueryCache': ( 'bittensor._subtensor.query_cache', 'QueryCache' ),
+    'Serializer': ( 'bittensor._serializer.serializer_impl', 'Serializer' ),
+    'SubnetInfo': ( 'bittensor._subtensor.chain_data', 'SubnetInfo' ),
+    'Dataset': ( 'bittensor._dataset.dataset_impl', 'Dataset' ),
+    'PriorityThreadPoolExecutor': ( 'bittensor._threadpool.priority_thread_pool_impl', 'PriorityThreadPoolExecutor' ),
+    'Ipfs': ( 'bittensor._ipfs.ipfs_impl', 'Ipfs' ),
+    'Keypair': ( 'substrateinterface', 'Keypair' ),
+
+    # ---- Errors and Exceptions -----
+    'KeyFileError': ( 'bittensor._keyfile.keyfile_impl', 'KeyFileError' ),
+
+    'ForwardTextPromptingRequest': ( 'bittensor._proto.bittensor_pb2', 'ForwardTextPromptingRequest' ),
+    'ForwardTextPromptingResponse': ( 'bittensor._proto.bittensor_pb2', 'ForwardTextPromptingResponse' ),
+    'MultiForwardTextPromptingRequest': ( 'bittensor._proto.bittensor_pb2', 'MultiForwardTextPromptingRequest' ),
+    'MultiForwardTextPromptingResponse': ( 'bittensor._proto.bittensor_pb2', 'MultiForwardTextPromptingResponse' ),
+    'BackwardTextPromptingRequest': ( 'bittensor._proto.bittensor_pb2', 'BackwardTextPromptingRequest' ),
+    'BackwardTextPromptingResponse': ( 'bittensor._proto.bittensor_pb2', 'BackwardTextPromptingResponse' ),
+
+    # ---- Synapses -----
+    'Synapse': ( 'bittensor._synapse.synapse', 'Synapse' ),
+    'SynapseCall': ( 'bittensor._synapse.synapse', 'SynapseCall' ),
+    'TextPromptingSynapse': ( 'bittensor._synapse.text_prompting.synapse', 'TextPromptingSynapse' ),
+
+    # ---- Dendrites -----
+    'Dendrite': ( 'bittensor._dendrite.dendrite', 'Dendrite' ),
+    'DendriteCall': ( 'bittensor._dendrite.dendrite', 'DendriteCall' ),
+    'text_prompting': ( 'bittensor._dendrite.text_prompting.dendrite', 'TextPromptingDendrite' ),
+    'text_prompting_pool': ( 'bittensor._dendrite.text_prompting.dendrite_pool', 'TextPromptingDendritePool' ),
+
+    # ---- Base Miners -----
+    'BasePromptingMiner': ( 'bittensor._synapse.text_prompting.miner', 'BasePromptingMiner' ),
+
+    # ---- Prompting -----
+    'prompt': ( 'bittensor._prompting', 'prompt' ),
+    'prompting': ( 'bittensor._prompting', 'prompting' ),
+    'BittensorLLM': ( 'bittensor._prompting', 'BittensorLLM' ),
+
+    # ---- Names the eager namespace re-exported from its imports -----
+    'get_random_unused_port': ( 'bittensor.utils.test_utils', 'get_random_unused_port' ),
+    'bt_promo_info': ( 'bittensor._prometheus', 'bt_promo_info' ),
+    'torch': ( 'torch', None ),
+    'Console': ( 'rich.console', 'Console' ),
+    'install': ( 'rich.traceback', 'install' ),
+    'Info': ( 'prometheus_client', 'Info' ),
+    'LLM': ( 'langchain.llms.base', 'LLM' ),
+    'Dict': ( 'typing', 'Dict' ),
+    'Mapping': ( 'typing', 'Mapping' ),
+    'Optional': ( 'typing', 'Optional' ),
+    'Tuple': ( 'typing', 'Tuple' ),
+    'Union': ( 'typing', 'Union' ),
+}
 
-    @property
-    def _llm_type(self) -> str:
-        return "BittensorLLM"
+# Sections of bittensor.defaults and the factory whose add_defaults fills them on first access.
+_DEFAULTS_SECTIONS = {
+    'subtensor': 'subtensor',
+    'axon': 'axon',
+    'priority': 'prioritythreadpool',
+    'prometheus': 'prometheus',
+    'wallet': 'wallet',
+    'dataset': 'dataset',
+    'logging': 'logging',
+}
 
-    def _call(self, prompt: str, stop: Optional[List[str]] = None) -> str:
-        """Call the LLM with the given prompt and stop tokens."""
-        return self.llm(prompt)
+def _make_defaults() -> 'bittensor.Config':
+    r""" Returns bittensor.defaults, whose sections are filled from the environment by the add_defaults of their
+        factory when first read, so that reading defaults.wallet does not import the axon.
+    """
+    class Defaults( bittensor.Config ):
+        def __getattr__( self, name: str ) -> Any:
+            self._load_section( name )
+            return super().__getattr__( name )
+
+        def __getitem__( self, name: str ) -> Any:
+            self._load_section( name )
+            return super().__getitem__( name )
+
+        def _load_section( self, name: str ):
+            if name in _DEFAULTS_SECTIONS and not dict.__contains__( self, name ):
+                getattr( bittensor, _DEFAULTS_SECTIONS[ name ] ).add_defaults( self )
+
+        def load( self ) -> 'Defaults':
+            r""" Fills every section, e.g. before copying or printing the defaults. """
+            for name in _DEFAULTS_SECTIONS:
+                self._load_section( name )
+            return self
+
+    defaults = Defaults()
+    defaults.netuid = 1
+    return defaults
+
+def __getattr__( name: str ) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attribute = _LAZY_ATTRIBUTES[ name ]
+        module = importlib.import_module( module_name )
+        value = module if attribute is None else getattr( module, attribute )
+    elif name == 'defaults':
+        value = _make_defaults()
+    elif name == '__console__':
+        from rich.console import Console
+        value = Console()
+    elif name in ( 'mock_subtensor_port', '__mock_entrypoint__' ):
+        from .utils.test_utils import get_random_unused_port
+        globals()[ 'mock_subtensor_port' ] = get_random_unused_port()
+        globals()[ '__mock_entrypoint__' ] = f"localhost:{mock_subtensor_port}"
+        return globals()[ name ]
+    elif not name.startswith( '__' ) and importlib.util.find_spec( __name__ + '.' + name ) is not None:
+        # Private subpackages, e.g. bittensor._subtensor.
+        value = importlib.import_module( __name__ + '.' + name )
+    else:
+        raise AttributeError( "module 'bittensor' has no attribute '{}'".format( name ) )
+    globals()[ name ] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted( set( globals() ) | set( _LAZY_ATTRIBUTES ) | { 'defaults', '__console__', 'mock_subtensor_port', '__mock_entrypoint__' } )
+
+import bittensor
 
+# Logging helpers.
+def trace():
+    bittensor.logging.set_trace(True)
 
+def debug():
+    bittensor.logging.set_debug(True)
@@ -19,12 +19,19 @@
 # DEALINGS IN THE SOFTWARE.
 import os
 import json
+import time
+import asyncio
 import grpc
 import copy
 import torch
+import sr25519
 import argparse
+import functools
+import threading
 import bittensor
+import multiprocessing
 
+from collections import OrderedDict
 from concurrent import futures
 from dataclasses import dataclass
 from substrateinterface import Keypair
@@ -61,6 +68,7 @@ class axon:
         server: "grpc._server._Server" = None,
         maximum_concurrent_rpcs: Optional[int] = None,
         blacklist: Optional[Callable] = None,
+        use_asyncio: Optional[bool] = None,
     ) -> "bittensor.Axon":
         r"""Creates a new bittensor.Axon object from passed arguments.
         Args:
@@ -82,6 +90,9 @@ class axon:
                 Maximum allowed concurrently processed RPCs.
             blacklist (:obj:`Optional[callable]`, `optional`):
                 function to blacklist requests.
+            use_asyncio (:type:`Optional[bool]`, `optional`):
+                Serve requests from a grpc.aio server running on its own event loop thread. Waiting requests
+                then hold no handler thread and in-flight requests are only bounded by maximum_concurrent_rpcs.
         """
         self.metagraph = metagraph
         self.wallet = wallet
@@ -102,6 +113,7 @@ class axon:
             if maximum_concurrent_rpcs is not None
             else config.axon.maximum_concurrent_rpcs
         )
+        config.axon.asyncio = use_asyncio if use_asyncio is not None else config.axon.get("asyncio", False)
         axon.check_config(config)
         self.config = config
 
@@ -113,18 +125,25 @@ class axon:
         self.full_address = str(self.config.axon.ip) + ":" + str(self.config.axon.port)
         self.blacklist = blacklist
         self.started = False
+        self.use_asyncio = self.config.axon.asyncio
 
         # Build priority thread pool
         self.priority_threadpool = bittensor.prioritythreadpool(config=self.config.axon)
 
         # Build interceptor.
         self.receiver_hotkey = self.wallet.hotkey.ss58_address
-        self.auth_interceptor = AuthInterceptor(
-            receiver_hotkey=self.receiver_hotkey, blacklist=self.blacklist
+        self.auth_interceptor = ( AsyncAuthInterceptor if self.use_asyncio else AuthInterceptor )(
+            receiver_hotkey=self.receiver_hotkey,
+            blacklist=self.blacklist,
+            verification_processes=self.config.axon.get("verification_processes", 0),
         )
 
         # Build grpc server
-        if server is None:
+        if self.use_asyncio:
+            assert server is None, "a grpc server can not be passed to an asyncio axon"
+            self.thread_pool = None
+            self._build_aio_server()
+        elif server is None:
             self.thread_pool = futures.ThreadPoolExecutor(max_workers=self.config.axon.max_workers)
             self.server = grpc.server(
                 self.thread_pool,
@@ -138,6 +157,33 @@ class axon:
             self.thread_pool = server._state.thread_pool
             self.server.add_insecure_port(self.full_address)
 
+    def _build_aio_server(self):
+        r"""Starts the event loop thread and builds the grpc.aio server on it, the server is bound to that loop."""
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread = threading.Thread( target = self.loop.run_forever, name = "axon-asyncio", daemon = True )
+        self.loop_thread.start()
+        async def build():
+            return grpc.aio.server(
+                interceptors=(self.auth_interceptor,),
+                maximum_concurrent_rpcs=self.config.axon.maximum_concurrent_rpcs,
+                options=[("grpc.keepalive_time_ms", 100000), ("grpc.keepalive_timeout_ms", 500000)],
+            )
+        self.server = self.run_in_loop( build() )
+        self.server.add_insecure_port(self.full_address)
+
+    def _stop_loop(self):
+        r"""Stops the event loop of an asyncio axon and joins its thread."""
+        if not hasattr(self, "loop_thread") or self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if threading.current_thread() is not self.loop_thread:
+            self.loop_thread.join()
+            self.loop.close()
+
+    def run_in_loop(self, coroutine):
+        r"""Runs the coroutine on the event loop of an asyncio axon and returns its result."""
+        return asyncio.run_coroutine_threadsafe( coroutine, self.loop ).result()
+
     @classmethod
     def config(cls) -> "bittensor.Config":
         """Get config from the argument parser
@@ -200,6 +246,18 @@ class axon:
                 help="""Maximum number of allowed active connections""",
                 default=bittensor.defaults.axon.maximum_concurrent_rpcs,
             )
+            parser.add_argument(
+                "--" + prefix_str + "axon.verification_processes",
+                type=int,
+                help="""Number of processes verifying request signatures, 0 verifies them on the handler threads.""",
+                default=bittensor.defaults.axon.verification_processes,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.asyncio",
+                action="store_true",
+                help="""If set, serves requests from a grpc.aio server, waiting requests do not hold a handler thread.""",
+                default=bittensor.defaults.axon.asyncio,
+            )
         except argparse.ArgumentError:
             # re-parsing arguments.
             pass
@@ -228,6 +286,12 @@ class axon:
             if os.getenv("BT_AXON_MAXIMUM_CONCURRENT_RPCS") is not None
             else 400
         )
+        defaults.axon.verification_processes = (
+            int(os.getenv("BT_AXON_VERIFICATION_PROCESSES"))
+            if os.getenv("BT_AXON_VERIFICATION_PROCESSES") is not None
+            else 0
+        )
+        defaults.axon.asyncio = os.getenv("BT_AXON_ASYNCIO") is not None
 
     @classmethod
     def check_config(cls, config: "bittensor.Config"):
@@ -256,6 +320,10 @@ class axon:
 
     def start(self) -> "bittensor.axon":
         r"""Starts the standalone axon GRPC server thread."""
+        if self.use_asyncio:
+            self.run_in_loop( self.server.start() )
+            self.started = True
+            return self
         if self.server is not None:
             self.server.stop(grace=1)
         self.server.start()
@@ -264,11 +332,87 @@ class axon:
 
     def stop(self) -> "bittensor.axon":
         r"""Stop the axon grpc server."""
-        if hasattr(self, "server") and self.server is not None:
+        if getattr(self, "use_asyncio", False):
+            if hasattr(self, "server") and self.loop.is_running():
+                self.run_in_loop( self.server.stop(grace=1) )
+            self._stop_loop()
+        elif hasattr(self, "server") and self.server is not None:
             self.server.stop(grace=1)
+        if hasattr(self, "auth_interceptor"):
+            self.auth_interceptor.close()
         self.started = False
 
 
+class NonceStore:
+    r""" Latest nonce seen from each signing endpoint, keyed by "hotkey:uuid". Endpoints idle for longer than ttl
+        seconds are forgotten, and the least recently seen endpoints are dropped once max_size is exceeded.
+
+        Both parts of the key are chosen by the sender, so anyone can push a victim's endpoint out. To keep its
+        captured requests from being replayed afterwards, the last nonce of a dropped endpoint becomes a floor for
+        every endpoint of its hotkey: nonces at or below it are rejected.
+    """
+    def __init__( self, max_size: int = 100000, ttl: float = 3600 ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._nonces = OrderedDict() # endpoint key -> ( nonce, last seen ), least recently seen first.
+        self._floors: Dict[str, int] = {} # hotkey -> largest nonce of its dropped endpoints.
+        self._lock = threading.Lock()
+
+    def __len__( self ) -> int:
+        return len( self._nonces )
+
+    def __contains__( self, endpoint_key: str ) -> bool:
+        return endpoint_key in self._nonces
+
+    def __getitem__( self, endpoint_key: str ) -> int:
+        return self._nonces[ endpoint_key ][ 0 ]
+
+    @staticmethod
+    def _hotkey( endpoint_key: str ) -> str:
+        return endpoint_key.split( ':', 1 )[ 0 ]
+
+    def _evict_oldest( self ):
+        endpoint_key, ( nonce, _ ) = self._nonces.popitem( last = False )
+        hotkey = self._hotkey( endpoint_key )
+        self._floors[ hotkey ] = max( nonce, self._floors.get( hotkey, nonce ) )
+
+    def _evict_expired( self, now: float ):
+        while len( self._nonces ) > 0:
+            _, ( _, last_seen ) = next( iter( self._nonces.items() ) )
+            if now - last_seen <= self.ttl:
+                break
+            self._evict_oldest()
+
+    def is_fresh( self, endpoint_key: str, nonce: int ) -> bool:
+        r""" True if nonce is larger than the last nonce stored for the endpoint and the floor of its hotkey. """
+        floor = self._floors.get( self._hotkey( endpoint_key ) )
+        if floor is not None and nonce <= floor:
+            return False
+        entry = self._nonces.get( endpoint_key )
+        return entry is None or nonce > entry[ 0 ]
+
+    def update( self, endpoint_key: str, nonce: int ) -> bool:
+        r""" Stores nonce for the endpoint if it is fresh, returns False otherwise. """
+        with self._lock:
+            now = time.monotonic()
+            self._evict_expired( now )
+            if not self.is_fresh( endpoint_key, nonce ):
+                return False
+            self._nonces[ endpoint_key ] = ( nonce, now )
+            self._nonces.move_to_end( endpoint_key )
+            while len( self._nonces ) > self.max_size:
+                self._evict_oldest()
+            return True
+
+
+def _public_key( ss58_address: str ) -> bytes:
+    return Keypair( ss58_address = ss58_address ).public_key
+
+def _verify_signature( public_key: bytes, message: bytes, signature: bytes ) -> bool:
+    r""" sr25519 verification as done by Keypair.verify, kept at module level so it can run in a process pool. """
+    return sr25519.verify( signature, message, public_key ) or sr25519.verify( signature, b'<Bytes>' + message + b'</Bytes>', public_key )
+
+
 class AuthInterceptor(grpc.ServerInterceptor):
     """Creates a new server interceptor that authenticates incoming messages from passed arguments."""
 
@@ -276,6 +420,10 @@ class AuthInterceptor(grpc.ServerInterceptor):
         self,
         receiver_hotkey: str,
         blacklist: Callable = None,
+        key_cache_size: int = 4096,
+        max_nonces: int = 100000,
+        nonce_ttl: float = 3600,
+        verification_processes: int = 0,
     ):
         r"""Creates a new server interceptor that authenticates incoming messages from passed arguments.
         Args:
@@ -283,12 +431,44 @@ class AuthInterceptor(grpc.ServerInterceptor):
                 the SS58 address of the hotkey which should be targeted by RPCs
             black_list (Function, `optional`):
                 black list function that prevents certain pubkeys from sending messages
+            key_cache_size (int, `optional`):
+                number of sender public keys kept parsed in an LRU cache.
+            max_nonces (int, `optional`):
+                maximum number of sender endpoints whose latest nonce is remembered.
+            nonce_ttl (float, `optional`):
+                seconds after which the nonce of an idle sender endpoint is forgotten.
+            verification_processes (int, `optional`):
+                if positive, signatures are verified in a pool of this many processes instead of on the grpc thread.
         """
         super().__init__()
-        self.nonces = {}
+        self.nonces = NonceStore( max_size = max_nonces, ttl = nonce_ttl )
         self.blacklist = blacklist
         self.receiver_hotkey = receiver_hotkey
-
+        self.public_key = functools.lru_cache( maxsize = key_cache_size )( _public_key )
+        self.verification_processes = verification_processes
+        self._verification_pool = None
+        self._verification_pool_lock = threading.Lock()
+
+    def verification_pool( self ) -> Optional[futures.ProcessPoolExecutor]:
+        r"""Returns the signature verification process pool, started on first use, or None if disabled."""
+        if self.verification_processes <= 0:
+            return None
+        if self._verification_pool is None:
+            with self._verification_pool_lock:
+                if self._verification_pool is None:
+                    # Forking a process running grpc threads is unsafe, workers are spawned instead.
+                    self._verification_pool = futures.ProcessPoolExecutor(
+                        max_workers = self.verification_processes,
+                        mp_context = multiprocessing.get_context( 'spawn' ),
+                    )
+        return self._verification_pool
+
+    def close( self ):
+        r"""Shuts down the verification process pool if one was started."""
+        with self._verification_pool_lock:
+            if self._verification_pool is not None:
+                self._verification_pool.shutdown( wait = False )
+                self._verification_pool = None
 
     def parse_signature_v2(self, signature: str) -> Union[Tuple[int, str, str, str, int], None]:
         r"""Attempts to parse a signature using the v2 format"""
@@ -325,7 +505,17 @@ class AuthInterceptor(grpc.ServerInterceptor):
         receptor_uuid: str,
     ):
         r"""verification of signature in metadata. Uses the pubkey and nonce"""
-        keypair = Keypair(ss58_address=sender_hotkey)
+        public_key, message, signature, endpoint_key = self._signed_message( nonce, sender_hotkey, signature, receptor_uuid )
+        pool = self.verification_pool()
+        if pool is None:
+            verified = _verify_signature( public_key, message, signature )
+        else:
+            verified = pool.submit( _verify_signature, public_key, message, signature ).result()
+        self._accept( verified, endpoint_key, nonce )
+
+    def _signed_message( self, nonce: int, sender_hotkey: str, signature: str, receptor_uuid: str ) -> Tuple[bytes, bytes, bytes, str]:
+        r"""Checks the nonce and signature format, returns the public key, message, signature and endpoint key to verify."""
+        public_key = self.public_key( sender_hotkey )
         # Build the expected message which was used to build the signature.
         message = f"{nonce}.{sender_hotkey}.{self.receiver_hotkey}.{receptor_uuid}"
 
@@ -333,15 +523,19 @@ class AuthInterceptor(grpc.ServerInterceptor):
         # the message.
         endpoint_key = f"{sender_hotkey}:{receptor_uuid}"
 
-        if endpoint_key in self.nonces.keys():
-            previous_nonce = self.nonces[endpoint_key]
-            # Nonces must be strictly monotonic over time.
-            if nonce <= previous_nonce:
-                raise Exception("Nonce is too small")
+        # Nonces must be strictly monotonic over time.
+        if not self.nonces.is_fresh( endpoint_key, nonce ):
+            raise Exception("Nonce is too small")
+
+        if signature[0:2] != '0x':
+            raise Exception("Signature should be a hex-string")
+        return public_key, message.encode(), bytes.fromhex( signature[2:] ), endpoint_key
 
-        if not keypair.verify(message, signature):
+    def _accept( self, verified: bool, endpoint_key: str, nonce: int ):
+        if not verified:
             raise Exception("Signature mismatch")
-        self.nonces[endpoint_key] = nonce
+        if not self.nonces.update( endpoint_key, nonce ):
+            raise Exception("Nonce is too small")
 
     def black_list_checking(self, hotkey: str, method: str):
         r"""Tries to call to blacklist function in the miner and checks if it should blacklist the pubkey"""
@@ -388,6 +582,56 @@ class AuthInterceptor(grpc.ServerInterceptor):
             return grpc.unary_unary_rpc_method_handler(abort)
 
 
+class AsyncAuthInterceptor(AuthInterceptor, grpc.aio.ServerInterceptor):
+    """AuthInterceptor for the grpc.aio server of an asyncio axon. Requests are checked on the event loop,
+    signature verification is awaited in the verification process pool when one is configured."""
+
+    async def async_check_signature(
+        self,
+        nonce: int,
+        sender_hotkey: str,
+        signature: str,
+        receptor_uuid: str,
+    ):
+        r"""verification of signature in metadata. Uses the pubkey and nonce"""
+        public_key, message, signature, endpoint_key = self._signed_message( nonce, sender_hotkey, signature, receptor_uuid )
+        pool = self.verification_pool()
+        if pool is None:
+            verified = _verify_signature( public_key, message, signature )
+        else:
+            verified = await asyncio.get_running_loop().run_in_executor( pool, _verify_signature, public_key, message, signature )
+        self._accept( verified, endpoint_key, nonce )
+
+    async def intercept_service(self, continuation, handler_call_details):
+        r"""Authentication between bittensor nodes. Intercepts messages and checks them"""
+        method = handler_call_details.method
+        metadata = dict(handler_call_details.invocation_metadata)
+
+        try:
+            (
+                nonce,
+                sender_hotkey,
+                signature,
+                receptor_uuid,
+            ) = self.parse_signature(metadata)
+
+            # signature checking
+            await self.async_check_signature(
+                nonce, sender_hotkey, signature, receptor_uuid
+            )
+
+            # blacklist checking
+            self.black_list_checking(sender_hotkey, method)
+
+            return await continuation(handler_call_details)
+
+        except Exception as e:
+            message = str(e)
+            async def abort(_, ctx):
+                await ctx.abort(grpc.StatusCode.UNAUTHENTICATED, message)
+            return grpc.unary_unary_rpc_method_handler(abort)
+
+
 METADATA_BUFFER_SIZE = 250
 
 @dataclass
@@ -84,6 +84,7 @@ class cli:
         ListDelegatesCommand.add_args( cmd_parsers )
         RegenColdkeypubCommand.add_args( cmd_parsers )
         RecycleRegisterCommand.add_args( cmd_parsers )
+        PowBenchCommand.add_args( cmd_parsers )
 
         return parser
 
@@ -156,6 +157,8 @@ class cli:
             MyDelegatesCommand.check_config( config )
         elif config.command == "recycle_register":
             RecycleRegisterCommand.check_config( config )
+        elif config.command == "pow_bench":
+            PowBenchCommand.check_config( config )
         else:
             console.print(":cross_mark:[red]Unknown command: {}[/red]".format(config.command))
             sys.exit()
@@ -82,4 +82,6 @@ class CLI:
             ListSubnetsCommand.run( self )
         elif self.config.command == 'recycle_register':
             RecycleRegisterCommand.run( self )
+        elif self.config.command == 'pow_bench':
+            PowBenchCommand.run( self )
 
@@ -1,7 +1,7 @@
 from .stake import StakeCommand
 from .unstake import UnStakeCommand
 from .overview import OverviewCommand
-from .register import RegisterCommand, RecycleRegisterCommand
+from .register import RegisterCommand, RecycleRegisterCommand, PowBenchCommand
 from .delegates import NominateCommand, ListDelegatesCommand, DelegateStakeCommand, DelegateUnstakeCommand, MyDelegatesCommand
 from .wallets import NewColdkeyCommand, NewHotkeyCommand, RegenColdkeyCommand, RegenColdkeypubCommand, RegenHotkeyCommand
 from .transfer import TransferCommand
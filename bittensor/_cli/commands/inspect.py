@@ -18,7 +18,6 @@
 import json
 import argparse
 import bittensor
-from tqdm import tqdm
 from rich.table import Table
 from rich.prompt import Prompt
 from .utils import check_netuid_set, get_delegates_details, DelegatesDetails
@@ -38,20 +37,7 @@ def _get_coldkey_wallets_for_path( path: str ) -> List['bittensor.wallet']:
     return wallets
 
 def _get_hotkey_wallets_for_wallet( wallet ) -> List['bittensor.wallet']:
-    hotkey_wallets = []
-    hotkeys_path = wallet.path + '/' + wallet.name + '/hotkeys'
-    try:
-        hotkey_files = next(os.walk(os.path.expanduser(hotkeys_path)))[2]
-    except StopIteration:
-        hotkey_files = []
-    for hotkey_file_name in hotkey_files:
-        try:
-            hotkey_for_name = bittensor.wallet( path = wallet.path, name = wallet.name, hotkey = hotkey_file_name )
-            if hotkey_for_name.hotkey_file.exists_on_device() and not hotkey_for_name.hotkey_file.is_encrypted():
-                hotkey_wallets.append( hotkey_for_name )
-        except Exception:
-            pass
-    return hotkey_wallets
+    return bittensor.wallet.load_all( path = wallet.path, names = [ wallet.name ] )
 
 class InspectCommand:
     @staticmethod
@@ -63,17 +49,24 @@ class InspectCommand:
         else:
             wallets = [bittensor.wallet( config = cli.config )]
         subtensor = bittensor.subtensor( config = cli.config )
+        with subtensor.snapshot() as snapshot:
+            InspectCommand._run( wallets, snapshot )
 
-        netuids = subtensor.get_all_subnet_netuids()
+    @staticmethod
+    def _run( wallets: List['bittensor.wallet'], snapshot: 'bittensor.SubtensorSnapshot' ):
+        netuids = snapshot.get_all_subnet_netuids()
 
         registered_delegate_info: Optional[Dict[str, DelegatesDetails]] = get_delegates_details(url = bittensor.__delegates_details_url__)
         if registered_delegate_info is None:
             bittensor.__console__.print( ':warning:[yellow]Could not get delegate info from chain.[/yellow]')
             registered_delegate_info = {}
 
-        neuron_state_dict = {}
-        for netuid in tqdm( netuids ):
-            neuron_state_dict[netuid] = subtensor.neurons_lite( netuid )
+        # Every subnet, delegation and balance is read concurrently at the snapshot block.
+        neuron_state_dict = snapshot.neurons_lite_for( netuids )
+        wallets = [ wallet for wallet in wallets if wallet.coldkeypub_file.exists_on_device() ]
+        coldkeys = [ wallet.coldkeypub.ss58_address for wallet in wallets ]
+        delegated = snapshot.get_delegated_for( coldkeys )
+        balances = snapshot.get_balances_for( coldkeys )
 
         table = Table(show_footer=True, pad_edge=False, box=None, expand=True)
         table.add_column("[overline white]Coldkey", footer_style = "overline white", style='bold white')
@@ -85,10 +78,9 @@ class InspectCommand:
         table.add_column("[overline white]Hotkey", footer_style = "overline white", style='yellow')
         table.add_column("[overline white]Stake", footer_style = "overline white", style='green')
         table.add_column("[overline white]Emission", footer_style = "overline white", style='green')
-        for wallet in tqdm( wallets ):
-            delegates: List[Tuple(bittensor.DelegateInfo, bittensor.Balance)] = subtensor.get_delegated( coldkey_ss58=wallet.coldkeypub.ss58_address )
-            if not wallet.coldkeypub_file.exists_on_device(): continue
-            cold_balance = wallet.get_balance( subtensor = subtensor )
+        for wallet in wallets:
+            delegates: List[Tuple(bittensor.DelegateInfo, bittensor.Balance)] = delegated[ wallet.coldkeypub.ss58_address ]
+            cold_balance = balances[ wallet.coldkeypub.ss58_address ]
             table.add_row(
                 wallet.name,
                 str(cold_balance),
@@ -31,7 +31,7 @@ class MetagraphCommand:
         subtensor = bittensor.subtensor( config = cli.config )
         console.print(":satellite: Syncing with chain: [white]{}[/white] ...".format(cli.config.subtensor.network))
         metagraph: bittensor.metagraph = subtensor.metagraph( netuid = cli.config.netuid )
-        metagraph.save()
+        metagraph.save( keep_last = cli.config.get( 'keep_snapshots', 100 ), keep_every = cli.config.get( 'keep_snapshots_every', None ) )
         difficulty = subtensor.difficulty( cli.config.netuid )
         subnet_emission = bittensor.Balance.from_tao(subtensor.get_emission_value_by_subnet(cli.config.netuid))
         total_issuance = bittensor.Balance.from_tao(subtensor.total_issuance())
@@ -46,10 +46,9 @@ class MetagraphCommand:
         total_dividends = 0.0
         total_emission = 0
         for uid in metagraph.uids:
-            neuron = metagraph.neurons[uid]
             ep = metagraph.axons[uid]
             row = [
-                str(neuron.uid),
+                str(uid.item()),
                 '{:.5f}'.format( metagraph.total_stake[uid]),
                 '{:.5f}'.format( metagraph.ranks[uid]),
                 '{:.5f}'.format( metagraph.trust[uid]),
@@ -127,5 +126,19 @@ class MetagraphCommand:
             help='''Set true to avoid prompting the user.''',
             default=False,
         )
+        metagraph_parser.add_argument(
+            '--keep_snapshots',
+            dest='keep_snapshots',
+            type=int,
+            help='''Number of most recent metagraph snapshots kept on disk, older ones are deleted.''',
+            default=100,
+        )
+        metagraph_parser.add_argument(
+            '--keep_snapshots_every',
+            dest='keep_snapshots_every',
+            type=int,
+            help='''Also keep the older snapshots whose block is a multiple of this.''',
+            default=None,
+        )
         metagraph_parser.add_argument( '--no_version_checking', action='store_true', help='''Set false to stop cli version checking''', default = False )
         bittensor.subtensor.add_args( metagraph_parser )
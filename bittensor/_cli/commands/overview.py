@@ -17,7 +17,6 @@
 
 import argparse
 import bittensor
-from tqdm import tqdm
 from fuzzywuzzy import fuzz
 from rich.align import Align
 from rich.table import Table
@@ -33,25 +32,30 @@ class OverviewCommand:
     def run( cli ):
         r""" Prints an overview for the wallet's colkey.
         """
-        console = bittensor.__console__
         wallet = bittensor.wallet( config = cli.config )
         subtensor: 'bittensor.Subtensor' = bittensor.subtensor( config = cli.config )
 
+        with subtensor.snapshot() as snapshot:
+            OverviewCommand._run( cli, wallet, snapshot )
+
+    @staticmethod
+    def _run( cli, wallet: 'bittensor.wallet', snapshot: 'bittensor.SubtensorSnapshot' ):
+        console = bittensor.__console__
         all_hotkeys = []
         total_balance = bittensor.Balance(0)
 
         # We are printing for every coldkey.
         if cli.config.get( 'all', d=None ):
             cold_wallets = get_coldkey_wallets_for_path(cli.config.wallet.path)
-            for cold_wallet in tqdm(cold_wallets, desc="Pulling balances"):
-                if cold_wallet.coldkeypub_file.exists_on_device() and not cold_wallet.coldkeypub_file.is_encrypted():
-                    total_balance = total_balance + subtensor.get_balance( cold_wallet.coldkeypub.ss58_address )
+            coldkeys = [ cold_wallet.coldkeypub.ss58_address for cold_wallet in cold_wallets if cold_wallet.coldkeypub_file.exists_on_device() and not cold_wallet.coldkeypub_file.is_encrypted() ]
+            for balance in snapshot.get_balances_for( coldkeys ).values():
+                total_balance = total_balance + balance
             all_hotkeys = get_all_wallets_for_path( cli.config.wallet.path )
         else:
             # We are only printing keys for a single coldkey
             coldkey_wallet = bittensor.wallet( config = cli.config )
             if coldkey_wallet.coldkeypub_file.exists_on_device() and not coldkey_wallet.coldkeypub_file.is_encrypted():
-                total_balance = subtensor.get_balance( coldkey_wallet.coldkeypub.ss58_address )
+                total_balance = snapshot.get_balance( coldkey_wallet.coldkeypub.ss58_address )
             if not coldkey_wallet.coldkeypub_file.exists_on_device():
                 console.print("[bold red]No wallets found.")
                 return
@@ -72,11 +76,12 @@ class OverviewCommand:
             console.print("[red]No wallets found.[/red]")
             return
 
-        # Pull neuron info for all keys.
+        # Pull neuron info for all keys, every read is at the snapshot block.
         neurons: Dict[str, List[bittensor.NeuronInfoLite, bittensor.Wallet]] = {}
-        block = subtensor.block
+        block = snapshot.block
 
-        netuids = subtensor.get_all_subnet_netuids()
+        tempos = snapshot.tempos()
+        netuids = list( tempos.keys() )
         if cli.config.netuid != []:
             netuids = [netuid for netuid in netuids if netuid in cli.config.netuid]
         for netuid in netuids:
@@ -84,8 +89,9 @@ class OverviewCommand:
         netuids_copy = netuids.copy()
 
         with console.status(":satellite: Syncing with chain: [white]{}[/white] ...".format(cli.config.subtensor.get('network', bittensor.defaults.subtensor.network))):
-            for netuid in tqdm(netuids_copy, desc="Checking each subnet"):
-                all_neurons: List[bittensor.NeuronInfoLite] = subtensor.neurons_lite( netuid = netuid )
+            neurons_for_netuid = snapshot.neurons_lite_for( netuids_copy )
+            for netuid in netuids_copy:
+                all_neurons: List[bittensor.NeuronInfoLite] = neurons_for_netuid[netuid]
                 # Map the hotkeys to uids
                 hotkey_to_neurons = {n.hotkey: n.uid for n in all_neurons}
                 for hot_wallet in all_hotkeys:
@@ -115,7 +121,7 @@ class OverviewCommand:
         total_neurons = 0
         total_stake = 0.0
         for netuid in netuids:
-            subnet_tempo = subtensor.tempo(netuid=netuid)
+            subnet_tempo = tempos[netuid]
             last_subnet = netuid == netuids[-1]
             TABLE_DATA = []
             total_rank = 0.0
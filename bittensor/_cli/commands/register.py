@@ -16,6 +16,7 @@
 # DEALINGS IN THE SOFTWARE.
 
 import sys
+import time
 import argparse
 import bittensor
 from rich.prompt import Prompt, Confirm
@@ -170,3 +171,65 @@ class RecycleRegisterCommand:
         if config.wallet.get('hotkey') == bittensor.defaults.wallet.hotkey and not config.no_prompt:
             hotkey = Prompt.ask("Enter hotkey name", default = bittensor.defaults.wallet.hotkey)
             config.wallet.hotkey = str(hotkey)
+
+class PowBenchCommand:
+
+    @staticmethod
+    def run( cli ):
+        r""" Benchmark the CPU registration POW solver, no chain connection is needed. """
+        from bittensor.utils.registration import benchmark_pow, get_cpu_count, _create_seal_hash
+        from bittensor.utils.formatting import get_human_readable
+        num_processes = cli.config.get( 'num_processes', None ) or get_cpu_count()
+        bittensor.__console__.print( f"Solving with {num_processes} processes for {cli.config.seconds}s ..." )
+        stats = benchmark_pow( num_processes = num_processes, update_interval = cli.config.get( 'update_interval', None ), seconds = cli.config.seconds )
+        bittensor.__console__.print( f"Hash rate: [bold white]{get_human_readable( stats.hash_rate, 'H' )}/s[/bold white] ({get_human_readable( stats.hash_rate / num_processes, 'H' )}/s per process), {stats.hashes_total:,} hashes" )
+
+        if cli.config.reference:
+            # The nonce by nonce seal the batched solver replaced, on one core.
+            block_and_hotkey_hash_bytes = bytes.fromhex( stats.block_hash[2:] )
+            nonce, start = 0, time.time()
+            while time.time() - start < 1.0:
+                _create_seal_hash( block_and_hotkey_hash_bytes, nonce )
+                nonce += 1
+            bittensor.__console__.print( f"Reference, one nonce at a time: [bold white]{get_human_readable( nonce / ( time.time() - start ), 'H' )}/s[/bold white] per process" )
+
+    @staticmethod
+    def add_args( parser: argparse.ArgumentParser ):
+        pow_bench_parser = parser.add_parser(
+            'pow_bench',
+            help='''Benchmark the CPU registration POW solver without a chain connection.'''
+        )
+        pow_bench_parser.add_argument(
+            '--no_version_checking',
+            action='store_true',
+            help='''Set false to stop cli version checking''',
+            default = False
+        )
+        pow_bench_parser.add_argument(
+            '--seconds',
+            type=float,
+            help='''Duration of the benchmark in seconds.''',
+            default=10.0,
+        )
+        pow_bench_parser.add_argument(
+            '--num_processes',
+            type=int,
+            help='''Number of solver processes, defaults to the number of CPU cores.''',
+            default=None,
+        )
+        pow_bench_parser.add_argument(
+            '--update_interval',
+            type=int,
+            help='''Number of nonces each process solves between reports.''',
+            default=None,
+        )
+        pow_bench_parser.add_argument(
+            '--reference',
+            action='store_true',
+            help='''Also measure the nonce by nonce seal hash on one core.''',
+            default=False,
+        )
+
+    @staticmethod
+    def check_config( config: 'bittensor.Config' ):
+        pass
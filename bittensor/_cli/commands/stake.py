@@ -78,6 +78,9 @@ class StakeCommand:
 
         # Get coldkey balance
         wallet_balance: Balance = subtensor.get_balance( wallet.coldkeypub.ss58_address )
+        if config.get('max_stake'):
+            # Get the current stake of every hotkey from this coldkey, in one round trip.
+            hotkey_stakes = subtensor.get_stakes_for( [ ( hotkey[1], wallet.coldkeypub.ss58_address ) for hotkey in hotkeys_to_stake_to ] )
         final_hotkeys: List[Tuple[str, str]] = []
         final_amounts: List[Union[float, Balance]] = []
         for hotkey in tqdm(hotkeys_to_stake_to):
@@ -97,7 +100,7 @@ class StakeCommand:
             stake_amount_tao: float = config.get('amount')
             if config.get('max_stake'):
                 # Get the current stake of the hotkey from this coldkey.
-                hotkey_stake: Balance = subtensor.get_stake_for_coldkey_and_hotkey( hotkey_ss58 = hotkey[1], coldkey_ss58 = wallet.coldkeypub.ss58_address )
+                hotkey_stake: Balance = hotkey_stakes[ ( hotkey[1], wallet.coldkeypub.ss58_address ) ]
                 stake_amount_tao: float = config.get('max_stake') - hotkey_stake.tao
 
                 # If the max_stake is greater than the current wallet balance, stake the entire balance.
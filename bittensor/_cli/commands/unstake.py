@@ -178,10 +178,12 @@ class UnStakeCommand:
 
         final_hotkeys: List[Tuple[str, str]] = []
         final_amounts: List[Union[float, Balance]] = []
+        # Get the current stake of every hotkey from this coldkey, in one round trip.
+        hotkey_stakes = subtensor.get_stakes_for( [ ( hotkey[1], wallet.coldkeypub.ss58_address ) for hotkey in hotkeys_to_unstake_from ] )
         for hotkey in tqdm(hotkeys_to_unstake_from):
             hotkey: Tuple[Optional[str], str] # (hotkey_name (or None), hotkey_ss58)
             unstake_amount_tao: float = cli.config.get('amount') # The amount specified to unstake.
-            hotkey_stake: Balance = subtensor.get_stake_for_coldkey_and_hotkey( hotkey_ss58 = hotkey[1], coldkey_ss58 = wallet.coldkeypub.ss58_address )
+            hotkey_stake: Balance = hotkey_stakes[ ( hotkey[1], wallet.coldkeypub.ss58_address ) ]
             if unstake_amount_tao == None:
                 unstake_amount_tao = hotkey_stake.tao
             if cli.config.get('max_stake'):
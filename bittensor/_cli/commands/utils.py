@@ -18,7 +18,6 @@
 
 import sys
 import os
-import torch
 import bittensor
 from typing import List, Dict, Any, Optional
 from rich.prompt import Confirm, Prompt, PromptBase
@@ -64,6 +63,7 @@ def check_netuid_set( config: 'bittensor.Config', subtensor: 'bittensor.Subtenso
 
 def check_for_cuda_reg_config( config: 'bittensor.Config' ) -> None:
     """Checks, when CUDA is available, if the user would like to register with their CUDA device."""
+    import torch
     if torch.cuda.is_available():
         if not config.no_prompt:
             if config.subtensor.register.cuda.get('use_cuda') == None: # flag not set
@@ -98,20 +98,8 @@ def check_for_cuda_reg_config( config: 'bittensor.Config' ) -> None:
                 config.subtensor.register.cuda.use_cuda = bittensor.defaults.subtensor.register.cuda.use_cuda
 
 def get_hotkey_wallets_for_wallet( wallet ) -> List['bittensor.wallet']:
-    hotkey_wallets = []
-    hotkeys_path = wallet.path + '/' + wallet.name + '/hotkeys'
-    try:
-        hotkey_files = next(os.walk(os.path.expanduser(hotkeys_path)))[2]
-    except StopIteration:
-        hotkey_files = []
-    for hotkey_file_name in hotkey_files:
-        try:
-            hotkey_for_name = bittensor.wallet( path = wallet.path, name = wallet.name, hotkey = hotkey_file_name )
-            if hotkey_for_name.hotkey_file.exists_on_device() and not hotkey_for_name.hotkey_file.is_encrypted():
-                hotkey_wallets.append( hotkey_for_name )
-        except Exception:
-            pass
-    return hotkey_wallets
+    # Address only views, the hotkey files are read in parallel and nothing is decrypted.
+    return bittensor.wallet.load_all( path = wallet.path, names = [ wallet.name ] )
 
 def get_coldkey_wallets_for_path( path: str ) -> List['bittensor.wallet']:
     try:
@@ -123,12 +111,7 @@ def get_coldkey_wallets_for_path( path: str ) -> List['bittensor.wallet']:
     return wallets
 
 def get_all_wallets_for_path( path:str ) -> List['bittensor.wallet']:
-    all_wallets = []
-    cold_wallets = get_coldkey_wallets_for_path(path)
-    for cold_wallet in cold_wallets:
-        if cold_wallet.coldkeypub_file.exists_on_device() and not cold_wallet.coldkeypub_file.is_encrypted():
-            all_wallets.extend( get_hotkey_wallets_for_wallet(cold_wallet) )
-    return all_wallets
+    return [ view for view in bittensor.wallet.load_all( path = path ) if view.coldkeypub_ss58 != None ]
 
 @dataclass
 class DelegatesDetails:
@@ -21,10 +21,8 @@ Implementation of the config class, which manages the config of different bitten
 
 import yaml
 import json
-import pandas
 import bittensor
 from munch import Munch
-from prometheus_client import Info
 
 class Config ( Munch ):
     """
@@ -61,6 +59,8 @@ class Config ( Munch ):
         """
             Sends the config to the inprocess prometheus server if it exists.
         """
+        import pandas
+        from prometheus_client import Info
         try:
             prometheus_info = Info('config', 'Config Values')
             config_info = pandas.json_normalize(json.loads(json.dumps(self)), sep='.').to_dict(orient='records')[0]
@@ -98,6 +98,7 @@ class DendriteCall( ABC ):
     def did_fail( self ) -> bool: return not self.is_success
 
     def log_outbound(self):
+        if not bittensor.logging.rpc_log_enabled(): return
         bittensor.logging.rpc_log(
             axon = False,
             forward = self.is_forward,
@@ -113,6 +114,7 @@ class DendriteCall( ABC ):
         )
 
     def log_inbound(self):
+        if not bittensor.logging.rpc_log_enabled(): return
         bittensor.logging.rpc_log(
             axon = False,
             forward = self.is_forward,
@@ -193,6 +195,12 @@ class Dendrite( ABC, torch.nn.Module ):
             dendrite_call.return_message = 'GRPC error code: {}, details: {}'.format( rpc_error_call.code(), str(rpc_error_call.details()) )
             bittensor.logging.trace( 'Dendrite.apply() rpc error: {}'.format( dendrite_call.return_message ) )
 
+        # The caller stopped waiting for this call, e.g. a dendrite pool which already has enough responses.
+        except asyncio.CancelledError:
+            dendrite_call.return_code = bittensor.proto.ReturnCode.Timeout
+            dendrite_call.return_message = 'GRPC request cancelled'
+            bittensor.logging.trace( 'Dendrite.apply() cancelled' )
+
         # Catch timeout errors.
         except asyncio.TimeoutError:
             dendrite_call.return_code = bittensor.proto.ReturnCode.Timeout
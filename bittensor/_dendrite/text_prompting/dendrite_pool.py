@@ -17,10 +17,33 @@
 # DEALINGS IN THE SOFTWARE.
 import grpc
 import json
+import time
 import torch
 import asyncio
 import bittensor
-from typing import Callable, List, Dict, Union
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, List, Dict, Optional, Tuple, Union
+from bittensor._dendrite.text_prompting.dendrite import DendriteForwardCall
+
+@dataclass
+class DendritePoolStats:
+    """ Channel counters of a TextPromptingDendritePool, accumulated over its resyncs."""
+    # Channels currently held by the pool, one per uid.
+    open_channels: int = 0
+    # Channels created, including the ones built on construction.
+    channels_created: int = 0
+    # Channels closed because their axon left or changed.
+    channels_closed: int = 0
+    # Channels replaced because the axon serving a uid changed its hotkey, ip or port.
+    reconnects: int = 0
+    # Channels kept open across the last resync.
+    reused_last_resync: int = 0
+    # Wall time spent creating channels.
+    channel_creation_seconds: float = 0.0
+
+    @property
+    def mean_channel_creation_seconds( self ) -> float:
+        return self.channel_creation_seconds / max( 1, self.channels_created )
 
 class TextPromptingDendritePool( torch.nn.Module ):
 
@@ -32,11 +55,65 @@ class TextPromptingDendritePool( torch.nn.Module ):
         super(TextPromptingDendritePool, self).__init__()
         self.metagraph = metagraph
         self.keypair = keypair
-        self.ip = bittensor.utils.networking.get_external_ip()
-        self.dendrites = [ bittensor.text_prompting( axon = axon, keypair = self.keypair, uid = uid, ip = self.ip) for uid, axon in enumerate(self.metagraph.axons) ]
+        self.ip = bittensor.utils.networking.get_external_ip_cached()
+        self.stats = DendritePoolStats()
+        self.dendrites = [ self._create_dendrite( uid, axon ) for uid, axon in enumerate( self.metagraph.axons ) ]
+        self.stats.open_channels = len( self.dendrites )
         self.loop = asyncio.get_event_loop()
         self.priority_threadpool = bittensor.prioritythreadpool(max_workers = 1)
 
+    @staticmethod
+    def _endpoint_key( axon: 'bittensor.axon_info' ) -> Tuple[str, str, int]:
+        return ( axon.hotkey, axon.ip, axon.port )
+
+    def _create_dendrite( self, uid: int, axon: 'bittensor.axon_info' ) -> 'bittensor.text_prompting':
+        start = time.perf_counter()
+        dendrite = bittensor.text_prompting( axon = axon, keypair = self.keypair, uid = uid, ip = self.ip )
+        self.stats.channel_creation_seconds += time.perf_counter() - start
+        self.stats.channels_created += 1
+        return dendrite
+
+    def resync( self, metagraph: 'bittensor.metagraph' ) -> 'DendritePoolStats':
+        r""" Points the pool at the axons of metagraph, usually the same object after a sync. Dendrites whose
+            ( hotkey, ip, port ) is unchanged keep their open channel, even if their uid moved. Channels are only
+            opened for new or changed axons and closed for axons which are gone.
+            Args:
+                metagraph (:obj:`bittensor.metagraph`, `required`):
+                    The synced metagraph.
+            Returns:
+                stats (:obj:`DendritePoolStats`):
+                    The pool counters after the resync.
+        """
+        previous = {}
+        for dendrite in self.dendrites:
+            previous.setdefault( self._endpoint_key( dendrite.axon_info ), [] ).append( dendrite )
+        previous_keys = [ self._endpoint_key( dendrite.axon_info ) for dendrite in self.dendrites ]
+
+        dendrites, reused = [], 0
+        for uid, axon in enumerate( metagraph.axons ):
+            key = self._endpoint_key( axon )
+            if len( previous.get( key, [] ) ) > 0:
+                dendrite = previous[ key ].pop( 0 )
+                dendrite.uid = uid
+                dendrite.axon_info = axon
+                reused += 1
+            else:
+                if uid < len( previous_keys ):
+                    self.stats.reconnects += 1
+                dendrite = self._create_dendrite( uid, axon )
+            dendrites.append( dendrite )
+
+        for stale in previous.values():
+            for dendrite in stale:
+                dendrite.close()
+                self.stats.channels_closed += 1
+
+        self.metagraph = metagraph
+        self.dendrites = dendrites
+        self.stats.open_channels = len( dendrites )
+        self.stats.reused_last_resync = reused
+        return self.stats
+
     def backward( self,
             forward_calls: List[ 'DendriteForwardCall' ],
             rewards: Union[ List[ float ], torch.FloatTensor ],
@@ -76,6 +153,8 @@ class TextPromptingDendritePool( torch.nn.Module ):
             return_call:bool = True,
             timeout: float = 12,
             priority: int = 1,
+            first_k: Optional[int] = None,
+            deadline: Optional[float] = None,
         ) -> List['DendriteForwardCall']:
         def _forward():
             bittensor.logging.trace( 'dendrite pool: forward: _forward: start')
@@ -86,6 +165,8 @@ class TextPromptingDendritePool( torch.nn.Module ):
                     uids = uids,
                     return_call = return_call,
                     timeout = timeout,
+                    first_k = first_k,
+                    deadline = deadline,
                 )
             )
         future = self.priority_threadpool.submit(
@@ -100,24 +181,106 @@ class TextPromptingDendritePool( torch.nn.Module ):
             messages: Union[ str, List[str] ],
             uids: Union[ torch.LongTensor, List[int] ] = None,
             return_call:bool = True,
-            timeout: float = 12
+            timeout: float = 12,
+            first_k: Optional[int] = None,
+            deadline: Optional[float] = None,
         ) -> List['DendriteForwardCall']:
+        r""" Queries uids and returns their calls, or completions if not return_call, in the order of uids.
+            With first_k or deadline set, the calls still in flight once first_k calls succeeded or the deadline
+            passed are cancelled and returned with a Timeout return code.
+        """
         # We optionally set the uids to all if uids is None.
         if uids is None: uids = range( self.metagraph.n.item() )
         if isinstance( uids, torch.Tensor ): uids = uids.tolist()
-        # The following asyncio defintion queries a single endpoint with the message
-        # prompt and returns the response.
-        async def call_single_uid( uid: int ) -> str:
-            return await self.dendrites[uid].async_forward(
-                roles = roles,
-                messages = messages,
-                return_call = return_call,
-                timeout = timeout
-            )
-        # The following asyncio definition gathers the responses
-        # from multiple coroutines for each uid.
-        async def query():
-            coroutines = [ call_single_uid( uid ) for uid in uids ]
-            all_responses = await asyncio.gather(*coroutines)
-            return all_responses
-        return await query()
\ No newline at end of file
+        if first_k is None and deadline is None:
+            # The following asyncio defintion queries a single endpoint with the message
+            # prompt and returns the response.
+            async def call_single_uid( uid: int ) -> str:
+                return await self.dendrites[uid].async_forward(
+                    roles = roles,
+                    messages = messages,
+                    return_call = return_call,
+                    timeout = timeout
+                )
+            # The following asyncio definition gathers the responses
+            # from multiple coroutines for each uid.
+            async def query():
+                coroutines = [ call_single_uid( uid ) for uid in uids ]
+                all_responses = await asyncio.gather(*coroutines)
+                return all_responses
+            return await query()
+
+        responses = [ None ] * len( uids )
+        async for index, forward_call in self._stream_forward( roles, messages, uids, timeout, first_k, deadline ):
+            responses[ index ] = forward_call if return_call else forward_call.completion
+        return responses
+
+    async def async_forward_as_completed(
+            self,
+            roles: Union[ str, List[str] ],
+            messages: Union[ str, List[str] ],
+            uids: Union[ torch.LongTensor, List[int] ] = None,
+            timeout: float = 12,
+            first_k: Optional[int] = None,
+            deadline: Optional[float] = None,
+        ) -> AsyncIterator['DendriteForwardCall']:
+        r""" Queries uids and yields each forward call as soon as it finishes, fastest first.
+            Args:
+                roles ( Union[ str, List[str] ] ):
+                    roles associated with messages.
+                messages ( Union[ str, List[str] ] ):
+                    messages content for each role.
+                uids ( Union[ torch.LongTensor, List[int] ], `optional` ):
+                    uids to query, defaults to all.
+                timeout ( float ):
+                    timeout of each call in seconds.
+                first_k ( Optional[int] ):
+                    once first_k calls returned a non empty completion, the remaining calls are cancelled.
+                deadline ( Optional[float] ):
+                    seconds from now after which the remaining calls are cancelled. Each call timeout is capped
+                    to the deadline.
+            Yields:
+                forward_call ( DendriteForwardCall ):
+                    finished calls, then the cancelled ones with a Timeout return code. forward_call.dendrite.uid
+                    is the queried uid.
+        """
+        if uids is None: uids = range( self.metagraph.n.item() )
+        if isinstance( uids, torch.Tensor ): uids = uids.tolist()
+        async for _, forward_call in self._stream_forward( roles, messages, uids, timeout, first_k, deadline ):
+            yield forward_call
+
+    async def _stream_forward(
+            self,
+            roles: Union[ str, List[str] ],
+            messages: Union[ str, List[str] ],
+            uids: List[int],
+            timeout: Optional[float],
+            first_k: Optional[int],
+            deadline: Optional[float],
+        ) -> AsyncIterator[Tuple[int, 'DendriteForwardCall']]:
+        if deadline is not None:
+            timeout = deadline if timeout is None else min( timeout, deadline )
+            deadline = time.monotonic() + deadline
+        forward_calls = [ DendriteForwardCall( dendrite = self.dendrites[uid], messages = messages, roles = roles, timeout = timeout ) for uid in uids ]
+        tasks = { asyncio.ensure_future( self.dendrites[uid].apply( dendrite_call = forward_call ) ): index for index, ( uid, forward_call ) in enumerate( zip( uids, forward_calls ) ) }
+        pending, successes = set( tasks ), 0
+        try:
+            while len( pending ) > 0 and ( first_k is None or successes < first_k ):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0: break
+                done, pending = await asyncio.wait( pending, timeout = remaining, return_when = asyncio.FIRST_COMPLETED )
+                for task in done:
+                    forward_call = forward_calls[ tasks[task] ]
+                    if forward_call.is_success and len( forward_call.completion ) > 0: successes += 1
+                    yield tasks[task], forward_call
+        finally:
+            for task in pending: task.cancel()
+            if len( pending ) > 0:
+                await asyncio.gather( *pending, return_exceptions = True )
+        reason = 'Cancelled after {} successful completions'.format( first_k ) if first_k is not None and successes >= first_k else 'Cancelled at the deadline'
+        for task in pending:
+            forward_call = forward_calls[ tasks[task] ]
+            if not forward_call.completed: forward_call.end()
+            forward_call.return_code = bittensor.proto.ReturnCode.Timeout
+            forward_call.return_message = reason
+            yield tasks[task], forward_call
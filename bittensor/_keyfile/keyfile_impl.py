@@ -20,8 +20,9 @@ import base64
 import json
 import stat
 import getpass
+import threading
 import bittensor
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 
 from ansible_vault import Vault
@@ -252,6 +253,78 @@ def decrypt_keyfile_data(keyfile_data: bytes, password: str = None, coldkey_name
         decrypted_keyfile_data = json.dumps( decrypted_keyfile_data ).encode()
     return decrypted_keyfile_data
 
+def keyfile_data_to_ss58_address( keyfile_data:bytes ) -> str:
+    """ Returns the ss58 address stored in unencrypted keyfile data, without deriving the keypair from its secret.
+        Args:
+            keyfile_data ( bytes, required ):
+                Unencrypted keyfile data.
+        Returns:
+            ss58_address (str):
+                Address of the keypair.
+        Raises:
+            KeyFileError:
+                Raised if the data is encrypted or holds no keypair.
+    """
+    if keyfile_data_is_encrypted( keyfile_data ):
+        raise KeyFileError( 'Keyfile data is encrypted, decrypt it to read its address' )
+    try:
+        keyfile_dict = dict( json.loads( keyfile_data.decode() ) )
+    except:
+        keyfile_dict = {}
+    if keyfile_dict.get( 'ss58Address' ) != None:
+        return keyfile_dict['ss58Address']
+    return deserialize_keypair_from_keyfile_data( keyfile_data ).ss58_address
+
+class KeypairCache( object ):
+    """ In process cache of the keypairs deserialized from unencrypted keyfiles. An entry is keyed by the keyfile
+        path and only returned while the ( inode, mtime, size ) of the file is unchanged, so edits made by other
+        processes are picked up. Keypairs read from encrypted keyfiles are never cached, their secrets stay
+        wherever the caller keeps them.
+    """
+    def __init__( self ):
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[ str, Tuple[ Tuple[int, int, int], 'bittensor.Keypair' ] ] = {}
+
+    @staticmethod
+    def stat_key( path: str ) -> Optional[ Tuple[int, int, int] ]:
+        """ Returns the ( inode, mtime, size ) of path, or None if it cannot be stat'ed. """
+        try:
+            stat_result = os.stat( path )
+        except OSError:
+            return None
+        return ( stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size )
+
+    def get( self, path: str, stat_key: Tuple[int, int, int] ) -> Optional['bittensor.Keypair']:
+        with self.lock:
+            entry = self._entries.get( path )
+            if entry is None or entry[0] != stat_key:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def put( self, path: str, stat_key: Tuple[int, int, int], keypair: 'bittensor.Keypair' ):
+        with self.lock:
+            self._entries[ path ] = ( stat_key, keypair )
+
+    def invalidate( self, path: str ):
+        with self.lock:
+            self._entries.pop( path, None )
+
+    def clear( self ):
+        with self.lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__( self ) -> int:
+        return len( self._entries )
+
+# Shared by the keyfiles of this process.
+keypair_cache = KeypairCache()
+
 class Keyfile( object ):
     """ Defines an interface for a subtrate interface keypair stored on device.
     """
@@ -344,10 +417,34 @@ class Keyfile( object ):
                     Raised if the file does not exists, is not readable, writable
                     corrupted, or if the password is incorrect.
         """
+        stat_key = keypair_cache.stat_key( self.path )
+        keypair = keypair_cache.get( self.path, stat_key ) if stat_key != None else None
+        if keypair != None:
+            return keypair
         keyfile_data = self._read_keyfile_data_from_file()
         if keyfile_data_is_encrypted( keyfile_data ):
             keyfile_data = decrypt_keyfile_data(keyfile_data, password, coldkey_name=self.name)
-        return deserialize_keypair_from_keyfile_data( keyfile_data )
+            return deserialize_keypair_from_keyfile_data( keyfile_data )
+        keypair = deserialize_keypair_from_keyfile_data( keyfile_data )
+        if stat_key != None:
+            keypair_cache.put( self.path, stat_key, keypair )
+        return keypair
+
+    @property
+    def ss58_address( self ) -> str:
+        """ Returns the address of the keypair under path without deriving it from its secret.
+            Returns:
+                ss58_address (str):
+                    Address of the keypair stored under path.
+            Raises:
+                KeyFileError:
+                    Raised if the file does not exists, is not readable, is encrypted or corrupted.
+        """
+        stat_key = keypair_cache.stat_key( self.path )
+        keypair = keypair_cache.get( self.path, stat_key ) if stat_key != None else None
+        if keypair != None:
+            return keypair.ss58_address
+        return keyfile_data_to_ss58_address( self._read_keyfile_data_from_file() )
 
     def make_dirs( self ):
         """ Makes directories for path.
@@ -481,6 +578,8 @@ class Keyfile( object ):
         if self.exists_on_device() and not overwrite:
             if not self._may_overwrite():
                 raise KeyFileError( "Keyfile at: {} is not writeable".format( self.path ) )
+        # Writes from this process may keep the size and land within the mtime resolution.
+        keypair_cache.invalidate( self.path )
         with open(self.path, "wb") as keyfile:
             keyfile.write( keyfile_data )
         # Set file permissions.
@@ -510,6 +609,10 @@ class MockKeyfile( object ):
     def keypair( self ) -> 'bittensor.Keypair':
         return self._mock_keypair
 
+    @property
+    def ss58_address( self ) -> str:
+        return self._mock_keypair.ss58_address
+
     @property
     def data( self ) -> bytes:
         return bytes(self._mock_data)
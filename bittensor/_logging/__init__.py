@@ -20,12 +20,13 @@
 import os
 import sys
 import copy
-import torch
+import time
 import argparse
 import bittensor
 import bittensor.utils.codes as codes
 
 from loguru import logger
+from .rpc_sink import RpcLogSink
 logger = logger.opt(colors=True)
 # Remove default sink.
 try:
@@ -46,6 +47,7 @@ class logging:
     __trace_on__:bool = False
     __std_sink__:int = None
     __file_sink__:int = None
+    __rpc_sink__:'RpcLogSink' = None
 
     def __new__(
             cls,
@@ -54,6 +56,7 @@ class logging:
             trace: bool = None,
             record_log: bool = None,
             logging_dir: str = None,
+            rpc_sink: str = None,
         ):
         r""" Instantiate bittensor logging system backend.
             Args:
@@ -67,6 +70,8 @@ class logging:
                     If true, logs are saved to loggind dir.
                 logging_dir (:obj:`str`, `optional`):
                     Directory where logs are sunk.
+                rpc_sink (:obj:`str`, `optional`):
+                    If set, JSON lines file receiving every rpc_log record, see add_rpc_sink.
         """
 
         cls.__has_been_inited__ = True
@@ -78,6 +83,7 @@ class logging:
         config.logging.trace = trace if trace != None else config.logging.trace
         config.logging.record_log = record_log if record_log != None else config.logging.record_log
         config.logging.logging_dir = logging_dir if logging_dir != None else config.logging.logging_dir
+        config.logging.rpc_sink = rpc_sink if rpc_sink != None else config.logging.get( 'rpc_sink', None )
 
         # Remove default sink.
         try:
@@ -120,6 +126,10 @@ class logging:
                 retention="10 days"
             )
 
+        # ---- Setup the structured rpc sink ----
+        if config.logging.rpc_sink:
+            cls.add_rpc_sink( config.logging.rpc_sink )
+
     @classmethod
     def config(cls):
         """ Get config from the argument parser
@@ -148,6 +158,7 @@ class logging:
             parser.add_argument('--' + prefix_str + 'logging.trace', action='store_true', help='''Turn on bittensor trace level information''', default = bittensor.defaults.logging.trace )
             parser.add_argument('--' + prefix_str + 'logging.record_log', action='store_true', help='''Turns on logging to file.''', default = bittensor.defaults.logging.record_log )
             parser.add_argument('--' + prefix_str + 'logging.logging_dir', type=str, help='Logging default root directory.', default = bittensor.defaults.logging.logging_dir )
+            parser.add_argument('--' + prefix_str + 'logging.rpc_sink', type=str, help='''If set, axon and dendrite rpc records are written to this JSON lines file from a background thread.''', default = bittensor.defaults.logging.rpc_sink )
         except argparse.ArgumentError:
             # re-parsing arguments.
             pass
@@ -161,6 +172,7 @@ class logging:
         defaults.logging.trace = os.getenv('BT_LOGGING_TRACE') if os.getenv('BT_LOGGING_DEBUG') != None else False
         defaults.logging.record_log = os.getenv('BT_LOGGING_RECORD_LOG') if os.getenv('BT_LOGGING_RECORD_LOG') != None else False
         defaults.logging.logging_dir = os.getenv('BT_LOGGING_LOGGING_DIR') if os.getenv('BT_LOGGING_LOGGING_DIR') != None else '~/.bittensor/miners'
+        defaults.logging.rpc_sink = os.getenv('BT_LOGGING_RPC_SINK') if os.getenv('BT_LOGGING_RPC_SINK') != None else None
 
     @classmethod
     def check_config( cls, config: 'bittensor.Config' ):
@@ -188,6 +200,39 @@ class logging:
     def get_level( cls ) -> int:
         return 5 if cls.__trace_on__ else 10 if cls.__debug_on__ else 20
 
+    @classmethod
+    def add_rpc_sink( cls, path: str, batch_size: int = 1024, flush_interval: float = 1.0 ) -> 'RpcLogSink':
+        r""" Sends every rpc_log record, whatever the log level, to a JSON lines file written in batches from a
+            background thread. Replaces the previous rpc sink.
+            Args:
+                path (:obj:`str`, `required`):
+                    JSON lines file.
+                batch_size (:obj:`int`, `optional`):
+                    Maximum records per write.
+                flush_interval (:obj:`float`, `optional`):
+                    Maximum seconds a record waits before being written.
+            Returns:
+                sink (:obj:`RpcLogSink`):
+                    The attached sink.
+        """
+        cls.remove_rpc_sink()
+        cls.__rpc_sink__ = RpcLogSink( path, batch_size = batch_size, flush_interval = flush_interval )
+        return cls.__rpc_sink__
+
+    @classmethod
+    def remove_rpc_sink( cls ):
+        """ Detaches the rpc sink, writing its queued records first.
+        """
+        sink, cls.__rpc_sink__ = cls.__rpc_sink__, None
+        if sink != None:
+            sink.close()
+
+    @classmethod
+    def rpc_log_enabled( cls ) -> bool:
+        """ True if rpc_log records go anywhere. Callers check it before computing the rpc_log arguments.
+        """
+        return cls.__debug_on__ or cls.__trace_on__ or cls.__rpc_sink__ != None
+
     @classmethod
     def log_filter(cls, record ):
         """ Filter out debug log if debug is not on
@@ -243,6 +288,12 @@ class logging:
         ):
         """ Debug logging for the communication between endpoints with axon/dendrite
         """
+        if cls.__rpc_sink__ != None:
+            cls.__rpc_sink__.put( ( time.time(), axon, forward, is_response, code, call_time, pubkey, uid, outputs if is_response else inputs, message, synapse ) )
+
+        # Debug records are filtered out by both loguru sinks below debug, skip the formatting.
+        if not ( cls.__debug_on__ or cls.__trace_on__ ):
+            return
 
         if axon:
             prefix = "Synapse"
@@ -303,10 +354,12 @@ class logging:
     def _format( cls, prefix:object, sufix:object = None ):
         """ Format logging message
         """
-        if isinstance( prefix, torch.Tensor ):
+        # Tensors can only come from callers which imported torch already.
+        torch = sys.modules.get( 'torch' )
+        if torch is not None and isinstance( prefix, torch.Tensor ):
             prefix = prefix.detach()
         if sufix != None:
-            if isinstance( sufix, torch.Tensor ):
+            if torch is not None and isinstance( sufix, torch.Tensor ):
                 sufix = 'shape: {}'.format( str(sufix.shape) ) + " data: {}".format( str( sufix.detach() ) )
             else:
                 sufix = "{}".format( str( sufix ) )
@@ -349,6 +402,7 @@ class logging:
         """ Info logging
         """
         if not cls.__has_been_inited__: cls()
+        if not ( cls.__debug_on__ or cls.__trace_on__ ): return
         logger.debug( cls._format( prefix, sufix ) )
 
     @classmethod
@@ -356,4 +410,5 @@ class logging:
         """ Info logging
         """
         if not cls.__has_been_inited__: cls()
+        if not ( cls.__trace_on__ ): return
         logger.trace( cls._format( prefix, sufix ) )
@@ -0,0 +1,155 @@
+# The MIT License (MIT)
+# Copyright © 2021 Yuma Rao
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import os
+import json
+import time
+import queue
+import threading
+import bittensor
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import bittensor.utils.codes as codes
+
+# Fields of a queued rpc record, in tuple order.
+RPC_RECORD_FIELDS = ( 'time', 'axon', 'forward', 'is_response', 'code', 'call_time', 'pubkey', 'uid', 'shape', 'message', 'synapse' )
+
+@dataclass
+class RpcLogSinkStats:
+    """ Counters of an RpcLogSink."""
+    # Records written to the file.
+    written: int = 0
+    # Records dropped because the queue was full.
+    dropped: int = 0
+    # Batched writes.
+    batches: int = 0
+    # Records which could not be formatted.
+    format_errors: int = 0
+    # Batches lost because the file write failed.
+    write_errors: int = 0
+
+class RpcLogSink:
+    r""" Writes rpc_log records as JSON lines from a background thread.
+
+        put() only enqueues the raw record tuple, the formatting and file writes happen on the writer thread in
+        batches of up to batch_size records, at least every flush_interval seconds. When the queue is full new
+        records are dropped and counted instead of blocking the caller.
+    """
+    def __init__(
+            self,
+            path: str,
+            batch_size: int = 1024,
+            flush_interval: float = 1.0,
+            max_queue: int = 65536,
+        ):
+        r""" Opens path for appending and starts the writer thread.
+            Args:
+                path (:obj:`str`, `required`):
+                    JSON lines file, created with its parent directories.
+                batch_size (:obj:`int`, `optional`):
+                    Maximum records per write.
+                flush_interval (:obj:`float`, `optional`):
+                    Maximum seconds a record waits in the queue.
+                max_queue (:obj:`int`, `optional`):
+                    Queued records after which new ones are dropped.
+        """
+        self.path = os.path.expanduser( path )
+        directory = os.path.dirname( self.path )
+        if directory != '':
+            os.makedirs( directory, exist_ok = True )
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.stats = RpcLogSinkStats()
+        self._file = open( self.path, 'a' )
+        self._queue = queue.Queue( maxsize = max_queue )
+        self._stop = object()
+        self._thread = threading.Thread( target = self._run, name = 'rpc_log_sink', daemon = True )
+        self._thread.start()
+
+    def __str__( self ) -> str:
+        return "RpcLogSink({})".format( self.path )
+
+    def __repr__( self ) -> str:
+        return self.__str__()
+
+    def put( self, record: Tuple ):
+        r""" Enqueues a record tuple ordered as RPC_RECORD_FIELDS. """
+        try:
+            self._queue.put_nowait( record )
+        except queue.Full:
+            self.stats.dropped += 1
+
+    @staticmethod
+    def to_json( record: Tuple ) -> str:
+        fields = dict( zip( RPC_RECORD_FIELDS, record ) )
+        fields['code'] = codes.code_to_string( fields['code'] )
+        fields['shape'] = list( fields['shape'] ) if fields['shape'] is not None else None
+        if fields['synapse'] is not None:
+            fields['synapse'] = str( fields['synapse'] )
+        return json.dumps( fields, separators = ( ',', ':' ), default = str )
+
+    def _run( self ):
+        stopping = False
+        while not stopping:
+            try:
+                batch = [ self._queue.get( timeout = self.flush_interval ) ]
+            except queue.Empty:
+                continue
+            while len( batch ) < self.batch_size:
+                try:
+                    batch.append( self._queue.get_nowait() )
+                except queue.Empty:
+                    break
+            lines, flushed = [], []
+            for record in batch:
+                if record is self._stop:
+                    stopping = True
+                elif isinstance( record, threading.Event ):
+                    flushed.append( record )
+                else:
+                    try:
+                        lines.append( self.to_json( record ) + '\n' )
+                    except Exception as e:
+                        self.stats.format_errors += 1
+                        bittensor.logging.error( 'RpcLogSink dropped a record', str( e ) )
+            if len( lines ) > 0:
+                try:
+                    self._file.write( ''.join( lines ) )
+                    self._file.flush()
+                    self.stats.written += len( lines )
+                    self.stats.batches += 1
+                except Exception as e:
+                    self.stats.write_errors += 1
+                    bittensor.logging.error( 'RpcLogSink failed to write {} records'.format( len( lines ) ), str( e ) )
+            for event in flushed:
+                event.set()
+        self._file.close()
+
+    def flush( self, timeout: Optional[float] = None ) -> bool:
+        r""" Blocks until the records queued before the call are written. Returns False on timeout. """
+        if not self._thread.is_alive():
+            return False
+        event = threading.Event()
+        self._queue.put( event )
+        return event.wait( timeout )
+
+    def close( self ):
+        r""" Writes the queued records, then stops the writer thread and closes the file. """
+        if self._thread.is_alive():
+            self._queue.put( self._stop )
+            self._thread.join()
@@ -23,7 +23,108 @@ import bittensor
 
 from os import listdir
 from os.path import join
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+from bittensor._subtensor.chain_data import RAOPERTAO
+from . import snapshot
+
+# Names of the axon columns stored in snapshots, as in bittensor.NeuronColumns.
+AXON_TABLE = ( 'axon_version', 'axon_ip', 'axon_port', 'axon_ip_type', 'hotkey_bytes', 'coldkey_bytes' )
+
+# Weights and bonds layouts as named in snapshot headers.
+# Snapshots kept by save() under the bittensor root dir, older ones are compacted away.
+SNAPSHOT_KEEP_LAST = 100
+
+_LAYOUTS = { 'strided': torch.strided, 'sparse_coo': torch.sparse_coo, 'sparse_csr': torch.sparse_csr }
+_LAYOUT_NAMES = { layout: name for name, layout in _LAYOUTS.items() }
+
+# Per-uid tensors filled from the neuron columns on sync: ( attribute name, column getter, dtype ).
+NEURON_COLUMNS = [
+    ( 'uids', lambda columns: columns.uid, torch.int64 ),
+    ( 'trust', lambda columns: columns.trust, torch.float32 ),
+    ( 'consensus', lambda columns: columns.consensus, torch.float32 ),
+    ( 'incentive', lambda columns: columns.incentive, torch.float32 ),
+    ( 'dividends', lambda columns: columns.dividends, torch.float32 ),
+    ( 'ranks', lambda columns: columns.rank, torch.float32 ),
+    ( 'emission', lambda columns: columns.emission.double() / RAOPERTAO, torch.float32 ),
+    ( 'active', lambda columns: columns.active, torch.int64 ),
+    ( 'last_update', lambda columns: columns.last_update, torch.int64 ),
+    ( 'validator_permit', lambda columns: columns.validator_permit, torch.bool ),
+    ( 'validator_trust', lambda columns: columns.validator_trust, torch.float32 ),
+    ( 'total_stake', lambda columns: columns.stake.double() / RAOPERTAO, torch.float32 ),
+    ( 'stake', lambda columns: columns.stake.double() / RAOPERTAO, torch.float32 ),
+]
+
+@dataclass
+class MetagraphDiff:
+    r""" Describes which uids changed between two consecutive metagraph syncs.
+    """
+    block: int = 0
+    # True if the tensors were rebuilt from scratch, in which case the uid lists below are not meaningful.
+    full: bool = False
+    # uids which did not exist at the previous sync.
+    new_uids: List[int] = field( default_factory = list )
+    # uids whose hotkey was replaced (deregistered and re-registered).
+    hotkey_changed: List[int] = field( default_factory = list )
+    # uids whose served axon (ip, port, version) changed.
+    axon_changed: List[int] = field( default_factory = list )
+    # uids whose total stake changed.
+    stake_changed: List[int] = field( default_factory = list )
+    # uids which set weights (last_update moved).
+    updated: List[int] = field( default_factory = list )
+    # All previously existing uids with any changed field, including the ones above.
+    changed: List[int] = field( default_factory = list )
+
+    @classmethod
+    def for_full_sync( cls, columns: 'bittensor.NeuronColumns' ) -> 'MetagraphDiff':
+        return cls( full = True, new_uids = list( range( len( columns ) ) ) )
+
+    @classmethod
+    def from_columns( cls, previous: 'bittensor.NeuronColumns', current: 'bittensor.NeuronColumns' ) -> 'MetagraphDiff':
+        r""" Compares two neuron snapshots column by column. current must not be shorter than previous. """
+        n = len( previous )
+        diff = cls( new_uids = list( range( n, len( current ) ) ) )
+        if n == 0:
+            return diff
+        differs = lambda name: ( getattr( previous, name ) != getattr( current, name )[ :n ] ).view( n, -1 ).any( dim = 1 )
+        hotkey_changed = differs( 'hotkey_bytes' )
+        axon_changed = hotkey_changed | differs( 'coldkey_bytes' )
+        for name in ( 'axon_version', 'axon_ip', 'axon_port', 'axon_ip_type' ):
+            axon_changed |= differs( name )
+        changed = axon_changed.clone()
+        for name in bittensor.NeuronColumns.FIELDS:
+            changed |= differs( name )
+        # Stake moving between coldkeys without changing the total.
+        changed |= torch.tensor( [ old != new for old, new in zip( previous.stakes, current.stakes ) ], dtype = torch.bool )
+        if not previous.lite and not current.lite:
+            changed |= _sparse_rows_changed( previous, current, 'weights' ) | _sparse_rows_changed( previous, current, 'bonds' )
+
+        as_list = lambda mask: mask.nonzero().flatten().tolist()
+        diff.hotkey_changed = as_list( hotkey_changed )
+        diff.axon_changed = as_list( axon_changed )
+        diff.stake_changed = as_list( differs( 'stake' ) )
+        diff.updated = as_list( differs( 'last_update' ) )
+        diff.changed = as_list( changed )
+        return diff
+
+    def __len__( self ) -> int:
+        return len( self.changed ) + len( self.new_uids )
+
+def _sparse_rows_changed( previous: 'bittensor.NeuronColumns', current: 'bittensor.NeuronColumns', name: str ) -> torch.BoolTensor:
+    r""" Marks the rows of previous whose sparse 'weights' or 'bonds' entries differ in current. """
+    n = len( previous )
+    # uids and values are u16, so ( row, uid, value ) packs into a single int64 key.
+    as_keys = lambda index, values: ( index[0] << 32 ) | ( index[1] << 16 ) | values
+    previous_index, previous_values = getattr( previous, name )
+    current_index, current_values = getattr( current, name )
+    previous_keys = as_keys( previous_index, previous_values )
+    current_keys = as_keys( current_index, current_values )
+    changed = torch.zeros( n, dtype = torch.bool )
+    changed[ previous_index[0][ ~torch.isin( previous_keys, current_keys ) ] ] = True
+    current_rows = current_index[0]
+    changed[ current_rows[ ( current_rows < n ) & ~torch.isin( current_keys, previous_keys ) ] ] = True
+    return changed
 
 
 # Return directory path from network and netuid
@@ -70,9 +171,18 @@ class metagraph( torch.nn.Module ):
     @property
     def W(self) -> torch.FloatTensor: return self.weights
     @property
-    def hotkeys( self ) -> List[str]: return [ axon.hotkey for axon in self.axons ]
+    def hotkeys( self ) -> List[str]:
+        if getattr( self.axons, 'columns', None ) is not None: return list( self.axons.columns.hotkeys )
+        return [ axon.hotkey for axon in self.axons ]
+    @property
+    def coldkeys( self ) -> List[str]:
+        if getattr( self.axons, 'columns', None ) is not None: return list( self.axons.columns.coldkeys )
+        return [ axon.coldkey for axon in self.axons ]
     @property
-    def coldkeys( self ) -> List[str]: return [ axon.coldkey for axon in self.axons ]
+    def neurons( self ) -> Optional[List['bittensor.NeuronInfoLite']]:
+        r""" Neuron objects of the last sync, materialized from the columns on first access. """
+        if self.columns is None: return None
+        return self.columns.to_neurons()
     @property
     def addresses( self ) -> List[str]: return [ axon.ip_str() for axon in self.axons ]
 
@@ -82,7 +192,7 @@ class metagraph( torch.nn.Module ):
 
     def metadata(self) -> dict: return {"netuid": self.netuid, "n": self.n.item(), "block": self.block.item(), "network": self.network, "version": bittensor.__version__ }
 
-    def __init__(self, netuid: int, network: str = 'finney', lite: bool = True, sync: bool = True ) -> 'metagraph':
+    def __init__(self, netuid: int, network: str = 'finney', lite: bool = True, sync: bool = True, layout: torch.layout = torch.strided ) -> 'metagraph':
         super(metagraph, self).__init__()
         self.netuid = netuid
         self.network = network
@@ -105,73 +215,247 @@ class metagraph( torch.nn.Module ):
         self.bonds = torch.nn.Parameter(  torch.tensor( [], dtype=torch.int64), requires_grad=False )
         self.uids = torch.nn.Parameter( torch.tensor([], dtype = torch.int64),requires_grad=False )
         self.axons = []
+        self.columns = None
+        self._build_key_index()
+        self.lite = lite
+        self.layout = layout
+        self.diff = None
         if sync:
-            self.sync( block = None, lite = lite )
+            self.sync( block = None, lite = lite, layout = layout )
 
-    def sync ( self, block: Optional[int] = None, lite: bool = True ) -> 'metagraph':
+    def sync ( self, block: Optional[int] = None, lite: bool = True, incremental: bool = False, layout: Optional[torch.layout] = None ) -> 'metagraph':
+        r""" Syncs the metagraph with the chain state at the passed block.
+            Args:
+                block ( Optional[int] ):
+                    block to sync from, defaults to the latest block.
+                lite ( bool, default = True ):
+                    If true, syncs using the lite neuron info (no weights, no bonds).
+                incremental ( bool, default = False ):
+                    If true and a previous neuron snapshot exists, only the rows of neurons which changed
+                    since the last sync are rewritten. The result of the comparison is stored in self.diff.
+                layout ( Optional[torch.layout] ):
+                    Layout of the weights and bonds matrices when not lite: torch.strided ( dense ), torch.sparse_coo
+                    or torch.sparse_csr. Defaults to the layout the metagraph was created with.
+        """
         subtensor = bittensor.subtensor( network = self.network )
-        if lite:
-            self.neurons = subtensor.neurons_lite( block = block, netuid = self.netuid )
+        columns = subtensor.neuron_columns( block = block, netuid = self.netuid, lite = lite )
+        self.layout = self.layout if layout is None else layout
+
+        previous_columns = self.columns
+        if incremental and previous_columns and self.lite == lite and len( columns ) >= len( previous_columns ):
+            self.diff = MetagraphDiff.from_columns( previous_columns, columns )
+            self.columns = columns
+            self._patch_from_columns( self.diff )
         else:
-            self.neurons = subtensor.neurons(block = block, netuid = self.netuid )
-        self.lite = lite
-        self.n = torch.nn.Parameter( torch.tensor( len(self.neurons), dtype=torch.int64 ), requires_grad=False )
+            self.columns = columns
+            self.lite = lite
+            self._build_from_columns()
+            self.diff = MetagraphDiff.for_full_sync( self.columns )
         self.version = torch.nn.Parameter( torch.tensor( [bittensor.__version_as_int__], dtype=torch.int64 ), requires_grad=False )
         self.block = torch.nn.Parameter( torch.tensor( subtensor.block, dtype=torch.int64 ), requires_grad=False )
-        self.uids = torch.nn.Parameter( torch.tensor( [ neuron.uid for neuron in self.neurons ], dtype=torch.int64 ), requires_grad=False )
-        self.trust = torch.nn.Parameter( torch.tensor( [ neuron.trust for neuron in self.neurons ], dtype=torch.float32 ), requires_grad=False )
-        self.consensus = torch.nn.Parameter( torch.tensor( [ neuron.consensus for neuron in self.neurons ], dtype=torch.float32 ), requires_grad=False )
-        self.incentive = torch.nn.Parameter( torch.tensor( [ neuron.incentive for neuron in self.neurons ], dtype=torch.float32 ), requires_grad=False )
-        self.dividends = torch.nn.Parameter( torch.tensor( [ neuron.dividends for neuron in self.neurons ], dtype=torch.float32 ), requires_grad=False )
-        self.ranks = torch.nn.Parameter( torch.tensor( [ neuron.rank for neuron in self.neurons ], dtype=torch.float32 ), requires_grad=False )
-        self.emission = torch.nn.Parameter( torch.tensor( [ neuron.emission for neuron in self.neurons ], dtype=torch.float32 ), requires_grad=False )
-        self.active = torch.nn.Parameter( torch.tensor( [ neuron.active for neuron in self.neurons ], dtype=torch.int64 ), requires_grad=False )
-        self.last_update = torch.nn.Parameter( torch.tensor( [ neuron.last_update for neuron in self.neurons ], dtype=torch.int64 ), requires_grad=False )
-        self.validator_permit = torch.nn.Parameter( torch.tensor( [ neuron.validator_permit for neuron in self.neurons ], dtype=torch.bool ), requires_grad=False )
-        self.validator_trust = torch.nn.Parameter( torch.tensor( [ neuron.validator_trust for neuron in self.neurons ], dtype=torch.float32 ), requires_grad=False )
-        self.total_stake = torch.nn.Parameter( torch.tensor( [ neuron.total_stake.tao for neuron in self.neurons ], dtype=torch.float32 ), requires_grad=False )
-        self.stake = torch.nn.Parameter( torch.tensor( [ neuron.stake for neuron in self.neurons ], dtype=torch.float32 ), requires_grad=False )
-        self.axons = [ n.axon_info for n in self.neurons ]
-        if not lite:
-            weights_array = []
-            for n in self.neurons:
-                if len(n.weights) == 0:
-                    weights_array.append( torch.zeros( len( self.neurons ) ) )
-                else:
-                    w_uids, w_weights = zip(*n.weights)
-                    weights_array.append( bittensor.utils.weight_utils.convert_weight_uids_and_vals_to_tensor( len(self.neurons), w_uids, w_weights ) )
-            self.weights = torch.nn.Parameter( torch.stack( weights_array ), requires_grad=False ) if len( weights_array ) else torch.nn.Parameter()
-            if len(weights_array) == 0:
+        self.diff.block = self.block.item()
+        return self
+
+    def _build_from_columns( self ):
+        r""" Rebuilds every tensor and the axons list from self.columns. """
+        n = len( self.columns )
+        self.n = torch.nn.Parameter( torch.tensor( n, dtype=torch.int64 ), requires_grad=False )
+        for name, getter, dtype in NEURON_COLUMNS:
+            setattr( self, name, torch.nn.Parameter( getter( self.columns ).to( dtype ), requires_grad=False ) )
+        self.axons = self.columns.axons
+        self._build_key_index()
+        if not self.lite:
+            if n == 0:
                 bittensor.logging.warning("Empty weights_array on metagraph.sync(). The 'weights' tensor is empty.")
-        if not lite:
-            bonds_array = []
-            for n in self.neurons:
-                if len(n.bonds) == 0:
-                    bonds_array.append( torch.zeros( len( self.neurons ) ) )
-                else:
-                    b_uids, b_bonds = zip(*n.bonds)
-                    bonds_array.append( bittensor.utils.weight_utils.convert_bond_uids_and_vals_to_tensor( len(self.neurons), b_uids, b_bonds ) )
-            self.bonds = torch.nn.Parameter( torch.stack( bonds_array ), requires_grad=False ) if len( bonds_array ) else torch.nn.Parameter()
-            if len(bonds_array) == 0:
                 bittensor.logging.warning("Empty bonds_array on metagraph.sync(). The 'bonds' tensor is empty.")
+                self.weights = torch.nn.Parameter()
+                self.bonds = torch.nn.Parameter()
+            else:
+                self._build_matrices()
 
-    def save( self ) -> 'metagraph':
-        r""" Saves this metagraph object's state_dict under bittensor root dir."""
-        save_directory = get_save_dir( self.network, self.netuid  )
-        os.makedirs( save_directory, exist_ok=True )
-        graph_file = save_directory + f'/block-{self.block.item()}.pt'
-        state_dict = self.state_dict()
-        state_dict['axons'] = self.axons
-        torch.save(state_dict, graph_file)
-        state_dict = torch.load( graph_file )
+    def _build_matrices( self ):
+        r""" Builds the weights and bonds matrices from the sparse column entries, in self.layout. """
+        n = len( self.columns )
+        self.weights = torch.nn.Parameter( bittensor.utils.weight_utils.convert_sparse_weights_to_tensor( n, *self.columns.weights, layout = self.layout ), requires_grad=False )
+        self.bonds = torch.nn.Parameter( bittensor.utils.weight_utils.convert_sparse_bonds_to_tensor( n, *self.columns.bonds, layout = self.layout ), requires_grad=False )
+
+    def _patch_from_columns( self, diff: 'MetagraphDiff' ):
+        r""" Rewrites only the rows of the changed and newly registered uids listed in diff. """
+        n = len( self.columns )
+        grown = n - self.n.item()
+        if grown > 0:
+            self.n = torch.nn.Parameter( torch.tensor( n, dtype=torch.int64 ), requires_grad=False )
+            for name, _, dtype in NEURON_COLUMNS:
+                column = getattr( self, name ).data
+                setattr( self, name, torch.nn.Parameter( torch.cat( [ column, torch.zeros( grown, dtype=dtype ) ] ), requires_grad=False ) )
+        self.axons = self.columns.axons
+
+        if not self.lite:
+            # Rebuilding from the sparse entries is a single vectorised pass, cheaper than patching rows in place.
+            self._build_matrices()
+
+        rows = diff.changed + diff.new_uids
+        if len( rows ) == 0:
+            return
+        index = torch.tensor( rows, dtype=torch.int64 )
+        for name, getter, dtype in NEURON_COLUMNS:
+            getattr( self, name ).data[ index ] = getter( self.columns )[ index ].to( dtype )
+        self._build_key_index()
+
+    def _build_key_index( self ):
+        r""" Rebuilds the hotkey to uid and coldkey to uids lookups from self.axons and self.uids. """
+        if getattr( self.axons, 'columns', None ) is not None:
+            hotkeys, coldkeys = self.axons.columns.hotkeys, self.axons.columns.coldkeys
+        else:
+            hotkeys, coldkeys = [ axon.hotkey for axon in self.axons ], [ axon.coldkey for axon in self.axons ]
+        uids = self.uids.tolist()
+        # Built in reverse so a repeated hotkey maps to its first uid, as hotkeys.index() did.
+        self._hotkey_to_uid = dict( zip( reversed( hotkeys ), reversed( uids ) ) )
+        self._coldkey_to_uids = {}
+        for coldkey, uid in zip( coldkeys, uids ):
+            self._coldkey_to_uids.setdefault( coldkey, [] ).append( uid )
+
+    def uid_for_hotkey( self, hotkey: str ) -> Optional[int]:
+        r""" Returns the uid registered to hotkey, or None if the hotkey is not registered on this subnet. """
+        return self._hotkey_to_uid.get( hotkey )
+
+    def uids_for_coldkey( self, coldkey: str ) -> List[int]:
+        r""" Returns the uids whose hotkeys are owned by coldkey, in ascending order. """
+        return list( self._coldkey_to_uids.get( coldkey, [] ) )
+
+    def is_registered( self, hotkey: str ) -> bool:
+        r""" True if hotkey holds a uid on this subnet. """
+        return hotkey in self._hotkey_to_uid
+
+    def save( self, keep_last: Optional[int] = SNAPSHOT_KEEP_LAST, keep_every: Optional[int] = None ) -> 'metagraph':
+        r""" Saves a snapshot of this metagraph under bittensor root dir, then compacts the older ones.
+            Args:
+                keep_last ( Optional[int] ):
+                    Number of most recent blocks to keep, all are kept if None.
+                keep_every ( Optional[int] ):
+                    Older blocks which are a multiple of keep_every are also kept.
+        """
+        return self.save_to_path( get_save_dir( self.network, self.netuid ), keep_last = keep_last, keep_every = keep_every )
+
+    def save_to_path( self, dir_path: str, keep_last: Optional[int] = None, keep_every: Optional[int] = None ) -> 'metagraph':
+        r""" Saves a snapshot of this metagraph's block under the specified path and adds it to the block index.
+            With keep_last set, older snapshots are compacted as in compact().
+        """
+        columns = { name: getattr( self, name ).data for name, _, _ in NEURON_COLUMNS }
+        columns.update( self._axon_table() )
+        layout = self.weights.layout
+        if layout == torch.strided:
+            columns['weights'] = self.weights.data
+            columns['bonds'] = self.bonds.data
+        else:
+            for name in ( 'weights', 'bonds' ):
+                matrix = getattr( self, name ).data
+                matrix = matrix.coalesce() if layout == torch.sparse_coo else matrix.to_sparse()
+                columns[ name + '_indices' ] = matrix.indices()
+                columns[ name + '_values' ] = matrix.values()
+        header = {
+            'netuid': self.netuid,
+            'network': self.network,
+            'block': self.block.item(),
+            'n': self.n.item(),
+            'version': bittensor.__version_as_int__,
+            'lite': self.lite,
+            'layout': _LAYOUT_NAMES[ layout ],
+        }
+        store = snapshot.SnapshotStore( dir_path )
+        store.save( self.block.item(), header, columns )
+        if keep_last is not None:
+            store.compact( keep_last = keep_last, keep_every = keep_every )
         return self
 
+    def _axon_table( self ) -> Dict[str, torch.Tensor]:
+        axon_columns = getattr( self.axons, 'columns', None )
+        if axon_columns is not None:
+            return { name: getattr( axon_columns, name ) for name in AXON_TABLE }
+        return snapshot.axon_table( self.axons )
+
     def load( self ) -> 'metagraph':
-        r""" Loads this metagraph object's state_dict from bittensor root dir. """
-        self.load_from_path( get_save_dir( self.network, self.netuid ) )
+        r""" Loads the latest snapshot of this metagraph from bittensor root dir. """
+        return self.load_from_path( get_save_dir( self.network, self.netuid ) )
 
     def load_from_path( self, dir_path:str ) -> 'metagraph':
-        r""" Loads this metagraph object with state_dict under the specified path."""
+        r""" Loads the latest snapshot under the specified path."""
+        store = snapshot.SnapshotStore( dir_path )
+        if not store.exists():
+            return self._load_legacy( dir_path )
+        return self._load_snapshot( *store.load() )
+
+    def load_block( self, block: int, dir_path: Optional[str] = None ) -> 'metagraph':
+        r""" Loads the snapshot of a historical block.
+            Args:
+                block ( int ):
+                    The saved block to load.
+                dir_path ( Optional[str] ):
+                    Snapshot directory, defaults to the one under bittensor root dir.
+        """
+        dir_path = get_save_dir( self.network, self.netuid ) if dir_path is None else dir_path
+        return self._load_snapshot( *snapshot.SnapshotStore( dir_path ).load( block ) )
+
+    def iter_blocks( self, start: Optional[int] = None, end: Optional[int] = None, dir_path: Optional[str] = None ) -> Iterator['metagraph']:
+        r""" Yields a metagraph for each saved block in [ start, end ], oldest first. Columns are memory mapped,
+            so only the tensors which are read are paged in.
+            Args:
+                start ( Optional[int] ):
+                    First block, defaults to the oldest saved block.
+                end ( Optional[int] ):
+                    Last block, defaults to the latest saved block.
+                dir_path ( Optional[str] ):
+                    Snapshot directory, defaults to the one under bittensor root dir.
+        """
+        dir_path = get_save_dir( self.network, self.netuid ) if dir_path is None else dir_path
+        for header, columns in snapshot.SnapshotStore( dir_path ).iter_blocks( start, end ):
+            yield metagraph( netuid = self.netuid, network = self.network, sync = False )._load_snapshot( header, columns )
+
+    def saved_blocks( self, dir_path: Optional[str] = None ) -> List[int]:
+        r""" Returns the saved blocks in ascending order. """
+        dir_path = get_save_dir( self.network, self.netuid ) if dir_path is None else dir_path
+        return snapshot.SnapshotStore( dir_path ).blocks()
+
+    def compact( self, keep_last: Optional[int] = None, keep_every: Optional[int] = None, dir_path: Optional[str] = None ) -> List[int]:
+        r""" Deletes old snapshots.
+            Args:
+                keep_last ( Optional[int] ):
+                    Number of most recent blocks to keep, all are kept if None.
+                keep_every ( Optional[int] ):
+                    Older blocks which are a multiple of keep_every are also kept.
+                dir_path ( Optional[str] ):
+                    Snapshot directory, defaults to the one under bittensor root dir.
+            Returns:
+                removed ( List[int] ):
+                    The deleted blocks.
+        """
+        dir_path = get_save_dir( self.network, self.netuid ) if dir_path is None else dir_path
+        return snapshot.SnapshotStore( dir_path ).compact( keep_last = keep_last, keep_every = keep_every )
+
+    def _load_snapshot( self, header: Dict, columns: Dict[str, torch.Tensor] ) -> 'metagraph':
+        n = header['n']
+        self.n = torch.nn.Parameter( torch.tensor( n, dtype=torch.int64 ), requires_grad=False )
+        self.block = torch.nn.Parameter( torch.tensor( header['block'], dtype=torch.int64 ), requires_grad=False )
+        for name, _, _ in NEURON_COLUMNS:
+            setattr( self, name, torch.nn.Parameter( columns[ name ], requires_grad=False ) )
+        self.axons = bittensor.NeuronColumns( dict( { name: columns[ name ] for name in AXON_TABLE }, uid = columns['uids'] ) ).axons
+        self._build_key_index()
+        self.lite = header['lite']
+        self.layout = _LAYOUTS[ header['layout'] ]
+        if self.layout == torch.strided:
+            self.weights = torch.nn.Parameter( columns['weights'], requires_grad=False )
+            self.bonds = torch.nn.Parameter( columns['bonds'], requires_grad=False )
+        else:
+            for name in ( 'weights', 'bonds' ):
+                matrix = torch.sparse_coo_tensor( columns[ name + '_indices' ], columns[ name + '_values' ], ( n, n ) ).coalesce()
+                matrix = matrix if self.layout == torch.sparse_coo else matrix.to_sparse_csr()
+                setattr( self, name, torch.nn.Parameter( matrix, requires_grad=False ) )
+        self.columns = None
+        self.diff = None
+        return self
+
+    def _load_legacy( self, dir_path: str ) -> 'metagraph':
+        r""" Loads the latest pickled state_dict written by older versions."""
         graph_file = latest_block_path( dir_path )
         state_dict = torch.load( graph_file )
         self.n = torch.nn.Parameter( state_dict['n'], requires_grad=False )
@@ -191,6 +475,9 @@ class metagraph( torch.nn.Module ):
         self.validator_permit = torch.nn.Parameter( state_dict['validator_permit'], requires_grad=False )
         self.uids = torch.nn.Parameter( state_dict['uids'], requires_grad=False )
         self.axons = state_dict['axons']
+        self._build_key_index()
+        self.columns = None
+        self.diff = None
         if 'weights' in state_dict:
             self.weights = torch.nn.Parameter( state_dict['weights'], requires_grad=False )
         if 'bonds' in state_dict:
@@ -0,0 +1,218 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+""" On disk metagraph snapshots.
+
+    Each block is stored in its own file:
+        magic ( 4 bytes ) | format version ( u32 ) | header length ( u64 ) | json header | columns
+
+    The json header holds the metadata and, for every column, its numpy dtype, shape and offset from the start of the
+    column section. Columns are raw little endian arrays aligned to ALIGNMENT bytes, so a snapshot is read by memory
+    mapping the file once and viewing each column in place, without unpickling. An index.json next to the snapshots
+    lists the stored blocks.
+"""
+import os
+import json
+import struct
+import numpy as np
+import torch
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b'BTMG'
+SNAPSHOT_VERSION = 1
+ALIGNMENT = 64
+INDEX_FILE = 'index.json'
+_PREAMBLE = struct.Struct( '<4sIQ' )
+
+def _align( offset: int ) -> int:
+    return ( offset + ALIGNMENT - 1 ) // ALIGNMENT * ALIGNMENT
+
+def write_snapshot( path: str, header: Dict, columns: Dict[str, torch.Tensor] ):
+    r""" Writes the columns and header to path, atomically replacing any existing file.
+        Args:
+            path ( str ):
+                Destination file.
+            header ( Dict ):
+                json serializable metadata.
+            columns ( Dict[str, torch.Tensor] ):
+                Strided tensors to store.
+    """
+    arrays = { name: np.ascontiguousarray( tensor.detach().cpu().numpy() ) for name, tensor in columns.items() }
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        layout[ name ] = { 'dtype': array.dtype.str, 'shape': list( array.shape ), 'offset': offset }
+        offset = _align( offset + array.nbytes )
+    header = dict( header, columns = layout )
+    encoded_header = json.dumps( header ).encode( 'utf-8' )
+    data_start = _align( _PREAMBLE.size + len( encoded_header ) )
+
+    tmp_path = path + '.tmp'
+    with open( tmp_path, 'wb' ) as file:
+        file.write( _PREAMBLE.pack( MAGIC, SNAPSHOT_VERSION, len( encoded_header ) ) )
+        file.write( encoded_header )
+        for name, array in arrays.items():
+            file.seek( data_start + layout[ name ]['offset'] )
+            file.write( array.tobytes() )
+        file.truncate( data_start + offset )
+    os.replace( tmp_path, path )
+
+def read_header( path: str ) -> Tuple[Dict, int]:
+    r""" Returns the json header of the snapshot at path and the file offset of its column section. """
+    with open( path, 'rb' ) as file:
+        magic, version, header_length = _PREAMBLE.unpack( file.read( _PREAMBLE.size ) )
+        if magic != MAGIC:
+            raise ValueError( "Not a metagraph snapshot: {}".format( path ) )
+        if version > SNAPSHOT_VERSION:
+            raise ValueError( "Metagraph snapshot {} has format version {}, this bittensor reads up to {}".format( path, version, SNAPSHOT_VERSION ) )
+        header = json.loads( file.read( header_length ).decode( 'utf-8' ) )
+    return header, _align( _PREAMBLE.size + header_length )
+
+def read_snapshot( path: str ) -> Tuple[Dict, Dict[str, torch.Tensor]]:
+    r""" Memory maps the snapshot at path.
+        Returns:
+            header ( Dict ):
+                The stored metadata.
+            columns ( Dict[str, torch.Tensor] ):
+                Copy on write tensors backed by the file, pages are only read when touched.
+    """
+    header, data_start = read_header( path )
+    buffer = np.memmap( path, dtype = np.uint8, mode = 'c' ) if os.path.getsize( path ) > data_start else None
+    columns = {}
+    for name, column in header.pop( 'columns' ).items():
+        dtype = np.dtype( column['dtype'] )
+        count = int( np.prod( column['shape'] ) )
+        if count == 0:
+            array = np.empty( column['shape'], dtype = dtype )
+        else:
+            start = data_start + column['offset']
+            array = buffer[ start:start + count * dtype.itemsize ].view( dtype ).reshape( column['shape'] )
+        columns[ name ] = torch.from_numpy( array )
+    return header, columns
+
+
+class SnapshotStore:
+    r""" Directory of block snapshots with an index of the stored blocks. """
+
+    def __init__( self, directory: str ):
+        self.directory = os.path.expanduser( directory )
+
+    @property
+    def index_path( self ) -> str:
+        return os.path.join( self.directory, INDEX_FILE )
+
+    def exists( self ) -> bool:
+        return os.path.exists( self.index_path )
+
+    def _read_index( self ) -> Dict:
+        if not self.exists():
+            return { 'version': SNAPSHOT_VERSION, 'blocks': {} }
+        with open( self.index_path, 'r' ) as file:
+            return json.load( file )
+
+    def _write_index( self, index: Dict ):
+        tmp_path = self.index_path + '.tmp'
+        with open( tmp_path, 'w' ) as file:
+            json.dump( index, file )
+        os.replace( tmp_path, self.index_path )
+
+    def blocks( self ) -> List[int]:
+        r""" Returns the stored blocks in ascending order. """
+        return sorted( int( block ) for block in self._read_index()['blocks'] )
+
+    def latest_block( self ) -> int:
+        blocks = self.blocks()
+        if len( blocks ) == 0:
+            raise ValueError( "Metagraph not found at: {}".format( self.directory ) )
+        return blocks[-1]
+
+    def path_for( self, block: int ) -> str:
+        entry = self._read_index()['blocks'].get( str( block ) )
+        if entry is None:
+            raise ValueError( "Metagraph at block {} not found at: {}".format( block, self.directory ) )
+        return os.path.join( self.directory, entry['file'] )
+
+    def save( self, block: int, header: Dict, columns: Dict[str, torch.Tensor] ):
+        r""" Writes the snapshot of block and adds it to the index. """
+        os.makedirs( self.directory, exist_ok = True )
+        filename = 'block-{}.mg'.format( block )
+        write_snapshot( os.path.join( self.directory, filename ), header, columns )
+        index = self._read_index()
+        index['blocks'][ str( block ) ] = { 'file': filename, 'n': header.get( 'n' ) }
+        self._write_index( index )
+
+    def load( self, block: Optional[int] = None ) -> Tuple[Dict, Dict[str, torch.Tensor]]:
+        r""" Reads the snapshot of block, defaults to the latest stored block. """
+        return read_snapshot( self.path_for( self.latest_block() if block is None else block ) )
+
+    def iter_blocks( self, start: Optional[int] = None, end: Optional[int] = None ) -> Iterator[Tuple[Dict, Dict[str, torch.Tensor]]]:
+        r""" Yields the snapshots of the stored blocks in [ start, end ] in ascending order. """
+        for block in self.blocks():
+            if ( start is None or block >= start ) and ( end is None or block <= end ):
+                yield self.load( block )
+
+    def compact( self, keep_last: Optional[int] = None, keep_every: Optional[int] = None ) -> List[int]:
+        r""" Deletes old snapshots and drops index entries whose file is missing.
+            Args:
+                keep_last ( Optional[int] ):
+                    Number of most recent blocks to keep, all are kept if None.
+                keep_every ( Optional[int] ):
+                    Older blocks which are a multiple of keep_every are also kept.
+            Returns:
+                removed ( List[int] ):
+                    The blocks removed from the index.
+        """
+        index = self._read_index()
+        blocks = sorted( int( block ) for block in index['blocks'] )
+        keep = set( blocks if keep_last is None else blocks[ max( 0, len( blocks ) - keep_last ): ] if keep_last > 0 else [] )
+        if keep_every:
+            keep |= { block for block in blocks if block % keep_every == 0 }
+        removed = []
+        for block in blocks:
+            path = os.path.join( self.directory, index['blocks'][ str( block ) ]['file'] )
+            if block in keep and os.path.exists( path ):
+                continue
+            if os.path.exists( path ):
+                os.remove( path )
+            del index['blocks'][ str( block ) ]
+            removed.append( block )
+        self._write_index( index )
+        return removed
+
+def axon_table( axons: List['bittensor.axon_info'] ) -> Dict[str, torch.Tensor]:
+    r""" Builds the snapshot axon columns from axon_info objects, for metagraphs loaded from legacy pickles. """
+    from scalecodec.utils.ss58 import ss58_decode
+    import bittensor
+    ips = []
+    for axon in axons:
+        ip = bittensor.utils.networking.ip_to_int( axon.ip )
+        ips.append( [ _to_signed( ip & 0xFFFFFFFFFFFFFFFF ), _to_signed( ip >> 64 ) ] )
+    return {
+        'axon_version': torch.tensor( [ axon.version for axon in axons ], dtype = torch.int64 ),
+        'axon_ip': torch.tensor( ips, dtype = torch.int64 ).view( len( axons ), 2 ),
+        'axon_port': torch.tensor( [ axon.port for axon in axons ], dtype = torch.int64 ),
+        'axon_ip_type': torch.tensor( [ axon.ip_type for axon in axons ], dtype = torch.int64 ),
+        'hotkey_bytes': _account_ids( [ ss58_decode( axon.hotkey ) for axon in axons ] ),
+        'coldkey_bytes': _account_ids( [ ss58_decode( axon.coldkey ) for axon in axons ] ),
+    }
+
+def _to_signed( value: int ) -> int:
+    return value - ( 1 << 64 ) if value >= ( 1 << 63 ) else value
+
+def _account_ids( hex_keys: List[str] ) -> torch.ByteTensor:
+    return torch.tensor( [ list( bytes.fromhex( key ) ) for key in hex_keys ], dtype = torch.uint8 ).view( len( hex_keys ), 32 )
@@ -22,12 +22,30 @@ import os
 import argparse
 import bittensor
 from typing import List, Callable, Union
-from prometheus_client import start_http_server
+from prometheus_client import start_http_server, Info
 from enum import Enum
 
 from loguru import logger
 logger = logger.opt(colors=True)
 
+try:
+    bt_promo_info = Info("bittensor_info", "Information about the installed bittensor package.")
+    bt_promo_info.info (
+        {
+            '__version__': str(bittensor.__version__),
+            '__version_as_int__': str(bittensor.__version_as_int__),
+            '__vocab_size__': str(bittensor.__vocab_size__),
+            '__network_dim__': str(bittensor.__network_dim__),
+            '__blocktime__': str(bittensor.__blocktime__),
+            '__prometheus_version__': str(bittensor.__prometheus_version__),
+            '__prometheus_version__as_int__': str(bittensor.__prometheus_version__as_int__),
+        }
+    )
+except ValueError:
+    # This can silently fail if we import bittensor twice in the same process.
+    # We simply pass over this error.
+    pass
+
 
 class prometheus:
     """ Namespace for prometheus tooling.
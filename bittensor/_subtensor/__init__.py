@@ -24,8 +24,7 @@ import bittensor
 
 from loguru import logger
 from substrateinterface import SubstrateInterface
-from torch.cuda import is_available as is_cuda_available
-from . import subtensor_impl, subtensor_mock
+from . import connection_pool
 
 logger = logger.opt(colors=True)
 
@@ -68,7 +67,9 @@ class subtensor:
         config.subtensor._mock = _mock if _mock != None else config.subtensor._mock
         if config.subtensor._mock == True or network == 'mock' or config.subtensor.get('network', bittensor.defaults.subtensor.network) == 'mock':
             config.subtensor._mock = True
-            return subtensor_mock.mock_subtensor.mock()
+            # Imported here so that e.g. building the btcli parser does not load the chain types and torch.
+            from . import subtensor_mock
+            return subtensor.enable_cache_from_config( subtensor_mock.mock_subtensor.mock(), config )
 
         # Determine config.subtensor.chain_endpoint and config.subtensor.network config.
         # If chain_endpoint is set, we override the network flag, otherwise, the chain_endpoint is assigned by the network.
@@ -111,17 +112,26 @@ class subtensor:
 
         subtensor.check_config( config )
         network = config.subtensor.get('network', bittensor.defaults.subtensor.network)
-        substrate = SubstrateInterface(
+        # Subtensors of one process share a pool of persistent connections per endpoint.
+        substrate = connection_pool.pool.get(
+            max_connections = config.subtensor.get( 'max_connections', bittensor.defaults.subtensor.max_connections ),
             ss58_format = bittensor.__ss58_format__,
             use_remote_preset=True,
             url = endpoint_url,
             type_registry=bittensor.__type_registry__
         )
-        return subtensor_impl.Subtensor(
+        from . import subtensor_impl
+        return subtensor.enable_cache_from_config( subtensor_impl.Subtensor(
             substrate = substrate,
             network = config.subtensor.get('network', bittensor.defaults.subtensor.network),
             chain_endpoint = config.subtensor.chain_endpoint,
-        )
+        ), config )
+
+    @staticmethod
+    def enable_cache_from_config( subtensor: 'bittensor.Subtensor', config: 'bittensor.Config' ) -> 'bittensor.Subtensor':
+        if config.subtensor.get( 'cache', bittensor.defaults.subtensor.cache ):
+            subtensor.enable_cache( ttl = config.subtensor.get( 'cache_ttl', bittensor.defaults.subtensor.cache_ttl ) )
+        return subtensor
 
     @staticmethod
     def config() -> 'bittensor.Config':
@@ -154,6 +164,9 @@ class subtensor:
                                 help='''The subtensor endpoint flag. If set, overrides the --network flag.
                                     ''')
             parser.add_argument('--' + prefix_str + 'subtensor._mock', action='store_true', help='To turn on subtensor mocking for testing purposes.', default=bittensor.defaults.subtensor._mock)
+            parser.add_argument('--' + prefix_str + 'subtensor.cache', action='store_true', help='''Cache storage reads, reads of the latest state are served for --subtensor.cache_ttl seconds.''', default=bittensor.defaults.subtensor.cache)
+            parser.add_argument('--' + prefix_str + 'subtensor.max_connections', type=int, help='''Websockets opened to the endpoint at most, shared by the subtensors of this process. Each serves one call at a time.''', default=bittensor.defaults.subtensor.max_connections)
+            parser.add_argument('--' + prefix_str + 'subtensor.cache_ttl', type=float, help='''Seconds a cached read of the latest state is served for.''', default=bittensor.defaults.subtensor.cache_ttl)
             # registration args. Used for register and re-register and anything that calls register.
             parser.add_argument('--' + prefix_str + 'subtensor.register.num_processes', '-n', dest=prefix_str + 'subtensor.register.num_processes', help="Number of processors to use for registration", type=int, default=bittensor.defaults.subtensor.register.num_processes)
             parser.add_argument('--' + prefix_str + 'subtensor.register.update_interval', '--' + prefix_str + 'subtensor.register.cuda.update_interval', '--' + prefix_str + 'cuda.update_interval', '-u', help="The number of nonces to process before checking for next block during registration", type=int, default=bittensor.defaults.subtensor.register.update_interval)
@@ -179,6 +192,9 @@ class subtensor:
         defaults.subtensor.network = os.getenv('BT_SUBTENSOR_NETWORK') if os.getenv('BT_SUBTENSOR_NETWORK') != None else 'finney'
         defaults.subtensor.chain_endpoint = os.getenv('BT_SUBTENSOR_CHAIN_ENDPOINT') if os.getenv('BT_SUBTENSOR_CHAIN_ENDPOINT') != None else None
         defaults.subtensor._mock = os.getenv('BT_SUBTENSOR_MOCK') if os.getenv('BT_SUBTENSOR_MOCK') != None else False
+        defaults.subtensor.max_connections = int( os.getenv('BT_SUBTENSOR_MAX_CONNECTIONS') ) if os.getenv('BT_SUBTENSOR_MAX_CONNECTIONS') != None else connection_pool.MAX_CONNECTIONS
+        defaults.subtensor.cache = os.getenv('BT_SUBTENSOR_CACHE') if os.getenv('BT_SUBTENSOR_CACHE') != None else False
+        defaults.subtensor.cache_ttl = float( os.getenv('BT_SUBTENSOR_CACHE_TTL') ) if os.getenv('BT_SUBTENSOR_CACHE_TTL') != None else bittensor.__blocktime__
 
         defaults.subtensor.register = bittensor.Config()
         defaults.subtensor.register.num_processes = os.getenv('BT_SUBTENSOR_REGISTER_NUM_PROCESSES') if os.getenv('BT_SUBTENSOR_REGISTER_NUM_PROCESSES') != None else None # uses processor count by default within the function
@@ -206,6 +222,7 @@ class subtensor:
                 except ImportError:
                     raise ImportError('CUDA registration is enabled but cubit is not installed. Please install cubit.')
 
+                from torch.cuda import is_available as is_cuda_available
                 if not is_cuda_available():
                     raise RuntimeError('CUDA registration is enabled but no CUDA devices are detected.')
 
@@ -0,0 +1,99 @@
+# The MIT License (MIT)
+# Copyright © 2021 Yuma Rao
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import asyncio
+import functools
+import bittensor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+# Subtensor read methods exposed as coroutines by AsyncSubtensor.
+READ_METHODS = (
+    'query_subtensor', 'query_map_subtensor', 'query_constant', 'query_multi', 'get_current_block', 'get_block_hash',
+    'neurons', 'neurons_lite', 'neuron_for_uid', 'neuron_for_uid_lite', 'neuron_columns', 'neuron_for_wallet',
+    'get_delegates', 'get_delegate_by_hotkey', 'get_delegated', 'get_delegate_take', 'get_nominators_for_hotkey', 'is_hotkey_delegate',
+    'get_all_subnets_info', 'get_subnet_info', 'get_all_subnet_netuids', 'get_total_subnets', 'subnet_exists', 'get_subnets',
+    'get_balance', 'get_balances', 'get_balances_for', 'get_stakes_for', 'get_stake_for_coldkey_and_hotkey',
+    'get_total_stake_for_hotkey', 'get_total_stake_for_coldkey', 'get_hotkey_owner', 'get_axon_info', 'get_prometheus_info',
+    'get_uid_for_hotkey_on_subnet', 'get_all_uids_for_hotkey', 'get_netuids_for_hotkey', 'get_neuron_for_pubkey_and_subnet',
+    'is_hotkey_registered', 'is_hotkey_registered_any', 'is_hotkey_registered_on_subnet', 'neuron_has_validator_permit',
+    'tempo', 'subnetwork_n', 'max_n', 'blocks_since_epoch', 'difficulty', 'burn', 'immunity_period', 'rho', 'kappa',
+    'min_allowed_weights', 'max_weight_limit', 'max_allowed_validators', 'total_issuance', 'total_stake', 'tx_rate_limit',
+    'get_existential_deposit', 'metagraph',
+)
+
+class AsyncSubtensor:
+    r""" Coroutine versions of the Subtensor read APIs, e.g. `await async_subtensor.neurons_lite( netuid = 1 )`.
+
+        Each call runs the blocking Subtensor method on a small thread pool, so chain reads overlap with other
+        coroutines, such as dendrite queries, on the same event loop. Calls share the pooled connection of the
+        subtensor and are serialized on its websocket. Extrinsics stay on the synchronous Subtensor.
+    """
+    def __init__(
+            self,
+            subtensor: Optional['bittensor.Subtensor'] = None,
+            config: Optional['bittensor.config'] = None,
+            network: Optional[str] = None,
+            chain_endpoint: Optional[str] = None,
+            max_workers: int = 4,
+        ):
+        r""" Args:
+                subtensor (:obj:`bittensor.Subtensor`, `optional`):
+                    subtensor to wrap, created from config, network and chain_endpoint if not passed.
+                max_workers (:obj:`int`, `optional`):
+                    threads running the blocking reads.
+        """
+        if subtensor is None:
+            subtensor = bittensor.subtensor( config = config, network = network, chain_endpoint = chain_endpoint )
+        self.subtensor = subtensor
+        self._executor = ThreadPoolExecutor( max_workers = max_workers, thread_name_prefix = 'async_subtensor' )
+
+    def __str__( self ) -> str:
+        return "AsyncSubtensor({})".format( self.subtensor )
+
+    def __repr__( self ) -> str:
+        return self.__str__()
+
+    def __dir__( self ) -> List[str]:
+        return list( super().__dir__() ) + list( READ_METHODS )
+
+    def __getattr__( self, name: str ) -> Callable:
+        if name not in READ_METHODS:
+            raise AttributeError( "'AsyncSubtensor' object has no attribute '{}'".format( name ) )
+        method = getattr( self.subtensor, name )
+        @functools.wraps( method )
+        async def coroutine( *args, **kwargs ):
+            return await self.run( method, *args, **kwargs )
+        return coroutine
+
+    async def run( self, fn: Callable, *args, **kwargs ):
+        r""" Awaits fn( *args, **kwargs ) run on the thread pool, for reads not listed in READ_METHODS."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor( self._executor, functools.partial( fn, *args, **kwargs ) )
+
+    async def block( self ) -> int:
+        return await self.run( self.subtensor.get_current_block )
+
+    def close( self ):
+        self._executor.shutdown( wait = True )
+
+    def __enter__( self ) -> 'AsyncSubtensor':
+        return self
+
+    def __exit__( self, *args ):
+        self.close()
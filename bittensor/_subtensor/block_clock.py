@@ -0,0 +1,251 @@
+# The MIT License (MIT)
+# Copyright © 2021 Yuma Rao
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import os
+import time
+import threading
+import bittensor
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional, Tuple
+from substrateinterface import SubstrateInterface
+
+@dataclass
+class BlockClockStats:
+    """ Counters of a BlockClock."""
+    # Block headers received from the subscription.
+    headers: int = 0
+    # Subscriptions reopened after the websocket failed.
+    reconnects: int = 0
+    # get_current_block reads, made while no subscription was delivering headers.
+    polls: int = 0
+
+class BlockClock:
+    r""" Follows the chain head with one new heads subscription, read by a background thread, instead of
+        polling get_current_block. Every component of a process talking to the same endpoint can share one
+        clock, see Subtensor.block_clock().
+
+        current_block is the last header number, plus one once the next header is overdue. wait_for_block blocks until a header reaches a block, and on_block / on_epoch callbacks run on
+        the clock thread for every header. While the subscription is down, e.g. reconnecting, the clock falls
+        back to reading the block from the subtensor about once per block time.
+    """
+    def __init__(
+            self,
+            subtensor: 'bittensor.Subtensor',
+            substrate_factory: Optional[Callable[[], SubstrateInterface]] = None,
+            blocktime: float = bittensor.__blocktime__,
+            reconnect_delay: float = 2.0,
+            start: bool = True,
+        ):
+        r""" Creates the clock and, unless start is False, starts its subscription thread.
+            Args:
+                subtensor (:obj:`bittensor.Subtensor`, `required`):
+                    subtensor of the endpoint, also used to read the block while the subscription is down.
+                substrate_factory (:obj:`Callable[[], SubstrateInterface]`, `optional`):
+                    opens the websocket of the subscription, which must not be a pooled connection as the
+                    subscription holds it. Defaults to a new SubstrateInterface to subtensor.chain_endpoint.
+                blocktime (:obj:`float`, `optional`):
+                    seconds per block, after which the next header is overdue.
+                reconnect_delay (:obj:`float`, `optional`):
+                    seconds to wait before reopening a failed subscription.
+                start (:obj:`bool`, `optional`):
+                    if False, call start() to open the subscription.
+        """
+        self.subtensor = subtensor
+        self.blocktime = blocktime
+        self.reconnect_delay = reconnect_delay
+        self.substrate_factory = substrate_factory if substrate_factory is not None else self._default_substrate
+        self.stats = BlockClockStats()
+        self._condition = threading.Condition()
+        self._block: Optional[int] = None
+        self._block_time: Optional[float] = None
+        self._callbacks: Dict[int, Callable[[int], None]] = {}
+        self._next_handle = 0
+        self._stopped = threading.Event()
+        self._substrate: Optional[SubstrateInterface] = None
+        self._thread = threading.Thread( target = self._run, name = 'block-clock', daemon = True )
+        if start: self.start()
+
+    def __str__( self ) -> str:
+        return "BlockClock({}, block:{})".format( self.subtensor.chain_endpoint, self._block )
+
+    def __repr__( self ) -> str:
+        return self.__str__()
+
+    def _default_substrate( self ) -> SubstrateInterface:
+        return SubstrateInterface(
+            ss58_format = bittensor.__ss58_format__,
+            use_remote_preset = True,
+            url = self.subtensor.chain_endpoint,
+            type_registry = bittensor.__type_registry__
+        )
+
+    def start( self ) -> 'BlockClock':
+        if not self._thread.is_alive() and not self._stopped.is_set():
+            self._thread.start()
+        return self
+
+    def stop( self ):
+        r""" Ends the subscription. Blocks already waited for return with the last known block. """
+        self._stopped.set()
+        substrate = self._substrate
+        if substrate is not None:
+            # Unblocks the subscription read.
+            try: substrate.close()
+            except Exception: pass
+        with self._condition:
+            self._condition.notify_all()
+
+    @property
+    def is_running( self ) -> bool:
+        return self._thread.is_alive() and not self._stopped.is_set()
+
+    def _run( self ):
+        while not self._stopped.is_set():
+            try:
+                self._substrate = self.substrate_factory()
+                self._substrate.subscribe_block_headers( self._on_header )
+            except Exception as e:
+                if self._stopped.is_set(): break
+                self.stats.reconnects += 1
+                bittensor.logging.debug( 'BlockClock subscription failed, reconnecting', str( e ) )
+                self._stopped.wait( self.reconnect_delay )
+            finally:
+                substrate, self._substrate = self._substrate, None
+                if substrate is not None:
+                    try: substrate.close()
+                    except Exception: pass
+
+    def _on_header( self, header: dict, update_nr: int, subscription_id: str ) -> Optional[bool]:
+        # Returning anything but None ends subscribe_block_headers.
+        if self._stopped.is_set(): return True
+        self.stats.headers += 1
+        self._set_block( int( header['header']['number'] ) )
+        return None
+
+    def _set_block( self, block: int ):
+        with self._condition:
+            if self._block is not None and block < self._block: return
+            is_new = self._block is None or block > self._block
+            self._block = block
+            self._block_time = time.monotonic()
+            self._condition.notify_all()
+            callbacks = list( self._callbacks.values() ) if is_new else []
+        for callback in callbacks:
+            try:
+                callback( block )
+            except Exception as e:
+                bittensor.logging.error( 'BlockClock callback failed', str( e ) )
+
+    def _poll( self ) -> int:
+        r""" Reads the block from the subtensor, for when no header arrived for more than a block time. """
+        self.stats.polls += 1
+        self._set_block( self.subtensor.get_current_block() )
+        return self._block
+
+    def _is_stale( self ) -> bool:
+        return self._block is None or time.monotonic() - self._block_time > 1.5 * self.blocktime
+
+    @property
+    def last_header_block( self ) -> Optional[int]:
+        r""" Number of the last header received, None before the first one. """
+        return self._block
+
+    @property
+    def current_block( self ) -> int:
+        r""" The last header number, plus one if the next header is overdue. Not extrapolated any further, so a
+            stalled subscription never runs ahead of the chain by more than one block. Reads the chain once if no
+            header arrived yet.
+        """
+        with self._condition:
+            block, block_time = self._block, self._block_time
+        if block is None:
+            return self._poll()
+        return block + 1 if time.monotonic() - block_time >= self.blocktime else block
+
+    def wait_for_block( self, block: int, timeout: Optional[float] = None ) -> int:
+        r""" Blocks until the chain reaches block.
+            Args:
+                block (:obj:`int`, `required`):
+                    block number to wait for.
+                timeout (:obj:`Optional[float]`, `optional`):
+                    maximum seconds to wait, defaults to no limit.
+            Returns:
+                block (:obj:`int`):
+                    the block reached, lower than block only on timeout or stop().
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._condition:
+                if self._block is not None and self._block >= block: return self._block
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if self._stopped.is_set() or ( remaining is not None and remaining <= 0 ):
+                    return self._block if self._block is not None else self.current_block
+                if not self._is_stale():
+                    wait = self.blocktime if remaining is None else min( remaining, self.blocktime )
+                    self._condition.wait( wait )
+                    continue
+            self._poll()
+
+    def on_block( self, callback: Callable[[int], None] ) -> int:
+        r""" Calls callback( block ) on the clock thread for every new block.
+            Returns:
+                handle (:obj:`int`):
+                    pass it to remove_callback to unregister the callback.
+        """
+        with self._condition:
+            handle = self._next_handle
+            self._next_handle += 1
+            self._callbacks[ handle ] = callback
+        return handle
+
+    def on_epoch( self, callback: Callable[[int], None], blocks_per_epoch: int, start_block: Optional[int] = None ) -> int:
+        r""" Calls callback( block ) once blocks_per_epoch blocks have passed since start_block, then every
+            blocks_per_epoch blocks after the last call.
+            Args:
+                callback (:obj:`Callable[[int], None]`, `required`):
+                    called with the block number.
+                blocks_per_epoch (:obj:`int`, `required`):
+                    epoch length in blocks.
+                start_block (:obj:`Optional[int]`, `optional`):
+                    block the first epoch counts from, defaults to the current block.
+            Returns:
+                handle (:obj:`int`):
+                    pass it to remove_callback to unregister the callback.
+        """
+        last_epoch = [ start_block if start_block is not None else self.current_block ]
+        def on_block( block: int ):
+            if block - last_epoch[0] >= blocks_per_epoch:
+                last_epoch[0] = block
+                callback( block )
+        return self.on_block( on_block )
+
+    def remove_callback( self, handle: int ):
+        with self._condition:
+            self._callbacks.pop( handle, None )
+
+_clocks: Dict[ Tuple[int, Hashable], BlockClock ] = {}
+_clocks_lock = threading.Lock()
+
+def shared_clock( subtensor: 'bittensor.Subtensor' ) -> BlockClock:
+    r""" Returns the running clock of this process for the endpoint of subtensor, starting it on first use. """
+    key = ( os.getpid(), subtensor.chain_endpoint )
+    with _clocks_lock:
+        clock = _clocks.get( key )
+        if clock is None or clock._stopped.is_set():
+            clock = _clocks[ key ] = BlockClock( subtensor )
+        return clock
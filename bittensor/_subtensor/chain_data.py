@@ -15,12 +15,16 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import struct
+import functools
+import threading
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import List, Tuple, Dict, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import bittensor
 from bittensor import Balance
 import torch
-from scalecodec.base import RuntimeConfiguration, ScaleBytes
+from scalecodec.base import RuntimeConfigurationObject, ScaleBytes
 from scalecodec.type_registry import load_type_registry_preset
 from scalecodec.utils.ss58 import ss58_encode
 from enum import Enum
@@ -154,13 +158,13 @@ RAOPERTAO = 1e9
 U16_MAX = 65535
 U64_MAX = 18446744073709551615
 
-def from_scale_encoding( vec_u8: List[int], type_name: ChainDataType, is_vec: bool = False, is_option: bool = False ) -> Optional[Dict]:
-    as_bytes = bytes(vec_u8)
-    as_scale_bytes = ScaleBytes(as_bytes)
-    rpc_runtime_config = RuntimeConfiguration()
-    rpc_runtime_config.update_type_registry(load_type_registry_preset("legacy"))
-    rpc_runtime_config.update_type_registry(custom_rpc_type_registry)
+# Decoder runtime for the custom rpc types. Loading the legacy preset and building the
+# decoder classes is far more expensive than the decode itself, so both are done once.
+_rpc_runtime_config: Optional[RuntimeConfigurationObject] = None
+_rpc_decoder_classes: Dict[str, type] = {}
+_rpc_decoder_lock = threading.Lock()
 
+def _type_string( type_name: ChainDataType, is_vec: bool = False, is_option: bool = False ) -> str:
     type_string = type_name.name
     if type_name == ChainDataType.DelegatedInfo:
         # DelegatedInfo is a tuple of (DelegateInfo, Compact<u64>)
@@ -169,20 +173,194 @@ def from_scale_encoding( vec_u8: List[int], type_name: ChainDataType, is_vec: bo
         type_string = f'Option<{type_string}>'
     if is_vec:
         type_string = f'Vec<{type_string}>'
+    return type_string
 
-    obj = rpc_runtime_config.create_scale_object(
-        type_string,
-        data=as_scale_bytes
-    )
+def get_rpc_runtime_config() -> RuntimeConfigurationObject:
+    r""" Returns the shared runtime configuration used to decode custom rpc types,
+        building it and the decoder classes of every ChainDataType on first use.
+    """
+    global _rpc_runtime_config
+    if _rpc_runtime_config is None:
+        with _rpc_decoder_lock:
+            if _rpc_runtime_config is None:
+                rpc_runtime_config = RuntimeConfigurationObject()
+                rpc_runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+                rpc_runtime_config.update_type_registry(custom_rpc_type_registry)
+                for type_name in ChainDataType:
+                    for is_vec in (False, True):
+                        for is_option in (False, True):
+                            type_string = _type_string( type_name, is_vec, is_option )
+                            _rpc_decoder_classes[type_string] = rpc_runtime_config.get_decoder_class( type_string )
+                _rpc_runtime_config = rpc_runtime_config
+    return _rpc_runtime_config
+
+def get_decoder_class( type_name: ChainDataType, is_vec: bool = False, is_option: bool = False ) -> type:
+    r""" Returns the cached scale decoder class for the chain data type. """
+    get_rpc_runtime_config()
+    return _rpc_decoder_classes[ _type_string( type_name, is_vec, is_option ) ]
+
+def from_scale_encoding( vec_u8: List[int], type_name: ChainDataType, is_vec: bool = False, is_option: bool = False ) -> Optional[Dict]:
+    as_bytes = bytes(vec_u8)
+    as_scale_bytes = ScaleBytes(as_bytes)
+    decoder_class = get_decoder_class( type_name, is_vec = is_vec, is_option = is_option )
+    obj = decoder_class( data = as_scale_bytes )
 
     return obj.decode()
 
-# Dataclasses for chain data.
-@dataclass
-class NeuronInfo:
+class _lazy_field:
+    r""" Field of a slotted chain record, built by the record's _materialize_<name> method on first access and
+        cached in its _<name> slot. Assigning the field stores the value as is.
+    """
+    def __set_name__( self, owner: type, name: str ):
+        self.slot = '_' + name
+        self.materialize = '_materialize_' + name
+
+    def __get__( self, record: Optional['_ChainRecord'], owner: type = None ) -> Any:
+        if record is None:
+            return self
+        try:
+            return getattr( record, self.slot )
+        except AttributeError:
+            value = getattr( record, self.materialize )()
+            setattr( record, self.slot, value )
+            return value
+
+    def __set__( self, record: '_ChainRecord', value: Any ):
+        setattr( record, self.slot, value )
+
+class _ChainRecord:
+    r""" Base of the slotted chain data records. Behaves like the dataclass it replaces: keyword or positional
+        construction in annotation order, field wise equality and repr. Records decoded from the chain keep the
+        raw account ids and rao amounts and only build ss58 strings and Balances for the fields which are read.
+    """
+    __slots__ = ()
+    # Field names in annotation order, and the defaults of the optional ones.
+    _fields: Tuple[str, ...] = ()
+    _defaults: Dict[str, Any] = {}
+
+    def __init_subclass__( cls, **kwargs ):
+        super().__init_subclass__( **kwargs )
+        cls._fields = tuple( cls.__dict__.get( '__annotations__', {} ) ) or cls._fields
+
+    def __init__( self, *args, **kwargs ):
+        if len( args ) > len( self._fields ):
+            raise TypeError( "{}() takes {} positional arguments but {} were given".format( type( self ).__name__, len( self._fields ), len( args ) ) )
+        values = dict( zip( self._fields, args ) )
+        for name, value in kwargs.items():
+            if name not in self._fields or name in values:
+                raise TypeError( "{}() got an unexpected or repeated argument '{}'".format( type( self ).__name__, name ) )
+            values[ name ] = value
+        for name in self._fields:
+            if name not in values and name not in self._defaults:
+                raise TypeError( "{}() missing required argument: '{}'".format( type( self ).__name__, name ) )
+            setattr( self, name, values[ name ] if name in values else self._defaults[ name ] )
+
+    def __eq__( self, other ) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all( getattr( self, name ) == getattr( other, name ) for name in self._fields )
+
+    __hash__ = None
+
+    def __repr__( self ) -> str:
+        return "{}({})".format( type( self ).__name__, ', '.join( '{}={!r}'.format( name, getattr( self, name ) ) for name in self._fields ) )
+
+    def __getstate__( self ) -> Dict[str, Any]:
+        # Pickles and copies hold the materialized fields, not the raw chain values.
+        return { name: getattr( self, name ) for name in self._fields }
+
+    def __setstate__( self, state: Dict[str, Any] ):
+        for name, value in state.items():
+            setattr( self, name, value )
+
+class _NeuronRecord( _ChainRecord ):
+    r""" Lazy fields shared by NeuronInfo and NeuronInfoLite. The raw values are the hotkey and coldkey account ids,
+        the ( coldkey account id, rao ) stakes, and the axon and prometheus infos as decoded dicts or as callables
+        building them.
+    """
+    __slots__ = (
+        '_hotkey', '_coldkey', '_stake', '_stake_dict', '_total_stake', '_prometheus_info', '_axon_info',
+        '_hotkey_id', '_coldkey_id', '_stakes', '_raw_axon_info', '_raw_prometheus_info',
+    )
+    hotkey = _lazy_field()
+    coldkey = _lazy_field()
+    stake = _lazy_field()
+    stake_dict = _lazy_field()
+    total_stake = _lazy_field()
+    prometheus_info = _lazy_field()
+    axon_info = _lazy_field()
+
+    @classmethod
+    def _from_chain( cls, hotkey_id: Union[str, bytes], coldkey_id: Union[str, bytes], stakes: List[Tuple[Union[str, bytes], int]], axon_info: Union[Dict, Callable], prometheus_info: Union[Dict, Callable], **fields ) -> '_NeuronRecord':
+        record = cls.__new__( cls )
+        record._hotkey_id = hotkey_id
+        record._coldkey_id = coldkey_id
+        record._stakes = stakes
+        record._raw_axon_info = axon_info
+        record._raw_prometheus_info = prometheus_info
+        for name, value in fields.items():
+            setattr( record, name, value )
+        record.is_null = False
+        return record
+
+    def _materialize_hotkey( self ) -> str:
+        return ss58_encode( self._hotkey_id, bittensor.__ss58_format__ )
+
+    def _materialize_coldkey( self ) -> str:
+        return ss58_encode( self._coldkey_id, bittensor.__ss58_format__ )
+
+    def _materialize_stake( self ) -> Balance:
+        return Balance.from_rao( sum( int( amount ) for _, amount in self._stakes ) )
+
+    def _materialize_stake_dict( self ) -> Dict[str, Balance]:
+        return { ss58_encode( coldkey, bittensor.__ss58_format__ ): Balance.from_rao( int( amount ) ) for coldkey, amount in self._stakes }
+
+    def _materialize_total_stake( self ) -> Balance:
+        return self.stake
+
+    def _materialize_prometheus_info( self ) -> 'PrometheusInfo':
+        if callable( self._raw_prometheus_info ):
+            return self._raw_prometheus_info()
+        return PrometheusInfo.fix_decoded_values( dict( self._raw_prometheus_info ) )
+
+    def _materialize_axon_info( self ) -> 'bittensor.axon_info':
+        if callable( self._raw_axon_info ):
+            return self._raw_axon_info()
+        return bittensor.axon_info.from_neuron_info( { 'hotkey': self.hotkey, 'coldkey': self.coldkey, 'axon_info': self._raw_axon_info } )
+
+    @staticmethod
+    def _decoded_fields( neuron_info_decoded: Dict ) -> Dict[str, Any]:
+        return dict(
+            hotkey_id = neuron_info_decoded['hotkey'],
+            coldkey_id = neuron_info_decoded['coldkey'],
+            stakes = neuron_info_decoded['stake'],
+            axon_info = neuron_info_decoded['axon_info'],
+            prometheus_info = neuron_info_decoded['prometheus_info'],
+            uid = neuron_info_decoded['uid'],
+            netuid = neuron_info_decoded['netuid'],
+            active = neuron_info_decoded['active'],
+            rank = bittensor.utils.U16_NORMALIZED_FLOAT( neuron_info_decoded['rank'] ),
+            emission = neuron_info_decoded['emission'] / RAOPERTAO,
+            incentive = bittensor.utils.U16_NORMALIZED_FLOAT( neuron_info_decoded['incentive'] ),
+            consensus = bittensor.utils.U16_NORMALIZED_FLOAT( neuron_info_decoded['consensus'] ),
+            trust = bittensor.utils.U16_NORMALIZED_FLOAT( neuron_info_decoded['trust'] ),
+            validator_trust = bittensor.utils.U16_NORMALIZED_FLOAT( neuron_info_decoded['validator_trust'] ),
+            dividends = bittensor.utils.U16_NORMALIZED_FLOAT( neuron_info_decoded['dividends'] ),
+            last_update = neuron_info_decoded['last_update'],
+            validator_permit = neuron_info_decoded['validator_permit'],
+            pruning_score = neuron_info_decoded['pruning_score'],
+        )
+
+# Slotted records for chain data.
+class NeuronInfo( _NeuronRecord ):
     r"""
-    Dataclass for neuron metadata.
+    Neuron metadata. ss58 keys, stakes, axon_info and prometheus_info are built on first access.
     """
+    __slots__ = (
+        'uid', 'netuid', 'active', 'rank', 'emission', 'incentive', 'consensus', 'trust', 'validator_trust',
+        'dividends', 'last_update', 'validator_permit', 'weights', 'bonds', 'pruning_score', 'is_null',
+    )
+    _defaults = { 'is_null': False }
     hotkey: str
     coldkey: str
     uid: int
@@ -206,31 +384,17 @@ class NeuronInfo:
     prometheus_info: 'PrometheusInfo'
     axon_info: 'axon_info'
     pruning_score: int
-    is_null: bool = False
+    is_null: bool
 
     @classmethod
     def fix_decoded_values(cls, neuron_info_decoded: Any) -> 'NeuronInfo':
-        r""" Fixes the values of the NeuronInfo object.
+        r""" Returns a NeuronInfo from the scale decoded dict, keeping the account ids and stakes raw.
         """
-        neuron_info_decoded['hotkey'] = ss58_encode(neuron_info_decoded['hotkey'], bittensor.__ss58_format__)
-        neuron_info_decoded['coldkey'] = ss58_encode(neuron_info_decoded['coldkey'], bittensor.__ss58_format__)
-        stake_dict =  { ss58_encode( coldkey, bittensor.__ss58_format__): bittensor.Balance.from_rao(int(stake)) for coldkey, stake in neuron_info_decoded['stake'] }
-        neuron_info_decoded['stake_dict'] = stake_dict
-        neuron_info_decoded['stake'] = sum(stake_dict.values())
-        neuron_info_decoded['total_stake'] = neuron_info_decoded['stake']
-        neuron_info_decoded['weights'] = [[int(weight[0]), int(weight[1])] for weight in neuron_info_decoded['weights']]
-        neuron_info_decoded['bonds'] = [[int(bond[0]), int(bond[1])] for bond in neuron_info_decoded['bonds']]
-        neuron_info_decoded['rank'] = bittensor.utils.U16_NORMALIZED_FLOAT(neuron_info_decoded['rank'])
-        neuron_info_decoded['emission'] = neuron_info_decoded['emission'] / RAOPERTAO
-        neuron_info_decoded['incentive'] = bittensor.utils.U16_NORMALIZED_FLOAT(neuron_info_decoded['incentive'])
-        neuron_info_decoded['consensus'] = bittensor.utils.U16_NORMALIZED_FLOAT(neuron_info_decoded['consensus'])
-        neuron_info_decoded['trust'] = bittensor.utils.U16_NORMALIZED_FLOAT(neuron_info_decoded['trust'])
-        neuron_info_decoded['validator_trust'] = bittensor.utils.U16_NORMALIZED_FLOAT(neuron_info_decoded['validator_trust'])
-        neuron_info_decoded['dividends'] = bittensor.utils.U16_NORMALIZED_FLOAT(neuron_info_decoded['dividends'])
-        neuron_info_decoded['prometheus_info'] = PrometheusInfo.fix_decoded_values(neuron_info_decoded['prometheus_info'])
-        neuron_info_decoded['axon_info'] = bittensor.axon_info.from_neuron_info( neuron_info_decoded )
-
-        return cls(**neuron_info_decoded)
+        return cls._from_chain(
+            weights = [[int(weight[0]), int(weight[1])] for weight in neuron_info_decoded['weights']],
+            bonds = [[int(bond[0]), int(bond[1])] for bond in neuron_info_decoded['bonds']],
+            **cls._decoded_fields( neuron_info_decoded ),
+        )
 
     @classmethod
     def from_vec_u8(cls, vec_u8: List[int]) -> 'NeuronInfo':
@@ -249,16 +413,9 @@ class NeuronInfo:
 
     @classmethod
     def list_from_vec_u8(cls, vec_u8: List[int]) -> List['NeuronInfo']:
-        r""" Returns a list of NeuronInfo objects from a vec_u8.
+        r""" Returns a list of NeuronInfo objects from a vec_u8, decoded through NeuronColumns.
         """
-
-        decoded_list = from_scale_encoding(vec_u8, ChainDataType.NeuronInfo, is_vec=True)
-        if decoded_list is None:
-            return []
-
-        decoded_list = [NeuronInfo.fix_decoded_values(decoded) for decoded in decoded_list]
-        return decoded_list
-
+        return NeuronColumns.from_vec_u8( vec_u8, lite = False ).to_neurons()
 
     @staticmethod
     def _null_neuron() -> 'NeuronInfo':
@@ -309,11 +466,16 @@ class NeuronInfo:
 
             return neuron
 
-@dataclass
-class NeuronInfoLite:
+class NeuronInfoLite( _NeuronRecord ):
     r"""
-    Dataclass for neuron metadata, but without the weights and bonds.
+    Neuron metadata, but without the weights and bonds. ss58 keys, stakes, axon_info and prometheus_info are built
+    on first access.
     """
+    __slots__ = (
+        'uid', 'netuid', 'active', 'rank', 'emission', 'incentive', 'consensus', 'trust', 'validator_trust',
+        'dividends', 'last_update', 'validator_permit', 'pruning_score', 'is_null',
+    )
+    _defaults = { 'is_null': False }
     hotkey: str
     coldkey: str
     uid: int
@@ -337,31 +499,13 @@ class NeuronInfoLite:
     prometheus_info: 'PrometheusInfo'
     axon_info: 'axon_info'
     pruning_score: int
-    is_null: bool = False
+    is_null: bool
 
     @classmethod
     def fix_decoded_values(cls, neuron_info_decoded: Any) -> 'NeuronInfoLite':
-        r""" Fixes the values of the NeuronInfoLite object.
+        r""" Returns a NeuronInfoLite from the scale decoded dict, keeping the account ids and stakes raw.
         """
-        neuron_info_decoded['hotkey'] = ss58_encode(neuron_info_decoded['hotkey'], bittensor.__ss58_format__)
-        neuron_info_decoded['coldkey'] = ss58_encode(neuron_info_decoded['coldkey'], bittensor.__ss58_format__)
-        stake_dict =  { ss58_encode( coldkey, bittensor.__ss58_format__): bittensor.Balance.from_rao(int(stake)) for coldkey, stake in neuron_info_decoded['stake'] }
-        neuron_info_decoded['stake_dict'] = stake_dict
-        neuron_info_decoded['stake'] = sum(stake_dict.values())
-        neuron_info_decoded['total_stake'] = neuron_info_decoded['stake']
-        # Don't need weights and bonds in lite version
-        #neuron_info_decoded['weights'] = [[int(weight[0]), int(weight[1])] for weight in neuron_info_decoded['weights']]
-        #neuron_info_decoded['bonds'] = [[int(bond[0]), int(bond[1])] for bond in neuron_info_decoded['bonds']]
-        neuron_info_decoded['rank'] = bittensor.utils.U16_NORMALIZED_FLOAT(neuron_info_decoded['rank'])
-        neuron_info_decoded['emission'] = neuron_info_decoded['emission'] / RAOPERTAO
-        neuron_info_decoded['incentive'] = bittensor.utils.U16_NORMALIZED_FLOAT(neuron_info_decoded['incentive'])
-        neuron_info_decoded['consensus'] = bittensor.utils.U16_NORMALIZED_FLOAT(neuron_info_decoded['consensus'])
-        neuron_info_decoded['trust'] = bittensor.utils.U16_NORMALIZED_FLOAT(neuron_info_decoded['trust'])
-        neuron_info_decoded['validator_trust'] = bittensor.utils.U16_NORMALIZED_FLOAT(neuron_info_decoded['validator_trust'])
-        neuron_info_decoded['dividends'] = bittensor.utils.U16_NORMALIZED_FLOAT(neuron_info_decoded['dividends'])
-        neuron_info_decoded['prometheus_info'] = PrometheusInfo.fix_decoded_values(neuron_info_decoded['prometheus_info'])
-        neuron_info_decoded['axon_info'] = bittensor.axon_info.from_neuron_info(neuron_info_decoded)
-        return cls(**neuron_info_decoded)
+        return cls._from_chain( **cls._decoded_fields( neuron_info_decoded ) )
 
     @classmethod
     def from_vec_u8(cls, vec_u8: List[int]) -> 'NeuronInfoLite':
@@ -380,16 +524,9 @@ class NeuronInfoLite:
 
     @classmethod
     def list_from_vec_u8(cls, vec_u8: List[int]) -> List['NeuronInfoLite']:
-        r""" Returns a list of NeuronInfoLite objects from a vec_u8.
+        r""" Returns a list of NeuronInfoLite objects from a vec_u8, decoded through NeuronColumns.
         """
-
-        decoded_list = from_scale_encoding(vec_u8, ChainDataType.NeuronInfoLite, is_vec=True)
-        if decoded_list is None:
-            return []
-
-        decoded_list = [NeuronInfoLite.fix_decoded_values(decoded) for decoded in decoded_list]
-        return decoded_list
-
+        return NeuronColumns.from_vec_u8( vec_u8 ).to_neurons()
 
     @staticmethod
     def _null_neuron() -> 'NeuronInfoLite':
@@ -480,41 +617,401 @@ class PrometheusInfo:
         prometheus_info_decoded['ip'] = bittensor.utils.networking.int_to_ip(int(prometheus_info_decoded['ip']))
 
         return cls(**prometheus_info_decoded)
-@dataclass
-class DelegateInfo:
+
+def _decode_compact( data: bytes, offset: int ) -> Tuple[int, int]:
+    r""" Decodes a SCALE Compact<uN> at offset, returning ( value, next offset ). """
+    byte = data[offset]
+    mode = byte & 0b11
+    if mode == 0:
+        return byte >> 2, offset + 1
+    elif mode == 1:
+        return int.from_bytes( data[offset:offset + 2], 'little' ) >> 2, offset + 2
+    elif mode == 2:
+        return int.from_bytes( data[offset:offset + 4], 'little' ) >> 2, offset + 4
+    length = ( byte >> 2 ) + 4
+    return int.from_bytes( data[offset + 1:offset + 1 + length], 'little' ), offset + 1 + length
+
+def _ip_from_halves( low: int, high: int ) -> int:
+    r""" Rebuilds a u128 ip from its two little endian u64 halves read as signed ints. """
+    return ( low & U64_MAX ) | ( ( high & U64_MAX ) << 64 )
+
+# Fixed size layouts of axon_info and PrometheusInfo. The u128 ip is read as two i64 halves so it fits an int64 tensor.
+_AXON_INFO_STRUCT = struct.Struct( '<QIqqHBBBB' )
+_PROMETHEUS_INFO_STRUCT = struct.Struct( '<QIqqHB' )
+_ACCOUNT_ID_SIZE = 32
+
+# Compact fields following the stake vector, in encoding order, and which of them are u16 normalized to [0, 1].
+_COMPACT_FIELDS = ( 'rank', 'emission', 'incentive', 'consensus', 'trust', 'validator_trust', 'dividends', 'last_update' )
+_U16_FIELDS = ( 'rank', 'incentive', 'consensus', 'trust', 'validator_trust', 'dividends' )
+_AXON_FIELDS = ( 'axon_block', 'axon_version', 'axon_ip', 'axon_port', 'axon_ip_type', 'axon_protocol', 'axon_placeholder1', 'axon_placeholder2' )
+_PROMETHEUS_FIELDS = ( 'prometheus_block', 'prometheus_version', 'prometheus_ip', 'prometheus_port', 'prometheus_ip_type' )
+_INT_FIELDS = ( 'uid', 'netuid', 'active', 'stake', 'validator_permit', 'pruning_score' ) + _COMPACT_FIELDS + _AXON_FIELDS + _PROMETHEUS_FIELDS
+
+class NeuronColumns:
+    r""" Struct-of-arrays view of a Vec<NeuronInfoLite> or Vec<NeuronInfo>, decoded straight from the rpc bytes
+        into one tensor per field. ss58 addresses, Balances and axon_info objects are only built on demand.
+
+        Columns, indexed by position in the rpc result:
+            uid, netuid, active, last_update, pruning_score ( torch.LongTensor )
+            validator_permit ( torch.BoolTensor )
+            stake, emission ( torch.LongTensor ): total stake and emission in rao.
+            rank, incentive, consensus, trust, validator_trust, dividends ( torch.DoubleTensor ):
+                u16 values divided by U16_MAX.
+            axon_*, prometheus_* ( torch.LongTensor ): served endpoints, the ips as [ n, 2 ] ( low, high ) halves.
+            hotkey_bytes, coldkey_bytes ( torch.ByteTensor ): [ n, 32 ] account ids.
+            stakes ( List[List[Tuple[bytes, int]]] ): ( coldkey account id, rao ) pairs of each neuron.
+            weights, bonds ( Tuple[torch.LongTensor, torch.LongTensor] ): only if not lite, the [ 2, nnz ]
+                ( position, uid ) indices and the [ nnz ] u16 values of the sparse matrices.
+    """
+    # Names of the per neuron tensor columns.
+    FIELDS = _INT_FIELDS + ( 'hotkey_bytes', 'coldkey_bytes' )
+
+    def __init__( self, columns: Dict[str, Any], lite: bool = True ):
+        self.lite = lite
+        for name, value in columns.items():
+            setattr( self, name, value )
+        self._hotkeys = None
+        self._coldkeys = None
+        self._axons = None
+        self._neurons = None
+
+    def __len__( self ) -> int:
+        return len( self.uid )
+
+    def __str__( self ) -> str:
+        return "NeuronColumns(n:{}, lite:{})".format( len( self ), self.lite )
+
+    def __repr__( self ) -> str:
+        return self.__str__()
+
+    @classmethod
+    def from_vec_u8( cls, vec_u8: List[int], lite: bool = True ) -> 'NeuronColumns':
+        r""" Decodes the result of neuronInfo_getNeuronsLite, or neuronInfo_getNeurons if not lite.
+            Args:
+                vec_u8 ( List[int] ):
+                    SCALE encoded Vec<NeuronInfoLite> or Vec<NeuronInfo>.
+                lite ( bool, default = True ):
+                    If false, the encoded neurons carry weights and bonds.
+            Returns:
+                columns ( NeuronColumns ):
+                    The decoded columns.
+        """
+        data = bytes( vec_u8 )
+        n, offset = _decode_compact( data, 0 ) if len( data ) > 0 else ( 0, 0 )
+        ints = { name: [] for name in _INT_FIELDS }
+        keys = bytearray()
+        stakes = []
+        sparse = { 'weights': ( [], [], [] ), 'bonds': ( [], [], [] ) }
+        axon_columns = [ ints[name] for name in _AXON_FIELDS ]
+        prometheus_columns = [ ints[name] for name in _PROMETHEUS_FIELDS ]
+        compact_columns = [ ints[name] for name in _COMPACT_FIELDS ]
+        compact = _decode_compact
+        unpack_axon, axon_size = _AXON_INFO_STRUCT.unpack_from, _AXON_INFO_STRUCT.size
+        unpack_prometheus, prometheus_size = _PROMETHEUS_INFO_STRUCT.unpack_from, _PROMETHEUS_INFO_STRUCT.size
+
+        for position in range( n ):
+            keys += data[offset:offset + 2 * _ACCOUNT_ID_SIZE]
+            offset += 2 * _ACCOUNT_ID_SIZE
+            uid, offset = compact( data, offset )
+            netuid, offset = compact( data, offset )
+            ints['uid'].append( uid )
+            ints['netuid'].append( netuid )
+            ints['active'].append( data[offset] )
+            offset += 1
+
+            block, version, ip_low, ip_high, *rest = unpack_axon( data, offset )
+            offset += axon_size
+            for column, value in zip( axon_columns, ( block, version, ( ip_low, ip_high ), *rest ) ):
+                column.append( value )
+            block, version, ip_low, ip_high, *rest = unpack_prometheus( data, offset )
+            offset += prometheus_size
+            for column, value in zip( prometheus_columns, ( block, version, ( ip_low, ip_high ), *rest ) ):
+                column.append( value )
+
+            n_stakes, offset = compact( data, offset )
+            neuron_stakes = []
+            for _ in range( n_stakes ):
+                coldkey = data[offset:offset + _ACCOUNT_ID_SIZE]
+                amount, offset = compact( data, offset + _ACCOUNT_ID_SIZE )
+                neuron_stakes.append( ( coldkey, amount ) )
+            stakes.append( neuron_stakes )
+            ints['stake'].append( sum( amount for _, amount in neuron_stakes ) )
+
+            for column in compact_columns:
+                value, offset = compact( data, offset )
+                column.append( value )
+            ints['validator_permit'].append( data[offset] )
+            offset += 1
+
+            if not lite:
+                for rows, cols, values in sparse.values():
+                    n_entries, offset = compact( data, offset )
+                    for _ in range( n_entries ):
+                        col, offset = compact( data, offset )
+                        value, offset = compact( data, offset )
+                        rows.append( position )
+                        cols.append( col )
+                        values.append( value )
+            pruning_score, offset = compact( data, offset )
+            ints['pruning_score'].append( pruning_score )
+
+        columns = { name: torch.tensor( values, dtype = torch.int64 ) for name, values in ints.items() }
+        for name in _U16_FIELDS:
+            columns[name] = columns[name].double() / U16_MAX
+        for name in ( 'axon_ip', 'prometheus_ip' ):
+            columns[name] = columns[name].view( n, 2 )
+        columns['validator_permit'] = columns['validator_permit'].bool()
+        keys = torch.frombuffer( keys, dtype = torch.uint8 ) if n > 0 else torch.zeros( 0, dtype = torch.uint8 )
+        keys = keys.view( n, 2, _ACCOUNT_ID_SIZE )
+        columns['hotkey_bytes'] = keys[:, 0]
+        columns['coldkey_bytes'] = keys[:, 1]
+        columns['stakes'] = stakes
+        if not lite:
+            for name, ( rows, cols, values ) in sparse.items():
+                columns[name] = ( torch.tensor( [ rows, cols ], dtype = torch.int64 ).view( 2, -1 ), torch.tensor( values, dtype = torch.int64 ) )
+        return cls( columns, lite = lite )
+
+    def hotkey( self, position: int ) -> str:
+        r""" Returns the ss58 hotkey of the neuron at position. """
+        if self._hotkeys is not None:
+            return self._hotkeys[ position ]
+        return ss58_encode( self.hotkey_bytes[ position ].numpy().tobytes(), bittensor.__ss58_format__ )
+
+    def coldkey( self, position: int ) -> str:
+        r""" Returns the ss58 coldkey of the neuron at position. """
+        if self._coldkeys is not None:
+            return self._coldkeys[ position ]
+        return ss58_encode( self.coldkey_bytes[ position ].numpy().tobytes(), bittensor.__ss58_format__ )
+
+    @property
+    def hotkeys( self ) -> List[str]:
+        r""" ss58 hotkeys of all neurons, encoded once on first access. """
+        if self._hotkeys is None:
+            self._hotkeys = _ss58_encode_rows( self.hotkey_bytes )
+        return self._hotkeys
+
+    @property
+    def coldkeys( self ) -> List[str]:
+        r""" ss58 coldkeys of all neurons, encoded once on first access. """
+        if self._coldkeys is None:
+            self._coldkeys = _ss58_encode_rows( self.coldkey_bytes )
+        return self._coldkeys
+
+    @property
+    def axons( self ) -> 'AxonInfoList':
+        r""" Lazy list of the bittensor.axon_info of all neurons. """
+        if self._axons is None:
+            self._axons = AxonInfoList( self )
+        return self._axons
+
+    def axon_info( self, position: int ) -> 'bittensor.axon_info':
+        r""" Builds the bittensor.axon_info of the neuron at position. """
+        return bittensor.axon_info(
+            version = self.axon_version[ position ].item(),
+            ip = bittensor.utils.networking.int_to_ip( _ip_from_halves( *self.axon_ip[ position ].tolist() ) ),
+            port = self.axon_port[ position ].item(),
+            ip_type = self.axon_ip_type[ position ].item(),
+            hotkey = self.hotkey( position ),
+            coldkey = self.coldkey( position ),
+        )
+
+    def prometheus_info( self, position: int ) -> 'PrometheusInfo':
+        r""" Builds the PrometheusInfo of the neuron at position. """
+        return PrometheusInfo(
+            block = self.prometheus_block[ position ].item(),
+            version = self.prometheus_version[ position ].item(),
+            ip = bittensor.utils.networking.int_to_ip( _ip_from_halves( *self.prometheus_ip[ position ].tolist() ) ),
+            port = self.prometheus_port[ position ].item(),
+            ip_type = self.prometheus_ip_type[ position ].item(),
+        )
+
+    def to_neurons( self ) -> List[ Union[ 'NeuronInfoLite', 'NeuronInfo' ] ]:
+        r""" Materializes the neurons as returned by NeuronInfoLite.list_from_vec_u8 ( or NeuronInfo if not lite ).
+            Their ss58 keys, stakes and infos are only built when read. """
+        if self._neurons is not None:
+            return self._neurons
+        record = NeuronInfoLite if self.lite else NeuronInfo
+        hotkey_ids = self.hotkey_bytes.numpy().tobytes()
+        coldkey_ids = self.coldkey_bytes.numpy().tobytes()
+        if not self.lite:
+            weights, bonds = self.sparse_rows( 'weights' ), self.sparse_rows( 'bonds' )
+        columns = {
+            name: getattr( self, name ).tolist() for name in ( 'uid', 'netuid', 'active', 'rank', 'emission', 'incentive', 'consensus',
+                'trust', 'validator_trust', 'dividends', 'last_update', 'validator_permit', 'pruning_score' )
+        }
+        axons = self.axons
+        neurons = []
+        for position in range( len( self ) ):
+            start = position * _ACCOUNT_ID_SIZE
+            fields = dict(
+                hotkey_id = hotkey_ids[ start:start + _ACCOUNT_ID_SIZE ],
+                coldkey_id = coldkey_ids[ start:start + _ACCOUNT_ID_SIZE ],
+                stakes = self.stakes[ position ],
+                axon_info = functools.partial( axons.__getitem__, position ),
+                prometheus_info = functools.partial( self.prometheus_info, position ),
+                uid = columns['uid'][ position ],
+                netuid = columns['netuid'][ position ],
+                active = bool( columns['active'][ position ] ),
+                rank = columns['rank'][ position ],
+                emission = columns['emission'][ position ] / RAOPERTAO,
+                incentive = columns['incentive'][ position ],
+                consensus = columns['consensus'][ position ],
+                trust = columns['trust'][ position ],
+                validator_trust = columns['validator_trust'][ position ],
+                dividends = columns['dividends'][ position ],
+                last_update = columns['last_update'][ position ],
+                validator_permit = columns['validator_permit'][ position ],
+                pruning_score = columns['pruning_score'][ position ],
+            )
+            if not self.lite:
+                fields.update( weights = weights[ position ], bonds = bonds[ position ] )
+            neurons.append( record._from_chain( **fields ) )
+        self._neurons = neurons
+        return neurons
+
+    def sparse_rows( self, name: str ) -> List[List[List[int]]]:
+        r""" Splits the 'weights' or 'bonds' entries back into per neuron [ [ uid, value ], ... ] lists. """
+        index, values = getattr( self, name )
+        counts = torch.bincount( index[0], minlength = len( self ) ).tolist()
+        entries = [ [ uid, value ] for uid, value in zip( index[1].tolist(), values.tolist() ) ]
+        rows, start = [], 0
+        for count in counts:
+            rows.append( entries[ start:start + count ] )
+            start += count
+        return rows
+
+def _ss58_encode_rows( account_ids: torch.ByteTensor ) -> List[str]:
+    data = account_ids.numpy().tobytes()
+    return [ ss58_encode( data[ i:i + _ACCOUNT_ID_SIZE ], bittensor.__ss58_format__ ) for i in range( 0, len( data ), _ACCOUNT_ID_SIZE ) ]
+
+class AxonInfoList( Sequence ):
+    r""" Read only list of the bittensor.axon_info of each neuron in a NeuronColumns, each built on first access. """
+    def __init__( self, columns: NeuronColumns ):
+        self.columns = columns
+        self._axons = [ None ] * len( columns )
+
+    def __len__( self ) -> int:
+        return len( self._axons )
+
+    def __getitem__( self, index ):
+        if isinstance( index, slice ):
+            return [ self[ i ] for i in range( *index.indices( len( self ) ) ) ]
+        axon = self._axons[ index ]
+        if axon is None:
+            axon = self._axons[ index ] = self.columns.axon_info( index )
+        return axon
+
+    def __eq__( self, other ) -> bool:
+        if not isinstance( other, Sequence ):
+            return NotImplemented
+        return len( self ) == len( other ) and all( a == b for a, b in zip( self, other ) )
+
+    def __repr__( self ) -> str:
+        return repr( list( self ) )
+
+class DelegateInfo( _ChainRecord ):
     r"""
-    Dataclass for delegate info.
+    Delegate info. ss58 keys, nominators and Balances are built on first access.
     """
-    hotkey_ss58: str # Hotkey of delegate
-    total_stake: Balance # Total stake of the delegate
-    nominators: List[Tuple[str, Balance]] # List of nominators of the delegate and their stake
-    owner_ss58: str # Coldkey of owner
+    __slots__ = (
+        'take', 'validator_permits', 'registrations',
+        '_hotkey_ss58', '_total_stake', '_nominators', '_owner_ss58', '_return_per_1000', '_total_daily_return',
+        '_hotkey_id', '_owner_id', '_nominator_stakes', '_return_per_1000_rao', '_total_daily_return_rao',
+    )
+    hotkey_ss58: str = _lazy_field() # Hotkey of delegate
+    total_stake: Balance = _lazy_field() # Total stake of the delegate
+    nominators: List[Tuple[str, Balance]] = _lazy_field() # List of nominators of the delegate and their stake
+    owner_ss58: str = _lazy_field() # Coldkey of owner
     take: float # Take of the delegate as a percentage
     validator_permits: List[int] # List of subnets that the delegate is allowed to validate on
     registrations: List[int] # List of subnets that the delegate is registered on
-    return_per_1000: bittensor.Balance # Return per 1000 tao of the delegate over a day
-    total_daily_return: bittensor.Balance # Total daily return of the delegate
+    return_per_1000: bittensor.Balance = _lazy_field() # Return per 1000 tao of the delegate over a day
+    total_daily_return: bittensor.Balance = _lazy_field() # Total daily return of the delegate
+
+    @classmethod
+    def _from_chain( cls, hotkey_id: Union[str, bytes], owner_id: Union[str, bytes], nominator_stakes: List[Tuple[Union[str, bytes], int]], take: int, validator_permits: List[int], registrations: List[int], return_per_1000: int, total_daily_return: int ) -> 'DelegateInfo':
+        record = cls.__new__( cls )
+        record._hotkey_id = hotkey_id
+        record._owner_id = owner_id
+        record._nominator_stakes = nominator_stakes
+        record._return_per_1000_rao = return_per_1000
+        record._total_daily_return_rao = total_daily_return
+        record.take = bittensor.utils.U16_NORMALIZED_FLOAT( take )
+        record.validator_permits = validator_permits
+        record.registrations = registrations
+        return record
+
+    def _materialize_hotkey_ss58( self ) -> str:
+        return ss58_encode( self._hotkey_id, bittensor.__ss58_format__ )
+
+    def _materialize_owner_ss58( self ) -> str:
+        return ss58_encode( self._owner_id, bittensor.__ss58_format__ )
+
+    def _materialize_nominators( self ) -> List[Tuple[str, Balance]]:
+        return [ ( ss58_encode( nominator, bittensor.__ss58_format__ ), Balance.from_rao( amount ) ) for nominator, amount in self._nominator_stakes ]
+
+    def _materialize_total_stake( self ) -> Balance:
+        return Balance.from_rao( sum( amount for _, amount in self._nominator_stakes ) )
+
+    def _materialize_return_per_1000( self ) -> Balance:
+        return Balance.from_rao( self._return_per_1000_rao )
+
+    def _materialize_total_daily_return( self ) -> Balance:
+        return Balance.from_rao( self._total_daily_return_rao )
 
     @classmethod
     def fix_decoded_values(cls, decoded: Any) -> 'DelegateInfo':
-        r""" Fixes the decoded values.
+        r""" Returns a DelegateInfo from the scale decoded dict, keeping the account ids and stakes raw.
         """
-
-        return cls(
-            hotkey_ss58 = ss58_encode(decoded['delegate_ss58'], bittensor.__ss58_format__),
-            owner_ss58 = ss58_encode(decoded['owner_ss58'], bittensor.__ss58_format__),
-            take = bittensor.utils.U16_NORMALIZED_FLOAT(decoded['take']),
-            nominators = [
-                (ss58_encode(nom[0], bittensor.__ss58_format__), Balance.from_rao(nom[1]))
-                for nom in decoded['nominators']
-            ],
-            total_stake = Balance.from_rao(sum([nom[1] for nom in decoded['nominators']])),
+        return cls._from_chain(
+            hotkey_id = decoded['delegate_ss58'],
+            owner_id = decoded['owner_ss58'],
+            nominator_stakes = [ ( nominator, int( amount ) ) for nominator, amount in decoded['nominators'] ],
+            take = decoded['take'],
             validator_permits = decoded['validator_permits'],
             registrations = decoded['registrations'],
-            return_per_1000 = bittensor.Balance.from_rao(decoded['return_per_1000']),
-            total_daily_return = bittensor.Balance.from_rao(decoded['total_daily_return']),
+            return_per_1000 = decoded['return_per_1000'],
+            total_daily_return = decoded['total_daily_return'],
         )
 
+    @classmethod
+    def _decode( cls, data: bytes, offset: int ) -> Tuple['DelegateInfo', int]:
+        r""" Decodes the SCALE encoded DelegateInfo at offset, returning ( delegate, next offset ). """
+        compact = _decode_compact
+        hotkey_id = data[offset:offset + _ACCOUNT_ID_SIZE]
+        take, offset = compact( data, offset + _ACCOUNT_ID_SIZE )
+        n_nominators, offset = compact( data, offset )
+        nominator_stakes = []
+        for _ in range( n_nominators ):
+            nominator = data[offset:offset + _ACCOUNT_ID_SIZE]
+            amount, offset = compact( data, offset + _ACCOUNT_ID_SIZE )
+            nominator_stakes.append( ( nominator, amount ) )
+        owner_id = data[offset:offset + _ACCOUNT_ID_SIZE]
+        offset += _ACCOUNT_ID_SIZE
+        netuid_lists = []
+        for _ in range( 2 ):
+            length, offset = compact( data, offset )
+            netuids = []
+            for _ in range( length ):
+                netuid, offset = compact( data, offset )
+                netuids.append( netuid )
+            netuid_lists.append( netuids )
+        return_per_1000, offset = compact( data, offset )
+        total_daily_return, offset = compact( data, offset )
+        if offset > len( data ):
+            raise ValueError( 'DelegateInfo encoding ends after {} of {} bytes'.format( offset, len( data ) ) )
+        delegate = cls._from_chain(
+            hotkey_id = hotkey_id,
+            owner_id = owner_id,
+            nominator_stakes = nominator_stakes,
+            take = take,
+            registrations = netuid_lists[0],
+            validator_permits = netuid_lists[1],
+            return_per_1000 = return_per_1000,
+            total_daily_return = total_daily_return,
+        )
+        return delegate, offset
+
     @classmethod
     def from_vec_u8(cls, vec_u8: List[int]) -> Optional['DelegateInfo']:
         r""" Returns a DelegateInfo object from a vec_u8.
@@ -522,41 +1019,40 @@ class DelegateInfo:
         if len(vec_u8) == 0:
             return None
 
-        decoded = from_scale_encoding(vec_u8, ChainDataType.DelegateInfo)
-
-        if decoded is None:
-            return None
-
-        decoded = DelegateInfo.fix_decoded_values(decoded)
-
-        return decoded
+        delegate, _ = cls._decode( bytes( vec_u8 ), 0 )
+        return delegate
 
     @classmethod
     def list_from_vec_u8(cls, vec_u8: List[int]) -> List['DelegateInfo']:
         r""" Returns a list of DelegateInfo objects from a vec_u8.
         """
-        decoded = from_scale_encoding(vec_u8, ChainDataType.DelegateInfo, is_vec=True)
-
-        if decoded is None:
+        data = bytes( vec_u8 )
+        if len( data ) == 0:
             return []
 
-        decoded = [DelegateInfo.fix_decoded_values(d) for d in decoded]
-
-        return decoded
+        n, offset = _decode_compact( data, 0 )
+        delegates = []
+        for _ in range( n ):
+            delegate, offset = cls._decode( data, offset )
+            delegates.append( delegate )
+        return delegates
 
     @classmethod
     def delegated_list_from_vec_u8(cls, vec_u8: List[int]) -> List[Tuple['DelegateInfo', Balance]]:
         r""" Returns a list of Tuples of DelegateInfo objects, and Balance, from a vec_u8.
         This is the list of delegates that the user has delegated to, and the amount of stake delegated.
         """
-        decoded = from_scale_encoding(vec_u8, ChainDataType.DelegatedInfo, is_vec=True)
-
-        if decoded is None:
+        data = bytes( vec_u8 )
+        if len( data ) == 0:
             return []
 
-        decoded = [(DelegateInfo.fix_decoded_values(d), Balance.from_rao(s)) for d, s in decoded]
-
-        return decoded
+        n, offset = _decode_compact( data, 0 )
+        delegated = []
+        for _ in range( n ):
+            delegate, offset = cls._decode( data, offset )
+            stake, offset = _decode_compact( data, offset )
+            delegated.append( ( delegate, Balance.from_rao( stake ) ) )
+        return delegated
 
 @dataclass
 class SubnetInfo:
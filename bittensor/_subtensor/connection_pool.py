@@ -0,0 +1,206 @@
+# The MIT License (MIT)
+# Copyright © 2021 Yuma Rao
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import os
+import time
+import threading
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Tuple
+from substrateinterface import SubstrateInterface
+
+# Websockets a pooled endpoint opens at most, each serving one `with` block at a time.
+MAX_CONNECTIONS = 4
+
+@dataclass
+class ConnectionPoolStats:
+    """ Counters of the process wide substrate ConnectionPool."""
+    # Websockets opened, at most max_connections per endpoint and process.
+    created: int = 0
+    # Subtensors served an already open connection.
+    reused: int = 0
+    # Websockets reopened because they were closed or failed their health check.
+    reconnects: int = 0
+    # `with` blocks which waited for a connection because all of them were checked out.
+    waits: int = 0
+
+class PooledSubstrateInterface( SubstrateInterface ):
+    r""" SubstrateInterface shared by every subtensor of a process talking to the same endpoint.
+
+        Each `with substrate as substrate:` block of Subtensor checks out one of up to max_connections websockets
+        to the endpoint, this one first, and puts it back on exit instead of closing it. Calls from different
+        threads never interleave on a socket, a block waiting for an extrinsic to be included only holds its own
+        connection, and the websocket handshake is paid once per connection instead of once per call. Nested
+        blocks of a thread reuse its connection. Checking out reconnects a closed websocket, and one idle for
+        longer than health_check_interval must first answer a system_health call.
+    """
+    def __init__(
+            self,
+            *args,
+            health_check_interval: float = 30.0,
+            max_connections: int = MAX_CONNECTIONS,
+            stats: Optional[ConnectionPoolStats] = None,
+            owner: Optional['PooledSubstrateInterface'] = None,
+            **kwargs
+        ):
+        self.lock = threading.RLock()
+        self.stats = stats if stats is not None else ConnectionPoolStats()
+        self.health_check_interval = health_check_interval
+        self.max_connections = max_connections
+        self.reconnects = 0
+        self.last_used = time.monotonic()
+        # The first connection to an endpoint owns the pool, the others are opened by it on demand.
+        self.owner = owner if owner is not None else self
+        if owner is None:
+            self._args, self._kwargs = args, kwargs
+            self._condition = threading.Condition()
+            self._connections: List['PooledSubstrateInterface'] = [ self ]
+            self._idle: List['PooledSubstrateInterface'] = [ self ]
+            self._opening = 0
+            self._local = threading.local()
+        super().__init__( *args, **kwargs )
+
+    def __enter__( self ) -> 'PooledSubstrateInterface':
+        return self.checkout()
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        self.checkin()
+
+    def checkout( self ) -> 'PooledSubstrateInterface':
+        r""" Returns a connected websocket of the pool for the calling thread, waiting for one if all
+            max_connections are checked out. Every checkout must be followed by a checkin from the same thread.
+        """
+        pool = self.owner
+        held = getattr( pool._local, 'held', None )
+        if held is not None:
+            pool._local.held = ( held[0], held[1] + 1 )
+            return held[0]
+        connection = None
+        with pool._condition:
+            if len( pool._idle ) == 0 and len( pool._connections ) + pool._opening >= pool.max_connections:
+                pool.stats.waits += 1
+                pool._condition.wait_for( lambda: len( pool._idle ) > 0 or len( pool._connections ) + pool._opening < pool.max_connections )
+            if len( pool._idle ) > 0:
+                connection = pool._idle.pop()
+            else:
+                pool._opening += 1
+        if connection is None:
+            # The handshake happens outside the pool lock, other threads keep checking out idle connections.
+            try:
+                connection = PooledSubstrateInterface( *pool._args, health_check_interval = pool.health_check_interval, stats = pool.stats, owner = pool, **pool._kwargs )
+                pool.stats.created += 1
+            finally:
+                with pool._condition:
+                    pool._opening -= 1
+                    if connection is not None: pool._connections.append( connection )
+                    pool._condition.notify()
+        connection.lock.acquire()
+        try:
+            connection.ensure_connected()
+        except Exception:
+            connection.lock.release()
+            pool._put_back( connection )
+            raise
+        pool._local.held = ( connection, 1 )
+        return connection
+
+    def checkin( self ):
+        r""" Puts back the connection checked out by the calling thread once its outermost block exits."""
+        pool = self.owner
+        connection, depth = pool._local.held
+        if depth > 1:
+            pool._local.held = ( connection, depth - 1 )
+            return
+        pool._local.held = None
+        connection.last_used = time.monotonic()
+        connection.lock.release()
+        pool._put_back( connection )
+
+    def _put_back( self, connection: 'PooledSubstrateInterface' ):
+        with self._condition:
+            self._idle.append( connection )
+            self._condition.notify()
+
+    def close_all( self ):
+        r""" Closes every websocket of the pool, they are reopened on their next checkout."""
+        for connection in list( self.owner._connections ):
+            try: connection.close()
+            except Exception: pass
+
+    def is_connected( self ) -> bool:
+        return self.websocket is not None and getattr( self.websocket, 'connected', False )
+
+    def ensure_connected( self ):
+        r""" Reopens the websocket if it is closed or fails its health check."""
+        with self.lock:
+            healthy = self.is_connected()
+            if healthy and time.monotonic() - self.last_used > self.health_check_interval:
+                try:
+                    self.rpc_request( 'system_health', [] )
+                except Exception:
+                    healthy = False
+            if not healthy:
+                try: self.close()
+                except Exception: pass
+                self.connect_websocket()
+                self.reconnects += 1
+                self.stats.reconnects += 1
+            self.last_used = time.monotonic()
+
+class ConnectionPool:
+    r""" Process wide pool of substrate connections keyed by endpoint, see PooledSubstrateInterface."""
+    def __init__( self ):
+        self.stats = ConnectionPoolStats()
+        self._lock = threading.Lock()
+        self._connections: Dict[Tuple[int, Hashable], PooledSubstrateInterface] = {}
+
+    def __len__( self ) -> int:
+        return len( self._connections )
+
+    def get( self, url: str, max_connections: int = MAX_CONNECTIONS, **kwargs ) -> PooledSubstrateInterface:
+        r""" Returns the open connection to url, creating it on first use.
+            Args:
+                url (:obj:`str`, `required`):
+                    websocket endpoint, e.g. ws://127.0.0.1:9944.
+                max_connections (:obj:`int`, `optional`):
+                    websockets opened to url at most, the largest value asked for an endpoint is kept.
+                kwargs:
+                    SubstrateInterface arguments, connections are only shared between identical arguments.
+            Returns:
+                substrate (:obj:`PooledSubstrateInterface`):
+                    the shared connection.
+        """
+        # Forked processes, e.g. the registration solvers, must not share the parent's sockets.
+        key = ( os.getpid(), url, repr( sorted( kwargs.items() ) ) )
+        with self._lock:
+            connection = self._connections.get( key )
+            if connection is not None:
+                self.stats.reused += 1
+                connection.max_connections = max( connection.max_connections, max_connections )
+                return connection
+            connection = self._connections[ key ] = PooledSubstrateInterface( url = url, max_connections = max_connections, stats = self.stats, **kwargs )
+            self.stats.created += 1
+            return connection
+
+    def close( self ):
+        r""" Closes and forgets every connection."""
+        with self._lock:
+            for connection in self._connections.values():
+                connection.close_all()
+            self._connections = {}
+
+pool = ConnectionPool()
@@ -215,13 +215,12 @@ def add_stake_multiple_extrinsic (
     # Decrypt coldkey.
     wallet.coldkey
 
-    old_stakes = []
     with bittensor.__console__.status(":satellite: Syncing with chain: [white]{}[/white] ...".format(subtensor.network)):
         old_balance = subtensor.get_balance( wallet.coldkeypub.ss58_address )
 
-        # Get the old stakes.
-        for hotkey_ss58 in hotkey_ss58s:
-            old_stakes.append( subtensor.get_stake_for_coldkey_and_hotkey( coldkey_ss58 = wallet.coldkeypub.ss58_address, hotkey_ss58 = hotkey_ss58 ) )
+        # Get the old stakes, in one round trip.
+        stakes = subtensor.get_stakes_for( [ ( hotkey_ss58, wallet.coldkeypub.ss58_address ) for hotkey_ss58 in hotkey_ss58s ] )
+        old_stakes = [ stakes[ ( hotkey_ss58, wallet.coldkeypub.ss58_address ) ] for hotkey_ss58 in hotkey_ss58s ]
 
     # Remove existential balance to keep key alive.
     ## Keys must maintain a balance of at least 1000 rao to stay alive.
@@ -384,6 +383,7 @@ def __do_add_stake_single(
         )
         extrinsic = substrate.create_signed_extrinsic( call = call, keypair = wallet.coldkey )
         response = substrate.submit_extrinsic( extrinsic, wait_for_inclusion = wait_for_inclusion, wait_for_finalization = wait_for_finalization )
+        subtensor.invalidate_cache()
         # We only wait here if we expect finalization.
         if not wait_for_finalization and not wait_for_inclusion:
             return True
@@ -74,6 +74,7 @@ def __do_remove_stake_single(
         )
         extrinsic = substrate.create_signed_extrinsic( call = call, keypair = wallet.coldkey )
         response = substrate.submit_extrinsic( extrinsic, wait_for_inclusion = wait_for_inclusion, wait_for_finalization = wait_for_finalization )
+        subtensor.invalidate_cache()
         # We only wait here if we expect finalization.
         if not wait_for_finalization and not wait_for_inclusion:
             return True
@@ -237,13 +238,12 @@ def unstake_multiple_extrinsic (
     # Unlock coldkey.
     wallet.coldkey
 
-    old_stakes = []
     with bittensor.__console__.status(":satellite: Syncing with chain: [white]{}[/white] ...".format(subtensor.network)):
         old_balance = subtensor.get_balance( wallet.coldkeypub.ss58_address )
 
-        for hotkey_ss58 in hotkey_ss58s:
-            old_stake = subtensor.get_stake_for_coldkey_and_hotkey( coldkey_ss58 = wallet.coldkeypub.ss58_address, hotkey_ss58 = hotkey_ss58 ) # Get stake on hotkey.
-            old_stakes.append(old_stake) # None if not registered.
+        # Get the stake on each hotkey, in one round trip.
+        stakes = subtensor.get_stakes_for( [ ( hotkey_ss58, wallet.coldkeypub.ss58_address ) for hotkey_ss58 in hotkey_ss58s ] )
+        old_stakes = [ stakes[ ( hotkey_ss58, wallet.coldkeypub.ss58_address ) ] for hotkey_ss58 in hotkey_ss58s ]
 
     successful_unstakes = 0
     for idx, (hotkey_ss58, amount, old_stake) in enumerate(zip(hotkey_ss58s, amounts, old_stakes)):
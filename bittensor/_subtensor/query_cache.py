@@ -0,0 +1,183 @@
+# The MIT License (MIT)
+# Copyright © 2021 Yuma Rao
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import time
+import threading
+import bittensor
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+@dataclass
+class QueryCacheStats:
+    """ Counters of a subtensor QueryCache."""
+    # Reads served from the cache.
+    hits: int = 0
+    # Reads which went to the chain.
+    misses: int = 0
+    # Latest reads dropped because their ttl passed.
+    expired: int = 0
+    # Times the latest reads were dropped by a new block header or an extrinsic.
+    invalidations: int = 0
+
+    @property
+    def hit_rate( self ) -> float:
+        return self.hits / max( 1, self.hits + self.misses )
+
+def _freeze( value: Any ) -> Hashable:
+    if isinstance( value, ( list, tuple ) ):
+        return tuple( _freeze( item ) for item in value )
+    if isinstance( value, dict ):
+        return tuple( sorted( ( key, _freeze( item ) ) for key, item in value.items() ) )
+    return value
+
+class QueryCache:
+    r""" Cache of subtensor storage reads keyed by ( storage, params, block hash ).
+
+        Reads pinned to a block hash never change and are kept until max_entries pushes them out, least recently
+        used first. Reads of the latest state expire after ttl seconds, one block by default, or as soon as
+        on_new_block sees a newer header. Block number to block hash lookups are kept as historical entries.
+        While suspended, e.g. when the header subscription feeding on_new_block is down, reads of the latest state
+        are not cached.
+    """
+    def __init__( self, ttl: float = None, max_entries: int = 65536 ):
+        r""" Initializes an empty cache.
+            Args:
+                ttl (:obj:`float`, `optional`):
+                    seconds a latest read is served for, defaults to bittensor.__blocktime__.
+                max_entries (:obj:`int`, `optional`):
+                    maximum number of historical entries.
+        """
+        self.ttl = bittensor.__blocktime__ if ttl is None else ttl
+        self.max_entries = max_entries
+        self.stats = QueryCacheStats()
+        self.head: Optional[int] = None
+        self.suspended = False
+        self._lock = threading.Lock()
+        self._historical: 'OrderedDict[Tuple, Any]' = OrderedDict()
+        self._latest: Dict[Tuple, Tuple[float, Any]] = {}
+
+    def __len__( self ) -> int:
+        return len( self._historical ) + len( self._latest )
+
+    def __str__( self ) -> str:
+        return "QueryCache(entries:{}, hits:{}, misses:{})".format( len( self ), self.stats.hits, self.stats.misses )
+
+    def __repr__( self ) -> str:
+        return self.__str__()
+
+    @staticmethod
+    def key( *parts ) -> Tuple:
+        r""" Returns the hashable key of a read, e.g. key( 'SubtensorModule', 'Tempo', [ netuid ] )."""
+        return _freeze( parts )
+
+    def get( self, key: Tuple, block_hash: Optional[str], query: Callable[[], Any] ) -> Any:
+        r""" Returns the cached value of key at block_hash, calling query on a miss.
+            Args:
+                key (:obj:`Tuple`, `required`):
+                    key of the read, without the block hash.
+                block_hash (:obj:`Optional[str]`, `required`):
+                    block the read is pinned to, None for the latest state.
+                query (:obj:`Callable[[], Any]`, `required`):
+                    reads the value from the chain.
+            Returns:
+                value (:obj:`Any`):
+                    the cached or queried value.
+        """
+        found, value = self.lookup( key, block_hash )
+        if found:
+            return value
+        value = query()
+        self.put( key, block_hash, value )
+        return value
+
+    def lookup( self, key: Tuple, block_hash: Optional[str] ) -> Tuple[bool, Any]:
+        r""" Returns ( True, value ) if key at block_hash is cached, else ( False, None ). Counts a hit or a miss."""
+        with self._lock:
+            if block_hash is not None:
+                if ( key, block_hash ) in self._historical:
+                    self._historical.move_to_end( ( key, block_hash ) )
+                    self.stats.hits += 1
+                    return True, self._historical[ ( key, block_hash ) ]
+            elif key in self._latest:
+                expires, value = self._latest[ key ]
+                if time.monotonic() < expires:
+                    self.stats.hits += 1
+                    return True, value
+                del self._latest[ key ]
+                self.stats.expired += 1
+            self.stats.misses += 1
+            return False, None
+
+    def put( self, key: Tuple, block_hash: Optional[str], value: Any ):
+        r""" Caches value as the read of key at block_hash, None for the latest state."""
+        with self._lock:
+            if block_hash is not None:
+                self._put_historical( ( key, block_hash ), value )
+            elif not self.suspended:
+                self._latest[ key ] = ( time.monotonic() + self.ttl, value )
+
+    def _put_historical( self, key: Tuple, value: Any ):
+        self._historical[ key ] = value
+        while len( self._historical ) > self.max_entries:
+            self._historical.popitem( last = False )
+
+    def get_block_hash( self, block: int, query: Callable[[], str] ) -> str:
+        r""" Returns the cached hash of block, calling query on a miss."""
+        with self._lock:
+            if ( 'BlockHash', block ) in self._historical:
+                self._historical.move_to_end( ( 'BlockHash', block ) )
+                self.stats.hits += 1
+                return self._historical[ ( 'BlockHash', block ) ]
+            self.stats.misses += 1
+        block_hash = query()
+        if block_hash is not None:
+            with self._lock:
+                self._put_historical( ( 'BlockHash', block ), block_hash )
+        return block_hash
+
+    def on_new_block( self, block: Optional[int] = None ):
+        r""" Invalidation hook for new block headers, drops every latest read.
+            Args:
+                block (:obj:`Optional[int]`, `optional`):
+                    number of the new header. Headers at or below the last seen one are ignored.
+        """
+        with self._lock:
+            if block is not None:
+                if self.head is not None and block <= self.head: return
+                self.head = block
+            if len( self._latest ) > 0:
+                self._latest.clear()
+            self.stats.invalidations += 1
+
+    def suspend( self ):
+        r""" Drops every latest read and stops caching them until resume(), historical reads are still served."""
+        with self._lock:
+            self.suspended = True
+            self._latest.clear()
+
+    def resume( self ):
+        r""" Caches reads of the latest state again after suspend()."""
+        with self._lock:
+            self.suspended = False
+
+    def clear( self ):
+        r""" Drops every entry, historical ones included."""
+        with self._lock:
+            self._historical.clear()
+            self._latest.clear()
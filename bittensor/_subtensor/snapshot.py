@@ -0,0 +1,224 @@
+# The MIT License (MIT)
+# Copyright © 2021 Yuma Rao
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import queue
+import threading
+import bittensor
+import scalecodec
+from retry import retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+from substrateinterface import SubstrateInterface
+from bittensor.utils.balance import Balance
+
+from .chain_data import DelegateInfo, NeuronColumns, NeuronInfoLite, SubnetInfo
+from .storage import StorageQuery, query_storage_at
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+class SubtensorSnapshot:
+    r""" Reads the chain state at one pinned block hash, fanning independent calls out over a pool of
+        websocket connections. Every read of a snapshot sees the same block, so tables built from it never mix
+        state from different blocks.
+
+        Custom rpc calls (neurons, delegates, subnets) carry no runtime metadata and run concurrently, one
+        pooled connection per worker. Storage reads need the decoded runtime of the subtensor connection, so
+        they are serialized on it and batched into one state_queryStorageAt where possible.
+    """
+    def __init__(
+            self,
+            subtensor: 'bittensor.Subtensor',
+            block: Optional[int] = None,
+            max_workers: int = 8,
+        ):
+        r""" Pins the block and opens the pool.
+            Args:
+                subtensor (:obj:`bittensor.Subtensor`, `required`):
+                    subtensor whose endpoint is read.
+                block (:obj:`Optional[int]`, `optional`):
+                    block to pin, defaults to the chain head.
+                max_workers (:obj:`int`, `optional`):
+                    maximum number of concurrent calls, and of pooled connections.
+        """
+        self.subtensor = subtensor
+        self.substrate = subtensor.substrate
+        self.max_workers = max( 1, max_workers )
+        self._storage_lock = threading.Lock()
+        self._idle = queue.Queue()
+        self._connections: List[SubstrateInterface] = []
+        self._connections_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor( max_workers = self.max_workers, thread_name_prefix = 'subtensor-snapshot' )
+
+        @retry(delay=2, tries=3, backoff=2, max_delay=4)
+        def make_substrate_call_with_retry():
+            with self._storage_lock, self.substrate as substrate:
+                if block == None:
+                    block_hash = substrate.get_chain_head()
+                    return substrate.get_block_number( block_hash ), block_hash
+                return block, substrate.get_block_hash( block )
+        self.block, self.block_hash = make_substrate_call_with_retry()
+
+    def __str__( self ) -> str:
+        return "SubtensorSnapshot({}, {}, {})".format( self.subtensor.network, self.block, self.block_hash )
+
+    def __repr__( self ) -> str:
+        return self.__str__()
+
+    def __enter__( self ) -> 'SubtensorSnapshot':
+        return self
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        self.close()
+
+    def close( self ):
+        r""" Stops the workers and closes the connections opened by the snapshot."""
+        self._executor.shutdown( wait = True )
+        with self._connections_lock:
+            for connection in self._connections:
+                try: connection.close()
+                except Exception: pass
+            self._connections = []
+
+    def _open_connection( self ) -> SubstrateInterface:
+        # Pooled connections only issue raw rpc requests, they skip the type registry download.
+        return SubstrateInterface(
+            ss58_format = bittensor.__ss58_format__,
+            url = self.substrate.url,
+            use_remote_preset = False,
+            auto_discover = False,
+        )
+
+    def _acquire( self ) -> SubstrateInterface:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._connections_lock:
+            if len( self._connections ) < self.max_workers:
+                connection = self._open_connection()
+                self._connections.append( connection )
+                return connection
+        return self._idle.get()
+
+    def rpc( self, method: str, params: List[object] = [] ) -> object:
+        r""" Calls a custom rpc method at the pinned block on a pooled connection.
+            Args:
+                method (:obj:`str`, `required`):
+                    rpc method name, e.g. neuronInfo_getNeuronsLite.
+                params (:obj:`List[object]`, `optional`):
+                    method params, the pinned block hash is appended.
+            Returns:
+                result (:obj:`object`):
+                    the result field of the json response.
+        """
+        @retry(delay=2, tries=3, backoff=2, max_delay=4)
+        def make_substrate_call_with_retry():
+            connection = self._acquire()
+            try:
+                return connection.rpc_request( method = method, params = list( params ) + [ self.block_hash ] )
+            finally:
+                self._idle.put( connection )
+        return make_substrate_call_with_retry()['result']
+
+    def query( self, module: str, storage_function: str, params: List[object] = [] ) -> Optional[object]:
+        r""" Reads a storage item at the pinned block on the subtensor connection."""
+        @retry(delay=2, tries=3, backoff=2, max_delay=4)
+        def make_substrate_call_with_retry():
+            with self._storage_lock, self.substrate as substrate:
+                return substrate.query(
+                    module = module,
+                    storage_function = storage_function,
+                    params = params,
+                    block_hash = self.block_hash
+                )
+        return make_substrate_call_with_retry()
+
+    def query_multi( self, queries: List[StorageQuery] ) -> List[object]:
+        r""" Reads many storage items at the pinned block in one round trip on the subtensor connection."""
+        @retry(delay=2, tries=3, backoff=2, max_delay=4)
+        def make_substrate_call_with_retry():
+            with self._storage_lock, self.substrate as substrate:
+                return query_storage_at( substrate, queries, self.block_hash )
+        return make_substrate_call_with_retry()
+
+    def map( self, fn: Callable[[T], R], items: Iterable[T] ) -> List[R]:
+        r""" Applies fn to every item concurrently and returns the results in the order of items."""
+        return list( self._executor.map( fn, list( items ) ) )
+
+    #### Subnets ####
+
+    def get_all_subnets_info( self ) -> List[SubnetInfo]:
+        result = self.rpc( 'subnetInfo_getSubnetsInfo' )
+        if result in (None, []):
+            return []
+        return SubnetInfo.list_from_vec_u8( result )
+
+    def get_all_subnet_netuids( self ) -> List[int]:
+        return [ info.netuid for info in self.get_all_subnets_info() ]
+
+    def tempos( self ) -> Dict[int, int]:
+        r""" Returns the tempo of every subnet, read in one call."""
+        return { info.netuid: info.tempo for info in self.get_all_subnets_info() }
+
+    def tempo( self, netuid: int ) -> Optional[int]:
+        return self.tempos().get( netuid )
+
+    #### Neurons ####
+
+    def neuron_columns( self, netuid: int ) -> NeuronColumns:
+        result = self.rpc( 'neuronInfo_getNeuronsLite', [ netuid ] )
+        return NeuronColumns.from_vec_u8( [] if result in (None, []) else result )
+
+    def neurons_lite( self, netuid: int ) -> List[NeuronInfoLite]:
+        # Materialized from the columnar decode, the same neurons as NeuronInfoLite.list_from_vec_u8 at a fraction of the cost.
+        return self.neuron_columns( netuid ).to_neurons()
+
+    def neurons_lite_for( self, netuids: List[int] ) -> Dict[int, List[NeuronInfoLite]]:
+        r""" Returns the lite neurons of every netuid, fetched concurrently."""
+        return dict( zip( netuids, self.map( self.neurons_lite, netuids ) ) )
+
+    #### Accounts ####
+
+    def get_balance( self, address: str ) -> Balance:
+        try:
+            result = self.query( 'System', 'Account', [ address ] )
+        except scalecodec.exceptions.RemainingScaleBytesNotEmptyException:
+            bittensor.logging.error( "Your wallet it legacy formatted, you need to run btcli stake --ammount 0 to reformat it." )
+            return Balance(1000)
+        return Balance( result.value['data']['free'] )
+
+    def get_balances_for( self, addresses: List[str] ) -> Dict[str, Balance]:
+        r""" Returns the balance of every address, read in one round trip. If a legacy formatted account fails to
+            decode, the addresses are read one by one and it gets the placeholder balance of get_balance."""
+        try:
+            results = self.query_multi( [ ( 'System', 'Account', [ address ] ) for address in addresses ] )
+        except scalecodec.exceptions.RemainingScaleBytesNotEmptyException:
+            return dict( zip( addresses, self.map( self.get_balance, addresses ) ) )
+        return { address: Balance( result.value['data']['free'] ) for address, result in zip( addresses, results ) }
+
+    def get_delegated( self, coldkey_ss58: str ) -> List[Tuple[DelegateInfo, Balance]]:
+        encoded_coldkey = [ int( byte ) for byte in bittensor.utils.ss58_address_to_bytes( coldkey_ss58 ) ]
+        result = self.rpc( 'delegateInfo_getDelegated', [ encoded_coldkey ] )
+        if result in (None, []):
+            return []
+        return DelegateInfo.delegated_list_from_vec_u8( result )
+
+    def get_delegated_for( self, coldkeys: List[str] ) -> Dict[str, List[Tuple[DelegateInfo, Balance]]]:
+        r""" Returns the delegations of every coldkey, fetched concurrently."""
+        return dict( zip( coldkeys, self.map( self.get_delegated, coldkeys ) ) )
@@ -0,0 +1,88 @@
+# The MIT License (MIT)
+# Copyright © 2021 Yuma Rao
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+from typing import List, Optional, Tuple
+from scalecodec import ScaleBytes, ScaleType
+from substrateinterface import SubstrateInterface
+from substrateinterface.exceptions import StorageFunctionNotFound, SubstrateRequestException
+
+# ( module, storage_function, params ) of one storage read.
+StorageQuery = Tuple[str, str, List[object]]
+
+def query_storage_at( substrate: 'SubstrateInterface', queries: List[StorageQuery], block_hash: Optional[str] = None ) -> List[ScaleType]:
+    r""" Reads many storage items in one state_queryStorageAt round trip. Keys are built and values decoded as
+        SubstrateInterface.query does, so each result matches the one query would return for it.
+        Args:
+            substrate (:obj:`SubstrateInterface`, `required`):
+                open substrate connection.
+            queries (:obj:`List[StorageQuery]`, `required`):
+                ( module, storage_function, params ) of each read.
+            block_hash (:obj:`Optional[str]`, `optional`):
+                block to read at, defaults to the chain head.
+        Returns:
+            results (:obj:`List[ScaleType]`):
+                decoded value of each query, in order.
+    """
+    if len( queries ) == 0: return []
+    if block_hash is None:
+        block_hash = substrate.get_chain_head()
+    substrate.init_runtime( block_hash = block_hash )
+
+    storage_keys, storage_items = [], []
+    for module, storage_function, params in queries:
+        metadata_module = substrate.get_metadata_module( module, block_hash = block_hash )
+        storage_item = substrate.get_metadata_storage_function( module, storage_function, block_hash = block_hash )
+        if not metadata_module or not storage_item:
+            raise StorageFunctionNotFound( 'Storage function "{}.{}" not found'.format( module, storage_function ) )
+        param_types = storage_item.get_params_type_string()
+        if len( params ) != len( param_types ):
+            raise ValueError( f'Storage function requires {len(param_types)} parameters, {len(params)} given' )
+        encoded_params = [
+            substrate.runtime_config.create_scale_object( type_string = param_type ).encode( substrate.convert_storage_parameter( param_type, param ) )
+            for param_type, param in zip( param_types, params )
+        ]
+        storage_keys.append( substrate.generate_storage_hash(
+            storage_module = metadata_module.value['storage']['prefix'],
+            storage_function = storage_function,
+            params = encoded_params,
+            hashers = storage_item.get_param_hashers()
+        ) )
+        storage_items.append( storage_item )
+
+    response = substrate.rpc_request( 'state_queryStorageAt', [ list( dict.fromkeys( storage_keys ) ), block_hash ] )
+    if 'error' in response:
+        raise SubstrateRequestException( response['error']['message'] )
+    changes = {}
+    for change_set in response['result']:
+        for storage_key, data in change_set['changes']:
+            changes[ storage_key ] = data
+
+    results = []
+    for storage_key, storage_item in zip( storage_keys, storage_items ):
+        value_scale_type = storage_item.get_value_type_string()
+        data = changes.get( storage_key )
+        if data is None:
+            if storage_item.value['modifier'] != 'Default':
+                # No result is interpreted as an Option<...> result
+                value_scale_type = f'Option<{value_scale_type}>'
+            data = storage_item.value_object['default'].value_object
+        obj = substrate.runtime_config.create_scale_object( type_string = value_scale_type, data = ScaleBytes( data ), metadata = substrate.metadata )
+        obj.decode()
+        obj.meta_info = { 'result_found': changes.get( storage_key ) is not None }
+        results.append( obj )
+    return results
@@ -17,18 +17,25 @@
 # DEALINGS IN THE SOFTWARE.
 
 # Imports
+import time
 import torch
+import threading
 import bittensor
 import scalecodec
 from retry import retry
-from typing import List, Dict, Union, Optional, Tuple
+from typing import Any, Callable, List, Dict, Union, Optional, Tuple
 from substrateinterface import SubstrateInterface
+from substrateinterface.base import QueryMapResult
 from bittensor.utils.balance import Balance
 from bittensor.utils import U16_NORMALIZED_FLOAT, U64_MAX, RAOPERTAO, U16_MAX
 
 # Local imports.
-from .chain_data import NeuronInfo, axon_info, DelegateInfo, PrometheusInfo, SubnetInfo, NeuronInfoLite
+from .chain_data import NeuronInfo, axon_info, DelegateInfo, PrometheusInfo, SubnetInfo, NeuronInfoLite, NeuronColumns
 from .errors import *
+from .snapshot import SubtensorSnapshot
+from .async_subtensor import AsyncSubtensor
+from .query_cache import QueryCache
+from .storage import StorageQuery, query_storage_at
 from .extrinsics.staking import add_stake_extrinsic, add_stake_multiple_extrinsic
 from .extrinsics.unstaking import unstake_extrinsic, unstake_multiple_extrinsic
 from .extrinsics.serving import serve_extrinsic, serve_axon_extrinsic
@@ -51,6 +58,7 @@ class Subtensor:
         substrate: 'SubstrateInterface',
         network: str,
         chain_endpoint: str,
+        cache: Optional['QueryCache'] = None,
     ):
         r""" Initializes a subtensor chain interface.
             Args:
@@ -65,10 +73,13 @@ class Subtensor:
                     an entry point node from that network.
                 chain_endpoint (default=None, type=str)
                     The subtensor endpoint flag. If set, overrides the network argument.
+                cache (:obj:`QueryCache`, `optional`):
+                    cache of storage reads, reads are not cached if None.
         """
         self.network = network
         self.chain_endpoint = chain_endpoint
         self.substrate = substrate
+        self.cache = cache
 
     def __str__(self) -> str:
         if self.network == self.chain_endpoint:
@@ -361,6 +372,98 @@ class Subtensor:
         return unstake_extrinsic( self, wallet, hotkey_ss58, amount, wait_for_inclusion, wait_for_finalization, prompt )
 
 
+    ###############
+    #### Cache ####
+    ###############
+
+    def enable_cache( self, ttl: Optional[float] = None, max_entries: int = 65536 ) -> 'QueryCache':
+        r""" Caches the storage reads of this subtensor, see QueryCache.
+        Args:
+            ttl (Optional[float]):
+                seconds a read of the latest state is served for, defaults to one block.
+            max_entries (int):
+                maximum number of reads pinned to a block kept.
+        Returns:
+            cache (QueryCache):
+                the cache, its stats field counts hits and misses.
+        """
+        self.cache = QueryCache( ttl = ttl, max_entries = max_entries )
+        return self.cache
+
+    def disable_cache( self ):
+        self.cache = None
+
+    def invalidate_cache( self ):
+        r""" Drops the cached reads of the latest state, called once an extrinsic is submitted."""
+        if self.cache is not None:
+            self.cache.on_new_block()
+
+    def subscribe_block_headers( self, reconnect_delay: float = 2.0, max_reconnect_delay: float = 60.0 ) -> threading.Thread:
+        r""" Follows new block headers on a dedicated websocket and feeds them to the cache invalidation hook, so
+            reads of the latest state never outlive their block. If the websocket fails, the cache is suspended until
+            the first header of a new subscription arrives, reconnecting with exponential backoff. The subscription
+            ends once the cache is disabled or replaced.
+        Args:
+            reconnect_delay (float):
+                seconds to wait before the first reconnect, doubled after each failed attempt.
+            max_reconnect_delay (float):
+                maximum seconds between reconnects.
+        Returns:
+            thread (threading.Thread):
+                the daemon thread holding the subscription.
+        """
+        if self.cache is None:
+            self.enable_cache()
+        cache = self.cache
+        delay = [ reconnect_delay ]
+        def on_header( message, update_nr, subscription_id ):
+            # Returning anything but None ends the subscription.
+            if self.cache is not cache: return True
+            delay[0] = reconnect_delay
+            cache.resume()
+            cache.on_new_block( int( message['params']['result']['number'], 16 ) )
+        def subscribe():
+            while self.cache is cache:
+                connection = None
+                try:
+                    connection = SubstrateInterface( ss58_format = bittensor.__ss58_format__, url = self.substrate.url, use_remote_preset = False, auto_discover = False )
+                    connection.rpc_request( 'chain_subscribeNewHeads', [], result_handler = on_header )
+                except Exception as e:
+                    # Headers may be missed until the next subscription, latest reads are no longer invalidated.
+                    cache.suspend()
+                    bittensor.logging.warning( 'Block header subscription failed, reconnecting in {}s'.format( delay[0] ), str( e ) )
+                    time.sleep( delay[0] )
+                    delay[0] = min( 2 * delay[0], max_reconnect_delay )
+                finally:
+                    if connection is not None:
+                        try: connection.close()
+                        except Exception: pass
+        thread = threading.Thread( target = subscribe, name = 'subtensor-headers', daemon = True )
+        thread.start()
+        return thread
+
+    def get_block_hash( self, block: int ) -> Optional[str]:
+        r""" Returns the hash of block, cached for good if the cache is enabled."""
+        @retry(delay=2, tries=3, backoff=2, max_delay=4)
+        def make_substrate_call_with_retry():
+            with self.substrate as substrate:
+                return substrate.get_block_hash( block )
+        if self.cache is None:
+            return make_substrate_call_with_retry()
+        return self.cache.get_block_hash( block, make_substrate_call_with_retry )
+
+    def _block_hash( self, substrate: 'SubstrateInterface', block: Optional[int] ) -> Optional[str]:
+        # Resolves block on an open substrate connection, through the cache if enabled.
+        if block == None: return None
+        if self.cache is None: return substrate.get_block_hash( block )
+        return self.cache.get_block_hash( block, lambda: substrate.get_block_hash( block ) )
+
+    def _cached( self, key: Tuple, block: Optional[int], query: Callable[[], Any] ) -> Any:
+        # Serves query through the cache, keyed by key and the hash of block.
+        if self.cache is None: return query()
+        block_hash = None if block == None else self.get_block_hash( block )
+        return self.cache.get( QueryCache.key( *key ), block_hash, query )
+
     ########################
     #### Standard Calls ####
     ########################
@@ -374,22 +477,29 @@ class Subtensor:
                     module='SubtensorModule',
                     storage_function = name,
                     params = params,
-                    block_hash = None if block == None else substrate.get_block_hash(block)
+                    block_hash = self._block_hash( substrate, block )
                 )
-        return make_substrate_call_with_retry()
+        return self._cached( ( 'SubtensorModule', name, params ), block, make_substrate_call_with_retry )
 
     """ Queries subtensor map storage with params and block. """
     def query_map_subtensor( self, name: str, block: Optional[int] = None, params: Optional[List[object]] = [] ) -> Optional[object]:
         @retry(delay=2, tries=3, backoff=2, max_delay=4)
         def make_substrate_call_with_retry():
             with self.substrate as substrate:
-                return substrate.query_map(
+                block_hash = self._block_hash( substrate, block )
+                # A cached read pins the head so every page is read at the same block.
+                if block_hash is None and self.cache is not None: block_hash = substrate.get_chain_head()
+                result = substrate.query_map(
                     module='SubtensorModule',
                     storage_function = name,
                     params = params,
-                    block_hash = None if block == None else substrate.get_block_hash(block)
+                    block_hash = block_hash
                 )
-        return make_substrate_call_with_retry()
+                # Loads the remaining pages while the connection is held.
+                return tuple( result )
+        records = self._cached( ( 'SubtensorModule', 'map', name, params ), block, make_substrate_call_with_retry )
+        # A fresh result per call, QueryMapResult iterators share their position.
+        return QueryMapResult( records = list( records ), page_size = max( 1, len( records ) ) )
 
     """ Gets a constant from subtensor with module_name, constant_name, and block. """
     def query_constant( self, module_name: str, constant_name: str, block: Optional[int] = None ) -> Optional[object]:
@@ -399,9 +509,39 @@ class Subtensor:
                 return substrate.get_constant(
                     module_name=module_name,
                     constant_name=constant_name,
-                    block_hash = None if block == None else substrate.get_block_hash(block)
+                    block_hash = self._block_hash( substrate, block )
                 )
-        return make_substrate_call_with_retry()
+        return self._cached( ( module_name, 'constant', constant_name ), block, make_substrate_call_with_retry )
+
+    def query_multi( self, queries: List[StorageQuery], block: Optional[int] = None ) -> List[object]:
+        r""" Reads many storage items at one block in a single state_queryStorageAt round trip.
+        Args:
+            queries (List[Tuple[str, str, List[object]]]):
+                ( module, storage_function, params ) of each read, e.g. ( 'SubtensorModule', 'Tempo', [ netuid ] ).
+            block (Optional[int]):
+                block to read at, defaults to the chain head.
+        Returns:
+            results (List[object]):
+                the value query_subtensor would return for each query, in order.
+        """
+        @retry(delay=2, tries=3, backoff=2, max_delay=4)
+        def make_substrate_call_with_retry( queries: List[StorageQuery] ):
+            with self.substrate as substrate:
+                return query_storage_at( substrate, queries, self._block_hash( substrate, block ) )
+        if self.cache is None:
+            return make_substrate_call_with_retry( queries )
+
+        # Only the reads missing from the cache go to the chain.
+        block_hash = None if block == None else self.get_block_hash( block )
+        keys = [ QueryCache.key( *query ) for query in queries ]
+        results = [ self.cache.lookup( key, block_hash ) for key in keys ]
+        missing = [ index for index, ( found, _ ) in enumerate( results ) if not found ]
+        values = [ value for _, value in results ]
+        if len( missing ) > 0:
+            for index, value in zip( missing, make_substrate_call_with_retry( [ queries[index] for index in missing ] ) ):
+                self.cache.put( keys[index], block_hash, value )
+                values[index] = value
+        return values
 
     #####################################
     #### Hyper parameter calls. ####
@@ -528,6 +668,11 @@ class Subtensor:
     def get_stake_for_coldkey_and_hotkey( self, hotkey_ss58: str, coldkey_ss58: str, block: Optional[int] = None ) -> Optional['bittensor.Balance']:
         return bittensor.Balance.from_rao( self.query_subtensor( 'Stake', block, [hotkey_ss58, coldkey_ss58] ).value )
 
+    """ Returns the stake under each ( hotkey, coldkey ) pairing, read in one round trip """
+    def get_stakes_for( self, pairs: List[Tuple[str, str]], block: Optional[int] = None ) -> Dict[Tuple[str, str], 'bittensor.Balance']:
+        results = self.query_multi( [ ( 'SubtensorModule', 'Stake', [ hotkey_ss58, coldkey_ss58 ] ) for hotkey_ss58, coldkey_ss58 in pairs ], block )
+        return { tuple( pair ): bittensor.Balance.from_rao( result.value ) for pair, result in zip( pairs, results ) }
+
     """ Returns a list of stake tuples (coldkey, balance) for each delegating coldkey including the owner"""
     def get_stake( self, hotkey_ss58: str, block: Optional[int] = None ) -> List[Tuple[str,'bittensor.Balance']]:
         return [ (r[0].value, bittensor.Balance.from_rao( r[1].value ))  for r in self.query_map_subtensor( 'Stake', block, [hotkey_ss58] ) ]
@@ -586,6 +731,40 @@ class Subtensor:
         """
         return self.get_current_block()
 
+    def snapshot( self, block: Optional[int] = None, max_workers: int = 8 ) -> 'SubtensorSnapshot':
+        r""" Returns a view of the chain pinned to one block hash, whose reads run concurrently over pooled connections.
+        Args:
+            block (Optional[int]):
+                block to pin, defaults to the chain head.
+            max_workers (int):
+                maximum number of concurrent calls.
+        Returns:
+            snapshot (SubtensorSnapshot):
+                the pinned view, close it or use it as a context manager once done.
+        """
+        return SubtensorSnapshot( self, block = block, max_workers = max_workers )
+
+    def as_async( self, max_workers: int = 4 ) -> 'AsyncSubtensor':
+        r""" Returns an AsyncSubtensor exposing the read methods of this subtensor as coroutines.
+        Args:
+            max_workers (int):
+                threads running the blocking reads.
+        Returns:
+            async_subtensor (AsyncSubtensor):
+                the coroutine view, close it or use it as a context manager once done.
+        """
+        return AsyncSubtensor( self, max_workers = max_workers )
+
+    def block_clock( self ) -> 'bittensor.BlockClock':
+        r""" Returns the block clock shared by the process for this endpoint, one new heads subscription
+        instead of polling get_current_block.
+        Returns:
+            clock (BlockClock):
+                the running clock.
+        """
+        from .block_clock import shared_clock
+        return shared_clock( self )
+
     def total_issuance (self, block: Optional[int] = None ) -> 'bittensor.Balance':
         return bittensor.Balance.from_rao( self.query_subtensor( 'TotalIssuance', block ).value )
 
@@ -653,7 +832,7 @@ class Subtensor:
         @retry(delay=2, tries=3, backoff=2, max_delay=4)
         def make_substrate_call_with_retry():
             with self.substrate as substrate:
-                block_hash = None if block == None else substrate.get_block_hash( block )
+                block_hash = self._block_hash( substrate, block )
                 params = []
                 if block_hash:
                     params = params + [block_hash]
@@ -674,7 +853,7 @@ class Subtensor:
         @retry(delay=2, tries=3, backoff=2, max_delay=4)
         def make_substrate_call_with_retry():
             with self.substrate as substrate:
-                block_hash = None if block == None else substrate.get_block_hash( block )
+                block_hash = self._block_hash( substrate, block )
                 params = [netuid]
                 if block_hash:
                     params = params + [block_hash]
@@ -711,7 +890,7 @@ class Subtensor:
         @retry(delay=2, tries=3, backoff=2, max_delay=4)
         def make_substrate_call_with_retry(encoded_hotkey: List[int]):
             with self.substrate as substrate:
-                block_hash = None if block == None else substrate.get_block_hash( block )
+                block_hash = self._block_hash( substrate, block )
                 params = [encoded_hotkey]
                 if block_hash:
                     params = params + [block_hash]
@@ -734,7 +913,7 @@ class Subtensor:
         @retry(delay=2, tries=3, backoff=2, max_delay=4)
         def make_substrate_call_with_retry():
             with self.substrate as substrate:
-                block_hash = None if block == None else substrate.get_block_hash( block )
+                block_hash = self._block_hash( substrate, block )
                 params = []
                 if block_hash:
                     params = params + [block_hash]
@@ -756,7 +935,7 @@ class Subtensor:
         @retry(delay=2, tries=3, backoff=2, max_delay=4)
         def make_substrate_call_with_retry(encoded_coldkey: List[int]):
             with self.substrate as substrate:
-                block_hash = None if block == None else substrate.get_block_hash( block )
+                block_hash = self._block_hash( substrate, block )
                 params = [encoded_coldkey]
                 if block_hash:
                     params = params + [block_hash]
@@ -793,7 +972,8 @@ class Subtensor:
         return self.query_subtensor( 'Uids', block, [ netuid, hotkey_ss58 ] ).value
 
     def get_all_uids_for_hotkey( self, hotkey_ss58: str, block: Optional[int] = None) -> List[int]:
-        return [ self.get_uid_for_hotkey_on_subnet( hotkey_ss58, netuid, block) for netuid in self.get_netuids_for_hotkey( hotkey_ss58, block)]
+        netuids = self.get_netuids_for_hotkey( hotkey_ss58, block)
+        return [ result.value for result in self.query_multi( [ ( 'SubtensorModule', 'Uids', [ netuid, hotkey_ss58 ] ) for netuid in netuids ], block ) ]
 
     def get_netuids_for_hotkey( self, hotkey_ss58: str, block: Optional[int] = None) -> List[int]:
         result = self.query_map_subtensor( 'IsNetworkMember', block, [ hotkey_ss58 ] )
@@ -808,8 +988,8 @@ class Subtensor:
 
     def get_all_neurons_for_pubkey( self, hotkey_ss58: str, block: Optional[int] = None ) -> List[NeuronInfo]:
         netuids = self.get_netuids_for_hotkey( hotkey_ss58, block)
-        uids = [self.get_uid_for_hotkey_on_subnet(hotkey_ss58, net) for net in netuids]
-        return [self.neuron_for_uid( uid, net ) for uid, net in list(zip(uids, netuids))]
+        uids = [ result.value for result in self.query_multi( [ ( 'SubtensorModule', 'Uids', [ netuid, hotkey_ss58 ] ) for netuid in netuids ], block ) ]
+        return [self.neuron_for_uid( uid, net, block ) for uid, net in list(zip(uids, netuids))]
 
     def neuron_has_validator_permit( self, uid: int, netuid: int, block: Optional[int] = None ) -> Optional[bool]:
         return self.query_subtensor( 'ValidatorPermit', block, [ netuid, uid ] ).value
@@ -834,7 +1014,7 @@ class Subtensor:
         @retry(delay=2, tries=3, backoff=2, max_delay=4)
         def make_substrate_call_with_retry():
             with self.substrate as substrate:
-                block_hash = None if block == None else substrate.get_block_hash( block )
+                block_hash = self._block_hash( substrate, block )
                 params = [netuid, uid]
                 if block_hash:
                     params = params + [block_hash]
@@ -864,7 +1044,7 @@ class Subtensor:
         @retry(delay=2, tries=3, backoff=2, max_delay=4)
         def make_substrate_call_with_retry():
             with self.substrate as substrate:
-                block_hash = None if block == None else substrate.get_block_hash( block )
+                block_hash = self._block_hash( substrate, block )
                 params = [netuid]
                 if block_hash:
                     params = params + [block_hash]
@@ -898,7 +1078,7 @@ class Subtensor:
         @retry(delay=2, tries=3, backoff=2, max_delay=4)
         def make_substrate_call_with_retry():
             with self.substrate as substrate:
-                block_hash = None if block == None else substrate.get_block_hash( block )
+                block_hash = self._block_hash( substrate, block )
                 params = [netuid, uid]
                 if block_hash:
                     params = params + [block_hash]
@@ -928,7 +1108,7 @@ class Subtensor:
         @retry(delay=2, tries=3, backoff=2, max_delay=4)
         def make_substrate_call_with_retry():
             with self.substrate as substrate:
-                block_hash = None if block == None else substrate.get_block_hash( block )
+                block_hash = self._block_hash( substrate, block )
                 params = [netuid]
                 if block_hash:
                     params = params + [block_hash]
@@ -945,18 +1125,53 @@ class Subtensor:
 
         return NeuronInfoLite.list_from_vec_u8( result )
 
-    def metagraph( self, netuid: int, lite: bool = True ) -> 'bittensor.Metagraph':
+    def neuron_columns( self, netuid: int, block: Optional[int] = None, lite: bool = True ) -> NeuronColumns:
+        r""" Returns the neurons of the subnet decoded into columns, skipping the per neuron objects.
+        Args:
+            netuid ( int ):
+                The netuid of the subnet to pull neurons from.
+            block ( Optional[int] ):
+                block to sync from.
+            lite ( bool, default = True ):
+                If false, also pulls the weights and bonds of each neuron.
+        Returns:
+            columns ( NeuronColumns ):
+                One tensor per neuron field.
+        """
+        @retry(delay=2, tries=3, backoff=2, max_delay=4)
+        def make_substrate_call_with_retry():
+            with self.substrate as substrate:
+                block_hash = self._block_hash( substrate, block )
+                params = [netuid]
+                if block_hash:
+                    params = params + [block_hash]
+                return substrate.rpc_request(
+                    method="neuronInfo_getNeuronsLite" if lite else "neuronInfo_getNeurons", # custom rpc method
+                    params=params
+                )
+
+        json_body = make_substrate_call_with_retry()
+        result = json_body['result']
+
+        if result in (None, []):
+            return NeuronColumns.from_vec_u8( [], lite = lite )
+
+        return NeuronColumns.from_vec_u8( result, lite = lite )
+
+    def metagraph( self, netuid: int, lite: bool = True, layout: torch.layout = torch.strided ) -> 'bittensor.Metagraph':
         r""" Returns the metagraph for the subnet.
         Args:
             netuid ( int ):
                 The network uid of the subnet to query.
             lite (bool, default=True):
                 If true, returns a metagraph using the lite sync (no weights, no bonds)
+            layout (torch.layout, default=torch.strided):
+                Layout of the weights and bonds when not lite, torch.sparse_coo or torch.sparse_csr keep them sparse.
         Returns:
             metagraph ( `bittensor.Metagraph` ):
                 The metagraph for the subnet at the block.
         """
-        return bittensor.metagraph( network = self.network, netuid = netuid, lite = lite )
+        return bittensor.metagraph( network = self.network, netuid = netuid, lite = lite, layout = layout )
 
     ################
     #### Transfer ##
@@ -986,14 +1201,30 @@ class Subtensor:
                         module='System',
                         storage_function='Account',
                         params=[address],
-                        block_hash = None if block == None else substrate.get_block_hash( block )
+                        block_hash = self._block_hash( substrate, block )
                     )
-            result = make_substrate_call_with_retry()
+            result = self._cached( ( 'System', 'Account', [address] ), block, make_substrate_call_with_retry )
         except scalecodec.exceptions.RemainingScaleBytesNotEmptyException:
             bittensor.logging.error( "Your wallet it legacy formatted, you need to run btcli stake --ammount 0 to reformat it." )
             return Balance(1000)
         return Balance( result.value['data']['free'] )
 
+    def get_balances_for( self, addresses: List[str], block: Optional[int] = None ) -> Dict[str, Balance]:
+        r""" Returns the token balance of each address, read in one round trip. If a legacy formatted account fails
+            to decode, the addresses are read one by one with get_balance.
+        Args:
+            addresses (List[str]):
+                ss58 chain addresses.
+        Return:
+            balances (Dict[str, bittensor.utils.balance.Balance]):
+                account balance of each address.
+        """
+        try:
+            results = self.query_multi( [ ( 'System', 'Account', [ address ] ) for address in addresses ], block )
+        except scalecodec.exceptions.RemainingScaleBytesNotEmptyException:
+            return { address: self.get_balance( address, block ) for address in addresses }
+        return { address: Balance( result.value['data']['free'] ) for address, result in zip( addresses, results ) }
+
     def get_current_block(self) -> int:
         r""" Returns the current block number on the chain.
         Returns:
@@ -1004,7 +1235,7 @@ class Subtensor:
         def make_substrate_call_with_retry():
             with self.substrate as substrate:
                 return substrate.get_block_number(None)
-        return make_substrate_call_with_retry()
+        return self._cached( ( 'System', 'Number' ), None, make_substrate_call_with_retry )
 
     def get_balances(self, block: int = None) -> Dict[str, Balance]:
         @retry(delay=2, tries=3, backoff=2, max_delay=4)
@@ -1013,7 +1244,7 @@ class Subtensor:
                 return substrate.query_map(
                     module='System',
                     storage_function='Account',
-                    block_hash = None if block == None else substrate.get_block_hash( block )
+                    block_hash = self._block_hash( substrate, block )
                 )
         result = make_substrate_call_with_retry()
         return_dict = {}
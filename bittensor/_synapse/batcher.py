@@ -0,0 +1,146 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+import time
+import queue
+import itertools
+import threading
+import bittensor
+
+from typing import Any, Callable, List, Optional
+
+
+class _PendingRequest:
+    r""" A request waiting in the batcher, completed by the batching thread. """
+    def __init__( self, inputs: Any, priority: float, deadline: Optional[float] ):
+        self.inputs = inputs
+        self.priority = priority
+        self.deadline = deadline
+        self.done = threading.Event()
+        self.output = None
+        self.error = None
+        # Set by submit() when its caller gave up, or by the batching thread once the request joined a batch.
+        self.cancelled = False
+        self.claimed = False
+
+    def expired( self, now: float ) -> bool:
+        return self.deadline is not None and now >= self.deadline
+
+
+class SynapseBatcher:
+    r""" Groups concurrent synapse requests into batches for a batched callback.
+
+        Calls to submit() block the calling axon worker thread. A single batching thread waits for the first
+        request, then keeps collecting until max_batch_size requests are waiting or max_wait_ms elapsed, runs
+        batch_callback on the inputs and hands each output back to its caller. When more requests wait than fit
+        in a batch, the ones with the highest priority go first. Requests whose deadline passed before their batch
+        ran are dropped from it and fail with a TimeoutError. A request whose caller already timed out is cancelled
+        and never reaches batch_callback.
+
+        A batch can't grow beyond the number of axon worker threads submitting to it, see --axon.priority.max_workers.
+    """
+    def __init__( self, batch_callback: Callable[ [List[Any]], List[Any] ], max_batch_size: int = 8, max_wait_ms: float = 10 ):
+        r""" Creates the batcher and starts its batching thread.
+            Args:
+                batch_callback ( Callable[ [List[Any]], List[Any] ] ):
+                    Maps a list of inputs to the list of their outputs, in the same order.
+                max_batch_size ( int ):
+                    Maximum number of requests passed to batch_callback at once.
+                max_wait_ms ( float ):
+                    Time the first request of a batch waits for more requests to join, in milliseconds.
+        """
+        self.batch_callback = batch_callback
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue = queue.PriorityQueue()
+        # Breaks priority ties in arrival order and keeps requests out of the tuple comparison.
+        self._counter = itertools.count()
+        # Orders cancelling a timed out request against the batching thread claiming it for a batch.
+        self._lock = threading.Lock()
+        self._thread = threading.Thread( target = self._run, name = 'synapse_batcher', daemon = True )
+        self._thread.start()
+
+    def submit( self, inputs: Any, priority: float = 0, deadline: Optional[float] = None ) -> Any:
+        r""" Queues inputs for the next batch and blocks until their output is ready.
+            Args:
+                inputs ( Any ):
+                    One element of the list passed to batch_callback.
+                priority ( float ):
+                    Higher priority requests are batched first.
+                deadline ( Optional[float] ):
+                    time.time() after which the request is no longer worth answering.
+            Returns:
+                output ( Any ):
+                    The element of the batch_callback result for inputs.
+            Raises:
+                TimeoutError:
+                    If the deadline passed before the output was ready.
+        """
+        request = _PendingRequest( inputs, priority, deadline )
+        self._queue.put( ( -priority, next( self._counter ), request ) )
+        timeout = None if deadline is None else max( 0, deadline - time.time() )
+        if not request.done.wait( timeout ):
+            with self._lock:
+                request.cancelled = not request.claimed
+            raise TimeoutError( 'Batched request timed out' )
+        if request.error is not None:
+            raise request.error
+        return request.output
+
+    def _collect( self ) -> List[_PendingRequest]:
+        batch = []
+        close_at = None
+        while len( batch ) < self.max_batch_size:
+            if close_at is None:
+                _, _, request = self._queue.get()
+            else:
+                remaining = close_at - time.monotonic()
+                try:
+                    _, _, request = self._queue.get( timeout = remaining ) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            with self._lock:
+                # The caller of a cancelled request is gone, it is dropped without an answer.
+                if request.cancelled:
+                    continue
+                request.claimed = True
+            # Expired requests are answered right away and don't take a slot in the batch.
+            if request.expired( time.time() ):
+                request.error = TimeoutError( 'Batched request expired before its batch ran' )
+                request.done.set()
+                continue
+            if close_at is None:
+                close_at = time.monotonic() + self.max_wait_ms / 1000
+            batch.append( request )
+        return batch
+
+    def _run( self ):
+        while True:
+            batch = self._collect()
+            bittensor.logging.trace( 'SynapseBatcher: running batch of {}'.format( len( batch ) ) )
+            try:
+                outputs = self.batch_callback( [ request.inputs for request in batch ] )
+                if len( outputs ) != len( batch ):
+                    raise ValueError( 'Batch callback returned {} outputs for {} inputs'.format( len( outputs ), len( batch ) ) )
+                for request, output in zip( batch, outputs ):
+                    request.output = output
+            except Exception as e:
+                for request in batch:
+                    request.error = e
+            for request in batch:
+                request.done.set()
@@ -21,6 +21,7 @@ import torch
 import asyncio
 import bittensor
 
+from concurrent import futures
 from typing import Union, Optional, Callable, List, Dict, Tuple
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -81,6 +82,7 @@ class SynapseCall( ABC ):
         self.completed = True
 
     def log_outbound( self ):
+        if not bittensor.logging.rpc_log_enabled(): return
         bittensor.logging.rpc_log(
             axon = True,
             forward = self.is_forward,
@@ -96,6 +98,7 @@ class SynapseCall( ABC ):
         )
 
     def log_inbound( self ):
+        if not bittensor.logging.rpc_log_enabled(): return
         bittensor.logging.rpc_log(
             axon = True,
             forward = self.is_forward,
@@ -129,46 +132,65 @@ class Synapse( ABC ):
     @abstractmethod
     def priority( self, call: SynapseCall ) -> float: ...
 
-    def apply( self, call: SynapseCall ) -> object:
-        bittensor.logging.trace( 'Synapse: {} received call: {}'.format( self.name, call ) )
-        try:
-            call.log_inbound()
-
-            # Check blacklist.
-            blacklist, reason = self._blacklist( call )
-            if blacklist:
-                call.return_code = bittensor.proto.ReturnCode.Blacklisted
-                call.return_message = reason
-                bittensor.logging.info( 'Synapse: {} blacklisted call: {} reason: {}'.format( self.name, call, reason) )
-
-            # Make call.
-            else:
-                # Queue the forward call with priority.
-                call.priority = self.priority( call )
-                future = self.axon.priority_threadpool.submit(
-                    call._apply,
-                    priority = call.priority,
-                )
-                bittensor.logging.trace( 'Synapse: {} loaded future: {}'.format( self.name, future ) )
-                future.result( timeout = call.timeout )
-                bittensor.logging.trace( 'Synapse: {} completed call: {}'.format( self.name, call ) )
+    def _check_blacklist( self, call: SynapseCall ) -> bool:
+        blacklist, reason = self._blacklist( call )
+        if blacklist:
+            call.return_code = bittensor.proto.ReturnCode.Blacklisted
+            call.return_message = reason
+            bittensor.logging.info( 'Synapse: {} blacklisted call: {} reason: {}'.format( self.name, call, reason) )
+        return blacklist
+
+    def _submit( self, call: SynapseCall ) -> futures.Future:
+        # Queue the call with priority.
+        call.priority = self.priority( call )
+        future = self.axon.priority_threadpool.submit(
+            call._apply,
+            priority = call.priority,
+        )
+        bittensor.logging.trace( 'Synapse: {} loaded future: {}'.format( self.name, future ) )
+        return future
 
+    def _finalize( self, call: SynapseCall, error: Optional[Exception] ) -> object:
         # Catch timeouts
-        except asyncio.TimeoutError:
+        if isinstance( error, asyncio.TimeoutError ):
             bittensor.logging.trace( 'Synapse: {} timeout: {}'.format( self.name, call.timeout ) )
             call.return_code = bittensor.proto.ReturnCode.Timeout
             call.return_message = 'GRPC request timeout after: {}s'.format( call.timeout)
 
         # Catch unknown exceptions.
-        except Exception as e:
-            bittensor.logging.trace( 'Synapse: {} unknown error: {}'.format( self.name, str(e) ) )
+        elif error is not None:
+            bittensor.logging.trace( 'Synapse: {} unknown error: {}'.format( self.name, str(error) ) )
             call.return_code = bittensor.proto.ReturnCode.UnknownException
-            call.return_message = str(e)
+            call.return_message = str(error)
 
         # Finally return the call.
-        finally:
-            bittensor.logging.trace( 'Synapse: {} finalize call {}'.format( self.name, call ) )
-            call.end()
-            call.log_outbound()
-            return call._get_response_proto()
+        bittensor.logging.trace( 'Synapse: {} finalize call {}'.format( self.name, call ) )
+        call.end()
+        call.log_outbound()
+        return call._get_response_proto()
+
+    def apply( self, call: SynapseCall ) -> object:
+        bittensor.logging.trace( 'Synapse: {} received call: {}'.format( self.name, call ) )
+        error = None
+        try:
+            call.log_inbound()
+            if not self._check_blacklist( call ):
+                self._submit( call ).result( timeout = call.timeout )
+                bittensor.logging.trace( 'Synapse: {} completed call: {}'.format( self.name, call ) )
+        except Exception as e:
+            error = e
+        return self._finalize( call, error )
 
+    async def async_apply( self, call: SynapseCall ) -> object:
+        r""" apply for the handlers of an asyncio axon, awaits the priority threadpool instead of blocking a thread."""
+        bittensor.logging.trace( 'Synapse: {} received call: {}'.format( self.name, call ) )
+        error = None
+        try:
+            call.log_inbound()
+            if not self._check_blacklist( call ):
+                # A timeout cancels the call if it is still queued.
+                await asyncio.wait_for( asyncio.wrap_future( self._submit( call ) ), timeout = call.timeout )
+                bittensor.logging.trace( 'Synapse: {} completed call: {}'.format( self.name, call ) )
+        except Exception as e:
+            error = e
+        return self._finalize( call, error )
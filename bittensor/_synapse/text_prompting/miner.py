@@ -36,43 +36,35 @@ class BasePromptingMiner( ABC ):
 
     def priority( self, forward_call: "bittensor.TextPromptingForwardCall" ) -> float:
         if self.metagraph is not None:
-            uid = self.metagraph.hotkeys.index(forward_call.src_hotkey)
-            return self.metagraph.S[uid].item()
-        else:
-            return self.config.neuron.default_priority
+            uid = self.metagraph.uid_for_hotkey( forward_call.src_hotkey )
+            if uid is not None:
+                return self.metagraph.S[uid].item()
+        return self.config.neuron.default_priority
 
     def blacklist( self, forward_call: "bittensor.TextPromptingForwardCall" ) -> Union[ Tuple[bool, str], bool ]:
+        uid = self.metagraph.uid_for_hotkey( forward_call.src_hotkey )
+
         # Check for registration
-        def registration_check():
-            is_registered = forward_call.src_hotkey in self.metagraph.hotkeys
-            if not is_registered:
-                if self.config.neuron.blacklist.allow_non_registered: return False, 'passed blacklist'
-                else: return True, 'pubkey not registered'
-
-        # Blacklist based on stake.
-        def stake_check() -> bool:
-            default_stake = self.config.neuron.blacklist.default_stake
-            if default_stake <= 0.0:
-                return False, 'passed blacklist'
-            uid = self.metagraph.hotkeys.index(forward_call.src_hotkey)
-            if self.metagraph.S[uid].item() < default_stake:
-                bittensor.logging.debug( "Blacklisted. Stake too low.")
-                return True, 'Stake too low.'
-            else: return False, 'passed blacklist'
-
-        # Optionally blacklist based on checks.
-        try:
-            registration_check()
-            stake_check()
-            return False, 'passed blacklist'
-        except Exception as e:
-            bittensor.logging.warning( "Blacklisted. Error in `registration_check` or `stake_check()" )
-            return True, 'Error in `registration_check` or `stake_check()'
+        if uid is None and not self.config.neuron.blacklist.allow_non_registered:
+            return True, 'pubkey not registered'
+
+        # Blacklist based on stake, non registered hotkeys hold no stake.
+        default_stake = self.config.neuron.blacklist.default_stake
+        if default_stake > 0.0 and ( uid is None or self.metagraph.S[uid].item() < default_stake ):
+            bittensor.logging.debug( "Blacklisted. Stake too low.")
+            return True, 'Stake too low.'
+        return False, 'passed blacklist'
 
     @abstractmethod
     def forward( self, messages: List[Dict[str, str]] ) -> str:
         ...
 
+    def forward_batch( self, messages_list: List[List[Dict[str, str]]] ) -> List[str]:
+        r""" Called instead of forward when --neuron.batch_size is larger than 1, with the conversations of
+            concurrent requests. Miners override it to run their model on the whole batch.
+        """
+        return [ self.forward( messages ) for messages in messages_list ]
+
     @classmethod
     @abstractmethod
     def check_config( cls, config: 'bittensor.Config' ):
@@ -165,6 +157,18 @@ class BasePromptingMiner( ABC ):
             help = 'Set default stake for miners.',
             default = 0.0
         )
+        parser.add_argument(
+            '--neuron.batch_size',
+            type = int,
+            help = 'If larger than 1, concurrent forward requests are answered in batches of up to this size with forward_batch. Bounded by --axon.priority.max_workers.',
+            default = 0
+        )
+        parser.add_argument(
+            '--neuron.batch_wait_ms',
+            type = float,
+            help = 'Milliseconds the first request of a batch waits for more requests.',
+            default = 10
+        )
         parser.add_argument(
             '--neuron.default_priority',
             type = float,
@@ -201,7 +205,13 @@ class BasePromptingMiner( ABC ):
             def backward( self, messages: List[Dict[str, str]], response: str, rewards: torch.FloatTensor ) -> str: pass
             def forward( _, messages: List[Dict[str, str]] ) -> str:
                 return self.forward( messages )
-        self.synapse = Synapse( axon = self.axon )
+            def forward_batch( _, messages_list: List[List[Dict[str, str]]] ) -> List[str]:
+                return self.forward_batch( messages_list )
+        self.synapse = Synapse(
+            axon = self.axon,
+            max_batch_size = self.config.neuron.batch_size,
+            max_batch_wait_ms = self.config.neuron.batch_wait_ms,
+        )
 
     def run( self ):
 
@@ -213,19 +223,19 @@ class BasePromptingMiner( ABC ):
         self.subtensor.serve_axon( netuid = self.config.netuid, axon = self.axon )
 
         # --- Run Forever.
-        last_update = self.subtensor.get_current_block()
+        clock = self.subtensor.block_clock()
+        last_update = clock.current_block
         while True:
 
             # --- Wait until next epoch.
-            current_block = self.subtensor.get_current_block()
-            while (current_block - last_update) < self.config.neuron.blocks_per_epoch:
-                time.sleep( 0.1 ) #bittensor.__blocktime__
-                current_block = self.subtensor.get_current_block()
-            last_update = self.subtensor.get_current_block()
+            last_update = clock.wait_for_block( last_update + self.config.neuron.blocks_per_epoch )
 
             # --- Update the metagraph with the latest network state.
-            self.metagraph.sync( lite = True )
-            uid = self.metagraph.hotkeys.index( self.wallet.hotkey.ss58_address )
+            self.metagraph.sync( lite = True, incremental = True )
+            uid = self.metagraph.uid_for_hotkey( self.wallet.hotkey.ss58_address )
+            if uid is None:
+                bittensor.logging.warning( 'Hotkey {} is not registered on netuid {}, skipping this epoch'.format( self.wallet.hotkey.ss58_address, self.config.netuid ) )
+                continue
 
             # --- Log performance.
             print(
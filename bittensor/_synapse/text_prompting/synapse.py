@@ -22,6 +22,8 @@ import bittensor
 from typing import List, Dict, Union, Callable
 from abc import ABC, abstractmethod
 import json
+from types import SimpleNamespace
+from bittensor._synapse.batcher import SynapseBatcher
 
 
 class SynapseForwardMulti( bittensor.SynapseCall ):
@@ -126,31 +128,74 @@ class SynapseBackward( bittensor.SynapseCall ):
 class TextPromptingSynapse( bittensor.Synapse, bittensor.grpc.TextPromptingServicer ):
     name: str = "text_prompting_synapse"
 
-    def __init__(self, axon: "bittensor.axon" ):
+    def __init__(self, axon: "bittensor.axon", max_batch_size: int = 0, max_batch_wait_ms: float = 10 ):
+        r""" Registers the synapse on the axon grpc server.
+            Args:
+                axon ( bittensor.axon ):
+                    axon serving the synapse.
+                max_batch_size ( int, default = 0 ):
+                    If larger than 1, concurrent Forward requests are grouped in batches of up to max_batch_size
+                    and answered with a single forward_batch call.
+                max_batch_wait_ms ( float, default = 10 ):
+                    Time the first request of a batch waits for others to join, in milliseconds.
+        """
         super().__init__( axon = axon )
         self.axon = axon
-        bittensor.grpc.add_TextPromptingServicer_to_server( self, self.axon.server )
+        self.batcher = SynapseBatcher( self.forward_batch, max_batch_size = max_batch_size, max_wait_ms = max_batch_wait_ms ) if max_batch_size > 1 else None
+        if getattr( self.axon, 'asyncio', False ):
+            # The grpc.aio server of an asyncio axon awaits the async handlers.
+            servicer = SimpleNamespace( Forward = self.AsyncForward, MultiForward = self.AsyncMultiForward, Backward = self.AsyncBackward )
+        else:
+            servicer = self
+        bittensor.grpc.add_TextPromptingServicer_to_server( servicer, self.axon.server )
 
     @abstractmethod
     def forward( self, messages: List[Dict[str, str]] ) -> str: ...
 
+    def forward_batch( self, messages_list: List[List[Dict[str, str]]] ) -> List[ str ]:
+        r""" Returns one completion per conversation in messages_list. Override with a batched implementation
+            to benefit from max_batch_size, the default calls forward on each conversation.
+        """
+        return [ self.forward( messages ) for messages in messages_list ]
+
     def multi_forward( self, messages: List[Dict[str, str]] ) -> List[ str ]: ...
 
     @abstractmethod
     def backward( self, messages: List[Dict[str, str]], response: str, rewards: torch.FloatTensor ) -> str: ...
 
-    def Forward( self, request: bittensor.proto.ForwardTextPromptingRequest, context: grpc.ServicerContext ) -> bittensor.proto.ForwardTextPromptingResponse:
+    def _forward_call( self, request: bittensor.proto.ForwardTextPromptingRequest ) -> SynapseForward:
         call = SynapseForward( self, request, self.forward )
+        if self.batcher is not None:
+            # The priority is set by apply before the call is queued on the axon threadpool.
+            call.forward_callback = lambda messages: self.batcher.submit( messages, priority = call.priority, deadline = call.start_time + call.timeout if call.timeout else None )
         bittensor.logging.trace( 'Forward: {} '.format( call ) )
-        return self.apply( call = call )
+        return call
 
-    def MultiForward( self, request: bittensor.proto.MultiForwardTextPromptingRequest, context: grpc.ServicerContext ) -> bittensor.proto.MultiForwardTextPromptingResponse:
+    def _multi_forward_call( self, request: bittensor.proto.MultiForwardTextPromptingRequest ) -> SynapseForwardMulti:
         call = SynapseForwardMulti( self, request, self.multi_forward )
         bittensor.logging.trace( 'MultiForward: {} '.format( call ) )
-        return self.apply( call = call )
+        return call
 
-    def Backward( self, request: bittensor.proto.BackwardTextPromptingRequest, context: grpc.ServicerContext ) -> bittensor.proto.BackwardTextPromptingResponse:
+    def _backward_call( self, request: bittensor.proto.BackwardTextPromptingRequest ) -> SynapseBackward:
         call = SynapseBackward( self, request, self.backward )
         bittensor.logging.trace( 'Backward: {}'.format( call ) )
-        return self.apply( call = call )
+        return call
+
+    def Forward( self, request: bittensor.proto.ForwardTextPromptingRequest, context: grpc.ServicerContext ) -> bittensor.proto.ForwardTextPromptingResponse:
+        return self.apply( call = self._forward_call( request ) )
+
+    def MultiForward( self, request: bittensor.proto.MultiForwardTextPromptingRequest, context: grpc.ServicerContext ) -> bittensor.proto.MultiForwardTextPromptingResponse:
+        return self.apply( call = self._multi_forward_call( request ) )
+
+    def Backward( self, request: bittensor.proto.BackwardTextPromptingRequest, context: grpc.ServicerContext ) -> bittensor.proto.BackwardTextPromptingResponse:
+        return self.apply( call = self._backward_call( request ) )
+
+    async def AsyncForward( self, request: bittensor.proto.ForwardTextPromptingRequest, context: grpc.aio.ServicerContext ) -> bittensor.proto.ForwardTextPromptingResponse:
+        return await self.async_apply( call = self._forward_call( request ) )
+
+    async def AsyncMultiForward( self, request: bittensor.proto.MultiForwardTextPromptingRequest, context: grpc.aio.ServicerContext ) -> bittensor.proto.MultiForwardTextPromptingResponse:
+        return await self.async_apply( call = self._multi_forward_call( request ) )
+
+    async def AsyncBackward( self, request: bittensor.proto.BackwardTextPromptingRequest, context: grpc.aio.ServicerContext ) -> bittensor.proto.BackwardTextPromptingResponse:
+        return await self.async_apply( call = self._backward_call( request ) )
 
@@ -22,7 +22,8 @@ import os
 
 import bittensor
 from bittensor.utils import strtobool
-from . import wallet_impl, wallet_mock
+from typing import List, Optional
+from . import wallet_impl, wallet_mock, wallet_view
 
 class wallet:
     """ Create and init wallet that stores hot and coldkey
@@ -84,6 +85,25 @@ class wallet:
             config = config
         )
 
+    @staticmethod
+    def load_all( path: str = None, names: Optional[List[str]] = None, max_workers: int = 8 ) -> List['bittensor.WalletView']:
+        r""" Loads the hotkey and coldkeypub addresses of every wallet under path, reading keyfiles in parallel.
+            Secrets are not read, the views forward signing operations to a full wallet built on first use.
+
+            Args:
+                path (`optional`, default=bittensor.defaults.wallet.path):
+                    The path to your bittensor wallets
+                names (`optional`):
+                    Only load the wallets with these names.
+                max_workers (default=8):
+                    Threads reading the keyfiles.
+            Returns:
+                views (List[bittensor.WalletView]):
+                    One view per readable, unencrypted hotkey.
+        """
+        path = path if path != None else bittensor.defaults.wallet.path
+        return wallet_view.load_all( path = path, names = names, max_workers = max_workers )
+
     @classmethod
     def config(cls) -> 'bittensor.Config':
         """ Get config from the argument parser
@@ -73,6 +73,8 @@ class Wallet():
         self._hotkey = None
         self._coldkey = None
         self._coldkeypub = None
+        # Neuron snapshots per netuid, see snapshot().
+        self._snapshots: Dict[int, 'bittensor.WalletSnapshot'] = {}
         self.config = config
 
     def __str__(self):
@@ -81,68 +83,79 @@ class Wallet():
     def __repr__(self):
         return self.__str__()
 
+    def snapshot(
+            self,
+            netuid: int,
+            block: Optional[int] = None,
+            subtensor: Optional['bittensor.Subtensor'] = None,
+            metagraph: Optional['bittensor.metagraph'] = None,
+            refresh: bool = False,
+            max_age: Optional[float] = bittensor.__blocktime__,
+        ) -> 'bittensor.WalletSnapshot':
+        r""" Returns the neuron of this wallet's hotkey on netuid, read once and cached on the wallet. The stat
+            accessors ( trust, rank, incentive, ... ) are served from it.
+            Args:
+                netuid (int):
+                    The network uid of the subnet to query.
+                block (Optional[int]):
+                    Block to read at. A cached snapshot at another block is re-read. Defaults to the cached
+                    snapshot, or the chain head.
+                subtensor( Optional['bittensor.Subtensor'] ):
+                    Bittensor subtensor connection. Overrides with defaults if None.
+                metagraph( Optional['bittensor.metagraph'] ):
+                    A synced metagraph of netuid, the neuron is then taken from it without any rpc.
+                refresh (bool):
+                    If True, re-reads the cached snapshot.
+                max_age (Optional[float]):
+                    Seconds after which the cached snapshot is re-read, one block by default so that the
+                    accessors read at most one block old stats. None keeps it until refreshed.
+            Return:
+                snapshot (bittensor.WalletSnapshot):
+                    block stamped neuron of this wallet.
+        """
+        cached = self._snapshots.get( netuid )
+        if cached is None or ( metagraph is not None and cached.metagraph is not metagraph ):
+            cached = bittensor.WalletSnapshot( self, netuid, subtensor = subtensor, block = block, metagraph = metagraph )
+            self._snapshots[ netuid ] = cached
+        elif refresh or ( block is not None and block != cached.block ) or ( block is None and max_age is not None and cached.age > max_age ):
+            if subtensor is not None: cached.subtensor = subtensor
+            cached.refresh( block = block )
+        if not cached.is_registered:
+            print(colored('This wallet is not registered. Call wallet.register() before this function.','red'))
+        return cached
+
     def neuron(self, netuid: int) -> Optional['bittensor.NeuronInfo']:
-        return self.get_neuron(netuid=netuid)
+        return self.snapshot(netuid=netuid).neuron
 
     def trust(self, netuid: int) -> Optional[float]:
-        neuron = self.get_neuron(netuid=netuid)
-        if neuron is None:
-            return None
-        return neuron.trust
+        return self.snapshot(netuid=netuid).trust
 
     def validator_trust(self, netuid: int) -> Optional[float]:
-        neuron = self.get_neuron(netuid=netuid)
-        if neuron is None:
-            return None
-        return neuron.validator_trust
+        return self.snapshot(netuid=netuid).validator_trust
 
     def rank(self, netuid: int) -> Optional[float]:
-        neuron = self.get_neuron(netuid=netuid)
-        if neuron is None:
-            return None
-        return neuron.rank
+        return self.snapshot(netuid=netuid).rank
 
     def incentive(self, netuid: int) -> Optional[float]:
-        neuron = self.get_neuron(netuid=netuid)
-        if neuron is None:
-            return None
-        return neuron.incentive
+        return self.snapshot(netuid=netuid).incentive
 
     def dividends(self, netuid: int) -> Optional[float]:
-        neuron = self.get_neuron(netuid=netuid)
-        if neuron is None:
-            return None
-        return neuron.dividends
+        return self.snapshot(netuid=netuid).dividends
 
     def consensus(self, netuid: int) -> Optional[float]:
-        neuron = self.get_neuron(netuid=netuid)
-        if neuron is None:
-            return None
-        return neuron.consensus
+        return self.snapshot(netuid=netuid).consensus
 
     def last_update(self, netuid: int) -> Optional[int]:
-        neuron = self.get_neuron(netuid=netuid)
-        if neuron is None:
-            return None
-        return neuron.last_update
+        return self.snapshot(netuid=netuid).last_update
 
     def validator_permit(self, netuid: int) -> Optional[bool]:
-        neuron = self.get_neuron(netuid=netuid)
-        if neuron is None:
-            return None
-        return neuron.validator_permit
+        return self.snapshot(netuid=netuid).validator_permit
 
     def weights(self, netuid: int) -> Optional[List[List[int]]]:
-        neuron = self.get_neuron(netuid=netuid)
-        if neuron is None:
-            return None
-        return neuron.weights
+        return self.snapshot(netuid=netuid).weights
 
     def bonds(self, netuid: int) -> Optional[List[List[int]]]:
-        neuron = self.get_neuron(netuid=netuid)
-        if neuron is None:
-            return None
-        return neuron.bonds
+        return self.snapshot(netuid=netuid).bonds
 
     def uid(self, netuid: int) -> int:
         return self.get_uid(netuid=netuid)
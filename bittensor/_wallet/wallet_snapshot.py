@@ -0,0 +1,141 @@
+# The MIT License (MIT)
+# Copyright © 2021 Yuma Rao
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import time
+import bittensor
+from typing import List, Optional
+
+class WalletSnapshot:
+    r""" The neuron of a wallet hotkey on one subnet, read once at a block and served from memory to the
+        Wallet stat accessors ( trust, rank, incentive, ... ). Reading it from the chain costs one uid lookup and
+        one neuron rpc, both at the same block. When a metagraph of the subnet is passed, the neuron comes from
+        its last sync and no rpc is made, weights and bonds are then read from the chain on first access if
+        the metagraph is lite.
+
+        The snapshot never updates itself. Call refresh() to read it again, e.g. after syncing the shared
+        metagraph, or check age / block to decide.
+    """
+    def __init__(
+            self,
+            wallet: 'bittensor.Wallet',
+            netuid: int,
+            subtensor: Optional['bittensor.Subtensor'] = None,
+            block: Optional[int] = None,
+            metagraph: Optional['bittensor.metagraph'] = None,
+        ):
+        r""" Reads the neuron.
+            Args:
+                wallet (:obj:`bittensor.Wallet`, `required`):
+                    wallet whose hotkey is read.
+                netuid (:obj:`int`, `required`):
+                    subnet of the neuron.
+                subtensor (:obj:`bittensor.Subtensor`, `optional`):
+                    chain connection, defaults to bittensor.subtensor() when the chain is read.
+                block (:obj:`Optional[int]`, `optional`):
+                    block to read at, defaults to the chain head, or to the metagraph block.
+                metagraph (:obj:`bittensor.metagraph`, `optional`):
+                    synced metagraph of netuid to share instead of reading the chain.
+        """
+        self.wallet = wallet
+        self.netuid = netuid
+        self.subtensor = subtensor
+        self.metagraph = metagraph if metagraph is not None and metagraph.netuid == netuid else None
+        self.refresh( block = block )
+
+    def __str__( self ) -> str:
+        return "WalletSnapshot({}, netuid:{}, uid:{}, block:{})".format( self.wallet.hotkey_str, self.netuid, self.uid, self.block )
+
+    def __repr__( self ) -> str:
+        return self.__str__()
+
+    def refresh( self, block: Optional[int] = None ) -> 'WalletSnapshot':
+        r""" Reads the neuron again, from the shared metagraph if it is at block ( or block is None ), else from
+            the chain at block, defaults to the chain head.
+            Returns:
+                snapshot (:obj:`WalletSnapshot`):
+                    self, refreshed.
+        """
+        hotkey = self.wallet.hotkey.ss58_address
+        self._full_neuron = None
+        if self.metagraph is not None and self.metagraph.neurons is not None and ( block is None or block == self.metagraph.block.item() ):
+            uid = self.metagraph.uid_for_hotkey( hotkey )
+            self.block = self.metagraph.block.item()
+            self.neuron = self.metagraph.neurons[ uid ] if uid is not None else None
+            # Full metagraphs already hold the weights and bonds.
+            if isinstance( self.neuron, bittensor.NeuronInfo ): self._full_neuron = self.neuron
+        else:
+            if self.subtensor is None: self.subtensor = bittensor.subtensor()
+            self.block = block if block is not None else self.subtensor.block
+            neuron = self.subtensor.get_neuron_for_pubkey_and_subnet( hotkey, netuid = self.netuid, block = self.block )
+            self.neuron = None if neuron is None or neuron.is_null else neuron
+            self._full_neuron = self.neuron
+        self.timestamp = time.time()
+        return self
+
+    @property
+    def age( self ) -> float:
+        r""" Seconds since the snapshot was read. """
+        return time.time() - self.timestamp
+
+    @property
+    def is_registered( self ) -> bool:
+        return self.neuron is not None
+
+    @property
+    def uid( self ) -> Optional[int]:
+        return None if self.neuron is None else self.neuron.uid
+
+    def _field( self, name: str ):
+        return None if self.neuron is None else getattr( self.neuron, name )
+
+    @property
+    def trust( self ) -> Optional[float]: return self._field( 'trust' )
+    @property
+    def validator_trust( self ) -> Optional[float]: return self._field( 'validator_trust' )
+    @property
+    def rank( self ) -> Optional[float]: return self._field( 'rank' )
+    @property
+    def incentive( self ) -> Optional[float]: return self._field( 'incentive' )
+    @property
+    def dividends( self ) -> Optional[float]: return self._field( 'dividends' )
+    @property
+    def consensus( self ) -> Optional[float]: return self._field( 'consensus' )
+    @property
+    def last_update( self ) -> Optional[int]: return self._field( 'last_update' )
+    @property
+    def validator_permit( self ) -> Optional[bool]: return self._field( 'validator_permit' )
+
+    def _get_full_neuron( self ) -> Optional['bittensor.NeuronInfo']:
+        r""" The neuron with weights and bonds, read from the chain at the snapshot block if the neuron came from
+            a lite metagraph.
+        """
+        if self.neuron is None: return None
+        if self._full_neuron is None:
+            if self.subtensor is None: self.subtensor = bittensor.subtensor()
+            self._full_neuron = self.subtensor.neuron_for_uid( self.neuron.uid, netuid = self.netuid, block = self.block )
+        return self._full_neuron
+
+    @property
+    def weights( self ) -> Optional[List[List[int]]]:
+        neuron = self._get_full_neuron()
+        return None if neuron is None else neuron.weights
+
+    @property
+    def bonds( self ) -> Optional[List[List[int]]]:
+        neuron = self._get_full_neuron()
+        return None if neuron is None else neuron.bonds
@@ -0,0 +1,130 @@
+# The MIT License (MIT)
+# Copyright © 2021 Yuma Rao
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import bittensor
+from substrateinterface import Keypair
+
+class WalletView( object ):
+    """ Address only view of a wallet on device, as returned by bittensor.wallet.load_all. It holds the ss58
+        addresses read from the keyfiles and never touches secret material. Anything else, e.g. coldkey or
+        add_stake, is forwarded to the full bittensor.wallet, built on first use, which decrypts keys as usual.
+    """
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        hotkey: str,
+        hotkey_ss58: str,
+        coldkeypub_ss58: Optional[str] = None,
+    ):
+        self.name = name
+        self.path = path
+        self.hotkey_str = hotkey
+        self.hotkey_ss58 = hotkey_ss58
+        self.coldkeypub_ss58 = coldkeypub_ss58
+        self._hotkey = None
+        self._coldkeypub = None
+        self._wallet = None
+
+    def __str__(self):
+        return "WalletView ({}, {}, {})".format(self.name, self.hotkey_str, self.path)
+
+    def __repr__(self):
+        return self.__str__()
+
+    @property
+    def hotkey( self ) -> 'bittensor.Keypair':
+        r""" Public only hotkey, it cannot sign. Use wallet().hotkey to sign with the hotkey. """
+        if self._hotkey == None:
+            self._hotkey = Keypair( ss58_address = self.hotkey_ss58 )
+        return self._hotkey
+
+    @property
+    def coldkeypub( self ) -> 'bittensor.Keypair':
+        r""" Public coldkey, read from coldkeypub.txt.
+            Raises:
+                KeyFileError: Raised if the wallet has no readable, unencrypted coldkeypub.txt.
+        """
+        if self.coldkeypub_ss58 == None:
+            raise bittensor.KeyFileError( "Wallet {} has no readable coldkeypub".format( self.name ) )
+        if self._coldkeypub == None:
+            self._coldkeypub = Keypair( ss58_address = self.coldkeypub_ss58 )
+        return self._coldkeypub
+
+    def wallet( self ) -> 'bittensor.Wallet':
+        r""" Returns the full wallet of this view, keys are loaded from device when first used. """
+        if self._wallet == None:
+            self._wallet = bittensor.wallet( name = self.name, hotkey = self.hotkey_str, path = self.path )
+        return self._wallet
+
+    def __getattr__( self, name: str ):
+        if name.startswith( '_' ):
+            raise AttributeError( name )
+        return getattr( self.wallet(), name )
+
+def _read_address( path: str ) -> Optional[str]:
+    r""" Returns the address stored in the unencrypted keyfile under path, None if there is none. """
+    try:
+        return bittensor.keyfile( path = path ).ss58_address
+    except Exception:
+        return None
+
+def load_all( path: str, names: Optional[List[str]] = None, max_workers: int = 8 ) -> List['WalletView']:
+    r""" Reads the addresses of every hotkey of every wallet under path with a thread pool.
+        Args:
+            path (str):
+                The path to the wallets, e.g. ~/.bittensor/wallets/.
+            names (List[str], `optional`):
+                Only load the wallets with these names, defaults to all.
+            max_workers (int):
+                Threads reading the keyfiles.
+        Returns:
+            views (List[WalletView]):
+                One view per hotkey with an unencrypted, readable keyfile, sorted by wallet then hotkey name.
+                coldkeypub_ss58 is None if the wallet has no readable, unencrypted coldkeypub.txt.
+    """
+    root = os.path.expanduser( path )
+    try:
+        wallet_names = sorted( next( os.walk( root ) )[1] )
+    except StopIteration:
+        return []
+    if names != None:
+        wallet_names = [ name for name in wallet_names if name in names ]
+
+    coldkeypub_paths = [ os.path.join( root, name, 'coldkeypub.txt' ) for name in wallet_names ]
+    hotkeys: List[ Tuple[str, str] ] = []
+    for name in wallet_names:
+        try:
+            hotkey_names = next( os.walk( os.path.join( root, name, 'hotkeys' ) ) )[2]
+        except StopIteration:
+            hotkey_names = []
+        hotkeys.extend( ( name, hotkey ) for hotkey in sorted( hotkey_names ) )
+    hotkey_paths = [ os.path.join( root, name, 'hotkeys', hotkey ) for name, hotkey in hotkeys ]
+
+    with ThreadPoolExecutor( max_workers = max( 1, max_workers ) ) as executor:
+        addresses = list( executor.map( _read_address, coldkeypub_paths + hotkey_paths ) )
+    coldkeypubs = dict( zip( wallet_names, addresses[ :len( wallet_names ) ] ) )
+    return [
+        WalletView( name = name, path = path, hotkey = hotkey, hotkey_ss58 = hotkey_ss58, coldkeypub_ss58 = coldkeypubs[ name ] )
+        for ( name, hotkey ), hotkey_ss58 in zip( hotkeys, addresses[ len( wallet_names ): ] )
+        if hotkey_ss58 != None
+    ]
@@ -2,9 +2,7 @@ import numbers
 from typing import Callable, Union, List, Optional, Dict
 
 import bittensor
-import pandas
 import requests
-import torch
 import scalecodec
 from substrateinterface import Keypair
 from substrateinterface.utils import ss58
@@ -16,10 +14,12 @@ U64_MAX = 18446744073709551615
 
 def indexed_values_to_dataframe (
         prefix: Union[str, int],
-        index: Union[list, torch.LongTensor],
-        values: Union[list, torch.Tensor],
+        index: Union[list, 'torch.LongTensor'],
+        values: Union[list, 'torch.Tensor'],
         filter_zeros: bool = False
     ) -> 'pandas.DataFrame':
+    import torch
+    import pandas
     # Type checking.
     if not isinstance(prefix, str) and not isinstance(prefix, numbers.Number):
         raise ValueError('Passed prefix must have type str or Number')
@@ -57,6 +57,7 @@ def unbiased_topk( values, k, dim=0, sorted = True, largest = True):
             indices: (torch.LongTensor)
                 indices of the topk values.
     """
+    import torch
     permutation = torch.randperm(values.shape[ dim ])
     permuted_values = values[ permutation ]
     topk, indices = torch.topk( permuted_values,  k, dim = dim, sorted=sorted, largest=largest )
@@ -18,6 +18,7 @@
 # DEALINGS IN THE SOFTWARE.
 
 import os
+import time
 import urllib
 import json
 import miniupnpc
@@ -149,6 +150,29 @@ def get_external_ip() -> str:
     raise ExternalIPNotFound
 
 
+_external_ip_cache = { 'ip': None, 'time': 0.0 }
+
+def get_external_ip_cached( max_age: float = 3600 ) -> str:
+    r""" Returns the external ip found by get_external_ip, looking it up again only once max_age seconds passed.
+        Args:
+            max_age  (:type:`float`, `optional`):
+                Seconds for which a previously found ip is returned without a new lookup.
+
+        Returns:
+            external_ip  (:obj:`str` `required`):
+                Your routers external facing ip as a string.
+
+        Raises:
+            ExternalIPNotFound (Exception):
+                Raised if all external ip attempts fail.
+    """
+    now = time.monotonic()
+    if _external_ip_cache['ip'] is None or now - _external_ip_cache['time'] > max_age:
+        _external_ip_cache['ip'] = get_external_ip()
+        _external_ip_cache['time'] = now
+    return _external_ip_cache['ip']
+
+
 class UPNPCException(Exception):
     """ Raised when trying to perform a port mapping on your router. """
 
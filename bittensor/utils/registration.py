@@ -12,7 +12,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import backoff
 import bittensor
-import torch
+import numpy as np
 from Crypto.Hash import keccak
 from rich import console as rich_console
 from rich import status as rich_status
@@ -42,6 +42,91 @@ def _seal_meets_difficulty( seal:bytes, difficulty:int, limit: int ):
     product = seal_number * difficulty
     return product < limit
 
+# Keccak-f[1600] round constants and, for each lane x + 5y, its rho rotation and pi destination lane.
+_KECCAK_ROUND_CONSTANTS = [ np.uint64(rc) for rc in (
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000, 0x000000000000808B, 0x0000000080000001,
+    0x8000000080008081, 0x8000000000008009, 0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003, 0x8000000000008002, 0x8000000000000080,
+    0x000000000000800A, 0x800000008000000A, 0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+) ]
+_KECCAK_ROTATIONS = [ [0, 36, 3, 41, 18], [1, 44, 10, 45, 2], [62, 6, 43, 15, 61], [28, 55, 25, 21, 56], [27, 20, 39, 8, 14] ]
+_KECCAK_RHO_PI = [ ( x + 5 * y, y + 5 * ( ( 2 * x + 3 * y ) % 5 ), np.uint64( _KECCAK_ROTATIONS[x][y] ), np.uint64( 64 - _KECCAK_ROTATIONS[x][y] ) ) for x in range(5) for y in range(5) ]
+
+# Number of nonces hashed together by _solve_for_nonce_block.
+_NONCE_BATCH_SIZE = 8192
+
+def _keccak_f1600_batch( lanes: List[np.ndarray] ) -> List[np.ndarray]:
+    """Applies the Keccak-f[1600] permutation to a batch of states, lanes[x + 5y] holds lane ( x, y ) of every state."""
+    one, sixty_three = np.uint64(1), np.uint64(63)
+    rotated = [None] * 25
+    for round_constant in _KECCAK_ROUND_CONSTANTS:
+        # theta
+        columns = [ lanes[x] ^ lanes[x + 5] ^ lanes[x + 10] ^ lanes[x + 15] ^ lanes[x + 20] for x in range(5) ]
+        for x in range(5):
+            right = columns[(x + 1) % 5]
+            d = columns[(x - 1) % 5] ^ ( ( right << one ) | ( right >> sixty_three ) )
+            for y in range(0, 25, 5):
+                lanes[x + y] ^= d
+        # rho and pi
+        for source, destination, rotation, complement in _KECCAK_RHO_PI:
+            lane = lanes[source]
+            rotated[destination] = lane if rotation == 0 else ( lane << rotation ) | ( lane >> complement )
+        # chi
+        for y in range(0, 25, 5):
+            b0, b1, b2, b3, b4 = rotated[y:y + 5]
+            lanes[y], lanes[y + 1], lanes[y + 2], lanes[y + 3], lanes[y + 4] = b0 ^ (~b1 & b2), b1 ^ (~b2 & b3), b2 ^ (~b3 & b4), b3 ^ (~b4 & b0), b4 ^ (~b0 & b1)
+        # iota
+        lanes[0] ^= round_constant
+    return lanes
+
+def _keccak_256_batch( messages: np.ndarray ) -> np.ndarray:
+    """Keccak-256 of each row of the [ n, 32 ] uint8 messages, as a [ n, 32 ] uint8 array."""
+    n = messages.shape[0]
+    words = np.ascontiguousarray( messages ).view( '<u8' ).reshape( n, 4 )
+    lanes = [ np.zeros( n, dtype = np.uint64 ) for _ in range(25) ]
+    for i in range(4):
+        lanes[i][:] = words[:, i]
+    # Keccak padding of a 32 byte message in the 136 byte rate: 0x01 after the message and 0x80 in the last byte.
+    lanes[4][:] = 0x01
+    lanes[16][:] = np.uint64( 0x8000000000000000 )
+    lanes = _keccak_f1600_batch( lanes )
+    return np.stack( lanes[:4], axis = 1 ).astype( '<u8' ).view( np.uint8 ).reshape( n, 32 )
+
+def _create_seal_hashes( block_and_hotkey_hash_bytes: bytes, nonce_start: int, n: int ) -> Tuple[np.ndarray, np.ndarray]:
+    """Batched _create_seal_hash over the n nonces from nonce_start, wrapping at 2^64.
+    The hex round trip of _create_seal_hash is the identity, so the pre seal is the little endian nonce followed by
+    the first 32 bytes of block_and_hotkey_hash_bytes, which are built once for the whole batch.
+    Returns the [ n ] uint64 nonces and their [ n, 32 ] uint8 seals."""
+    nonces = np.arange( n, dtype = np.uint64 ) + np.uint64( nonce_start % 2**64 )
+    pre_seals = np.empty( ( n, 40 ), dtype = np.uint8 )
+    pre_seals[:, :8] = nonces.astype( '<u8' ).view( np.uint8 ).reshape( n, 8 )
+    pre_seals[:, 8:] = np.frombuffer( bytes( block_and_hotkey_hash_bytes[:32] ), dtype = np.uint8 )
+    buffer = memoryview( pre_seals.tobytes() )
+    sha256 = hashlib.sha256
+    seals_sh256 = b''.join( [ sha256( buffer[ i: i + 40 ] ).digest() for i in range( 0, 40 * n, 40 ) ] )
+    return nonces, _keccak_256_batch( np.frombuffer( seals_sh256, dtype = np.uint8 ).reshape( n, 32 ) )
+
+def _seals_meet_difficulty( seals: np.ndarray, difficulty: int, limit: int ) -> np.ndarray:
+    """Batched _seal_meets_difficulty over the rows of the [ n, 32 ] uint8 seals, without big integer products.
+    seal * difficulty < limit holds exactly when seal <= ( limit - 1 ) // difficulty."""
+    n = seals.shape[0]
+    if difficulty <= 0:
+        return np.full( n, 0 < limit )
+    threshold = ( limit - 1 ) // difficulty
+    if threshold < 0:
+        return np.zeros( n, dtype = bool )
+    if threshold >= 2**256:
+        return np.ones( n, dtype = bool )
+    # Compare the big endian seals with the threshold, most significant 64 bit word first.
+    words = np.ascontiguousarray( seals ).view( '>u8' ).reshape( n, 4 ).astype( np.uint64 )
+    meets, decided = np.ones( n, dtype = bool ), np.zeros( n, dtype = bool )
+    for i, threshold_word in enumerate( threshold.to_bytes( 32, 'big' )[ j: j + 8 ] for j in range( 0, 32, 8 ) ):
+        threshold_word = np.uint64( int.from_bytes( threshold_word, 'big' ) )
+        below, above = words[:, i] < threshold_word, words[:, i] > threshold_word
+        meets &= ~( above & ~decided )
+        decided |= below | above
+    return meets
+
 @dataclass
 class POWSolution:
     """A solution to the registration PoW problem."""
@@ -240,15 +325,17 @@ def _solve_for_nonce_block_cuda(nonce_start: int, update_interval: int, block_an
 
 
 def _solve_for_nonce_block(nonce_start: int, nonce_end: int, block_and_hotkey_hash_bytes: bytes, difficulty: int, limit: int, block_number: int) -> Optional[POWSolution]:
-    """Tries to solve the POW for a block of nonces (nonce_start, nonce_end)"""
-    for nonce in range(nonce_start, nonce_end):
-        # Create seal.
-        seal = _create_seal_hash(block_and_hotkey_hash_bytes, nonce)
-
-        # Check if seal meets difficulty
-        if _seal_meets_difficulty(seal, difficulty, limit):
+    """Tries to solve the POW for a block of nonces (nonce_start, nonce_end), hashing _NONCE_BATCH_SIZE nonces at a time.
+    Returns the solution with the lowest nonce, as the nonce by nonce search did."""
+    for batch_start in range(nonce_start, nonce_end, _NONCE_BATCH_SIZE):
+        # Create seals.
+        nonces, seals = _create_seal_hashes(block_and_hotkey_hash_bytes, batch_start, min(_NONCE_BATCH_SIZE, nonce_end - batch_start))
+
+        # Check if seals meet difficulty
+        solved = np.flatnonzero(_seals_meet_difficulty(seals, difficulty, limit))
+        if len(solved) > 0:
             # Found a solution, save it.
-            return POWSolution(nonce, block_number, difficulty, seal)
+            return POWSolution(int(nonces[solved[0]]), block_number, difficulty, bytes(seals[solved[0]]))
 
     return None
 
@@ -301,6 +388,7 @@ class RegistrationStatistics:
     difficulty: int
     block_number: int
     block_hash: bytes
+    hashes_total: int = 0
 
 
 class RegistrationStatisticsLogger:
@@ -336,6 +424,7 @@ class RegistrationStatisticsLogger:
         f"Registration Difficulty: [bold white]{millify(stats.difficulty)}[/bold white]\n" + \
         f"Iters (Inst/Perp): [bold white]{get_human_readable(stats.hash_rate, 'H')}/s / " + \
             f"{get_human_readable(stats.hash_rate_perpetual, 'H')}/s[/bold white]\n" + \
+        f"Hashes (total): [bold white]{get_human_readable(stats.hashes_total, 'H')}[/bold white]\n" + \
         f"Block Number: [bold white]{stats.block_number}[/bold white]\n" + \
         f"Block Hash: [bold white]{stats.block_hash.encode('utf-8')}[/bold white]\n"
         return message
@@ -378,7 +467,7 @@ def _solve_for_difficulty_fast( subtensor, wallet: 'bittensor.Wallet', netuid: i
     """
     if num_processes == None:
         # get the number of allowed processes for this process
-        num_processes = min(1, get_cpu_count())
+        num_processes = get_cpu_count()
 
     if update_interval is None:
         update_interval = 50_000
@@ -497,6 +586,7 @@ def _solve_for_difficulty_fast( subtensor, wallet: 'bittensor.Wallet', netuid: i
         curr_stats.time_spent = time_since_last
         new_time_spent_total = time_now - start_time_perpetual
         curr_stats.hash_rate_perpetual = (curr_stats.rounds_total*update_interval)/ new_time_spent_total
+        curr_stats.hashes_total = curr_stats.rounds_total*update_interval
         curr_stats.time_spent_total = new_time_spent_total
 
         # Update the logger
@@ -666,6 +756,7 @@ def _solve_for_difficulty_fast_cuda( subtensor: 'bittensor.Subtensor', wallet: '
     if update_interval is None:
         update_interval = 50_000
 
+    import torch
     if not torch.cuda.is_available():
         raise Exception("CUDA not available")
 
@@ -787,6 +878,7 @@ def _solve_for_difficulty_fast_cuda( subtensor: 'bittensor.Subtensor', wallet: '
             curr_stats.time_spent = time_since_last
             new_time_spent_total = time_now - start_time_perpetual
             curr_stats.hash_rate_perpetual = (curr_stats.rounds_total * (TPB * update_interval))/ new_time_spent_total
+            curr_stats.hashes_total = curr_stats.rounds_total * (TPB * update_interval)
             curr_stats.time_spent_total = new_time_spent_total
 
             # Update the logger
@@ -803,6 +895,72 @@ def _solve_for_difficulty_fast_cuda( subtensor: 'bittensor.Subtensor', wallet: '
         return solution
 
 
+def benchmark_pow( num_processes: Optional[int] = None, update_interval: Optional[int] = None, seconds: float = 10.0 ) -> RegistrationStatistics:
+    """
+    Runs the CPU solver processes on a random block and hotkey for a fixed time, without a chain connection.
+    The difficulty is too high for a solution to be found, so every process hashes for the whole run.
+    Args:
+        num_processes: int
+            Number of processes to use, defaults to the number of CPU cores.
+        update_interval: int
+            Number of nonces each process solves between reports.
+        seconds: float
+            Duration of the run.
+    Returns:
+        stats (:obj:`RegistrationStatistics`):
+            The statistics of the run, hash_rate is the number of hashes per second over all processes.
+    """
+    if num_processes is None:
+        num_processes = get_cpu_count()
+    if update_interval is None:
+        update_interval = 50_000
+    limit = int(math.pow(2,256)) - 1
+    difficulty = 2**64 - 1
+
+    curr_block, curr_block_num, curr_diff = _Solver.create_shared_memory()
+    stopEvent = multiprocessing.Event()
+    solution_queue = multiprocessing.Queue()
+    finished_queues = [multiprocessing.Queue() for _ in range(num_processes)]
+    check_block = multiprocessing.Lock()
+    solvers = [ _Solver(i, num_processes, update_interval, finished_queues[i], solution_queue, stopEvent, curr_block, curr_block_num, curr_diff, check_block, limit)
+                for i in range(num_processes) ]
+
+    block_bytes = os.urandom(32)
+    _update_curr_block(curr_diff, curr_block, curr_block_num, 0, block_bytes, difficulty, os.urandom(32), check_block)
+    for worker in solvers:
+        worker.newBlockEvent.set()
+        worker.start()
+
+    start_time = time.time()
+    rounds_total = 0
+    while time.time() - start_time < seconds:
+        time.sleep(0.1)
+        for finished_queue in finished_queues:
+            while True:
+                try:
+                    finished_queue.get_nowait()
+                    rounds_total += 1
+                except Empty:
+                    break
+    time_spent_total = time.time() - start_time
+    stopEvent.set()
+    _terminate_workers_and_wait_for_exit(solvers)
+
+    hash_rate = rounds_total * update_interval / time_spent_total
+    return RegistrationStatistics(
+        time_spent_total = time_spent_total,
+        rounds_total = rounds_total,
+        time_average = time_spent_total * num_processes / max(1, rounds_total),
+        time_spent = time_spent_total,
+        hash_rate_perpetual = hash_rate,
+        hash_rate = hash_rate,
+        difficulty = difficulty,
+        block_number = 0,
+        block_hash = '0x' + block_bytes.hex(),
+        hashes_total = rounds_total * update_interval,
+    )
+
+
 def _terminate_workers_and_wait_for_exit(workers: List[multiprocessing.Process]) -> None:
     for worker in workers:
         worker.terminate()
@@ -19,13 +19,14 @@
 
 import torch
 import bittensor
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 
 U32_MAX = 4294967295
 U16_MAX = 65535
 
 def normalize_max_weight(  x: torch.FloatTensor, limit:float = 0.1 ) -> 'torch.FloatTensor':
     r""" Normalizes the tensor x so that sum(x) = 1 and the max value is not greater than the limit.
+        A [ k, n ] x is normalized row by row, in one batched call.
         Args:
             x (:obj:`torch.FloatTensor`):
                 Tensor to be max_value normalized.
@@ -37,34 +38,42 @@ def normalize_max_weight(  x: torch.FloatTensor, limit:float = 0.1 ) -> 'torch.F
     """
     epsilon = 1e-7 #For numerical stability after normalization
 
-    weights =  x.clone()
-    values, _ = torch.sort(weights)
-
-    if x.sum() == 0 or len(x)*limit <= 1:
-        return torch.ones_like(x)/x.size(0)
-    else:
-        estimation = values/values.sum()
-
-        if estimation.max() <= limit:
-            return weights/weights.sum()
-
-        # Find the cumlative sum and sorted tensor
-        cumsum = torch.cumsum(estimation,0)
-
-        # Determine the index of cutoff
-        estimation_sum = torch.tensor([(len(values)-i-1)*estimation[i] for i in range(len(values))])
-        n_values = (estimation/(estimation_sum+cumsum+epsilon)<limit).sum()
-
-        # Determine the cutoff based on the index
-        cutoff_scale = (limit*cumsum[n_values-1]-epsilon)/(1-(limit*(len(estimation)-n_values)))
-        cutoff= cutoff_scale*values.sum()
-
-        # Applying the cutoff
-        weights[weights > cutoff] = cutoff
-
-        y = weights/weights.sum()
-
-        return y
+    x = to_dense( x )
+    rows = x if x.dim() == 2 else x.unsqueeze( 0 )
+    n = rows.size( 1 )
+    weights = rows.clone()
+    uniform = ( rows.sum( dim = 1 ) == 0 ) | ( n * limit <= 1 )
+    if uniform.all():
+        y = torch.ones_like( rows ) / n
+        return y if x.dim() == 2 else y.squeeze( 0 )
+
+    values, _ = torch.sort( weights, dim = 1 )
+    values_sum = values.sum( dim = 1, keepdim = True )
+    estimation = values / values_sum
+    below_limit = estimation.max( dim = 1 ).values <= limit
+    if ( below_limit | uniform ).all():
+        y = weights / weights.sum( dim = 1, keepdim = True )
+        y = torch.where( uniform.unsqueeze( 1 ), torch.ones_like( rows ) / n, y )
+        return y if x.dim() == 2 else y.squeeze( 0 )
+
+    # Find the cumlative sum and sorted tensor
+    cumsum = torch.cumsum( estimation, 1 )
+
+    # Determine the index of cutoff
+    estimation_sum = torch.arange( n - 1, -1, -1, dtype = estimation.dtype ) * estimation
+    n_values = ( estimation / ( estimation_sum + cumsum + epsilon ) < limit ).sum( dim = 1, keepdim = True )
+
+    # Determine the cutoff based on the index
+    cumsum_cutoff = cumsum.gather( 1, ( n_values - 1 ) % max( n, 1 ) )
+    cutoff_scale = ( limit * cumsum_cutoff - epsilon ) / ( 1 - ( limit * ( n - n_values ) ) )
+    cutoff = cutoff_scale * values_sum
+
+    # Applying the cutoff
+    weights = torch.where( ( weights > cutoff ) & ~below_limit.unsqueeze( 1 ), cutoff, weights )
+
+    y = weights / weights.sum( dim = 1, keepdim = True )
+    y = torch.where( uniform.unsqueeze( 1 ), torch.ones_like( rows ) / n, y )
+    return y if x.dim() == 2 else y.squeeze( 0 )
 
 def convert_weight_uids_and_vals_to_tensor( n: int, uids: List[int], weights: List[int] ) -> 'torch.FloatTensor':
     r""" Converts weights and uids from chain representation into a torch tensor (inverse operation from convert_weights_and_uids_for_emit)
@@ -80,8 +89,7 @@ def convert_weight_uids_and_vals_to_tensor( n: int, uids: List[int], weights: Li
                 Converted row weights.
     """
     row_weights = torch.zeros( [ n ], dtype=torch.float32 )
-    for uid_j, wij in list(zip( uids, weights )):
-        row_weights[ uid_j ] = float( wij )  # assumes max-upscaled values (w_max = U16_MAX).
+    row_weights[ torch.as_tensor( uids, dtype=torch.int64 ) ] = torch.as_tensor( weights, dtype=torch.float32 )  # assumes max-upscaled values (w_max = U16_MAX).
     row_sum = row_weights.sum()
     if row_sum > 0:
         row_weights /= row_sum  # normalize
@@ -101,10 +109,76 @@ def convert_bond_uids_and_vals_to_tensor( n: int, uids: List[int], bonds: List[i
                 Converted row bonds.
     """
     row_bonds = torch.zeros( [ n ], dtype=torch.int64 )
-    for uid_j, bij in list(zip( uids, bonds )):
-        row_bonds[ uid_j ] = int( bij )
+    row_bonds[ torch.as_tensor( uids, dtype=torch.int64 ) ] = torch.as_tensor( bonds, dtype=torch.int64 )
     return row_bonds
 
+def convert_sparse_weights_to_tensor( n: int, index: torch.LongTensor, values: torch.LongTensor, layout: torch.layout = torch.strided ) -> 'torch.FloatTensor':
+    r""" Converts the weights of all neurons from sparse chain representation into a row normalized [ n, n ] tensor.
+        Matrix form of convert_weight_uids_and_vals_to_tensor.
+        Args:
+            n: int:
+                number of neurons on network.
+            index (:obj:`torch.LongTensor`):
+                [ 2, nnz ] ( row, uid ) indices of the passed weights.
+            values (:obj:`torch.LongTensor`):
+                [ nnz ] u16 weight values.
+            layout (:obj:`torch.layout`, default = torch.strided):
+                One of torch.strided, torch.sparse_coo or torch.sparse_csr.
+        Returns:
+            weights ( torch.FloatTensor ):
+                Converted weights, each non zero row sums to 1.
+    """
+    if layout == torch.strided:
+        weights = torch.zeros( [ n, n ], dtype=torch.float32 )
+        weights[ index[0], index[1] ] = values.float()
+        row_sums = weights.sum( dim = 1, keepdim = True )
+        return torch.where( row_sums > 0, weights / row_sums, weights )
+    values = values.float()
+    row_sums = torch.zeros( n, dtype=torch.float32 ).index_add_( 0, index[0], values )[ index[0] ]
+    values = torch.where( row_sums > 0, values / row_sums, values )
+    return _sparse_tensor( n, index, values, layout )
+
+def convert_sparse_bonds_to_tensor( n: int, index: torch.LongTensor, values: torch.LongTensor, layout: torch.layout = torch.strided ) -> 'torch.LongTensor':
+    r""" Converts the bonds of all neurons from sparse chain representation into a [ n, n ] tensor.
+        Matrix form of convert_bond_uids_and_vals_to_tensor.
+        Args:
+            n: int:
+                number of neurons on network.
+            index (:obj:`torch.LongTensor`):
+                [ 2, nnz ] ( row, uid ) indices of the passed bonds.
+            values (:obj:`torch.LongTensor`):
+                [ nnz ] bond values.
+            layout (:obj:`torch.layout`, default = torch.strided):
+                One of torch.strided, torch.sparse_coo or torch.sparse_csr.
+        Returns:
+            bonds ( torch.LongTensor ):
+                Converted bonds.
+    """
+    if layout == torch.strided:
+        bonds = torch.zeros( [ n, n ], dtype=torch.int64 )
+        bonds[ index[0], index[1] ] = values
+        return bonds
+    return _sparse_tensor( n, index, values, layout )
+
+def _sparse_tensor( n: int, index: torch.LongTensor, values: torch.Tensor, layout: torch.layout ) -> torch.Tensor:
+    matrix = torch.sparse_coo_tensor( index, values, ( n, n ) ).coalesce()
+    if layout == torch.sparse_coo:
+        return matrix
+    elif layout == torch.sparse_csr:
+        return matrix.to_sparse_csr()
+    raise ValueError( 'Unsupported layout {}, expected one of torch.strided, torch.sparse_coo or torch.sparse_csr'.format( layout ) )
+
+def to_dense( x: torch.Tensor ) -> torch.Tensor:
+    r""" Returns x as a strided tensor, densifying sparse COO or CSR layouts.
+        Args:
+            x (:obj:`torch.Tensor`):
+                Tensor in any layout, e.g. a row of a sparse metagraph.W.
+        Returns:
+            x (:obj:`torch.Tensor`):
+                Dense tensor.
+    """
+    return x if x.layout == torch.strided else x.to_dense()
+
 def convert_weights_and_uids_for_emit( uids: torch.LongTensor, weights: torch.FloatTensor ) -> Tuple[List[int], List[int]]:
     r""" Converts weights into integer u32 representation that sum to MAX_INT_WEIGHT.
         Args:
@@ -119,33 +193,59 @@ def convert_weights_and_uids_for_emit( uids: torch.LongTensor, weights: torch.Fl
                 Weights as a list.
     """
     # Checks.
-    weights = weights.tolist()
-    uids = uids.tolist()
-    if min(weights) < 0:
-        raise ValueError('Passed weight is negative cannot exist on chain {}'.format(weights))
-    if min(uids) < 0:
-        raise ValueError('Passed uid is negative cannot exist on chain {}'.format(uids))
+    weights = to_dense( weights )
+    uids = to_dense( uids )
+    if weights.numel() == 0 or uids.numel() == 0:
+        raise ValueError('Passed weights and uids must not be empty, got {} and {}'.format(weights.tolist(), uids.tolist()))
+    if weights.min() < 0:
+        raise ValueError('Passed weight is negative cannot exist on chain {}'.format(weights.tolist()))
+    if uids.min() < 0:
+        raise ValueError('Passed uid is negative cannot exist on chain {}'.format(uids.tolist()))
     if len(uids) != len(weights):
         raise ValueError('Passed weights and uids must have the same length, got {} and {}'.format(len(uids), len(weights)))
-    if sum(weights) == 0:
-        return [],[] # Nothing to set on chain.
-    else:
-        max_weight = float(max(weights))
-        weights = [float(value) / max_weight for value in weights]  # max-upscale values (max_weight = 1).
-
-    weight_vals = []
-    weight_uids = []
-    for i, (weight_i, uid_i) in enumerate(list(zip(weights, uids))):
-        uint16_val = round(float(weight_i) * int(U16_MAX))  # convert to int representation.
-
-        # Filter zeros
-        if uint16_val != 0: # Filter zeros
-            weight_vals.append( uint16_val )
-            weight_uids.append( uid_i )
+    uint16_vals = _uint16_weights( weights.unsqueeze( 0 ) )[ 0 ]
+
+    # Filter zeros
+    non_zero = uint16_vals != 0
+    return uids[ non_zero ].tolist(), uint16_vals[ non_zero ].tolist()
 
+def convert_weight_matrix_for_emit( weights: torch.FloatTensor, uids: Optional[torch.LongTensor] = None ) -> Tuple[List[List[int]], List[List[int]]]:
+    r""" Converts the [ k, n ] weights of k neurons into their u16 chain representation in one batched call.
+        Row i gives the same result as convert_weights_and_uids_for_emit( uids, weights[i] ).
+        Args:
+            weights (:obj:`torch.FloatTensor`):
+                [ k, n ] non negative weights, one row per neuron.
+            uids (:obj:`torch.LongTensor`, `optional`):
+                [ n ] destination uids of the columns, defaults to range( n ).
+        Returns:
+            weight_uids (List[List[int]]):
+                Non zero uids of each row.
+            weight_vals (List[List[int]]):
+                Their u16 weights, the max weight of a non empty row is U16_MAX.
+    """
+    weights = to_dense( weights )
+    uids = torch.arange( weights.size( 1 ) ) if uids is None else to_dense( uids )
+    if weights.size( 1 ) == 0:
+        raise ValueError('Passed weights must have at least one column, got shape {}'.format(list(weights.shape)))
+
+    uint16_vals = _uint16_weights( weights )
+
+    # Filter zeros, nothing is set on chain for zero rows.
+    rows, cols = uint16_vals.nonzero( as_tuple = True )
+    counts = torch.bincount( rows, minlength = weights.size( 0 ) ).tolist()
+    weight_uids = [ row.tolist() for row in uids[ cols ].split( counts ) ]
+    weight_vals = [ row.tolist() for row in uint16_vals[ rows, cols ].split( counts ) ]
     return weight_uids, weight_vals
 
 
+def _uint16_weights( weights: torch.FloatTensor ) -> torch.LongTensor:
+    # max-upscale rows (max_weight = 1) then convert to int representation, in double precision like python floats.
+    weights = weights.double()
+    max_weights = weights.max( dim = 1, keepdim = True ).values
+    max_weights = torch.where( max_weights > 0, max_weights, torch.ones_like( max_weights ) )
+    return torch.round( weights / max_weights * U16_MAX ).long()
+
+
 def process_weights_for_netuid(
         uids,
         weights: torch.Tensor,
@@ -164,6 +264,7 @@ def process_weights_for_netuid(
         metagraph = subtensor.metagraph( netuid )
 
     # Cast weights to floats.
+    weights = to_dense( weights )
     if not isinstance( weights, torch.FloatTensor ):
         weights = weights.type( torch.float32 )
 
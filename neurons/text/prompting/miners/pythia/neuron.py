@@ -85,6 +85,24 @@ class PythiaMiner( bittensor.BasePromptingMiner ):
         bittensor.logging.debug("Generation: " + str(generation).replace("<","-").replace(">","-"))
         return generation
 
+    def forward_batch(self, messages_list: List[List[Dict[str, str]]]) -> List[str]:
+        prompts = [self._process_history(messages) + "<bot>:" for messages in messages_list]
+        # Left padding keeps the last prompt token of every row next to the generated tokens.
+        self.tokenizer.padding_side = "left"
+        if self.tokenizer.pad_token is None: self.tokenizer.pad_token = self.tokenizer.eos_token
+        inputs = self.tokenizer(prompts, return_tensors="pt", padding=True).to(self.config.pythia.device)
+        output = self.model.generate(
+            **inputs,
+            max_new_tokens=self.config.pythia.max_new_tokens,
+            temperature=self.config.pythia.temperature,
+            do_sample=self.config.pythia.do_sample,
+            pad_token_id=self.tokenizer.eos_token_id,
+        )
+        generated_texts = self.tokenizer.batch_decode(output[:, inputs["input_ids"].shape[1]:], skip_special_tokens=True)
+        generations = [generated_text.split("<human>")[0].strip() for generated_text in generated_texts]
+        bittensor.logging.debug("Batched generations: " + str(len(generations)))
+        return generations
+
 if __name__ == "__main__":
     bittensor.utils.version_checking()
     PythiaMiner().run()
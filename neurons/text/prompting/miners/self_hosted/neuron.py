@@ -106,7 +106,7 @@ def main():
     # --- Create our network state cache
     metagraph = bittensor.metagraph(config=config, netuid=config.netuid, )
     metagraph.sync(netuid=config.netuid, subtensor=subtensor).save()
-    uid = metagraph.hotkeys.index(wallet.hotkey.ss58_address)
+    uid = metagraph.uid_for_hotkey(wallet.hotkey.ss58_address)
 
     # --- Build /Load our model and set the device.
     with bittensor.__console__.status("Loading huggingface model robertmyers/bpt-sft ..."):
@@ -164,19 +164,19 @@ def main():
     print (axon)
 
     # --- Run Forever.
-    last_update = subtensor.get_current_block()
+    clock = subtensor.block_clock()
+    last_update = clock.current_block
     while True:
 
         # --- Wait until next epoch.
-        current_block = subtensor.get_current_block()
-        while (current_block - last_update) < config.neuron.blocks_per_epoch:
-            time.sleep(bittensor.__blocktime__)
-            current_block = subtensor.get_current_block()
-        last_update = subtensor.get_current_block()
+        last_update = clock.wait_for_block(last_update + config.neuron.blocks_per_epoch)
 
         # --- Update the metagraph with the latest network state.
         metagraph.sync(netuid=config.netuid, subtensor=subtensor)
-        uid = metagraph.hotkeys.index(wallet.hotkey.ss58_address)
+        uid = metagraph.uid_for_hotkey(wallet.hotkey.ss58_address)
+        if uid is None:
+            bittensor.logging.warning('Hotkey {} is not registered on netuid {}, skipping this epoch'.format(wallet.hotkey.ss58_address, config.netuid))
+            continue
 
         # --- Log performance.
         print(
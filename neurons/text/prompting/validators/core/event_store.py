@@ -0,0 +1,248 @@
+# The MIT License (MIT)
+# Copyright © 2021 Yuma Rao
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import os
+import re
+import gzip
+import json
+import time
+import zlib
+import atexit
+import torch
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# Sizes as loguru rotation accepts them, e.g. '2 GB', '500 MiB' or '100 kb' ( bits ).
+_SIZE = re.compile( r'([e\+\-\.\d]+)\s*([kmgtpezy])?(i)?(b)', flags = re.I )
+
+def parse_size( size: str ) -> Optional[int]:
+    r""" Returns the bytes of a size such as '2 GB' or '500 MiB', None if size is not one, e.g. '1 week'. """
+    match = _SIZE.fullmatch( size.strip() )
+    if match is None: return None
+    number, prefix, binary, unit = match.groups()
+    try:
+        number = float( number )
+    except ValueError:
+        return None
+    power = 'kmgtpezy'.index( prefix.lower() ) + 1 if prefix else 0
+    return int( number * ( 1024 if binary else 1000 ) ** power / ( 8 if unit == 'b' else 1 ) )
+
+class EventStore:
+    r""" Bounded history of the validator forward events.
+
+        The ( uid, reward ) pairs of every event are kept in a ring buffer of preallocated columns, one row per
+        rewarded uid, stamped with the event step and block. Once capacity rows are held the oldest rows are
+        overwritten, so memory does not grow with uptime. Prompts and completions are not held in memory: with a
+        log_path each event is appended as a JSON line to a gzip file, written one gzip member per flush_every
+        events. read_log() streams it back and from_log() rebuilds a store from it for offline analysis.
+    """
+    def __init__(
+            self,
+            capacity: int = 1000000,
+            log_path: Optional[str] = None,
+            flush_every: int = 64,
+            rotation_bytes: Optional[int] = None,
+        ):
+        r""" Creates an empty store.
+            Args:
+                capacity (int):
+                    number of ( uid, reward ) rows held in memory.
+                log_path (Optional[str]):
+                    gzip JSON lines file the events are appended to, events are not written if None.
+                flush_every (int):
+                    events buffered before they are compressed and appended to log_path.
+                rotation_bytes (Optional[int]):
+                    once log_path is larger, it is renamed with a timestamp and a new file started.
+        """
+        self.capacity = capacity
+        self.steps = torch.zeros( capacity, dtype = torch.int64 )
+        self.blocks = torch.zeros( capacity, dtype = torch.int64 )
+        self.uids = torch.zeros( capacity, dtype = torch.int64 )
+        self.rewards = torch.zeros( capacity, dtype = torch.float32 )
+        self.size = 0
+        self.head = 0
+        self.num_events = 0
+        self.log_path = log_path
+        self.flush_every = flush_every
+        self.rotation_bytes = rotation_bytes
+        self._pending: List[bytes] = []
+        if log_path is not None:
+            os.makedirs( os.path.dirname( os.path.abspath( log_path ) ), exist_ok = True )
+            atexit.register( self.flush )
+
+    def __len__( self ) -> int:
+        return self.size
+
+    def __str__( self ) -> str:
+        return "EventStore(events:{}, rows:{}/{})".format( self.num_events, self.size, self.capacity )
+
+    def __repr__( self ) -> str:
+        return self.__str__()
+
+    def append(
+            self,
+            uids: Union[ torch.Tensor, List[int] ],
+            rewards: Union[ torch.Tensor, List[float] ],
+            block: int,
+            message: Optional[str] = None,
+            completion: Optional[str] = None,
+            all_uids: Optional[ Union[ torch.Tensor, List[int] ] ] = None,
+            all_completions: Optional[ List[str] ] = None,
+            is_question: bool = False,
+        ) -> int:
+        r""" Records an event.
+            Args:
+                uids (Union[torch.Tensor, List[int]]):
+                    rewarded uids.
+                rewards (Union[torch.Tensor, List[float]]):
+                    reward of each uid.
+                block (int):
+                    block of the event.
+                message, completion, all_uids, all_completions, is_question:
+                    only written to the log.
+            Returns:
+                step (int):
+                    index of the event.
+        """
+        step = self.num_events
+        self.num_events += 1
+        uids = torch.as_tensor( uids ).detach().flatten().to( 'cpu', torch.int64 )
+        rewards = torch.as_tensor( rewards ).detach().flatten().to( 'cpu', torch.float32 )
+        self._put( step, int( block ), uids, rewards )
+        if self.log_path is not None:
+            record = {
+                'step': step,
+                'block': int( block ),
+                'time': time.time(),
+                'is_question': is_question,
+                'prompt': message,
+                'completion': completion,
+                'uids': uids.tolist(),
+                'rewards': rewards.tolist(),
+                'all_uids': torch.as_tensor( all_uids ).tolist() if all_uids is not None else None,
+                'all_completions': all_completions,
+            }
+            self._pending.append( ( json.dumps( record ) + '\n' ).encode() )
+            if len( self._pending ) >= self.flush_every: self.flush()
+        return step
+
+    def _put( self, step: int, block: int, uids: torch.Tensor, rewards: torch.Tensor ):
+        if len( uids ) > self.capacity:
+            uids, rewards = uids[ -self.capacity: ], rewards[ -self.capacity: ]
+        rows = ( self.head + torch.arange( len( uids ) ) ) % self.capacity
+        self.steps[ rows ] = step
+        self.blocks[ rows ] = block
+        self.uids[ rows ] = uids
+        self.rewards[ rows ] = rewards
+        self.head = ( self.head + len( uids ) ) % self.capacity
+        self.size = min( self.size + len( uids ), self.capacity )
+
+    def flush( self ):
+        r""" Appends the buffered events to the log as one gzip member. """
+        if self.log_path is None or len( self._pending ) == 0: return
+        data, self._pending = b''.join( self._pending ), []
+        if self.rotation_bytes is not None and os.path.exists( self.log_path ) and os.path.getsize( self.log_path ) >= self.rotation_bytes:
+            root, ext = os.path.splitext( self.log_path )
+            rotated, index = '{}.{}{}'.format( root, int( time.time() ), ext ), 1
+            while os.path.exists( rotated ):
+                rotated, index = '{}.{}.{}{}'.format( root, int( time.time() ), index, ext ), index + 1
+            os.replace( self.log_path, rotated )
+        with open( self.log_path, 'ab' ) as file:
+            file.write( gzip.compress( data, compresslevel = 6 ) )
+
+    def _ordered( self, column: torch.Tensor ) -> torch.Tensor:
+        r""" Returns the held rows of column oldest first, a view until the ring wraps. """
+        if self.size < self.capacity: return column[ :self.size ]
+        return torch.cat( ( column[ self.head: ], column[ :self.head ] ) )
+
+    def _start( self, since_block: Optional[int], last_events: Optional[int] ) -> int:
+        r""" Returns the offset of the first held row in the window. Steps and blocks only grow, so the window is
+            a suffix of the rows found with a binary search.
+        """
+        start = 0
+        if last_events is not None:
+            start = max( start, int( torch.searchsorted( self._ordered( self.steps ), self.num_events - last_events ) ) )
+        if since_block is not None:
+            start = max( start, int( torch.searchsorted( self._ordered( self.blocks ), since_block ) ) )
+        return start
+
+    def columns( self, since_block: Optional[int] = None, last_events: Optional[int] = None ) -> Dict[ str, torch.Tensor ]:
+        r""" Returns the steps, blocks, uids and rewards of the rows in the window, oldest first.
+            Args:
+                since_block (Optional[int]):
+                    only rows of events at this block or later.
+                last_events (Optional[int]):
+                    only rows of the last last_events events.
+        """
+        start = self._start( since_block, last_events )
+        return { name: self._ordered( getattr( self, name ) )[ start: ] for name in ( 'steps', 'blocks', 'uids', 'rewards' ) }
+
+    def uid_history( self, uid: int, since_block: Optional[int] = None, last_events: Optional[int] = None ) -> Tuple[ torch.LongTensor, torch.FloatTensor ]:
+        r""" Returns the blocks and rewards of uid in the window, oldest first. """
+        columns = self.columns( since_block, last_events )
+        mask = columns['uids'] == uid
+        return columns['blocks'][ mask ], columns['rewards'][ mask ]
+
+    def reward_counts( self, n: int, since_block: Optional[int] = None, last_events: Optional[int] = None ) -> torch.LongTensor:
+        r""" Returns the number of rewards of each uid below n in the window. """
+        start = self._start( since_block, last_events )
+        return torch.bincount( self._ordered( self.uids )[ start: ], minlength = n )[ :n ]
+
+    def mean_rewards( self, n: int, since_block: Optional[int] = None, last_events: Optional[int] = None ) -> torch.FloatTensor:
+        r""" Returns the mean reward of each uid below n in the window, 0 for uids without rewards.
+            Args:
+                n (int):
+                    number of uids, usually metagraph.n.
+                since_block (Optional[int]):
+                    only rewards of events at this block or later.
+                last_events (Optional[int]):
+                    only rewards of the last last_events events.
+            Returns:
+                means (torch.FloatTensor, shape = (n)):
+                    mean reward per uid.
+        """
+        start = self._start( since_block, last_events )
+        uids, rewards = self._ordered( self.uids )[ start: ], self._ordered( self.rewards )[ start: ]
+        # Uids above n, e.g. of a subnet which shrank, are sliced off instead of masked.
+        sums = torch.bincount( uids, weights = rewards, minlength = n )[ :n ].to( torch.float32 )
+        counts = torch.bincount( uids, minlength = n )[ :n ]
+        return sums / counts.clamp( min = 1 )
+
+    @property
+    def nbytes( self ) -> int:
+        r""" Bytes of the preallocated columns. """
+        return sum( column.element_size() * column.nelement() for column in ( self.steps, self.blocks, self.uids, self.rewards ) )
+
+    @staticmethod
+    def read_log( path: str ) -> Iterator[ dict ]:
+        r""" Yields the events written to the log at path, oldest first. A member cut short by a crash ends the
+            iteration.
+        """
+        with gzip.open( path, 'rb' ) as file:
+            try:
+                for line in file:
+                    yield json.loads( line )
+            except ( EOFError, zlib.error, gzip.BadGzipFile, json.JSONDecodeError ):
+                return
+
+    @classmethod
+    def from_log( cls, path: str, capacity: int = 1000000 ) -> 'EventStore':
+        r""" Rebuilds a store from the log at path, keeping the last capacity rows. """
+        store = cls( capacity = capacity )
+        for record in cls.read_log( path ):
+            store.num_events = record['step']
+            store.append( record['uids'], record['rewards'], record['block'] )
+        return store
@@ -19,7 +19,6 @@ import os
 import time
 import math
 import copy
-import queue
 import torch
 import random
 import bittensor
@@ -32,6 +31,7 @@ from types import SimpleNamespace
 from typing import List, Optional, Tuple, Dict
 from reward import RewardModel
 from gating import GatingModel
+from event_store import EventStore, parse_size
 from transformers import AutoTokenizer
 from datasets import load_dataset
 
@@ -59,35 +59,28 @@ class neuron:
         config.neuron.reward_path = os.path.expanduser( config.neuron.reward_path )
         if not os.path.exists( config.neuron.full_path ):
             os.makedirs( config.neuron.full_path, exist_ok = True)
+        if parse_size( config.neuron.events_retention_size ) is None:
+            # The events log only rotates on size, time based loguru rotations are not supported.
+            bt.logging.warning( 'Unsupported --neuron.events_retention_size {}, using 2 GB'.format( config.neuron.events_retention_size ) )
+            config.neuron.events_retention_size = '2 GB'
         if not os.path.exists( config.neuron.reward_path + '/hf_ckpt.pt' ):
             os.makedirs( config.neuron.reward_path, exist_ok = True )
             os.system(
                 f"wget -O { config.neuron.reward_path + '/hf_ckpt.pt'} \
                 https://huggingface.co/Dahoas/gptj-rm-static/resolve/main/hf_ckpt.pt"
             )
-        if not config.neuron.dont_save_events:
-            # Add custom event logger for the events.
-            logger.level("EVENTS", no=38, icon="📝")
-            logger.add( 
-                config.neuron.full_path + "/" + "completions.log", 
-                rotation=config.neuron.events_retention_size, serialize=True, enqueue=True, backtrace=False, diagnose=False, level="EVENTS", 
-                format = "{time:YYYY-MM-DD at HH:mm:ss} | {level} | {message} | {extra[prompt]} {extra[completion]} {extra[uids]} {extra[all_uids]} {extra[rewards]}{extra[all_completions]} {extra[block]}"
-            )
 
     def record_event( self, event: SimpleNamespace ):
-        self.history.put( event )
-        if not self.config.neuron.dont_save_events:
-            logger.log(
-                "EVENTS", 
-                "events", 
-                prompt = event.message,
-                completion = event.completion,
-                uids = event.uids.tolist(),
-                all_uids = event.all_uids.tolist(),
-                rewards = event.rewards.tolist(),
-                all_completions = event.all_completions,
-                block = event.block.item(),
-            )
+        self.history.append(
+            uids = event.uids,
+            rewards = event.rewards,
+            block = event.block.item(),
+            message = event.message,
+            completion = event.completion,
+            all_uids = event.all_uids,
+            all_completions = event.all_completions,
+            is_question = event.is_question,
+        )
 
     @classmethod
     def add_args( cls, parser ):
@@ -104,14 +97,16 @@ class neuron:
         parser.add_argument( '--neuron.training_topk', type = int, help = 'During training time, how many miners to we query for each batch based on scores from gating network.', default = 50 )
         parser.add_argument( '--neuron.training_timeout', type = int, help = 'Query timeout during training', default = 4 )
         parser.add_argument( '--neuron.inference_timeout', type = int, help = 'Query timeout during inference', default = 10 )
+        parser.add_argument( '--neuron.training_first_k', type = int, help = 'During training, stop waiting for miners once this many completed, -1 waits for all.', default = -1 )
+        parser.add_argument( '--neuron.inference_first_k', type = int, help = 'At inference time, stop waiting for miners once this many completed, -1 waits for all.', default = -1 )
         parser.add_argument( '--neuron.inference_only', action = 'store_true', help = 'If set, training off and only inference will be served via axon.', default = False )
         parser.add_argument( '--neuron.axon_off', action = 'store_true', help = 'If set, the axon will be turned off.', default = False )
         parser.add_argument( '--neuron.reward_path', type = str, help = 'Path to reward model.', default = '~/.bittensor/reward_models' )
-        parser.add_argument( '--neuron.max_history', type = int, help = 'Maximum number history values to store at any time.', default = 100000 )
+        parser.add_argument( '--neuron.max_history', type = int, help = 'Maximum number of ( uid, reward ) history rows to hold in memory.', default = 1000000 )
         parser.add_argument( '--neuron.device', type = str, help = 'Device to run the validator on.', default = "cuda" if torch.cuda.is_available() else "cpu" )
         parser.add_argument( '--neuron.epoch_length_override', type = int, help = 'Override the default timeout', default = -1 )
         parser.add_argument( '--neuron.dont_save_events', action = 'store_true', help = 'If set, we dont save events to a log file.', default = False )
-        parser.add_argument( '--neuron.events_retention_size',  type = str,  help = 'Events retention size.', default = "2 GB" )
+        parser.add_argument( '--neuron.events_retention_size',  type = str,  help = 'Size after which the events log is rotated, e.g. 2 GB or 500 MiB.', default = "2 GB" )
         parser.add_argument( '--neuron.no_reward_model', action = 'store_true', help = 'If set, we dont load the reward model instead use just the scores.', default = False )
         parser.add_argument( '--neuron.question_random_sample_uids', action = 'store_true', help = 'If set, random sample uids to get question.', default = False )
         parser.add_argument( '--neuron.reward_shift', type = int, help = 'The value to shift rewards for calculation.', default = 3 )
@@ -134,6 +129,7 @@ class neuron:
         print( self.config )
         
         self.subtensor = bt.subtensor ( config = self.config )
+        self.clock = self.subtensor.block_clock()
         self.device = torch.device( self.config.neuron.device )
         self.wallet = bt.wallet ( config = self.config )
         self.metagraph = bt.metagraph( netuid = self.config.netuid, network = self.subtensor.network )
@@ -170,7 +166,11 @@ class neuron:
         self.dendrite_pool = bt.text_prompting_pool( keypair = self.wallet.hotkey, metagraph = self.metagraph )
         self.inference_pool = bt.text_prompting_pool( keypair = self.wallet.hotkey, metagraph = self.metagraph )
         # History of forward events.
-        self.history = queue.Queue( maxsize = self.config.neuron.max_history )
+        self.history = EventStore(
+            capacity = self.config.neuron.max_history,
+            log_path = None if self.config.neuron.dont_save_events else self.config.neuron.full_path + '/completions.jsonl.gz',
+            rotation_bytes = parse_size( self.config.neuron.events_retention_size ),
+        )
         # Get a list of peers delegating to me
         delegated = self.subtensor.get_delegated( self.wallet.coldkeypub.ss58_address )
         self.my_nominators = { nomin[0]: nomin[1] for nomin in delegated[0][0].nominators } if len(delegated) else {}
@@ -191,8 +191,8 @@ class neuron:
                     if forward_call.src_hotkey == self.wallet.hotkey.ss58_address: 
                         return True
 
-                    elif forward_call.src_hotkey in self.metagraph.hotkeys:
-                        uid =  self.metagraph.hotkeys.index(forward_call.src_hotkey)
+                    elif self.metagraph.is_registered( forward_call.src_hotkey ):
+                        uid = self.metagraph.uid_for_hotkey( forward_call.src_hotkey )
                         if self.metagraph.validator_permit[uid]:
                             return True         
                         return False # Non Validator miners
@@ -300,6 +300,7 @@ class neuron:
             messages = messages, 
             uids = topk_uids, 
             timeout = timeout,
+            first_k = self.config.neuron.training_first_k if self.config.neuron.training_first_k > 0 else None,
         )
         bittensor.logging.trace( 'topk_uids', topk_uids )
 
@@ -414,6 +415,7 @@ class neuron:
             messages = contents, 
             uids = uids, 
             timeout = timeout,
+            first_k = self.config.neuron.inference_first_k if self.config.neuron.inference_first_k > 0 else None,
         )
         bittensor.logging.trace( 'finished dendrite forward ', time.time() - forward_start )
 
@@ -525,14 +527,14 @@ class neuron:
             the question and the resulting completions.
         """
         # Store the current epoch block number for comparison later.
-        last_epoch_block = self.subtensor.block
+        last_epoch_block = self.clock.current_block
         steps = 0
         
         # grab the question from the current sample
         prompt = next(self.dataset)['context']
         self.base_prompt = self.config.neuron.base_prompt
         reward_diff = 0
-        self.last_sync = self.subtensor.block
+        self.last_sync = self.clock.current_block
         
         # Start an infinite loop for training.
         try:
@@ -564,15 +566,15 @@ class neuron:
                     )
 
                 # Resync metagraph before returning. (sync every 15 min or ~75 blocks)
-                if self.subtensor.block - self.last_sync > 100:
-                    self.metagraph.sync()
-                    self.last_sync = self.subtensor.block
+                if self.clock.current_block - self.last_sync > 100:
+                    self.metagraph.sync( incremental = True )
+                    self.last_sync = self.clock.current_block
                     self.save()
                     delegates = self.subtensor.get_delegated( self.wallet.coldkeypub.ss58_address )
 
-                    # Recreate pools here to ensure sizing is correct.
-                    self.dendrite_pool = bt.text_prompting_pool( keypair = self.wallet.hotkey, metagraph = self.metagraph )
-                    self.inference_pool = bt.text_prompting_pool( keypair = self.wallet.hotkey, metagraph = self.metagraph )
+                    # Resize the pools, keeping the channels of unchanged axons open.
+                    self.dendrite_pool.resync( self.metagraph )
+                    self.inference_pool.resync( self.metagraph )
 
                     self.my_nominators = { nomin[0]: nomin[1] for nomin in delegates[0][0].nominators } if len(delegates) else {}
                     self.check_weights()
@@ -582,17 +584,17 @@ class neuron:
 
                 # Check if enough epoch blocks have elapsed since the last epoch.
                 epoch_length = self.subtensor.validator_epoch_length(self.config.netuid) if self.config.neuron.epoch_length_override == -1 else self.config.neuron.epoch_length_override
-                blocks_until_epoch = epoch_length - ( self.subtensor.block - last_epoch_block )
+                blocks_until_epoch = epoch_length - ( self.clock.current_block - last_epoch_block )
                 bittensor.logging.debug( 'blocks_until_epoch', blocks_until_epoch )
                 if blocks_until_epoch <= 0: 
                     bittensor.logging.trace( 'epoch()' )
-                    bittensor.logging.info( 'block', self.subtensor.block )
+                    bittensor.logging.info( 'block', self.clock.current_block )
 
                     # Update the last epoch block to the current epoch block.
-                    last_epoch_block = self.subtensor.block
+                    last_epoch_block = self.clock.current_block
                     
                     # Computes the average reward for each uid across non-zero values 
-                    # using the rewards history stored in the self.history list.
+                    # using the rewards history stored in self.history.
                     uids, weights = self.compute_weights()
                     bittensor.logging.info( 'weights', weights )
 
@@ -613,7 +615,7 @@ class neuron:
     def compute_weights( self ) -> Tuple[ torch.LongTensor, torch.FloatTensor ]:
         """
             Computes the average reward for each uid across non-zero values 
-            using the rewards history stored in the self.history list.
+            using the rewards history stored in self.history.
 
             Returns:
                 uids ( torch.LongTensor, shape = (n) ): 
@@ -624,7 +626,7 @@ class neuron:
         bittensor.logging.info( 'compute_weights()' )
 
         # Return zeros weights if there is no history.
-        if self.history.qsize() == 0: 
+        if len( self.history ) == 0: 
             bittensor.logging.warning( 'No history to compute weights returning all ones.' )
             return torch.ones((self.metagraph.n)) / self.metagraph.n
 
@@ -650,13 +652,11 @@ class neuron:
     def run(self):
         if self.config.neuron.inference_only:
             # Start an infinite loop, allows axon to service inference requests.
-            last_sync = self.subtensor.block
+            self.last_sync = self.clock.current_block
             while True:
-                time.sleep(12)
-                if self.subtensor.block -last_sync > 100:
-                    self.metagraph.sync()
-                    self.last_sync = self.subtensor.block
-                    self.load(inference_only = True)
+                self.last_sync = self.clock.wait_for_block( self.last_sync + 101 )
+                self.metagraph.sync( incremental = True )
+                self.load(inference_only = True)
 
         else:
             # Normal validator train operation for validation.
@@ -681,6 +681,8 @@ class neuron:
             }
             torch.save(gating_state_dict, f'{path}/gating.torch')
             bittensor.logging.success(prefix='Saved gating model', sufix=f'<blue>{path}/gating.torch</blue>')
+
+            self.history.flush()
         except Exception as e:
             logger.warning(f'Failed to save model with error: {e}')
 
@@ -709,9 +711,15 @@ class neuron:
 
     def check_weights(self):
         """ Checks current hotkeys with the current version of the metagraph """
-        for uid, hotkey in enumerate( self.hotkeys ):
-            if hotkey != self.metagraph.hotkeys[ uid ]:
+        diff = self.metagraph.diff
+        if diff is not None and not diff.full and len( self.hotkeys ) + len( diff.new_uids ) == self.metagraph.n.item():
+            # The incremental sync already knows which uids had their hotkey replaced.
+            for uid in diff.hotkey_changed:
                 self.moving_averaged_scores[ uid ] = 0 #hotkey has been replaced
+        else:
+            for uid, hotkey in enumerate( self.hotkeys ):
+                if hotkey != self.metagraph.hotkeys[ uid ]:
+                    self.moving_averaged_scores[ uid ] = 0 #hotkey has been replaced
         if len(self.hotkeys) < len(self.metagraph.hotkeys):
             new_moving_average  = torch.zeros((self.metagraph.n)).to( self.device )
             new_moving_average[:len(self.hotkeys)] = self.moving_averaged_scores
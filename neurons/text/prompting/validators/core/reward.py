@@ -27,7 +27,7 @@ from transformers import AutoModelForCausalLM, AutoTokenizer, AutoConfig
 
 class RewardModel(nn.Module):
 
-    def __init__( self, model_path: str, device: str, config: 'bittensor.config' = None):
+    def __init__( self, model_path: str, device: str, config: 'bittensor.config' = None, tokenizer_path: str = 'EleutherAI/gpt-j-6b' ):
         super().__init__()
         config = AutoConfig.from_pretrained( model_path )
         self.model = AutoModelForCausalLM.from_config( config )
@@ -39,47 +39,52 @@ class RewardModel(nn.Module):
         self.device = torch.device( device )
         self.transformer = self.model.transformer
         self.v_head = nn.Linear(self.config.n_embd, 1, bias=False)
-        self.tokenizer = AutoTokenizer.from_pretrained('EleutherAI/gpt-j-6b')
+        self.tokenizer = AutoTokenizer.from_pretrained( tokenizer_path )
         self.tokenizer.pad_token = self.tokenizer.eos_token
         self.PAD_ID = self.tokenizer(self.tokenizer.pad_token)["input_ids"][0]
 
-    def reward( self, full_completions: List[str],  comp: List[str], difference=False, shift =3) -> torch.FloatTensor:
-        def reward_fn( samples ):
-            if samples is None: return 0
-            scores_list = []
-            batch_size = 1
-            for i in range(0, len(samples), batch_size):
-                sub_samples = samples[i : i + batch_size]
-                sub_samples = [
-                    "<|startoftext|>" + chosen + "<|endoftext|>" for chosen in sub_samples
-                ]
-                encodings_dict = self.tokenizer(
-                    sub_samples,
-                    truncation=False,
-                    max_length=550,
-                    padding="max_length",
-                    return_tensors="pt",
-                )
-                input_ids = encodings_dict["input_ids"].to( self.device )
-                attn_masks = encodings_dict["attention_mask"].to( self.device )
-                input_ids = input_ids.repeat(2, 1)
-                attn_masks = attn_masks.repeat(2, 1)
-                with torch.no_grad():
-                    sub_scores = self.forward(input_ids=input_ids.to( self.device ), attention_mask=attn_masks.to( self.device ))
-                scores_list.append(sub_scores["chosen_end_scores"])
-            scores = torch.cat(scores_list, dim=0).mean().item()
-            return scores
-        
+    def reward( self, full_completions: List[str],  comp: List[str], difference=False, shift =3, batch_size: int = 16 ) -> torch.FloatTensor:
         with torch.no_grad():
-            full_rewards = [reward_fn([completion]) for completion in full_completions]
+            full_rewards = self.end_scores( full_completions, batch_size = batch_size )
             if difference:
-                comp_rewards = [reward_fn([completion]) for completion in comp]
-                return torch.nn.functional.relu(torch.tensor(full_rewards, dtype=torch.float32)+shift) - torch.nn.functional.relu(torch.tensor(comp_rewards, dtype=torch.float32)+shift)
+                comp_rewards = self.end_scores( comp, batch_size = batch_size )
+                return torch.nn.functional.relu(full_rewards+shift) - torch.nn.functional.relu(comp_rewards+shift)
             else:
-                for completion, f_reward in zip(full_completions, full_rewards):
+                for completion, f_reward in zip(full_completions, full_rewards.tolist()):
                     print(completion)
                     print(f_reward)
-                return torch.tensor(full_rewards, dtype=torch.float32)
+                return full_rewards
+
+    def end_scores( self, samples: List[str], batch_size: int = 16 ) -> torch.FloatTensor:
+        r""" Scores each sample by the reward head output at its last token before the end of text token.
+            Samples are sorted by token length and scored in micro-batches of batch_size, each padded only to its
+            longest sample. Padding follows the scored token, so with causal attention it doesn't change the scores.
+        """
+        if len( samples ) == 0: return torch.zeros( 0, dtype = torch.float32 )
+        samples = [ "<|startoftext|>" + sample + "<|endoftext|>" for sample in samples ]
+        token_ids = self.tokenizer( samples, truncation = False )["input_ids"]
+        order = sorted( range( len( token_ids ) ), key = lambda index: len( token_ids[index] ) )
+        scores = torch.zeros( len( samples ), dtype = torch.float32 )
+        for start in range( 0, len( order ), batch_size ):
+            batch = order[ start : start + batch_size ]
+            lengths = torch.tensor( [ len( token_ids[index] ) for index in batch ] )
+            input_ids = torch.full( ( len( batch ), lengths.max().item() ), self.PAD_ID, dtype = torch.long )
+            for row, index in enumerate( batch ):
+                input_ids[ row, :lengths[row] ] = torch.tensor( token_ids[index] )
+            attention_mask = ( torch.arange( input_ids.shape[1] ) < lengths[:, None] ).long()
+            input_ids, attention_mask = input_ids.to( self.device ), attention_mask.to( self.device )
+            with torch.no_grad():
+                hidden_states = self.transformer( input_ids, attention_mask = attention_mask )[0]
+                rewards = self.v_head( hidden_states ).squeeze( -1 )
+            scores[ batch ] = self.gather_end_scores( input_ids, rewards ).float().cpu()
+        return scores
+
+    def gather_end_scores( self, input_ids: torch.LongTensor, rewards: torch.FloatTensor ) -> torch.FloatTensor:
+        r""" Returns the reward of each row at the token preceding its first pad token, or at its last token. """
+        is_pad = input_ids == self.PAD_ID
+        end = torch.where( is_pad.any( dim = 1 ), is_pad.int().argmax( dim = 1 ), input_ids.shape[1] )
+        return rewards[ torch.arange( rewards.shape[0], device = rewards.device ), end - 1 ]
+
     def forward(
         self,
         input_ids=None,
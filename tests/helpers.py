@@ -15,6 +15,9 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import os
+import importlib.util
+from types import ModuleType
 from typing import Union, Optional
 from bittensor import Balance, NeuronInfo, axon_info, PrometheusInfo, Keypair, __ss58_format__
 from scalecodec import ss58_encode
@@ -23,6 +26,16 @@ from rich.text import Text
 
 from Crypto.Hash import keccak
 
+def load_module_from_path( name: str, path: str ) -> ModuleType:
+    r""" Imports the module at path, relative to the repository root, without adding its directory to sys.path.
+        Used for neurons/ modules, which are scripts rather than part of an installed package.
+    """
+    root = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+    spec = importlib.util.spec_from_file_location( name, os.path.join( root, path ) )
+    module = importlib.util.module_from_spec( spec )
+    spec.loader.exec_module( module )
+    return module
+
 class CLOSE_IN_VALUE():
     value: Union[float, int, Balance]
     tolerance: Union[float, int, Balance]
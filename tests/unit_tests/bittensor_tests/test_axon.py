@@ -18,10 +18,13 @@
 
 import time
 import grpc
+import asyncio
 import uuid
+import pytest
 import unittest
 import unittest.mock as mock
 from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import bittensor
 from bittensor.utils.test_utils import get_random_unused_port
@@ -325,3 +328,123 @@ class TestExternalAxon(unittest.TestCase):
 
         assert f'{internal_ip}:{internal_port}' == full_address1, f'{internal_ip}:{internal_port} is not eq to {full_address1}'
         assert f'{external_ip}:{external_port}' != full_address1, f'{external_ip}:{external_port} is eq to {full_address1}'
+
+def _tampered( signed: str ) -> str:
+    nonce, sender_hotkey, signature, receptor_uuid = signed.split( '.' )
+    return '.'.join( [ nonce, sender_hotkey, signature, str( uuid.uuid1() ) ] )
+
+def _check( interceptor, signed: str ):
+    nonce, sender_hotkey, signature, receptor_uuid = interceptor.parse_signature_v2( signed )
+    interceptor.check_signature( nonce, sender_hotkey, signature, receptor_uuid )
+
+def test_auth_interceptor_check_signature():
+    interceptor = bittensor._axon.AuthInterceptor( receiver_hotkey = wallet.hotkey.ss58_address )
+    signed = sign_v2( sender_wallet, wallet )
+    _check( interceptor, signed )
+    # Replays are rejected.
+    with pytest.raises( Exception, match = 'Nonce is too small' ):
+        _check( interceptor, signed )
+    # A signature over another message does not verify.
+    with pytest.raises( Exception, match = 'Signature mismatch' ):
+        _check( interceptor, _tampered( sign_v2( sender_wallet, wallet ) ) )
+    # The sender public key is parsed once.
+    _check( interceptor, sign_v2( sender_wallet, wallet ) )
+    assert interceptor.public_key.cache_info().misses == 1
+    assert interceptor.public_key.cache_info().hits >= 2
+
+def test_nonce_store_is_bounded():
+    store = bittensor._axon.NonceStore( max_size = 2, ttl = 60 )
+    assert store.update( 'a', 1 ) and store.update( 'b', 1 ) and store.update( 'c', 1 )
+    assert len( store ) == 2 and 'a' not in store
+    assert not store.update( 'c', 1 )
+    assert store.update( 'c', 2 ) and store[ 'c' ] == 2
+
+    store = bittensor._axon.NonceStore( ttl = 10 )
+    with mock.patch( 'time.monotonic', return_value = 0 ):
+        store.update( 'a', 1 )
+    with mock.patch( 'time.monotonic', return_value = 5 ):
+        store.update( 'b', 1 )
+    with mock.patch( 'time.monotonic', return_value = 12 ):
+        store.update( 'c', 1 )
+    assert 'a' not in store and 'b' in store and 'c' in store
+
+def test_nonce_store_floors_dropped_endpoints():
+    store = bittensor._axon.NonceStore( max_size = 1, ttl = 10 )
+    assert store.update( 'victim:a', 5 ) and store.update( 'attacker:a', 1 )
+    assert 'victim:a' not in store
+    # The dropped endpoint and the other endpoints of its hotkey keep rejecting nonces up to its last one.
+    assert not store.is_fresh( 'victim:a', 5 ) and not store.update( 'victim:b', 4 )
+    assert store.update( 'victim:b', 6 )
+
+    # So do endpoints which expired.
+    store = bittensor._axon.NonceStore( ttl = 10 )
+    with mock.patch( 'time.monotonic', return_value = 0 ):
+        store.update( 'victim:a', 5 )
+    with mock.patch( 'time.monotonic', return_value = 20 ):
+        assert store.update( 'other:a', 1 ) and 'victim:a' not in store
+        assert not store.update( 'victim:a', 5 ) and store.update( 'victim:a', 6 )
+
+def test_auth_interceptor_rejects_replay_after_eviction():
+    interceptor = bittensor._axon.AuthInterceptor( receiver_hotkey = wallet.hotkey.ss58_address, max_nonces = 2 )
+    captured = sign_v2( sender_wallet, wallet )
+    _check( interceptor, captured )
+    # An attacker pushes the victim endpoint out with fresh endpoints of its own.
+    attacker = bittensor.Keypair.create_from_mnemonic( bittensor.Keypair.generate_mnemonic() )
+    for _ in range( 3 ):
+        _check( interceptor, sign_v2( SimpleNamespace( hotkey = attacker ), wallet ) )
+    assert len( interceptor.nonces ) == 2
+    with pytest.raises( Exception, match = 'Nonce is too small' ):
+        _check( interceptor, captured )
+    # The victim's new requests still pass.
+    _check( interceptor, sign_v2( sender_wallet, wallet ) )
+
+def test_auth_interceptor_verification_pool():
+    interceptor = bittensor._axon.AuthInterceptor( receiver_hotkey = wallet.hotkey.ss58_address, verification_processes = 1 )
+    try:
+        _check( interceptor, sign_v2( sender_wallet, wallet ) )
+        assert interceptor._verification_pool is not None
+        with pytest.raises( Exception, match = 'Signature mismatch' ):
+            _check( interceptor, _tampered( sign_v2( sender_wallet, wallet ) ) )
+    finally:
+        interceptor.close()
+
+def test_async_auth_interceptor_check_signature():
+    interceptor = bittensor._axon.AsyncAuthInterceptor( receiver_hotkey = wallet.hotkey.ss58_address )
+    async def check( signed: str ):
+        await interceptor.async_check_signature( *interceptor.parse_signature_v2( signed ) )
+    signed = sign_v2( sender_wallet, wallet )
+    asyncio.run( check( signed ) )
+    with pytest.raises( Exception, match = 'Nonce is too small' ):
+        asyncio.run( check( signed ) )
+    with pytest.raises( Exception, match = 'Signature mismatch' ):
+        asyncio.run( check( _tampered( sign_v2( sender_wallet, wallet ) ) ) )
+
+class SleepingSynapse( bittensor.TextPromptingSynapse ):
+    def forward( self, messages ):
+        time.sleep( 0.5 )
+        return messages[0]['content']
+    def backward( self, messages, response, rewards ): pass
+    def priority( self, call: bittensor.SynapseCall ) -> float: return 0.0
+    def blacklist( self, call: bittensor.SynapseCall ) -> bool: return False
+
+def test_asyncio_axon_forward():
+    port = get_random_unused_port()
+    # A single handler thread would serve the requests below one after the other.
+    axon = bittensor.axon( wallet = wallet, metagraph = None, port = port, external_ip = '127.0.0.1', max_workers = 1, use_asyncio = True )
+    SleepingSynapse( axon = axon )
+    axon.start()
+    try:
+        dendrites = [ bittensor.text_prompting( axon = axon.info(), keypair = sender_wallet.hotkey, ip = '127.0.0.1' ) for _ in range( 4 ) ]
+        start = time.time()
+        calls = dendrites[0].loop.run_until_complete( asyncio.gather( *[
+            dendrite.async_forward( roles = [ 'user' ], messages = [ str( i ) ], timeout = 5 ) for i, dendrite in enumerate( dendrites )
+        ] ) )
+        assert [ call.completion for call in calls ] == [ '0', '1', '2', '3' ]
+        assert all( call.is_success for call in calls )
+        assert time.time() - start < 1.5
+    finally:
+        axon.stop()
+    assert not axon.loop_thread.is_alive()
+    assert axon.loop.is_closed()
+    # Stopping again, as __del__ does, is a no-op.
+    axon.stop()
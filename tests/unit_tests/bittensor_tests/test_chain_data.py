@@ -0,0 +1,132 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+import copy
+import pickle
+import pytest
+import torch
+import bittensor
+from bittensor._subtensor import chain_data
+from bittensor._subtensor.chain_data import ChainDataType
+
+
+def _neuron_lite_value( uid: int ) -> dict:
+    coldkey = '0x' + ( uid + 1 ).to_bytes( 32, 'little' ).hex()
+    return {
+        'hotkey': '0x' + uid.to_bytes( 32, 'little' ).hex(), 'coldkey': coldkey, 'uid': uid, 'netuid': 1, 'active': True,
+        'axon_info': { 'block': 1, 'version': 1, 'ip': 3232235777, 'port': 8091, 'ip_type': 4, 'protocol': 4, 'placeholder1': 0, 'placeholder2': 0 },
+        'prometheus_info': { 'block': 1, 'version': 1, 'ip': 0, 'port': 0, 'ip_type': 4 },
+        'stake': [ ( coldkey, 2 * 10**9 ) ], 'rank': 65535, 'emission': 10**9, 'incentive': 0, 'consensus': 0, 'trust': 0,
+        'validator_trust': 0, 'dividends': 0, 'last_update': 5, 'validator_permit': True, 'pruning_score': 3,
+    }
+
+def test_decoder_runtime_is_cached():
+    assert chain_data.get_rpc_runtime_config() is chain_data.get_rpc_runtime_config()
+    for type_name in ChainDataType:
+        assert chain_data.get_decoder_class( type_name, is_vec = True ) is chain_data.get_decoder_class( type_name, is_vec = True )
+
+def test_neuron_info_lite_list_from_vec_u8():
+    vec_u8 = list( chain_data.get_decoder_class( ChainDataType.NeuronInfoLite, is_vec = True )().encode( [ _neuron_lite_value( uid ) for uid in range( 3 ) ] ).data )
+    neurons = bittensor.NeuronInfoLite.list_from_vec_u8( vec_u8 )
+    assert [ neuron.uid for neuron in neurons ] == [ 0, 1, 2 ]
+    assert neurons[1].stake == bittensor.Balance.from_tao( 2 )
+    assert neurons[1].rank == 1.0
+    assert neurons[1].axon_info.ip == '192.168.1.1'
+    assert neurons[1].validator_permit
+
+def test_neuron_columns_match_neuron_objects():
+    values = [ _neuron_lite_value( uid ) for uid in range( 3 ) ]
+    values[2]['stake'] = []
+    values[2]['axon_info']['ip'] = 2**128 - 1
+    lite_vec_u8 = list( chain_data.get_decoder_class( ChainDataType.NeuronInfoLite, is_vec = True )().encode( values ).data )
+    columns = bittensor.NeuronColumns.from_vec_u8( lite_vec_u8 )
+    assert columns.uid.tolist() == [ 0, 1, 2 ]
+    assert columns.stake.tolist() == [ 2 * 10**9, 2 * 10**9, 0 ]
+    assert columns.rank.tolist() == [ 1.0, 1.0, 1.0 ]
+    reference = [ bittensor.NeuronInfoLite.fix_decoded_values( value ) for value in chain_data.from_scale_encoding( lite_vec_u8, ChainDataType.NeuronInfoLite, is_vec = True ) ]
+    assert columns.to_neurons() == bittensor.NeuronInfoLite.list_from_vec_u8( lite_vec_u8 ) == reference
+
+    for uid, value in enumerate( values ):
+        value['weights'] = [ ( target, uid + target + 1 ) for target in range( uid ) ]
+        value['bonds'] = [ ( target, 7 ) for target in range( uid ) ]
+    vec_u8 = list( chain_data.get_decoder_class( ChainDataType.NeuronInfo, is_vec = True )().encode( values ).data )
+    columns = bittensor.NeuronColumns.from_vec_u8( vec_u8, lite = False )
+    neurons = bittensor.NeuronInfo.list_from_vec_u8( vec_u8 )
+    assert columns.to_neurons() == neurons == [ bittensor.NeuronInfo.fix_decoded_values( value ) for value in chain_data.from_scale_encoding( vec_u8, ChainDataType.NeuronInfo, is_vec = True ) ]
+    weights = bittensor.utils.weight_utils.convert_sparse_weights_to_tensor( 3, *columns.weights )
+    bonds = bittensor.utils.weight_utils.convert_sparse_bonds_to_tensor( 3, *columns.bonds )
+    for neuron in neurons:
+        expected_weights = torch.zeros( 3 )
+        expected_bonds = torch.zeros( 3, dtype = torch.int64 )
+        if len( neuron.weights ) > 0:
+            expected_weights = bittensor.utils.weight_utils.convert_weight_uids_and_vals_to_tensor( 3, *zip( *neuron.weights ) )
+            expected_bonds = bittensor.utils.weight_utils.convert_bond_uids_and_vals_to_tensor( 3, *zip( *neuron.bonds ) )
+        assert torch.equal( weights[ neuron.uid ], expected_weights )
+        assert torch.equal( bonds[ neuron.uid ], expected_bonds )
+
+def test_neuron_columns_build_axons_lazily():
+    vec_u8 = list( chain_data.get_decoder_class( ChainDataType.NeuronInfoLite, is_vec = True )().encode( [ _neuron_lite_value( uid ) for uid in range( 3 ) ] ).data )
+    columns = bittensor.NeuronColumns.from_vec_u8( vec_u8 )
+    axons = columns.axons
+    assert axons._axons == [ None, None, None ]
+    assert axons[1].ip == '192.168.1.1'
+    assert axons[1] is axons[1]
+    assert axons._axons[0] is None and axons._axons[2] is None
+    assert len( bittensor.NeuronColumns.from_vec_u8( [] ) ) == 0
+
+def _delegate_value( index: int, n_nominators: int ) -> dict:
+    return {
+        'delegate_ss58': '0x' + index.to_bytes( 32, 'little' ).hex(), 'take': 11796,
+        'nominators': [ ( '0x' + ( 1000 + nominator ).to_bytes( 32, 'little' ).hex(), 10**9 + nominator ) for nominator in range( n_nominators ) ],
+        'owner_ss58': '0x' + ( index + 7 ).to_bytes( 32, 'little' ).hex(), 'registrations': [ 1, 300 ], 'validator_permits': [ 1 ],
+        'return_per_1000': 5, 'total_daily_return': 2**40,
+    }
+
+def test_delegate_info_decode_matches_scale():
+    values = [ _delegate_value( index, n_nominators ) for index, n_nominators in enumerate( [ 3, 0, 70 ] ) ]
+    vec_u8 = list( chain_data.get_decoder_class( ChainDataType.DelegateInfo, is_vec = True )().encode( values ).data )
+    reference = [ bittensor.DelegateInfo.fix_decoded_values( value ) for value in chain_data.from_scale_encoding( vec_u8, ChainDataType.DelegateInfo, is_vec = True ) ]
+    delegates = bittensor.DelegateInfo.list_from_vec_u8( vec_u8 )
+    assert delegates == reference
+    assert delegates[2].total_stake == bittensor.Balance.from_rao( sum( 10**9 + nominator for nominator in range( 70 ) ) )
+    assert delegates[0].registrations == [ 1, 300 ] and delegates[0].validator_permits == [ 1 ]
+    assert bittensor.DelegateInfo.list_from_vec_u8( [] ) == []
+
+    single = list( chain_data.get_decoder_class( ChainDataType.DelegateInfo )().encode( values[0] ).data )
+    assert bittensor.DelegateInfo.from_vec_u8( single ) == reference[0]
+    delegated = list( chain_data.get_decoder_class( ChainDataType.DelegatedInfo, is_vec = True )().encode( [ ( values[0], 42 ) ] ).data )
+    assert bittensor.DelegateInfo.delegated_list_from_vec_u8( delegated ) == [ ( reference[0], bittensor.Balance.from_rao( 42 ) ) ]
+
+def test_records_materialize_lazily():
+    vec_u8 = list( chain_data.get_decoder_class( ChainDataType.NeuronInfoLite, is_vec = True )().encode( [ _neuron_lite_value( uid ) for uid in range( 2 ) ] ).data )
+    neuron = bittensor.NeuronInfoLite.list_from_vec_u8( vec_u8 )[1]
+    assert not hasattr( neuron, '__dict__' )
+    assert not hasattr( neuron, '_hotkey' ) and not hasattr( neuron, '_stake_dict' ) and not hasattr( neuron, '_axon_info' )
+    assert neuron.uid == 1 and neuron.stake == bittensor.Balance.from_tao( 2 )
+    assert not hasattr( neuron, '_stake_dict' )
+    assert neuron.hotkey is neuron.hotkey
+    assert neuron.axon_info.hotkey == neuron.hotkey
+
+    # Records still construct, compare, assign, copy and pickle like the dataclasses they replace.
+    neuron.stake = bittensor.Balance.from_tao( 3 )
+    assert neuron.stake == bittensor.Balance.from_tao( 3 )
+    assert pickle.loads( pickle.dumps( neuron ) ) == neuron == copy.deepcopy( neuron )
+    null = bittensor.NeuronInfoLite._null_neuron()
+    assert null.is_null and null != neuron
+    with pytest.raises( TypeError ):
+        bittensor.DelegateInfo( take = 0.1 )
@@ -0,0 +1,99 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import torch
+import asyncio
+import bittensor
+from unittest.mock import MagicMock, patch
+
+
+def _axon( hotkey: str, ip: str = '1.2.3.4', port: int = 8091 ) -> 'bittensor.axon_info':
+    return bittensor.axon_info( version = 1, ip = ip, port = port, ip_type = 4, hotkey = hotkey, coldkey = 'coldkey' )
+
+def test_external_ip_is_cached():
+    bittensor.utils.networking._external_ip_cache['ip'] = None
+    with patch( 'bittensor.utils.networking.get_external_ip', return_value = '5.6.7.8' ) as get_external_ip:
+        assert bittensor.utils.networking.get_external_ip_cached() == '5.6.7.8'
+        assert bittensor.utils.networking.get_external_ip_cached() == '5.6.7.8'
+        assert get_external_ip.call_count == 1
+        bittensor.utils.networking.get_external_ip_cached( max_age = -1 )
+        assert get_external_ip.call_count == 2
+
+def test_dendrite_pool_resync_reuses_channels():
+    keypair = bittensor.Keypair.create_from_mnemonic( bittensor.Keypair.generate_mnemonic() )
+    metagraph = MagicMock( axons = [ _axon( 'a' ), _axon( 'b' ), _axon( 'c' ) ] )
+    with patch( 'bittensor.utils.networking.get_external_ip_cached', return_value = '5.6.7.8' ):
+        pool = bittensor.text_prompting_pool( keypair = keypair, metagraph = metagraph )
+    assert pool.stats.open_channels == pool.stats.channels_created == 3
+    a, b, c = pool.dendrites
+
+    # b moved port, c was replaced by d, e is new.
+    metagraph.axons = [ _axon( 'a' ), _axon( 'b', port = 9000 ), _axon( 'd' ), _axon( 'e' ) ]
+    stats = pool.resync( metagraph )
+    assert pool.dendrites[0] is a
+    assert pool.dendrites[1] is not b and pool.dendrites[1].axon_info.port == 9000
+    assert [ dendrite.axon_info.hotkey for dendrite in pool.dendrites ] == [ 'a', 'b', 'd', 'e' ]
+    assert [ dendrite.uid for dendrite in pool.dendrites ] == [ 0, 1, 2, 3 ]
+    assert stats.reused_last_resync == 1
+    assert stats.reconnects == 2
+    assert stats.channels_created == 6
+    assert stats.channels_closed == 2
+    assert stats.open_channels == 4
+
+    # An unchanged metagraph keeps every channel.
+    dendrites = list( pool.dendrites )
+    stats = pool.resync( metagraph )
+    assert pool.dendrites == dendrites
+    assert stats.reused_last_resync == 4 and stats.channels_created == 6
+
+def _pool_with_delays( delays ):
+    keypair = bittensor.Keypair.create_from_mnemonic( bittensor.Keypair.generate_mnemonic() )
+    metagraph = MagicMock( axons = [ _axon( str( uid ) ) for uid in range( len( delays ) ) ], n = torch.tensor( len( delays ) ) )
+    with patch( 'bittensor.utils.networking.get_external_ip_cached', return_value = '5.6.7.8' ):
+        pool = bittensor.text_prompting_pool( keypair = keypair, metagraph = metagraph )
+    for dendrite, delay in zip( pool.dendrites, delays ):
+        async def apply( dendrite_call, delay = delay ):
+            try:
+                await asyncio.sleep( delay )
+                dendrite_call.completion = 'completion {}'.format( dendrite_call.dendrite.uid )
+            except asyncio.CancelledError:
+                dendrite_call.return_code = bittensor.proto.ReturnCode.Timeout
+            dendrite_call.end()
+            return dendrite_call
+        dendrite.apply = apply
+    return pool
+
+def test_dendrite_pool_forward_as_completed():
+    pool = _pool_with_delays( [ 0.3, 0.0, 0.2, 0.1 ] )
+
+    async def stream( **kwargs ):
+        return [ call async for call in pool.async_forward_as_completed( roles = [ 'user' ], messages = [ 'hi' ], **kwargs ) ]
+
+    calls = pool.loop.run_until_complete( stream() )
+    assert [ call.dendrite.uid for call in calls ] == [ 1, 3, 2, 0 ]
+    assert all( call.is_success for call in calls )
+
+    # The two slowest calls are cancelled once two completions arrived.
+    calls = pool.loop.run_until_complete( stream( first_k = 2 ) )
+    assert [ call.dendrite.uid for call in calls[:2] ] == [ 1, 3 ]
+    assert sorted( call.dendrite.uid for call in calls[2:] ) == [ 0, 2 ]
+    assert all( call.did_timeout for call in calls[2:] )
+
+    # forward keeps the order of the uids.
+    calls = pool.forward( roles = [ 'user' ], messages = [ 'hi' ], uids = [ 0, 1, 2, 3 ], deadline = 0.15 )
+    assert [ call.dendrite.uid for call in calls ] == [ 0, 1, 2, 3 ]
+    assert [ call.is_success for call in calls ] == [ False, True, False, True ]
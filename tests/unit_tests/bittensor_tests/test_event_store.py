@@ -0,0 +1,110 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import os
+import gzip
+import torch
+
+from tests.helpers import load_module_from_path
+
+event_store = load_module_from_path( 'event_store', 'neurons/text/prompting/validators/core/event_store.py' )
+EventStore, parse_size = event_store.EventStore, event_store.parse_size
+
+def _fill( store: EventStore, events: int, uids_per_event: int = 2 ):
+    # Event step s rewards uids s and s + 1 with s and s + 0.5, at block 10 * s.
+    for step in range( events ):
+        store.append( [ step + i for i in range( uids_per_event ) ], [ step + 0.5 * i for i in range( uids_per_event ) ], block = 10 * step )
+
+def test_ring_wraps_oldest_first():
+    store = EventStore( capacity = 5 )
+    _fill( store, 2 )
+    assert len( store ) == 4 and store.columns()['uids'].tolist() == [ 0, 1, 1, 2 ]
+    _fill( store, 2 )
+    columns = store.columns()
+    assert len( store ) == 5 and store.num_events == 4 and store.head == 3
+    # The oldest three rows were overwritten, the rest read back in append order.
+    assert columns['steps'].tolist() == [ 1, 2, 2, 3, 3 ]
+    assert columns['uids'].tolist() == [ 2, 0, 1, 1, 2 ]
+    assert columns['blocks'].tolist() == [ 10, 0, 0, 10, 10 ]
+
+def test_windows():
+    store = EventStore( capacity = 100 )
+    _fill( store, 5 )
+    assert store.columns( last_events = 2 )['steps'].tolist() == [ 3, 3, 4, 4 ]
+    assert store.columns( since_block = 25 )['steps'].tolist() == [ 3, 3, 4, 4 ]
+    assert store.columns( since_block = 10, last_events = 4 )['steps'].tolist() == [ 1, 1, 2, 2, 3, 3, 4, 4 ]
+    assert len( store.columns( since_block = 100 )['steps'] ) == 0
+    assert len( store.columns( last_events = 0 )['steps'] ) == 0
+
+    # Wrapped: rows of steps 2 to 6 are held, split across the end of the buffer.
+    wrapped = EventStore( capacity = 10 )
+    _fill( wrapped, 7 )
+    assert wrapped.head == 4
+    assert wrapped.columns()['steps'].tolist() == [ 2, 2, 3, 3, 4, 4, 5, 5, 6, 6 ]
+    assert wrapped.columns( last_events = 3 )['steps'].tolist() == [ 4, 4, 5, 5, 6, 6 ]
+    assert wrapped.columns( since_block = 35 )['blocks'].tolist() == [ 40, 40, 50, 50, 60, 60 ]
+    assert wrapped.columns( last_events = 100 )['steps'].tolist() == wrapped.columns()['steps'].tolist()
+    blocks, rewards = wrapped.uid_history( 5, last_events = 3 )
+    assert blocks.tolist() == [ 40, 50 ] and rewards.tolist() == [ 4.5, 5.0 ]
+
+def test_means_and_counts_drop_uids_above_n():
+    store = EventStore( capacity = 100 )
+    store.append( [ 0, 1, 7 ], [ 1.0, 2.0, 9.0 ], block = 1 )
+    store.append( [ 0, 9 ], [ 3.0, 9.0 ], block = 2 )
+    assert store.mean_rewards( 3 ).tolist() == [ 2.0, 2.0, 0.0 ]
+    assert store.reward_counts( 3 ).tolist() == [ 2, 1, 0 ]
+    assert store.mean_rewards( 3, since_block = 2 ).tolist() == [ 3.0, 0.0, 0.0 ]
+    # n above every held uid pads with zeros.
+    assert store.reward_counts( 12 ).tolist() == [ 2, 1, 0, 0, 0, 0, 0, 1, 0, 1, 0, 0 ]
+    assert EventStore().mean_rewards( 2 ).tolist() == [ 0.0, 0.0 ]
+
+def test_log_round_trip_and_truncated_member( tmp_path ):
+    path = str( tmp_path / 'events' / 'completions.jsonl.gz' )
+    store = EventStore( capacity = 6, log_path = path, flush_every = 2 )
+    _fill( store, 3 )
+    store.append( [ 4 ], [ 1.5 ], block = 40, message = 'prompt', completion = 'best', all_uids = torch.tensor( [ 4, 5 ] ), all_completions = [ 'best', '' ], is_question = True )
+    store.flush()
+    records = list( EventStore.read_log( path ) )
+    assert [ record['step'] for record in records ] == [ 0, 1, 2, 3 ]
+    assert records[3]['all_uids'] == [ 4, 5 ] and records[3]['completion'] == 'best' and records[3]['is_question']
+
+    rebuilt = EventStore.from_log( path, capacity = 6 )
+    assert rebuilt.num_events == store.num_events
+    for name, column in store.columns().items():
+        assert torch.equal( rebuilt.columns()[ name ], column ), name
+
+    # A member cut short by a crash ends the log at the last complete one.
+    member = gzip.compress( b'{"step": 4, "block": 50, "uids": [ 1 ], "rewards": [ 1.0 ]}\n' )
+    with open( path, 'ab' ) as file:
+        file.write( member[ : len( member ) // 2 ] )
+    assert [ record['step'] for record in EventStore.read_log( path ) ] == [ 0, 1, 2, 3 ]
+
+def test_rotation( tmp_path ):
+    path = str( tmp_path / 'completions.jsonl.gz' )
+    store = EventStore( log_path = path, flush_every = 1, rotation_bytes = 1 )
+    _fill( store, 3 )
+    # Rotations within the same second keep distinct files.
+    assert len( os.listdir( str( tmp_path ) ) ) == 3
+    assert [ record['step'] for record in EventStore.read_log( path ) ] == [ 2 ]
+
+def test_parse_size():
+    assert parse_size( '2 GB' ) == 2 * 1000**3
+    assert parse_size( '2 GiB' ) == 2 * 1024**3
+    assert parse_size( '500 MB' ) == 500 * 1000**2
+    # Lower case b are bits, as in loguru.
+    assert parse_size( '8 kb' ) == 1000
+    assert parse_size( '1 week' ) is None and parse_size( '00:00' ) is None and parse_size( '100' ) is None
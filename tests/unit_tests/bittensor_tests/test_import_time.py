@@ -0,0 +1,98 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import os
+import sys
+import subprocess
+from typing import Dict
+
+import pytest
+import bittensor
+
+# Modules the light entry points must not pull in, they cost seconds to import.
+HEAVY_MODULES = ( 'torch', 'langchain', 'transformers', 'pandas', 'grpc' )
+
+# Generous budget in seconds, well above the measured cost, so that a slow machine does not fail the suite but a
+# heavy eager import does. Override with BT_IMPORT_TIME_BUDGET.
+IMPORT_TIME_BUDGET = float( os.environ.get( 'BT_IMPORT_TIME_BUDGET', 2.5 ) )
+
+# Names the eager bittensor/__init__.py exported, all of which must still resolve.
+EAGER_NAMESPACE = (
+    'Any', 'BackwardTextPromptingRequest', 'BackwardTextPromptingResponse', 'Balance', 'BasePromptingMiner',
+    'BittensorLLM', 'CLI', 'Config', 'Console', 'Dataset', 'DelegateInfo', 'Dendrite', 'DendriteCall', 'Dict',
+    'ForwardTextPromptingRequest', 'ForwardTextPromptingResponse', 'Info', 'Ipfs', 'KeyFileError', 'Keyfile', 'Keypair',
+    'LLM', 'List', 'Mapping', 'MultiForwardTextPromptingRequest', 'MultiForwardTextPromptingResponse', 'NeuronInfo',
+    'NeuronInfoLite', 'Optional', 'PriorityThreadPoolExecutor', 'PrometheusInfo', 'Serializer', 'SubnetInfo',
+    'Subtensor', 'Synapse', 'SynapseCall', 'TextPromptingSynapse', 'Tuple', 'Union', 'Wallet',
+    '__bellagene_entrypoint__', '__blocktime__', '__console__', '__datasets__', '__delegates_details_url__',
+    '__finney_entrypoint__', '__local_entrypoint__', '__mock_chain_db__', '__mock_entrypoint__', '__network_dim__',
+    '__network_explorer_map__', '__networks__', '__new_signature_version__', '__nobunaga_entrypoint__',
+    '__pipaddress__', '__prometheus_version__', '__prometheus_version__as_int__', '__rao_symbol__',
+    '__ss58_address_length__', '__ss58_format__', '__tao_symbol__', '__type_registry__', '__use_console__',
+    '__version__', '__version_as_int__', '__vocab_size__', '_axon', '_cli', '_config', '_dataset', '_dendrite', '_ipfs',
+    '_keyfile', '_logging', '_metagraph', '_prometheus', '_proto', '_serializer', '_subtensor', '_synapse',
+    '_threadpool', '_tokenizer', '_wallet', 'axon', 'axon_info', 'bt_promo_info', 'cli', 'cli_utils',
+    'compact_topk_token_phrases', 'config', 'dataset', 'debug', 'default_prompt', 'default_prompting_validator_key',
+    'defaults', 'get_random_unused_port', 'grpc', 'install', 'keyfile', 'logger', 'logging', 'metagraph',
+    'mock_subtensor_port', 'nest_asyncio', 'prep_tokenizer', 'prioritythreadpool', 'prometheus',
+    'prometheus_version__split', 'prompt', 'prompting', 'proto', 'serializer', 'subtensor', 'text_prompting',
+    'text_prompting_pool', 'tokenizer', 'topk_token_phrases', 'torch', 'trace', 'turn_console_off', 'unbiased_topk',
+    'unravel_topk_token_phrases', 'utils', 'version_split', 'wallet',
+)
+
+REPO_ROOT = os.path.dirname( os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) ) )
+
+def _import_times( code: str ) -> Dict[str, float]:
+    r""" Runs code in a fresh interpreter with -X importtime and returns the cumulative seconds of each module. """
+    env = dict( os.environ, PYTHONPATH = REPO_ROOT )
+    stderr = subprocess.run( [ sys.executable, '-X', 'importtime', '-c', code ], cwd = REPO_ROOT, env = env, capture_output = True, text = True, check = True ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith( 'import time:' ) or 'cumulative' in line: continue
+        _, cumulative, name = line.split( '|' )
+        times[ name.strip() ] = int( cumulative ) / 1e6
+    return times
+
+@pytest.mark.parametrize( 'code', [
+    'import bittensor',
+    'import bittensor; bittensor.cli.__create_parser__()',
+    'import bittensor; bittensor.wallet( _mock = True ); bittensor.defaults.wallet.name',
+] )
+def test_light_imports_skip_heavy_modules( code: str ):
+    times = _import_times( code )
+    heavy = [ name for name in times if name.split( '.' )[0] in HEAVY_MODULES ]
+    assert heavy == [], heavy
+    assert times[ 'bittensor' ] < IMPORT_TIME_BUDGET, times[ 'bittensor' ]
+
+def test_lazy_attributes():
+    assert bittensor.Subtensor is bittensor._subtensor.subtensor_impl.Subtensor
+    assert bittensor.logger is bittensor.logging
+    assert set( bittensor._LAZY_ATTRIBUTES ) <= set( dir( bittensor ) )
+    with pytest.raises( AttributeError ):
+        bittensor.not_an_attribute
+
+def test_eager_namespace_resolves():
+    missing = [ name for name in EAGER_NAMESPACE if not hasattr( bittensor, name ) ]
+    assert missing == [], missing
+    assert isinstance( bittensor.get_random_unused_port(), int )
+
+def test_lazy_defaults():
+    defaults = bittensor._make_defaults()
+    assert 'wallet' not in defaults.keys()
+    assert defaults.wallet.name == bittensor.defaults.wallet.name
+    assert defaults.netuid == 1
+    assert set( bittensor._DEFAULTS_SECTIONS ) <= set( defaults.load().keys() )
@@ -0,0 +1,82 @@
+# The MIT License (MIT)
+# Copyright © 2023 Opentensor Foundation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import json
+import bittensor
+from unittest.mock import MagicMock, patch
+
+def _rpc_log( uid: int ):
+    bittensor.logging.rpc_log(
+        axon = False, forward = True, is_response = True, code = bittensor.proto.ReturnCode.Success, call_time = 0.25,
+        pubkey = 'hotkey', uid = uid, inputs = None, outputs = [ 3, 4 ], message = 'Success', synapse = 'text_prompting',
+    )
+
+def test_rpc_log_short_circuits_below_debug():
+    bittensor.logging.set_debug( False )
+    bittensor.logging.set_trace( False )
+    call = MagicMock()
+    with patch( 'bittensor._logging.logger' ) as logger:
+        _rpc_log( 1 )
+        bittensor.logging.debug( 'message' )
+        bittensor.DendriteCall.log_outbound( call )
+        assert not logger.debug.called
+    assert not bittensor.logging.rpc_log_enabled()
+    assert not call.get_inputs_shape.called
+
+    bittensor.logging.set_debug( True )
+    try:
+        with patch( 'bittensor._logging.logger' ) as logger:
+            _rpc_log( 1 )
+            assert logger.debug.call_args[1]['uid_str'].strip() == '1'
+    finally:
+        bittensor.logging.set_debug( False )
+
+def test_rpc_sink_writes_json_lines( tmp_path ):
+    path = tmp_path / 'rpc' / 'calls.jsonl'
+    sink = bittensor.logging.add_rpc_sink( str( path ), batch_size = 4 )
+    try:
+        assert bittensor.logging.rpc_log_enabled()
+        for uid in range( 10 ):
+            _rpc_log( uid )
+        assert sink.flush( timeout = 5 )
+        records = [ json.loads( line ) for line in path.read_text().splitlines() ]
+        assert [ record['uid'] for record in records ] == list( range( 10 ) )
+        assert records[0]['code'] == 'Success' and records[0]['shape'] == [ 3, 4 ] and records[0]['call_time'] == 0.25
+        assert sink.stats.written == 10 and sink.stats.batches >= 3
+    finally:
+        bittensor.logging.remove_rpc_sink()
+    assert not bittensor.logging.rpc_log_enabled()
+
+def test_rpc_sink_survives_bad_records_and_write_errors( tmp_path ):
+    import torch
+    from bittensor._logging.rpc_sink import RpcLogSink
+    path = tmp_path / 'calls.jsonl'
+    sink = RpcLogSink( str( path ), flush_interval = 0.05 )
+    try:
+        sink.put( ( 0, False, True, True, 0, 0.1, 'hotkey', torch.tensor( 3 ), None, 'Success', None ) )
+        sink.put( ( 0, False, True, True, 0, 0.1, 'hotkey', 4, 7, 'Success', None ) )
+        assert sink.flush( timeout = 5 )
+        with patch.object( sink, '_file' ) as file:
+            file.write.side_effect = OSError( 'disk full' )
+            sink.put( ( 0, False, True, True, 0, 0.1, 'hotkey', 5, None, 'Success', None ) )
+            assert sink.flush( timeout = 5 )
+        sink.put( ( 0, False, True, True, 0, 0.1, 'hotkey', 6, None, 'Success', None ) )
+        assert sink.flush( timeout = 5 )
+        assert [ json.loads( line )['uid'] for line in path.read_text().splitlines() ] == [ 'tensor(3)', 6 ]
+        assert sink.stats.format_errors == 1 and sink.stats.write_errors == 1 and sink.stats.written == 2
+    finally:
+        sink.close()
@@ -15,7 +15,12 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import copy
+import torch
 import bittensor
+from unittest.mock import MagicMock, patch
+from bittensor._metagraph import NEURON_COLUMNS
+from bittensor._subtensor.chain_data import ChainDataType, get_decoder_class
 
 
 def test_metagraph():
@@ -26,4 +31,177 @@ def test_metagraph():
     assert metagraph.n == 0
     assert len(metagraph.hotkeys) == 0
     assert len(metagraph.coldkeys) == 0
-    assert len(metagraph.uids) == 0
\ No newline at end of file
+    assert len(metagraph.uids) == 0
+
+def _neuron_value( uid: int, hotkey: int, stake: int = 0, last_update: int = 0, ip: int = 0 ) -> dict:
+    coldkey = '0x' + ( hotkey + 1000 ).to_bytes( 32, 'little' ).hex()
+    return {
+        'hotkey': '0x' + hotkey.to_bytes( 32, 'little' ).hex(), 'coldkey': coldkey, 'uid': uid, 'netuid': 1, 'active': True,
+        'axon_info': { 'block': 1, 'version': 1, 'ip': ip, 'port': 8091, 'ip_type': 4, 'protocol': 4, 'placeholder1': 0, 'placeholder2': 0 },
+        'prometheus_info': { 'block': 1, 'version': 1, 'ip': 0, 'port': 0, 'ip_type': 4 },
+        'stake': [ ( coldkey, stake ) ], 'rank': uid, 'emission': 0, 'incentive': 0, 'consensus': 0, 'trust': 0,
+        'validator_trust': 0, 'dividends': 0, 'last_update': last_update, 'validator_permit': False, 'pruning_score': 0,
+    }
+
+def _sync_with( metagraph, values, block: int, incremental: bool ):
+    vec_u8 = list( get_decoder_class( ChainDataType.NeuronInfoLite, is_vec = True )().encode( values ).data )
+    subtensor = MagicMock( block = block )
+    subtensor.neuron_columns.return_value = bittensor.NeuronColumns.from_vec_u8( vec_u8 )
+    with patch( 'bittensor.subtensor', return_value = subtensor ):
+        metagraph.sync( lite = True, incremental = incremental )
+
+def test_metagraph_incremental_sync():
+    metagraph = bittensor.metagraph( netuid = 1, network = 'mock', sync = False )
+    values = [ _neuron_value( uid, uid, stake = uid ) for uid in range( 4 ) ]
+    _sync_with( metagraph, values, block = 10, incremental = True )
+    assert metagraph.diff.full
+    assert metagraph.n.item() == 4
+
+    updated = copy.deepcopy( values ) + [ _neuron_value( 4, 4, stake = 4 ) ]
+    updated[1] = _neuron_value( 1, 99, stake = 7 )
+    updated[2]['last_update'] = 9
+    updated[3]['axon_info']['ip'] = 16909060
+    _sync_with( metagraph, updated, block = 20, incremental = True )
+
+    diff = metagraph.diff
+    assert not diff.full
+    assert diff.block == 20
+    assert diff.new_uids == [ 4 ]
+    assert diff.changed == [ 1, 2, 3 ]
+    assert diff.hotkey_changed == [ 1 ]
+    assert diff.stake_changed == [ 1 ]
+    assert diff.updated == [ 2 ]
+    assert diff.axon_changed == [ 1, 3 ]
+    assert metagraph.axons[3].ip == '1.2.3.4'
+
+    # The patched metagraph must match one built from scratch.
+    rebuilt = bittensor.metagraph( netuid = 1, network = 'mock', sync = False )
+    _sync_with( rebuilt, updated, block = 20, incremental = False )
+    assert metagraph.n.item() == rebuilt.n.item() == 5
+    assert metagraph.hotkeys == rebuilt.hotkeys
+    assert metagraph.axons == rebuilt.axons
+    assert metagraph.neurons == rebuilt.neurons
+    for name, _, _ in NEURON_COLUMNS:
+        assert torch.equal( getattr( metagraph, name ), getattr( rebuilt, name ) ), name
+
+def test_metagraph_key_index( tmp_path ):
+    metagraph = bittensor.metagraph( netuid = 1, network = 'mock', sync = False )
+    assert metagraph.uid_for_hotkey( 'unknown' ) is None
+    values = [ _neuron_value( uid, uid ) for uid in range( 4 ) ]
+    values[3]['coldkey'] = values[1]['coldkey']
+    _sync_with( metagraph, values, block = 10, incremental = True )
+    hotkeys, coldkeys = metagraph.hotkeys, metagraph.coldkeys
+    for uid in range( 4 ):
+        assert metagraph.uid_for_hotkey( hotkeys[uid] ) == hotkeys.index( hotkeys[uid] ) == uid
+        assert metagraph.is_registered( hotkeys[uid] )
+    assert metagraph.uids_for_coldkey( coldkeys[1] ) == [ 1, 3 ]
+    assert metagraph.uids_for_coldkey( coldkeys[0] ) == [ 0 ]
+    assert metagraph.uids_for_coldkey( 'unknown' ) == []
+
+    # A re-registered uid drops the previous hotkey from the index.
+    updated = copy.deepcopy( values )
+    updated[2] = _neuron_value( 2, 99 )
+    _sync_with( metagraph, updated, block = 20, incremental = True )
+    assert not metagraph.is_registered( hotkeys[2] )
+    assert metagraph.uid_for_hotkey( metagraph.hotkeys[2] ) == 2
+
+    metagraph.save_to_path( str( tmp_path ) )
+    loaded = bittensor.metagraph( netuid = 1, network = 'mock', sync = False ).load_from_path( str( tmp_path ) )
+    assert loaded._hotkey_to_uid == metagraph._hotkey_to_uid
+    assert loaded._coldkey_to_uids == metagraph._coldkey_to_uids
+
+def _sync_full_with( metagraph, values, block: int, incremental: bool, layout = None ):
+    vec_u8 = list( get_decoder_class( ChainDataType.NeuronInfo, is_vec = True )().encode( values ).data )
+    subtensor = MagicMock( block = block )
+    subtensor.neuron_columns.return_value = bittensor.NeuronColumns.from_vec_u8( vec_u8, lite = False )
+    with patch( 'bittensor.subtensor', return_value = subtensor ):
+        metagraph.sync( lite = False, incremental = incremental, layout = layout )
+
+def test_metagraph_sparse_weights_and_bonds():
+    values = [ _neuron_value( uid, uid ) for uid in range( 4 ) ]
+    for uid, value in enumerate( values ):
+        value['weights'] = [ ( target, 1 + uid ) for target in range( 0, 4, 2 ) ] if uid % 2 == 0 else []
+        value['bonds'] = [ ( uid, 5 ) ]
+    metagraph = bittensor.metagraph( netuid = 1, network = 'mock', sync = False )
+    _sync_full_with( metagraph, values, block = 1, incremental = False )
+    assert metagraph.W.layout == torch.strided
+    for layout in ( torch.sparse_coo, torch.sparse_csr ):
+        sparse = bittensor.metagraph( netuid = 1, network = 'mock', sync = False, layout = layout )
+        _sync_full_with( sparse, values, block = 1, incremental = False )
+        assert sparse.W.layout == layout and sparse.B.layout == layout
+        assert torch.equal( sparse.W.to_dense(), metagraph.W )
+        assert torch.equal( sparse.B.to_dense(), metagraph.B )
+
+        # Rows which set new weights are reported as changed without densifying.
+        updated = copy.deepcopy( values )
+        updated[1]['weights'] = [ ( 3, 9 ) ]
+        updated[2]['weights'] = [ ( 0, 3 ), ( 2, 4 ) ]
+        _sync_full_with( sparse, updated, block = 2, incremental = True )
+        assert sparse.diff.changed == [ 1, 2 ]
+        assert sparse.W.layout == layout
+        assert sparse.W.to_dense()[ 1 ].tolist() == [ 0, 0, 0, 1 ]
+
+def test_metagraph_snapshots( tmp_path ):
+    metagraph = bittensor.metagraph( netuid = 1, network = 'mock', sync = False )
+    values = [ _neuron_value( uid, uid, stake = uid, ip = 16909060 ) for uid in range( 3 ) ]
+    for block in ( 10, 20, 30, 40 ):
+        values[0]['last_update'] = block
+        _sync_with( metagraph, values, block = block, incremental = True )
+        metagraph.save_to_path( str( tmp_path ) )
+    assert metagraph.saved_blocks( dir_path = str( tmp_path ) ) == [ 10, 20, 30, 40 ]
+
+    loaded = bittensor.metagraph( netuid = 1, network = 'mock', sync = False ).load_from_path( str( tmp_path ) )
+    assert loaded.block.item() == 40
+    assert loaded.hotkeys == metagraph.hotkeys
+    assert loaded.axons == metagraph.axons
+    for name, _, _ in NEURON_COLUMNS:
+        assert torch.equal( getattr( loaded, name ), getattr( metagraph, name ) ), name
+
+    assert loaded.load_block( 20, dir_path = str( tmp_path ) ).last_update[0].item() == 20
+    assert [ graph.last_update[0].item() for graph in metagraph.iter_blocks( start = 15, end = 35, dir_path = str( tmp_path ) ) ] == [ 20, 30 ]
+
+    assert metagraph.compact( keep_last = 1, keep_every = 20, dir_path = str( tmp_path ) ) == [ 10, 30 ]
+    assert metagraph.saved_blocks( dir_path = str( tmp_path ) ) == [ 20, 40 ]
+    assert sorted( path.name for path in tmp_path.iterdir() ) == [ 'block-20.mg', 'block-40.mg', 'index.json' ]
+
+def test_metagraph_save_compacts( tmp_path ):
+    metagraph = bittensor.metagraph( netuid = 1, network = 'mock', sync = False )
+    values = [ _neuron_value( uid, uid ) for uid in range( 2 ) ]
+    for block in ( 10, 20, 30, 40 ):
+        _sync_with( metagraph, values, block = block, incremental = True )
+        metagraph.save_to_path( str( tmp_path / 'kept' ), keep_last = 2 )
+    assert metagraph.saved_blocks( dir_path = str( tmp_path / 'kept' ) ) == [ 30, 40 ]
+
+    # save() compacts the snapshots under the bittensor root dir by default.
+    with patch( 'bittensor._metagraph.get_save_dir', return_value = str( tmp_path / 'root' ) ):
+        for _ in range( bittensor._metagraph.SNAPSHOT_KEEP_LAST + 2 ):
+            metagraph.block.data += 1
+            metagraph.save()
+        assert len( metagraph.saved_blocks() ) == bittensor._metagraph.SNAPSHOT_KEEP_LAST
+        metagraph.block.data += 1
+        metagraph.save( keep_last = None )
+        assert len( metagraph.saved_blocks() ) == bittensor._metagraph.SNAPSHOT_KEEP_LAST + 1
+
+def test_metagraph_snapshot_sparse_and_legacy( tmp_path ):
+    values = [ _neuron_value( uid, uid ) for uid in range( 3 ) ]
+    for uid, value in enumerate( values ):
+        value['weights'] = [ ( ( uid + 1 ) % 3, 1 ) ]
+        value['bonds'] = [ ( uid, 5 ) ]
+    for layout in ( torch.strided, torch.sparse_csr ):
+        metagraph = bittensor.metagraph( netuid = 1, network = 'mock', sync = False, layout = layout )
+        _sync_full_with( metagraph, values, block = 5, incremental = False )
+        metagraph.save_to_path( str( tmp_path / str( layout ) ) )
+        loaded = bittensor.metagraph( netuid = 1, network = 'mock', sync = False ).load_from_path( str( tmp_path / str( layout ) ) )
+        assert loaded.W.layout == layout and not loaded.lite
+        assert torch.equal( loaded.W.to_dense(), metagraph.W.to_dense() )
+        assert torch.equal( loaded.B.to_dense(), metagraph.B.to_dense() )
+
+    # Directories written by older versions hold pickled state_dicts and no index.
+    state_dict = metagraph.state_dict()
+    state_dict['axons'] = list( metagraph.axons )
+    ( tmp_path / 'legacy' ).mkdir()
+    torch.save( state_dict, str( tmp_path / 'legacy' / 'block-5.pt' ) )
+    legacy = bittensor.metagraph( netuid = 1, network = 'mock', sync = False ).load_from_path( str( tmp_path / 'legacy' ) )
+    assert legacy.hotkeys == metagraph.hotkeys
+    legacy.save_to_path( str( tmp_path / 'resaved' ) )
+    assert bittensor.metagraph( netuid = 1, network = 'mock', sync = False ).load_from_path( str( tmp_path / 'resaved' ) ).axons == metagraph.axons
@@ -0,0 +1,76 @@
+# The MIT License (MIT)
+# Copyright © 2022 Yuma Rao
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import random
+import pytest
+import torch
+
+from tests.helpers import load_module_from_path
+
+transformers = pytest.importorskip( 'transformers' )
+tokenizers = pytest.importorskip( 'tokenizers' )
+
+reward = load_module_from_path( 'reward', 'neurons/text/prompting/validators/core/reward.py' )
+
+WORDS = [ 'word{}'.format( i ) for i in range( 50 ) ]
+
+@pytest.fixture( scope = 'module' )
+def reward_model( tmp_path_factory ):
+    path = str( tmp_path_factory.mktemp( 'reward_model' ) )
+    transformers.GPTJConfig( vocab_size = len( WORDS ) + 2, n_positions = 1024, n_embd = 32, n_layer = 2, n_head = 4, rotary_dim = 4 ).save_pretrained( path )
+    vocab = { word: i for i, word in enumerate( [ '[UNK]', '<|endoftext|>' ] + WORDS ) }
+    tokenizer = tokenizers.Tokenizer( tokenizers.models.WordLevel( vocab = vocab, unk_token = '[UNK]' ) )
+    tokenizer.pre_tokenizer = tokenizers.pre_tokenizers.WhitespaceSplit()
+    transformers.PreTrainedTokenizerFast( tokenizer_object = tokenizer, eos_token = '<|endoftext|>', unk_token = '[UNK]' ).save_pretrained( path )
+    torch.manual_seed( 0 )
+    return reward.RewardModel( model_path = path, device = 'cpu', tokenizer_path = path ).eval()
+
+def per_sample_end_scores( model, samples ) -> torch.FloatTensor:
+    r""" The unbatched path end_scores replaced: each sample padded to 550 tokens and duplicated into a chosen and
+        rejected row, scored with forward().
+    """
+    scores = []
+    for sample in samples:
+        encodings_dict = model.tokenizer( [ "<|startoftext|>" + sample + "<|endoftext|>" ], truncation = False, max_length = 550, padding = "max_length", return_tensors = "pt" )
+        input_ids = encodings_dict["input_ids"].repeat( 2, 1 )
+        attn_masks = encodings_dict["attention_mask"].repeat( 2, 1 )
+        with torch.no_grad():
+            scores.append( model( input_ids = input_ids, attention_mask = attn_masks )["chosen_end_scores"].mean().item() )
+    return torch.tensor( scores, dtype = torch.float32 )
+
+@pytest.mark.parametrize( 'batch_size', [ 1, 3, 16 ] )
+def test_end_scores_match_per_sample( reward_model, batch_size ):
+    rng = random.Random( 0 )
+    lengths = [ 1, 40, 2, 7, 7, 120, 0, 15, 3 ]
+    samples = [ ' ' + ' '.join( rng.choice( WORDS ) for _ in range( length ) ) for length in lengths ]
+    expected = per_sample_end_scores( reward_model, samples )
+    scores = reward_model.end_scores( samples, batch_size = batch_size )
+    assert scores.shape == ( len( samples ), )
+    assert torch.allclose( scores, expected, atol = 1e-4 ), ( scores - expected ).abs().max()
+
+def test_end_scores_empty( reward_model ):
+    assert reward_model.end_scores( [] ).shape == ( 0, )
+
+def test_gather_end_scores_right_padding( reward_model ):
+    pad = reward_model.PAD_ID
+    input_ids = torch.tensor( [
+        [ 5, 6, 7, 8 ],         # No padding, scored at the last token.
+        [ 5, 6, pad, pad ],     # Scored before the first pad token.
+        [ 5, pad, pad, pad ],
+    ] )
+    rewards = torch.arange( 12, dtype = torch.float32 ).reshape( 3, 4 )
+    assert reward_model.gather_end_scores( input_ids, rewards ).tolist() == [ 3., 5., 8. ]
@@ -16,12 +16,16 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import time
+import asyncio
+import threading
 import unittest.mock as mock
 from unittest.mock import MagicMock
 import pytest
 
 import bittensor
 import unittest
+import scalecodec
 
 class TestSubtensorWithExternalAxon(unittest.TestCase):
     """
@@ -214,5 +218,423 @@ class TestStakeMultiple(unittest.TestCase):
             self.assertEqual(kwargs['call_function'], 'add_stake')
             self.assertAlmostEqual(kwargs['call_params']['ammount_staked'], mock_amount.rao, delta=1.0 * 1e9) # delta of 1.0 TAO
 
+class TestSubtensorSnapshot(unittest.TestCase):
+    """
+    Test the pinned block snapshot of subtensor
+    """
+    def test_snapshot_pins_block_and_fans_out(self):
+        calls, active, peak, lock = [], [0], [0], threading.Lock()
+        def rpc_request( method, params ):
+            with lock:
+                calls.append( ( method, params ) )
+                active[0] += 1
+                peak[0] = max( peak[0], active[0] )
+            time.sleep( 0.2 )
+            with lock: active[0] -= 1
+            return { 'result': [] }
+
+        substrate = MagicMock( url = 'ws://127.0.0.1:9944' )
+        substrate.__enter__.return_value = substrate
+        substrate.get_block_hash.return_value = '0xpinned'
+        subtensor = bittensor.Subtensor( substrate = substrate, network = 'mock', chain_endpoint = 'ws://127.0.0.1:9944' )
+        connections = []
+        def open_connection( snapshot ):
+            connections.append( MagicMock( rpc_request = MagicMock( side_effect = rpc_request ) ) )
+            return connections[-1]
+
+        storage_reads = MagicMock( side_effect = lambda substrate, queries, block_hash: [ MagicMock( value = { 'data': { 'free': 5 } } ) for _ in queries ] )
+        with mock.patch.object( bittensor.SubtensorSnapshot, '_open_connection', open_connection ), mock.patch( 'bittensor._subtensor.snapshot.query_storage_at', storage_reads ):
+            with subtensor.snapshot( block = 10, max_workers = 4 ) as snapshot:
+                start = time.time()
+                neurons = snapshot.neurons_lite_for( [ 1, 2, 3, 4 ] )
+                elapsed = time.time() - start
+                balances = snapshot.get_balances_for( [ 'a', 'b' ] )
+
+        assert snapshot.block == 10 and snapshot.block_hash == '0xpinned'
+        assert neurons == { 1: [], 2: [], 3: [], 4: [] }
+        assert elapsed < 0.6 and peak[0] > 1 and len( connections ) <= 4
+        assert sorted( params for _, params in calls ) == [ [ netuid, '0xpinned' ] for netuid in range( 1, 5 ) ]
+        assert balances == { 'a': bittensor.Balance( 5 ), 'b': bittensor.Balance( 5 ) }
+        storage_reads.assert_called_once_with( substrate, [ ( 'System', 'Account', [ 'a' ] ), ( 'System', 'Account', [ 'b' ] ) ], '0xpinned' )
+        for connection in connections:
+            connection.close.assert_called_once()
+
+    def test_snapshot_balances_of_legacy_accounts(self):
+        substrate = MagicMock( url = 'ws://127.0.0.1:9944' )
+        substrate.__enter__.return_value = substrate
+        substrate.get_block_hash.return_value = '0xpinned'
+        def query( module, storage_function, params, block_hash ):
+            if params == [ 'b' ]:
+                raise scalecodec.exceptions.RemainingScaleBytesNotEmptyException()
+            return MagicMock( value = { 'data': { 'free': 5 } } )
+        substrate.query.side_effect = query
+        subtensor = bittensor.Subtensor( substrate = substrate, network = 'mock', chain_endpoint = 'ws://127.0.0.1:9944' )
+        storage_reads = MagicMock( side_effect = scalecodec.exceptions.RemainingScaleBytesNotEmptyException )
+        no_retry = lambda **kwargs: ( lambda fn: fn )
+        with mock.patch( 'bittensor._subtensor.snapshot.query_storage_at', storage_reads ), mock.patch( 'bittensor._subtensor.snapshot.retry', no_retry ):
+            with subtensor.snapshot( block = 10 ) as snapshot:
+                balances = snapshot.get_balances_for( [ 'a', 'b' ] )
+        assert balances == { 'a': bittensor.Balance( 5 ), 'b': bittensor.Balance( 1000 ) }
+        storage_reads.assert_called_once()
+
+class TestSubtensorQueryCache(unittest.TestCase):
+    """
+    Test the opt-in cache of subtensor storage reads
+    """
+    def test_query_cache(self):
+        substrate = MagicMock( url = 'ws://127.0.0.1:9944' )
+        substrate.__enter__.return_value = substrate
+        substrate.get_block_hash.side_effect = lambda block: '0x{}'.format( block )
+        substrate.get_block_number.return_value = 100
+        substrate.query.side_effect = lambda module, storage_function, params, block_hash: MagicMock( value = ( storage_function, params[0], block_hash ) )
+        subtensor = bittensor.Subtensor( substrate = substrate, network = 'mock', chain_endpoint = 'ws://127.0.0.1:9944' )
+
+        # Uncached reads always go to the chain.
+        assert subtensor.query_subtensor( 'Tempo', None, [ 1 ] ).value == ( 'Tempo', 1, None )
+        subtensor.query_subtensor( 'Tempo', None, [ 1 ] )
+        assert substrate.query.call_count == 2
+
+        cache = subtensor.enable_cache( ttl = 60 )
+        for _ in range( 3 ):
+            assert subtensor.query_subtensor( 'Tempo', None, [ 1 ] ).value == ( 'Tempo', 1, None )
+            assert subtensor.query_subtensor( 'Tempo', 10, [ 1 ] ).value == ( 'Tempo', 1, '0x10' )
+            assert subtensor.block == 100
+        assert subtensor.query_subtensor( 'Tempo', None, [ 2 ] ).value == ( 'Tempo', 2, None )
+        assert substrate.query.call_count == 5
+        assert substrate.get_block_hash.call_count == 1
+        assert substrate.get_block_number.call_count == 1
+
+        # A new header drops the latest reads, historical ones are kept.
+        cache.on_new_block( 101 )
+        cache.on_new_block( 101 )
+        subtensor.query_subtensor( 'Tempo', None, [ 1 ] )
+        subtensor.query_subtensor( 'Tempo', 10, [ 1 ] )
+        assert substrate.query.call_count == 6
+        assert cache.stats.invalidations == 1
+
+        # So do submitted extrinsics and expired ttls.
+        subtensor.invalidate_cache()
+        cache.ttl = 0
+        subtensor.query_subtensor( 'Tempo', None, [ 1 ] )
+        subtensor.query_subtensor( 'Tempo', None, [ 1 ] )
+        assert substrate.query.call_count == 8
+        assert cache.stats.expired == 1
+        assert cache.stats.hits > 0 and cache.stats.misses > 0
+
+    def test_block_header_subscription_reconnects(self):
+        substrate = MagicMock( url = 'ws://127.0.0.1:9944' )
+        substrate.__enter__.return_value = substrate
+        substrate.query.side_effect = lambda module, storage_function, params, block_hash: MagicMock( value = storage_function )
+        subtensor = bittensor.Subtensor( substrate = substrate, network = 'mock', chain_endpoint = 'ws://127.0.0.1:9944' )
+        cache = subtensor.enable_cache( ttl = 60 )
+        subtensor.query_subtensor( 'Tempo', None, [ 1 ] )
+        failed, reconnected, disabled, suspended = threading.Event(), threading.Event(), threading.Event(), []
+        def header( number ):
+            return { 'params': { 'result': { 'number': hex( number ) } } }
+        def rpc_request( method, params, result_handler ):
+            if not failed.is_set():
+                failed.set()
+                raise ConnectionError( 'websocket closed' )
+            # While the subscription was down, latest reads were dropped and not cached.
+            suspended.append( ( cache.suspended, len( cache ) ) )
+            subtensor.query_subtensor( 'Tempo', None, [ 1 ] )
+            subtensor.query_subtensor( 'Tempo', None, [ 1 ] )
+            result_handler( header( 101 ), 0, 'sub' )
+            reconnected.set()
+            disabled.wait()
+            return result_handler( header( 102 ), 1, 'sub' )
+        connections = []
+        def open_connection( **kwargs ):
+            connections.append( MagicMock( rpc_request = MagicMock( side_effect = rpc_request ) ) )
+            return connections[-1]
+
+        with mock.patch( 'bittensor._subtensor.subtensor_impl.SubstrateInterface', open_connection ), mock.patch( 'time.sleep' ) as sleep:
+            thread = subtensor.subscribe_block_headers( reconnect_delay = 0.5 )
+            assert reconnected.wait( 5 )
+            sleep.assert_called_once_with( 0.5 )
+            assert suspended == [ ( True, 0 ) ]
+            assert substrate.query.call_count == 3
+
+            # The first header of the new subscription resumes the cache.
+            assert not cache.suspended and cache.head == 101
+            subtensor.query_subtensor( 'Tempo', None, [ 1 ] )
+            subtensor.query_subtensor( 'Tempo', None, [ 1 ] )
+            assert substrate.query.call_count == 4
+
+            # Disabling the cache ends the subscription at the next header.
+            subtensor.disable_cache()
+            disabled.set()
+            thread.join( 5 )
+        assert not thread.is_alive() and cache.head == 101
+        assert len( connections ) == 2
+        for connection in connections:
+            connection.close.assert_called_once()
+
+    def test_query_map_without_cache(self):
+        substrate = MagicMock( url = 'ws://127.0.0.1:9944' )
+        substrate.__enter__.return_value = substrate
+        substrate.query_map.return_value = [ ( 'key', 1 ) ]
+        subtensor = bittensor.Subtensor( substrate = substrate, network = 'mock', chain_endpoint = 'ws://127.0.0.1:9944' )
+        assert list( subtensor.query_map_subtensor( 'Stake', None, [ 'hotkey' ] ) ) == [ ( 'key', 1 ) ]
+        substrate.get_chain_head.assert_not_called()
+        assert substrate.query_map.call_args.kwargs['block_hash'] is None
+
+    def test_query_map_cache(self):
+        from substrateinterface.base import QueryMapResult
+        substrate = MagicMock( url = 'ws://127.0.0.1:9944' )
+        substrate.__enter__.return_value = substrate
+        substrate.get_chain_head.return_value = '0xhead'
+        def query_map( module, storage_function, params, block_hash, start_key = None, **kwargs ):
+            # Two pages of two records, the second page is fetched while iterating.
+            page = [ 0, 1 ] if start_key is None else [ 2, 3 ] if start_key == 'page2' else []
+            return QueryMapResult( records = [ ( key, block_hash ) for key in page ], page_size = 2, substrate = substrate,
+                                   module = module, storage_function = storage_function, params = params, block_hash = block_hash,
+                                   last_key = 'page2' if start_key is None else 'end' )
+        substrate.query_map.side_effect = query_map
+        subtensor = bittensor.Subtensor( substrate = substrate, network = 'mock', chain_endpoint = 'ws://127.0.0.1:9944' )
+        subtensor.enable_cache( ttl = 60 )
+
+        # Every page is read at the pinned head, and nested loops over the cached read see every record.
+        outer = subtensor.query_map_subtensor( 'Stake', None, [ 'hotkey' ] )
+        pairs = [ ( a[0], b[0] ) for a in outer for b in subtensor.query_map_subtensor( 'Stake', None, [ 'hotkey' ] ) ]
+        assert len( pairs ) == 16
+        assert set( block_hash for _, block_hash in outer.records ) == { '0xhead' }
+        assert [ call.kwargs['block_hash'] for call in substrate.query_map.call_args_list ] == [ '0xhead' ] * 3
+
+class TestSubtensorQueryMulti(unittest.TestCase):
+    """
+    Test the batched storage reads of subtensor
+    """
+    class FakeSubstrate:
+        # Metadata of two SubtensorModule storage maps: Tempo ( u16 -> u16, with default ) and Uids ( u16 -> Option<u16> ).
+        def __init__( self, stored ):
+            from scalecodec.base import RuntimeConfigurationObject
+            from scalecodec.type_registry import load_type_registry_preset
+            self.runtime_config = RuntimeConfigurationObject()
+            self.runtime_config.update_type_registry( load_type_registry_preset( 'legacy' ) )
+            self.metadata = None
+            self.stored = stored
+            self.rpc_request = MagicMock( side_effect = self._rpc_request )
+        def __enter__( self ): return self
+        def __exit__( self, *args ): pass
+        def get_chain_head( self ): return '0xhead'
+        def get_block_hash( self, block ): return '0x{}'.format( block )
+        def init_runtime( self, block_hash ): pass
+        def get_metadata_module( self, module, block_hash ): return MagicMock( value = { 'storage': { 'prefix': module } } )
+        def get_metadata_storage_function( self, module, storage_function, block_hash ):
+            return MagicMock(
+                get_params_type_string = MagicMock( return_value = [ 'u16' ] ),
+                get_param_hashers = MagicMock( return_value = [ 'Twox64Concat' ] ),
+                get_value_type_string = MagicMock( return_value = 'u16' ),
+                value = { 'modifier': 'Default' if storage_function == 'Tempo' else 'Optional' },
+                value_object = { 'default': MagicMock( value_object = '0x6300' if storage_function == 'Tempo' else '0x00' ) },
+            )
+        def convert_storage_parameter( self, scale_type, value ): return value
+        def generate_storage_hash( self, **kwargs ):
+            from substrateinterface import SubstrateInterface
+            return SubstrateInterface.generate_storage_hash( self, **kwargs )
+        def _rpc_request( self, method, params ):
+            keys, block_hash = params
+            return { 'result': [ { 'block': block_hash, 'changes': [ [ key, self.stored.get( key ) ] for key in keys ] } ] }
+
+    def test_query_multi(self):
+        from bittensor._subtensor.storage import query_storage_at
+        substrate = self.FakeSubstrate( {} )
+        tempo_key = substrate.generate_storage_hash( storage_module = 'SubtensorModule', storage_function = 'Tempo', params = [ '0100' ], hashers = [ 'Twox64Concat' ] )
+        uids_key = substrate.generate_storage_hash( storage_module = 'SubtensorModule', storage_function = 'Uids', params = [ '0100' ], hashers = [ 'Twox64Concat' ] )
+        substrate.stored = { tempo_key: '0x0a00', uids_key: '0x0700' }
+
+        results = query_storage_at( substrate, [
+            ( 'SubtensorModule', 'Tempo', [ 1 ] ), ( 'SubtensorModule', 'Tempo', [ 2 ] ),
+            ( 'SubtensorModule', 'Uids', [ 1 ] ), ( 'SubtensorModule', 'Uids', [ 2 ] ),
+        ], '0x10' )
+        # Missing keys fall back to the storage default, or None for optional storage.
+        assert [ result.value for result in results ] == [ 10, 99, 7, None ]
+        assert substrate.rpc_request.call_count == 1
+        assert substrate.rpc_request.call_args[0][0] == 'state_queryStorageAt'
+
+        subtensor = bittensor.Subtensor( substrate = substrate, network = 'mock', chain_endpoint = 'ws://127.0.0.1:9944' )
+        queries = [ ( 'SubtensorModule', 'Tempo', [ netuid ] ) for netuid in range( 1, 5 ) ]
+        assert [ result.value for result in subtensor.query_multi( queries, block = 10 ) ] == [ 10, 99, 99, 99 ]
+        assert substrate.rpc_request.call_count == 2
+
+        # With the cache, only the missing reads go to the chain, shared with query_subtensor.
+        subtensor.enable_cache()
+        subtensor.query_multi( queries[:2], block = 10 )
+        assert subtensor.query_multi( queries, block = 10 )[0].value == 10
+        assert len( substrate.rpc_request.call_args[0][1][0] ) == 2
+        assert subtensor.query_subtensor( 'Tempo', 10, [ 1 ] ).value == 10
+        assert substrate.rpc_request.call_count == 4
+
+    def test_get_balances_and_stakes_for(self):
+        subtensor = bittensor.Subtensor( substrate = MagicMock(), network = 'mock', chain_endpoint = 'ws://127.0.0.1:9944' )
+        subtensor.query_multi = MagicMock( return_value = [ MagicMock( value = { 'data': { 'free': 5 } } ), MagicMock( value = { 'data': { 'free': 7 } } ) ] )
+        assert subtensor.get_balances_for( [ 'a', 'b' ] ) == { 'a': bittensor.Balance( 5 ), 'b': bittensor.Balance( 7 ) }
+        subtensor.query_multi.assert_called_once_with( [ ( 'System', 'Account', [ 'a' ] ), ( 'System', 'Account', [ 'b' ] ) ], None )
+
+        # A legacy formatted account fails the batched decode, each address is then read on its own.
+        subtensor.query_multi = MagicMock( side_effect = scalecodec.exceptions.RemainingScaleBytesNotEmptyException )
+        subtensor.get_balance = MagicMock( side_effect = lambda address, block: bittensor.Balance( 1000 if address == 'b' else 5 ) )
+        assert subtensor.get_balances_for( [ 'a', 'b' ], block = 2 ) == { 'a': bittensor.Balance( 5 ), 'b': bittensor.Balance( 1000 ) }
+        subtensor.get_balance.assert_has_calls( [ mock.call( 'a', 2 ), mock.call( 'b', 2 ) ] )
+
+        subtensor.query_multi = MagicMock( return_value = [ MagicMock( value = 3 ), MagicMock( value = 4 ) ] )
+        stakes = subtensor.get_stakes_for( [ ( 'h1', 'c' ), ( 'h2', 'c' ) ], block = 2 )
+        assert stakes == { ( 'h1', 'c' ): bittensor.Balance.from_rao( 3 ), ( 'h2', 'c' ): bittensor.Balance.from_rao( 4 ) }
+        subtensor.query_multi.assert_called_once_with( [ ( 'SubtensorModule', 'Stake', [ 'h1', 'c' ] ), ( 'SubtensorModule', 'Stake', [ 'h2', 'c' ] ) ], 2 )
+
+class TestSubtensorConnectionPool(unittest.TestCase):
+
+    def test_pool_reuses_and_reconnects(self):
+        from bittensor._subtensor.connection_pool import ConnectionPool
+        websocket = MagicMock( connected = True )
+        def connect( substrate ):
+            substrate.websocket = websocket
+        with mock.patch( 'substrateinterface.SubstrateInterface.__init__', lambda substrate, url, **kwargs: connect( substrate ) ), \
+                mock.patch( 'substrateinterface.SubstrateInterface.connect_websocket', connect ), \
+                mock.patch( 'substrateinterface.SubstrateInterface.close', lambda substrate: None ):
+            pool = ConnectionPool()
+            substrate = pool.get( url = 'ws://a:9944', ss58_format = 42 )
+            assert pool.get( url = 'ws://a:9944', ss58_format = 42 ) is substrate
+            assert pool.get( url = 'ws://b:9944', ss58_format = 42 ) is not substrate
+            assert len( pool ) == 2 and pool.stats.created == 2 and pool.stats.reused == 1
+
+            # Leaving the block keeps the websocket open, a dropped websocket is reopened on the next call.
+            with substrate as connection:
+                assert connection is substrate
+            assert substrate.reconnects == 0
+            websocket.connected = False
+            with substrate:
+                websocket.connected = True
+            assert substrate.reconnects == 1
+
+            # Idle connections must answer a health check first.
+            substrate.rpc_request = MagicMock( side_effect = ConnectionError )
+            substrate.last_used -= substrate.health_check_interval + 1
+            with substrate: pass
+            substrate.rpc_request.assert_called_once_with( 'system_health', [] )
+            assert substrate.reconnects == pool.stats.reconnects == 2
+
+    def test_pool_checks_out_a_connection_per_thread(self):
+        from bittensor._subtensor.connection_pool import ConnectionPool
+        def connect( substrate ):
+            substrate.websocket = MagicMock( connected = True )
+        with mock.patch( 'substrateinterface.SubstrateInterface.__init__', lambda substrate, url, **kwargs: connect( substrate ) ), \
+                mock.patch( 'substrateinterface.SubstrateInterface.close', lambda substrate: None ):
+            pool = ConnectionPool()
+            substrate = pool.get( url = 'ws://a:9944', max_connections = 2, ss58_format = 42 )
+            holding, release, checked_out = threading.Event(), threading.Event(), []
+            def wait_for_inclusion():
+                # Holds its connection like a submit_extrinsic waiting for its block.
+                with substrate as connection:
+                    checked_out.append( connection )
+                    holding.set()
+                    release.wait()
+            thread = threading.Thread( target = wait_for_inclusion )
+            thread.start()
+            assert holding.wait( 5 )
+
+            # Other calls are served on a second websocket meanwhile, nested blocks reuse it.
+            with substrate as connection:
+                with substrate as nested:
+                    assert nested is connection
+                assert connection is not checked_out[0]
+            assert pool.stats.created == 2 and pool.stats.waits == 0
+
+            # Once every connection is checked out, a call waits for one to be put back.
+            with substrate as connection:
+                waiter = threading.Thread( target = lambda: checked_out.append( substrate.__enter__() ) or substrate.__exit__( None, None, None ) )
+                waiter.start()
+                time.sleep( 0.1 )
+                assert len( checked_out ) == 1 and pool.stats.waits == 1
+                release.set()
+                waiter.join( 5 )
+                thread.join( 5 )
+            assert checked_out[1] is checked_out[0] and pool.stats.created == 2
+
+class TestAsyncSubtensor(unittest.TestCase):
+
+    def test_reads_overlap_with_other_coroutines(self):
+        subtensor = MagicMock()
+        def neurons_lite( netuid, block = None ):
+            time.sleep( 0.2 )
+            return [ netuid, block ]
+        subtensor.neurons_lite = neurons_lite
+        subtensor.get_current_block.return_value = 10
+
+        async def run( async_subtensor ):
+            start = time.monotonic()
+            neurons, _ = await asyncio.gather( async_subtensor.neurons_lite( 3, block = 7 ), asyncio.sleep( 0.2 ) )
+            return neurons, time.monotonic() - start, await async_subtensor.block()
+
+        with bittensor.AsyncSubtensor( subtensor ) as async_subtensor:
+            neurons, elapsed, block = asyncio.run( run( async_subtensor ) )
+            assert neurons == [ 3, 7 ] and block == 10
+            assert elapsed < 0.35
+            with pytest.raises( AttributeError ):
+                async_subtensor.set_weights
+
+class TestBlockClock(unittest.TestCase):
+
+    class HeadsSubstrate:
+        r""" Feeds the headers put on a queue to the subscription handler, raises on None. """
+        def __init__( self, headers ):
+            self.headers = headers
+        def subscribe_block_headers( self, handler ):
+            while True:
+                number = self.headers.get()
+                if number is None: raise ConnectionError( 'closed' )
+                if handler( { 'header': { 'number': number } }, 0, 'id' ) is not None: return
+        def close( self ): pass
+
+    def test_headers_drive_blocks_and_callbacks(self):
+        import queue
+        headers = queue.Queue()
+        subtensor = MagicMock( chain_endpoint = 'ws://clock:9944' )
+        subtensor.get_current_block.return_value = 100
+        clock = bittensor.BlockClock( subtensor, substrate_factory = lambda: self.HeadsSubstrate( headers ), blocktime = 1.0, reconnect_delay = 0 )
+        try:
+            # No header yet, the block is read once from the chain.
+            assert clock.current_block == 100 and clock.stats.polls == 1
+            blocks, epochs = [], []
+            handle = clock.on_block( blocks.append )
+            clock.on_epoch( epochs.append, blocks_per_epoch = 2, start_block = 100 )
+            headers.put( 101 )
+            assert clock.wait_for_block( 101, timeout = 5 ) == 101
+            headers.put( None )
+            headers.put( 102 )
+            assert clock.wait_for_block( 102, timeout = 5 ) == 102
+            assert clock.stats.reconnects == 1
+            clock.remove_callback( handle )
+            headers.put( 103 )
+            headers.put( 104 )
+            assert clock.wait_for_block( 104, timeout = 5 ) == 104
+            assert blocks == [ 101, 102 ] and epochs == [ 102, 104 ]
+            assert clock.current_block == 104 and subtensor.get_current_block.call_count == 1
+            assert clock.wait_for_block( 200, timeout = 0.05 ) == 104
+        finally:
+            clock.stop()
+            headers.put( 105 )
+
+    def test_current_block_estimated_between_headers(self):
+        subtensor = MagicMock( chain_endpoint = 'ws://clock:9944' )
+        clock = bittensor.BlockClock( subtensor, blocktime = 1.0, start = False )
+        clock._set_block( 10 )
+        assert clock.current_block == 10
+        clock._block_time -= 1.5
+        assert clock.last_header_block == 10 and clock.current_block == 11
+        # Stale headers make waiters fall back to reading the chain.
+        subtensor.get_current_block.return_value = 13
+        assert clock.wait_for_block( 13, timeout = 1 ) == 13 and clock.stats.polls == 1
+
+    def test_current_block_capped_when_headers_stall(self):
+        subtensor = MagicMock( chain_endpoint = 'ws://clock:9944' )
+        clock = bittensor.BlockClock( subtensor, blocktime = 1.0, start = False )
+        clock._set_block( 10 )
+        # No header for a hundred block times, e.g. a hung websocket, moves the estimate by one block at most.
+        clock._block_time -= 100
+        assert clock.current_block == 11
+        subtensor.get_current_block.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -15,9 +15,13 @@
 # THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
+import time
+import pytest
 import bittensor
 import torch
 import unittest
+import threading
+import concurrent.futures
 from unittest.mock import MagicMock
 
 
@@ -106,3 +110,71 @@ def test_text_prompting_synapse_priority():
     priority = synapse.priority( call )
     assert priority == 0.0
 
+
+def test_synapse_batcher_groups_concurrent_requests():
+    batches = []
+    def batch_callback( inputs ):
+        batches.append( list( inputs ) )
+        return [ value * 2 for value in inputs ]
+    batcher = bittensor._synapse.batcher.SynapseBatcher( batch_callback, max_batch_size = 4, max_wait_ms = 200 )
+    with concurrent.futures.ThreadPoolExecutor( max_workers = 6 ) as executor:
+        outputs = list( executor.map( batcher.submit, range( 6 ) ) )
+    assert outputs == [ 0, 2, 4, 6, 8, 10 ]
+    assert sorted( len( batch ) for batch in batches ) == [ 2, 4 ]
+
+def test_synapse_batcher_priority_and_deadline():
+    release, batches = threading.Event(), []
+    def batch_callback( inputs ):
+        batches.append( list( inputs ) )
+        release.wait()
+        return inputs
+    batcher = bittensor._synapse.batcher.SynapseBatcher( batch_callback, max_batch_size = 2, max_wait_ms = 0 )
+    with concurrent.futures.ThreadPoolExecutor( max_workers = 5 ) as executor:
+        # Occupies the batching thread while the others queue up.
+        first = executor.submit( batcher.submit, 'first' )
+        time.sleep( 0.1 )
+        low = executor.submit( batcher.submit, 'low', priority = 1 )
+        high = executor.submit( batcher.submit, 'high', priority = 10 )
+        mid = executor.submit( batcher.submit, 'mid', priority = 5 )
+        expired = executor.submit( batcher.submit, 'expired', priority = 100, deadline = time.time() + 0.05 )
+        time.sleep( 0.1 )
+        release.set()
+        assert [ first.result(), low.result(), high.result(), mid.result() ] == [ 'first', 'low', 'high', 'mid' ]
+        with pytest.raises( TimeoutError ):
+            expired.result()
+    assert batches == [ [ 'first' ], [ 'high', 'mid' ], [ 'low' ] ]
+
+def test_synapse_batcher_skips_timed_out_requests():
+    release, batches = threading.Event(), []
+    def batch_callback( inputs ):
+        batches.append( list( inputs ) )
+        release.wait()
+        return inputs
+    batcher = bittensor._synapse.batcher.SynapseBatcher( batch_callback, max_batch_size = 2, max_wait_ms = 0 )
+    with concurrent.futures.ThreadPoolExecutor( max_workers = 1 ) as executor:
+        # Occupies the batching thread while the timed out request sits in the queue.
+        first = executor.submit( batcher.submit, 'first' )
+        time.sleep( 0.1 )
+        with pytest.raises( TimeoutError ):
+            batcher.submit( 'timed_out', deadline = time.time() + 0.05 )
+        assert [ request.cancelled for _, _, request in batcher._queue.queue ] == [ True ]
+        release.set()
+        assert first.result() == 'first'
+    assert batcher.submit( 'next' ) == 'next'
+    assert batches == [ [ 'first' ], [ 'next' ] ]
+
+def test_synapse_batcher_propagates_errors():
+    def batch_callback( inputs ):
+        raise RuntimeError( 'model failed' )
+    batcher = bittensor._synapse.batcher.SynapseBatcher( batch_callback, max_batch_size = 2, max_wait_ms = 0 )
+    with pytest.raises( RuntimeError, match = 'model failed' ):
+        batcher.submit( 'input' )
+
+def test_text_prompting_synapse_forward_batch():
+    synapse = get_synapse()
+    forward_batch = lambda messages_list: [ messages[0]['content'] for messages in messages_list ]
+    synapse.batcher = bittensor._synapse.batcher.SynapseBatcher( forward_batch, max_batch_size = 4, max_wait_ms = 10 )
+    request = bittensor.proto.ForwardTextPromptingRequest( messages = [ '{"role": "user", "content": "hi"}' ], timeout = 5 )
+    response = synapse.Forward( request, None )
+    assert response.return_code == bittensor.proto.ReturnCode.Success
+    assert response.response == 'hi'
@@ -15,6 +15,8 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 import pytest
@@ -228,5 +230,115 @@ class TestWalletReregister(unittest.TestCase):
             self.assertEqual(kwargs['cuda'], False) # should be False when no flag was set
 
 
+class TestWalletLoadAll(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+        self.wallets = {}
+        for name in ( 'alice', 'bob' ):
+            coldkey = bittensor.wallet( path = self.path, name = name, hotkey = 'h0' )
+            coldkey.create_coldkey_from_uri( '//{}'.format( name ), use_password = False, overwrite = True )
+            for index in range( 3 ):
+                wallet = bittensor.wallet( path = self.path, name = name, hotkey = 'h{}'.format( index ) )
+                wallet.create_hotkey_from_uri( '//{}/{}'.format( name, index ), use_password = False, overwrite = True )
+                self.wallets[ ( name, wallet.hotkey_str ) ] = wallet
+        # An encrypted hotkey, and a wallet without coldkeypub.
+        with open( os.path.join( self.path, 'bob', 'hotkeys', 'locked' ), 'wb' ) as file:
+            file.write( b'gAAAAAencrypted' )
+        bittensor.wallet( path = self.path, name = 'carol', hotkey = 'h0' ).create_hotkey_from_uri( '//carol', use_password = False, overwrite = True )
+        bittensor._keyfile.keyfile_impl.keypair_cache.clear()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_all_reads_addresses(self):
+        views = bittensor.wallet.load_all( path = self.path, max_workers = 4 )
+        # No keypair was derived from a secret.
+        assert len( bittensor._keyfile.keyfile_impl.keypair_cache ) == 0
+        assert [ ( view.name, view.hotkey_str ) for view in views ] == [ ( 'alice', 'h0' ), ( 'alice', 'h1' ), ( 'alice', 'h2' ), ( 'bob', 'h0' ), ( 'bob', 'h1' ), ( 'bob', 'h2' ), ( 'carol', 'h0' ) ]
+        for view in views[:-1]:
+            wallet = self.wallets[ ( view.name, view.hotkey_str ) ]
+            assert view.hotkey.ss58_address == wallet.hotkey.ss58_address
+            assert view.coldkeypub.ss58_address == wallet.coldkeypub.ss58_address
+            assert view.hotkey.private_key == None
+        assert views[-1].coldkeypub_ss58 == None
+        with pytest.raises( bittensor.KeyFileError ):
+            views[-1].coldkeypub
+
+        assert [ view.hotkey_str for view in bittensor.wallet.load_all( path = self.path, names = [ 'bob' ] ) ] == [ 'h0', 'h1', 'h2' ]
+        assert bittensor.wallet.load_all( path = os.path.join( self.path, 'missing' ) ) == []
+
+    def test_view_forwards_to_wallet(self):
+        view = bittensor.wallet.load_all( path = self.path, names = [ 'alice' ] )[1]
+        assert view.hotkey_file.path == self.wallets[ ( 'alice', 'h1' ) ].hotkey_file.path
+        assert isinstance( view.wallet(), bittensor.Wallet )
+        assert view.wallet().hotkey.ss58_address == view.hotkey_ss58
+
+    def test_cli_helpers_use_views(self):
+        from bittensor._cli.commands.utils import get_all_wallets_for_path, get_hotkey_wallets_for_wallet
+        assert len( get_all_wallets_for_path( self.path ) ) == 6
+        assert [ view.hotkey_str for view in get_hotkey_wallets_for_wallet( self.wallets[ ( 'bob', 'h0' ) ] ) ] == [ 'h0', 'h1', 'h2' ]
+
+    def test_keypair_cache(self):
+        cache = bittensor._keyfile.keyfile_impl.keypair_cache
+        wallet = self.wallets[ ( 'alice', 'h0' ) ]
+        keypair = bittensor.keyfile( path = wallet.hotkey_file.path ).keypair
+        assert bittensor.keyfile( path = wallet.hotkey_file.path ).keypair is keypair
+        assert cache.hits == 1
+
+        # Rewriting the file drops the entry.
+        wallet.create_hotkey_from_uri( '//alice/other', use_password = False, overwrite = True )
+        assert bittensor.keyfile( path = wallet.hotkey_file.path ).keypair.ss58_address == bittensor.Keypair.create_from_uri( '//alice/other' ).ss58_address
+
+class TestWalletSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.wallet = bittensor.wallet( _mock = True )
+        self.neuron = MagicMock( is_null = False, uid = 3, trust = 0.5, rank = 0.25, incentive = 0.1, validator_permit = True, weights = [ [ 1, 2 ] ] )
+        self.subtensor = MagicMock( block = 100 )
+        self.subtensor.get_neuron_for_pubkey_and_subnet.return_value = self.neuron
+
+    def test_accessors_share_one_read(self):
+        snapshot = self.wallet.snapshot( netuid = 1, subtensor = self.subtensor )
+        assert ( snapshot.block, snapshot.uid ) == ( 100, 3 )
+        assert self.wallet.trust( 1 ) == 0.5
+        assert self.wallet.rank( 1 ) == 0.25
+        assert self.wallet.incentive( 1 ) == 0.1
+        assert self.wallet.validator_permit( 1 )
+        assert self.wallet.weights( 1 ) == [ [ 1, 2 ] ]
+        self.subtensor.get_neuron_for_pubkey_and_subnet.assert_called_once_with( self.wallet.hotkey.ss58_address, netuid = 1, block = 100 )
+
+        # Explicit refresh, another block, or an expired snapshot read again.
+        self.subtensor.block = 101
+        assert self.wallet.snapshot( netuid = 1, refresh = True ).block == 101
+        assert self.wallet.snapshot( netuid = 1, block = 90 ).block == 90
+        snapshot.timestamp -= bittensor.__blocktime__ + 1
+        assert self.wallet.snapshot( netuid = 1 ).block == 101
+        assert self.subtensor.get_neuron_for_pubkey_and_subnet.call_count == 4
+        assert self.wallet.snapshot( netuid = 1, max_age = None ) is snapshot
+
+    def test_unregistered(self):
+        self.subtensor.get_neuron_for_pubkey_and_subnet.return_value = MagicMock( is_null = True )
+        snapshot = self.wallet.snapshot( netuid = 2, subtensor = self.subtensor )
+        assert not snapshot.is_registered
+        assert snapshot.uid is None and snapshot.trust is None and snapshot.bonds is None
+
+    def test_shared_metagraph(self):
+        neurons = [ MagicMock( uid = uid, trust = uid / 10 ) for uid in range( 4 ) ]
+        metagraph = MagicMock( netuid = 1, neurons = neurons )
+        metagraph.block.item.return_value = 50
+        metagraph.uid_for_hotkey.return_value = 2
+        snapshot = self.wallet.snapshot( netuid = 1, subtensor = self.subtensor, metagraph = metagraph )
+        assert ( snapshot.block, snapshot.uid, snapshot.trust ) == ( 50, 2, 0.2 )
+        assert not self.subtensor.get_neuron_for_pubkey_and_subnet.called
+
+        # Weights are not in a lite metagraph, they are read once at the metagraph block.
+        self.subtensor.neuron_for_uid.return_value = self.neuron
+        assert snapshot.weights == snapshot.weights == [ [ 1, 2 ] ]
+        self.subtensor.neuron_for_uid.assert_called_once_with( 2, netuid = 1, block = 50 )
+
+        # A block the metagraph is not at is read from the chain.
+        assert snapshot.refresh( block = 60 ).uid == 3
+
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -271,6 +271,29 @@ class TestRegistrationHelpers(unittest.TestCase):
         # Make sure seal meets difficulty
         self.assertTrue(bittensor.utils.registration._seal_meets_difficulty(result.seal, difficulty, limit))
 
+    def test_batched_seals_match_nonce_by_nonce(self):
+        block_and_hotkey_hash_bytes = bytes(range(64))
+        limit = int(math.pow(2,256)) - 1
+        # The batch wraps around at 2^64.
+        nonces, seals = bittensor.utils.registration._create_seal_hashes(block_and_hotkey_hash_bytes, 2**64 - 8, 64)
+        self.assertEqual(int(nonces[8]), 0)
+        for nonce, seal in zip(nonces, seals):
+            self.assertEqual(bytes(seal), bittensor.utils.registration._create_seal_hash(block_and_hotkey_hash_bytes, int(nonce)))
+        for difficulty in [0, 1, 3, 10, 2**10, 2**32, 2**64 - 1]:
+            meets = bittensor.utils.registration._seals_meet_difficulty(seals, difficulty, limit)
+            self.assertEqual(list(meets), [bittensor.utils.registration._seal_meets_difficulty(bytes(seal), difficulty, limit) for seal in seals])
+
+        # The solution is the lowest solving nonce.
+        result = bittensor.utils.registration._solve_for_nonce_block(0, 20_000, block_and_hotkey_hash_bytes, 1000, limit, 1)
+        first = next(nonce for nonce in range(20_000) if bittensor.utils.registration._seal_meets_difficulty(bittensor.utils.registration._create_seal_hash(block_and_hotkey_hash_bytes, nonce), 1000, limit))
+        self.assertEqual(result.nonce, first)
+
+    def test_benchmark_pow(self):
+        stats = bittensor.utils.registration.benchmark_pow(num_processes = 1, update_interval = 10_000, seconds = 1.0)
+        self.assertGreater(stats.hashes_total, 0)
+        self.assertGreater(stats.hash_rate, 0)
+        self.assertEqual(stats.hashes_total, stats.rounds_total * 10_000)
+
 class TestSS58Utils(unittest.TestCase):
     def test_is_valid_ss58_address(self):
         keypair = bittensor.Keypair.create_from_mnemonic(
@@ -24,6 +24,12 @@ def test_convert_weight_and_uids():
     with pytest.raises(ValueError) as pytest_wrapped_e:
         weight_utils.convert_weights_and_uids_for_emit( uids, weights[1:] )
 
+    # empty weights or uids
+    with pytest.raises(ValueError) as pytest_wrapped_e:
+        weight_utils.convert_weights_and_uids_for_emit( torch.tensor([], dtype=torch.int64), torch.tensor([]) )
+    with pytest.raises(ValueError) as pytest_wrapped_e:
+        weight_utils.convert_weight_matrix_for_emit( torch.zeros( 2, 0 ) )
+
     # sum(weights) == 0
     weights = torch.zeros(10)
     weight_utils.convert_weights_and_uids_for_emit( uids, weights )
@@ -85,4 +91,49 @@ def test_normalize_with_max_weight():
     change = eplison*limit
     y = weight_utils.normalize_max_weight(x, limit=limit-change)
     z = weight_utils.normalize_max_weight(x, limit=limit+change)
-    assert (y-z).abs().sum() < eplison
\ No newline at end of file
+    assert (y-z).abs().sum() < eplison
+def test_convert_sparse_weights_and_bonds_layouts():
+    n = 6
+    index = torch.tensor( [ [ 0, 0, 2, 5, 5, 5 ], [ 1, 3, 2, 0, 4, 5 ] ] )
+    values = torch.tensor( [ 10, 30, 7, 1, 0, 65535 ] )
+    dense_weights = weight_utils.convert_sparse_weights_to_tensor( n, index, values )
+    dense_bonds = weight_utils.convert_sparse_bonds_to_tensor( n, index, values )
+    for row in range( n ):
+        mask = index[0] == row
+        if mask.any():
+            assert torch.equal( dense_weights[ row ], weight_utils.convert_weight_uids_and_vals_to_tensor( n, index[1][ mask ].tolist(), values[ mask ].tolist() ) )
+            assert torch.equal( dense_bonds[ row ], weight_utils.convert_bond_uids_and_vals_to_tensor( n, index[1][ mask ].tolist(), values[ mask ].tolist() ) )
+        else:
+            assert dense_weights[ row ].sum() == 0
+    for layout in ( torch.sparse_coo, torch.sparse_csr ):
+        weights = weight_utils.convert_sparse_weights_to_tensor( n, index, values, layout = layout )
+        bonds = weight_utils.convert_sparse_bonds_to_tensor( n, index, values, layout = layout )
+        assert weights.layout == layout and bonds.layout == layout
+        assert torch.allclose( weights.to_dense(), dense_weights )
+        assert torch.equal( bonds.to_dense(), dense_bonds )
+    with pytest.raises( ValueError ):
+        weight_utils.convert_sparse_weights_to_tensor( n, index, values, layout = torch.sparse_bsr )
+
+def test_weight_utils_accept_sparse_rows():
+    weights = weight_utils.convert_sparse_weights_to_tensor( 4, torch.tensor( [ [ 0, 0 ], [ 1, 3 ] ] ), torch.tensor( [ 1, 3 ] ), layout = torch.sparse_coo )
+    uids = torch.arange( 4 )
+    assert weight_utils.convert_weights_and_uids_for_emit( uids, weights[0] ) == weight_utils.convert_weights_and_uids_for_emit( uids, weights[0].to_dense() )
+    assert torch.equal( weight_utils.normalize_max_weight( weights[0], limit = 0.5 ), weight_utils.normalize_max_weight( weights[0].to_dense(), limit = 0.5 ) )
+
+def test_weight_utils_matrix_forms():
+    weights = torch.rand( 8, 100 ) ** 8
+    weights[ 0 ] = 0
+    weights[ 1 ] = torch.ones( 100 )
+    uids = torch.arange( 100 )
+    normalized = weight_utils.normalize_max_weight( weights, limit = 0.05 )
+    emitted = weight_utils.convert_weight_matrix_for_emit( weights, uids )
+    for row in range( 8 ):
+        assert torch.equal( normalized[ row ], weight_utils.normalize_max_weight( weights[ row ], limit = 0.05 ) )
+        assert ( emitted[0][ row ], emitted[1][ row ] ) == weight_utils.convert_weights_and_uids_for_emit( uids, weights[ row ] )
+    assert emitted[0][0] == [] and emitted[1][1] == [ weight_utils.U16_MAX ] * 100
+    assert normalized.max() <= 0.05
+
+def test_convert_weights_and_uids_for_emit_rounding():
+    uids = torch.tensor( [ 4, 7, 9 ] )
+    weights = torch.tensor( [ 0.0, 0.5, 1.0 ] )
+    assert weight_utils.convert_weights_and_uids_for_emit( uids, weights ) == ( [ 7, 9 ], [ 32768, 65535 ] )